@@ -0,0 +1,163 @@
+"""
+캐시 저장 형식 벤치마크
+
+기존 형식(들여쓰기 JSON, {"timestamp", "data"} 래퍼)과 CacheCodec 압축 형식의
+디스크 크기와 저장/로드 시간을 비교합니다.
+
+사용법:
+    python benchmarks/cache_format_benchmark.py                    # 600개 조문 합성 법령
+    python benchmarks/cache_format_benchmark.py --articles 1200
+    python benchmarks/cache_format_benchmark.py --input law.json   # 실제 lawService.do 응답 파일
+"""
+
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from mcp_kr_legislation.cache.codec import HAS_MSGPACK, HAS_ZSTD, CacheCodec
+
+
+_WORDS = (
+    "거주자 비거주자 납세의무자 소득 과세표준 세액 공제 감면 신고 납부 원천징수 사업자 법인 "
+    "금융소득 이자소득 배당소득 근로소득 연금소득 기타소득 퇴직소득 양도소득 필요경비 총수입금액 "
+    "대통령령 기획재정부령 관할 세무서장 국세청장 경우 다음 각 호 해당 금액 범위 이내 초과 미만 "
+    "이상 이하 정하는 바에 따라 산정한 계산한 적용한다 포함한다 제외한다 본다 한다 아니한다 "
+    "과세기간 종료일 개시일 사업연도 결손금 이월 공제액 가산세 환급 추징 조정 경정 결정 통지"
+).split()
+
+
+def _sentence(rng: random.Random, min_words: int = 12, max_words: int = 40) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(min_words, max_words))) + "."
+
+
+def build_synthetic_law(article_count: int, seed: int = 42) -> Dict[str, Any]:
+    """lawService.do(target=law) 응답 구조를 흉내 낸 대형 법령 생성"""
+    rng = random.Random(seed)
+    sentence = _sentence(rng)
+    articles: List[Dict[str, Any]] = []
+    for no in range(1, article_count + 1):
+        articles.append({
+            "조문키": f"{no:04d}001",
+            "조문번호": str(no),
+            "조문여부": "조문",
+            "조문제목": f"제{no}조의 제목",
+            "조문시행일자": "20250101",
+            "조문변경여부": "N",
+            "조문내용": f"제{no}조(제{no}조의 제목) {_sentence(rng)}",
+            "항": [
+                {
+                    "항번호": "①②③④⑤"[p],
+                    "항내용": f"{'①②③④⑤'[p]} {_sentence(rng)}",
+                    "호": [
+                        {"호번호": f"{h + 1}.", "호내용": f"{h + 1}. {_sentence(rng, 6, 20)}"}
+                        for h in range(rng.randint(0, 4))
+                    ],
+                }
+                for p in range(rng.randint(1, 4))
+            ],
+        })
+    return {
+        "법령": {
+            "법령키": "0017952025010100000",
+            "기본정보": {
+                "법령ID": "001795",
+                "법령명_한글": "소득세법",
+                "공포일자": "20241231",
+                "시행일자": "20250101",
+                "소관부처": {"content": "기획재정부", "소관부처코드": "1051000"},
+            },
+            "조문": {"조문단위": articles},
+            "부칙": {"부칙단위": [{"부칙내용": [[sentence] * 5]} for _ in range(20)]},
+            "개정문": {"개정문내용": [[sentence] * 10]},
+        }
+    }
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> float:
+    """repeat회 실행한 시간의 중앙값(ms)"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def bench_legacy(law: Dict[str, Any], path: Path, repeat: int) -> Tuple[int, float, float]:
+    """기존 save_to_cache/load_from_cache 형식"""
+    def save() -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"timestamp": datetime.now().isoformat(), "data": law}, f, ensure_ascii=False, indent=2)
+
+    def load() -> Any:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)["data"]
+
+    save_ms = _time(save, repeat)
+    load_ms = _time(load, repeat)
+    return path.stat().st_size, save_ms, load_ms
+
+
+def bench_codec(law: Dict[str, Any], codec: CacheCodec, path: Path, repeat: int) -> Tuple[int, float, float]:
+    """CacheCodec 형식"""
+    def save() -> None:
+        path.write_bytes(codec.encode(law))
+
+    def load() -> Any:
+        return CacheCodec.decode(path.read_bytes())
+
+    save_ms = _time(save, repeat)
+    assert load() == law
+    load_ms = _time(load, repeat)
+    return path.stat().st_size, save_ms, load_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="캐시 저장 형식 벤치마크")
+    parser.add_argument("--articles", type=int, default=600, help="합성 법령의 조문 수")
+    parser.add_argument("--input", type=Path, help="실제 법령 본문 JSON 파일 (지정 시 합성 데이터 대신 사용)")
+    parser.add_argument("--repeat", type=int, default=7, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    if args.input:
+        law = json.loads(args.input.read_text(encoding="utf-8"))
+        source = str(args.input)
+    else:
+        law = build_synthetic_law(args.articles)
+        source = f"합성 법령 ({args.articles}개 조문)"
+
+    variants = [("json", "none"), ("json", "gzip")]
+    if HAS_ZSTD:
+        variants.append(("json", "zstd"))
+    if HAS_MSGPACK:
+        variants.append(("msgpack", "gzip"))
+        if HAS_ZSTD:
+            variants.append(("msgpack", "zstd"))
+
+    print(f"데이터: {source}")
+    print(f"{'형식':<24}{'크기(KB)':>12}{'비율':>8}{'저장(ms)':>12}{'로드(ms)':>12}")
+    print("-" * 68)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        legacy_size, save_ms, load_ms = bench_legacy(law, tmp_dir / "legacy.json", args.repeat)
+        print(f"{'기존 (indent=2 JSON)':<24}{legacy_size / 1024:>12.1f}{1.0:>8.2f}{save_ms:>12.1f}{load_ms:>12.1f}")
+
+        for serializer, compression in variants:
+            codec = CacheCodec(serializer, compression)
+            size, save_ms, load_ms = bench_codec(law, codec, tmp_dir / f"{serializer}_{compression}.cache", args.repeat)
+            label = f"{serializer} + {compression}"
+            print(f"{label:<24}{size / 1024:>12.1f}{size / legacy_size:>8.2f}{save_ms:>12.1f}{load_ms:>12.1f}")
+
+    if not HAS_ZSTD or not HAS_MSGPACK:
+        print("\n참고: zstandard/msgpack을 설치하면 추가 형식도 측정합니다 (pip install 'mcp-kr-legislation[cache]').")
+
+
+if __name__ == "__main__":
+    main()
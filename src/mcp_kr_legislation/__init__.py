@@ -22,6 +22,7 @@ for module_name in [
     "linkage_tools",                 # 연계정보 도구들 (8개)
     "misc_tools",                    # 기타 도구들
     "legislation_tools",             # 나머지 도구들 (1개)
+    "system_tools",                  # 시스템 상태 도구들
 ]:
     try:
         importlib.import_module(f"mcp_kr_legislation.tools.{module_name}")
@@ -0,0 +1,79 @@
+"""
+법제처 OPEN API 비동기 클라이언트
+
+LegislationClient와 동일한 메서드를 제공하되, 모든 요청 메서드가 코루틴을 반환합니다.
+SSE 전송처럼 하나의 이벤트 루프에서 많은 세션을 처리할 때 블로킹 없이 사용합니다.
+
+사용 예시:
+    client = AsyncLegislationClient()
+    data = await client.search_law("은행법")
+    detail = await client.get_law_info("001635")
+"""
+
+import logging
+import json
+import httpx
+from typing import Dict, Any, Optional
+
+from mcp_kr_legislation.config import LegislationConfig
+from mcp_kr_legislation.apis.client import LegislationClient
+from mcp_kr_legislation.apis.transport import get_async_transport
+from mcp_kr_legislation.apis.singleflight import get_single_flight, canonical_request_key
+
+logger = logging.getLogger(__name__)
+
+class AsyncLegislationClient(LegislationClient):
+    """법제처 OPEN API 비동기 클라이언트
+
+    search/service 및 search_law, get_law_info 등 모든 API 메서드는
+    _make_request의 결과를 그대로 반환하므로 이 클래스에서는 await 가능한 객체를 반환합니다.
+    """
+    
+    def __init__(self, config: Optional[LegislationConfig] = None):
+        super().__init__(config)
+        logger.info("법제처 API 비동기 클라이언트 초기화 완료")
+
+    async def _make_request(self,  # type: ignore[override]
+                            endpoint_type: str = "search",
+                            params: Optional[Dict[str, Any]] = None,
+                            method: str = "GET") -> Dict[str, Any]:
+        """
+        법제처 API 비동기 요청 실행
+        
+        Args:
+            endpoint_type: "search" 또는 "service"
+            params: 요청 파라미터
+            method: HTTP 메소드
+        """
+        url, params = self._build_request(endpoint_type, params, method)
+        
+        if method.upper() == "GET":
+            return await get_single_flight().do_async(
+                canonical_request_key(url), lambda: self._send_request_async(url, params, method)
+            )
+        return await self._send_request_async(url, params, method)
+
+    async def _send_request_async(self, url: str, params: Dict[str, Any], method: str) -> Dict[str, Any]:
+        """비동기 HTTP 요청 전송 및 응답 파싱 (오류는 error 딕셔너리로 반환)"""
+        try:
+            if method.upper() == "GET":
+                response = await get_async_transport().get(url, timeout=self.timeout)
+            elif method.upper() == "POST":
+                response = await get_async_transport().post(url, data=params, timeout=self.timeout)
+            else:
+                raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
+            
+            logger.debug(f"비동기 API 응답 - 상태 코드: {response.status_code}")
+            response.raise_for_status()
+            
+            return self._parse_response(response.headers.get("Content-Type", ""), response.text)
+            
+        except httpx.HTTPStatusError as e:
+            logger.error(f"API 요청 실패: {str(e)}")
+            return {"error": str(e), "status_code": e.response.status_code}
+        except httpx.HTTPError as e:
+            logger.error(f"API 요청 실패: {str(e)}")
+            return {"error": str(e), "status_code": None}
+        except json.JSONDecodeError as e:
+            logger.error(f"API 응답 파싱 실패: {str(e)}")
+            return {"error": str(e), "status_code": response.status_code}
@@ -20,11 +20,13 @@
 import logging
 import json
 import requests
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Tuple, Union
 from urllib.parse import urlencode
 from dotenv import load_dotenv
 
 from mcp_kr_legislation.config import LegislationConfig, legislation_config
+from mcp_kr_legislation.apis.transport import get_transport
+from mcp_kr_legislation.apis.singleflight import get_single_flight, canonical_request_key
 
 load_dotenv()
 
@@ -45,18 +47,11 @@ class LegislationClient:
         
         logger.info(f"법제처 API 클라이언트 초기화 완료 - OC: {self.oc}")
 
-    def _make_request(self, 
-                     endpoint_type: str = "search",
-                     params: Optional[Dict[str, Any]] = None, 
-                     method: str = "GET") -> Dict[str, Any]:
-        """
-        법제처 API 요청 실행
-        
-        Args:
-            endpoint_type: "search" 또는 "service"
-            params: 요청 파라미터
-            method: HTTP 메소드
-        """
+    def _build_request(self,
+                       endpoint_type: str,
+                       params: Optional[Dict[str, Any]],
+                       method: str) -> Tuple[str, Dict[str, Any]]:
+        """요청 URL과 파라미터 생성 (동기/비동기 클라이언트 공용)"""
         if params is None:
             params = {}
         
@@ -79,11 +74,49 @@ class LegislationClient:
         logger.debug(f"Parameters: {params}")
         logger.debug("========================")
         
+        return url, params
+
+    def _parse_response(self, content_type: str, text: str) -> Dict[str, Any]:
+        """응답 본문 파싱 (동기/비동기 클라이언트 공용)"""
+        if "application/json" in content_type:
+            response_data: Dict[str, Any] = json.loads(text)
+            return response_data
+        
+        # JSON이 아닌 경우 텍스트로 처리한 후 JSON 파싱 시도
+        try:
+            parsed_data: Dict[str, Any] = json.loads(text)
+            return parsed_data
+        except json.JSONDecodeError:
+            return {"status": "000", "message": "정상", "content": text}
+
+    def _make_request(self, 
+                     endpoint_type: str = "search",
+                     params: Optional[Dict[str, Any]] = None, 
+                     method: str = "GET") -> Dict[str, Any]:
+        """
+        법제처 API 요청 실행
+        
+        Args:
+            endpoint_type: "search" 또는 "service"
+            params: 요청 파라미터
+            method: HTTP 메소드
+        """
+        url, params = self._build_request(endpoint_type, params, method)
+        
+        if method.upper() == "GET":
+            # 동일 GET 요청이 진행 중이면 응답 파싱 결과를 공유
+            return get_single_flight().do(
+                canonical_request_key(url), lambda: self._send_request(url, params, method)
+            )
+        return self._send_request(url, params, method)
+
+    def _send_request(self, url: str, params: Dict[str, Any], method: str) -> Dict[str, Any]:
+        """HTTP 요청 전송 및 응답 파싱 (오류는 error 딕셔너리로 반환)"""
         try:
             if method.upper() == "GET":
-                response = requests.get(url, timeout=self.timeout)
+                response = get_transport().get(url, timeout=self.timeout)
             elif method.upper() == "POST":
-                response = requests.post(url, data=params, timeout=self.timeout)
+                response = get_transport().post(url, data=params, timeout=self.timeout)
             else:
                 raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
                 
@@ -95,21 +128,14 @@ class LegislationClient:
             response.raise_for_status()
         
             # 응답 처리
-            content_type = response.headers.get("Content-Type", "")
-            if "application/json" in content_type:
-                response_data: Dict[str, Any] = response.json()
-                return response_data
-            else:
-                # JSON이 아닌 경우 텍스트로 처리한 후 JSON 파싱 시도
-                try:
-                    parsed_data: Dict[str, Any] = json.loads(response.text)
-                    return parsed_data
-                except json.JSONDecodeError:
-                    return {"status": "000", "message": "정상", "content": response.text}
+            return self._parse_response(response.headers.get("Content-Type", ""), response.text)
                     
         except requests.RequestException as e:
             logger.error(f"API 요청 실패: {str(e)}")
             return {"error": str(e), "status_code": getattr(e.response, 'status_code', None)}
+        except json.JSONDecodeError as e:
+            logger.error(f"API 응답 파싱 실패: {str(e)}")
+            return {"error": str(e), "status_code": response.status_code}
 
     def search(self, target: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
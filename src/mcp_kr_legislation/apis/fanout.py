@@ -0,0 +1,264 @@
+"""
+여러 업스트림 검색의 병렬 실행(fan-out)
+
+통합 검색처럼 서로 독립적인 검색 여러 개를 한 번에 보내는 도구에서 사용합니다.
+- 프로세스 공용 스레드 풀로 동시 실행 수를 제한
+- 항목별 응답 대기 시간(deadline)을 넘긴 항목은 결과 없이 시간 초과로 표시하고 나머지는 그대로 반환
+- 결과는 요청한 순서대로 반환 (완료 순서와 무관)
+- race: 조건을 만족하는 결과가 처음 도착하면 바로 반환하고 나머지는 취소/무시
+
+fan-out 작업 안에서 다시 fan-out을 호출하면 풀 고갈로 인한 교착을 막기 위해 순차 실행합니다.
+각 항목은 호출한 쪽의 contextvars 컨텍스트에서 실행됩니다 (오프라인 응답 안내 등 도구 호출 단위 상태 공유).
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from mcp_kr_legislation.config import legislation_config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 16
+DEFAULT_DEADLINE = 12.0
+
+
+@dataclass
+class SectionResult:
+    """fan-out 항목 하나의 실행 결과"""
+
+    name: str
+    value: Any = None
+    error: Optional[BaseException] = None
+    timed_out: bool = False
+    elapsed_ms: float = 0.0  # 실제 실행 시간 (시간 초과 시 대기한 시간)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.timed_out
+
+
+class FanOutExecutor:
+    """동시 실행 수가 제한된 fan-out 실행기"""
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS, default_deadline: float = DEFAULT_DEADLINE):
+        """
+        Args:
+            max_workers: 동시에 실행할 작업 수 상한
+            default_deadline: 항목별 기본 응답 대기 시간(초)
+        """
+        self.max_workers = max(1, max_workers)
+        self.default_deadline = default_deadline
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._runs = 0
+        self._sections = 0
+        self._timeouts = 0
+        self._errors = 0
+        self._inline_runs = 0
+        self._races = 0
+        self._race_wins = 0
+        self._race_cancelled = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="fanout")
+            return self._executor
+
+    def _execute(self, fn: Callable[[], Any]) -> Tuple[Any, float]:
+        self._local.in_worker = True
+        started = time.perf_counter()
+        try:
+            return fn(), (time.perf_counter() - started) * 1000
+        finally:
+            self._local.in_worker = False
+
+    def run(self,
+            sections: Sequence[Tuple[str, Callable[[], Any]]],
+            deadline: Optional[float] = None,
+            deadlines: Optional[Dict[str, float]] = None) -> List[SectionResult]:
+        """항목들을 동시에 실행하고 요청 순서대로 결과 반환
+
+        Args:
+            sections: (항목 이름, 실행 함수) 목록
+            deadline: 항목별 응답 대기 시간(초), None이면 기본값
+            deadlines: 항목 이름별 대기 시간 재정의
+
+        실행 함수의 예외는 SectionResult.error로 전달되며 다른 항목에 영향을 주지 않습니다.
+        """
+        deadline = self.default_deadline if deadline is None else deadline
+        deadlines = deadlines or {}
+        with self._lock:
+            self._runs += 1
+            self._sections += len(sections)
+
+        if getattr(self._local, "in_worker", False) or len(sections) <= 1:
+            with self._lock:
+                self._inline_runs += 1
+            return [self._run_inline(name, fn) for name, fn in sections]
+
+        executor = self._get_executor()
+        started = time.monotonic()
+        futures: List[Tuple[str, Future]] = [
+            (name, executor.submit(contextvars.copy_context().run, self._execute, fn)) for name, fn in sections
+        ]
+
+        results: List[SectionResult] = []
+        for name, future in futures:
+            section_deadline = deadlines.get(name, deadline)
+            remaining = max(0.0, started + section_deadline - time.monotonic())
+            try:
+                value, elapsed_ms = future.result(timeout=remaining)
+                results.append(SectionResult(name, value=value, elapsed_ms=round(elapsed_ms, 1)))
+            except FutureTimeoutError:
+                # 아직 시작하지 않은 작업은 취소, 실행 중인 작업은 끝나면 결과를 버림 (캐시에는 반영됨)
+                future.cancel()
+                with self._lock:
+                    self._timeouts += 1
+                logger.warning(f"fan-out 항목 시간 초과 ({name}, {section_deadline}초)")
+                results.append(SectionResult(name, timed_out=True, elapsed_ms=round(section_deadline * 1000, 1)))
+            except Exception as e:
+                with self._lock:
+                    self._errors += 1
+                results.append(SectionResult(name, error=e, elapsed_ms=round((time.monotonic() - started) * 1000, 1)))
+        return results
+
+    def race(self,
+             sections: Sequence[Tuple[str, Callable[[], Any]]],
+             accept: Callable[[Any], bool],
+             deadline: Optional[float] = None) -> Tuple[Optional[SectionResult], List[SectionResult]]:
+        """항목들을 동시에 실행하고 accept를 만족하는 결과가 처음 도착하면 바로 반환
+
+        나머지 항목은 시작 전이면 취소하고, 실행 중이면 결과를 버립니다(캐시에는 반영됨).
+        fan-out 작업 안에서 호출되면 순차 실행하며 조건을 만족하는 첫 결과에서 멈춥니다.
+
+        Returns:
+            (채택된 결과, 없으면 None), 채택 시점까지 완료된 결과 목록(요청 순서)
+        """
+        deadline = self.default_deadline if deadline is None else deadline
+        with self._lock:
+            self._races += 1
+            self._sections += len(sections)
+
+        def accepted(result: SectionResult) -> bool:
+            try:
+                return result.ok and bool(accept(result.value))
+            except Exception as e:
+                logger.debug(f"race 결과 판정 실패 ({result.name}): {e}")
+                return False
+
+        if getattr(self._local, "in_worker", False) or len(sections) <= 1:
+            with self._lock:
+                self._inline_runs += 1
+            completed: List[SectionResult] = []
+            for name, fn in sections:
+                result = self._run_inline(name, fn)
+                completed.append(result)
+                if accepted(result):
+                    with self._lock:
+                        self._race_wins += 1
+                    return result, completed
+            return None, completed
+
+        executor = self._get_executor()
+        ends_at = time.monotonic() + deadline
+        futures: Dict[Future, Tuple[int, str]] = {
+            executor.submit(contextvars.copy_context().run, self._execute, fn): (index, name) for index, (name, fn) in enumerate(sections)
+        }
+        finished: Dict[int, SectionResult] = {}
+        pending = set(futures)
+        winner: Optional[SectionResult] = None
+
+        while pending and winner is None:
+            remaining = ends_at - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            # 동시에 끝난 결과는 요청 순서가 앞선 항목을 우선
+            for future in sorted(done, key=lambda f: futures[f][0]):
+                index, name = futures[future]
+                try:
+                    value, elapsed_ms = future.result()
+                    result = SectionResult(name, value=value, elapsed_ms=round(elapsed_ms, 1))
+                except Exception as e:
+                    with self._lock:
+                        self._errors += 1
+                    result = SectionResult(name, error=e)
+                finished[index] = result
+                if winner is None and accepted(result):
+                    winner = result
+
+        for future in pending:
+            future.cancel()
+            if winner is None:
+                index, name = futures[future]
+                finished[index] = SectionResult(name, timed_out=True, elapsed_ms=round(deadline * 1000, 1))
+        with self._lock:
+            if winner is not None:
+                self._race_wins += 1
+                self._race_cancelled += len(pending)
+            else:
+                self._timeouts += len(pending)
+        return winner, [finished[i] for i in sorted(finished)]
+
+    def _run_inline(self, name: str, fn: Callable[[], Any]) -> SectionResult:
+        started = time.perf_counter()
+        try:
+            value = fn()
+            return SectionResult(name, value=value, elapsed_ms=round((time.perf_counter() - started) * 1000, 1))
+        except Exception as e:
+            with self._lock:
+                self._errors += 1
+            return SectionResult(name, error=e, elapsed_ms=round((time.perf_counter() - started) * 1000, 1))
+
+    def stats(self) -> Dict[str, Any]:
+        """fan-out 실행 통계"""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "default_deadline_seconds": self.default_deadline,
+                "runs": self._runs,
+                "inline_runs": self._inline_runs,
+                "races": self._races,
+                "race_wins": self._race_wins,
+                "race_cancelled": self._race_cancelled,
+                "sections": self._sections,
+                "timeouts": self._timeouts,
+                "errors": self._errors,
+            }
+
+    def shutdown(self) -> None:
+        """스레드 풀 종료 (대기 중인 작업은 취소)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_fanout: Optional[FanOutExecutor] = None
+_fanout_lock = threading.Lock()
+
+
+def get_fanout() -> FanOutExecutor:
+    """프로세스 공용 fan-out 실행기 반환"""
+    global _fanout
+    if _fanout is None:
+        with _fanout_lock:
+            if _fanout is None:
+                config = legislation_config
+                if config is not None:
+                    _fanout = FanOutExecutor(config.fanout_workers, config.fanout_section_deadline)
+                else:
+                    _fanout = FanOutExecutor()
+    return _fanout
+
+
+def fanout_stats() -> Dict[str, Any]:
+    """공용 fan-out 실행기 통계"""
+    return get_fanout().stats()
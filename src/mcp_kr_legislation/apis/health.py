@@ -0,0 +1,289 @@
+"""
+업스트림(법제처 API) 상태 감시와 오프라인 모드
+
+전송 계층이 모든 업스트림 호출의 최종 결과(재시도 후의 연결 실패, 타임아웃, 5xx 응답)를 target별로 기록하고,
+연속 실패 합계가 failure_threshold에 도달하면서 실패 중인 target이 min_failing_targets개 이상이면 오프라인 모드로 전환합니다.
+느린 target 하나(예: lsHstInf)의 타임아웃만으로 모든 도구가 오프라인 응답으로 바뀌지 않도록 하기 위함이며,
+상태 점검(probe)도 별도 target으로 집계하므로 한 target만 쓰는 중의 실제 장애는 점검 실패로 확인됩니다.
+오프라인 모드에서는 전송 계층이 업스트림을 호출하지 않고 바로 UpstreamUnavailableError를 발생시키므로
+도구가 타임아웃(최대 60초)을 기다리지 않고 로컬 저장소(캐시, 조문 샤드, 카탈로그)로 응답합니다.
+
+상태 점검(probe)은 실패가 기록되었거나 오프라인인 동안에만 probe_interval마다 가벼운 검색 요청을 보내고,
+성공하면 온라인으로 되돌립니다. 정상 상태에서는 업스트림을 추가로 호출하지 않습니다.
+
+모드 (OFFLINE_MODE):
+    - auto: 호출 결과와 상태 점검에 따라 자동 전환 (기본)
+    - on: 항상 오프라인 (업스트림을 호출하지 않고 로컬 저장소로만 응답)
+    - off: 오프라인으로 전환하지 않음
+
+로컬 저장소로 응답한 도구 결과에는 offline_notice() 안내문이 앞에 붙습니다 (server.py 도구 등록 래퍼).
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import anyio
+import httpx
+import requests  # type: ignore
+
+from mcp_kr_legislation.config import legislation_config
+
+logger = logging.getLogger(__name__)
+
+OFFLINE_MODES = ("auto", "on", "off")
+# 상태 점검 요청의 실패를 집계하는 target 이름
+PROBE_TARGET = "(probe)"
+
+
+class UpstreamUnavailableError(requests.exceptions.ConnectionError):
+    """오프라인 모드라 업스트림을 호출하지 않았음 (연결 오류로 처리됨)"""
+
+
+def is_unavailable_error(error: BaseException) -> bool:
+    """업스트림 장애로 볼 오류인지 여부 (연결 실패, 타임아웃, 5xx 응답)"""
+    if isinstance(error, httpx.PoolTimeout):
+        # 커넥션 풀·요청 제한 대기 초과 - 업스트림을 호출하지 않은 로컬 포화
+        return False
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout, httpx.TransportError)):
+        return True
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    return isinstance(status, int) and status >= 500
+
+
+class UpstreamHealth:
+    """업스트림 연속 실패 추적과 오프라인 모드 전환 (스레드 안전)"""
+
+    def __init__(self,
+                 probe: Callable[[], None],
+                 mode: str = "auto",
+                 failure_threshold: int = 3,
+                 probe_interval: float = 30.0,
+                 min_failing_targets: int = 2):
+        """
+        Args:
+            probe: 상태 점검 요청 (실패 시 예외 발생)
+            mode: auto, on(항상 오프라인), off(전환 안 함)
+            failure_threshold: 오프라인으로 전환할 연속 실패 수 (실패 중인 target 합계)
+            probe_interval: 상태 점검 주기(초)
+            min_failing_targets: 오프라인으로 전환하려면 연속 실패 중이어야 하는 target 수 (상태 점검 포함)
+        """
+        if mode not in OFFLINE_MODES:
+            logger.warning(f"알 수 없는 오프라인 모드 '{mode}' - auto를 사용합니다.")
+            mode = "auto"
+        self.probe = probe
+        self.mode = mode
+        self.failure_threshold = max(1, failure_threshold)
+        self.probe_interval = probe_interval
+        self.min_failing_targets = max(1, min_failing_targets)
+        self._lock = threading.Lock()
+        self._target_failures: Dict[str, int] = {}  # target → 연속 실패 수 (성공하면 삭제)
+        self._offline_since: Optional[float] = None
+        self._last_success: Optional[float] = None
+        self._last_failure: Optional[float] = None
+        self._last_error: Optional[str] = None
+        self._transitions = 0
+        self._rejected = 0
+        self._probes = 0
+        self._probe_failures = 0
+        self._local_serves = 0
+
+    def is_offline(self) -> bool:
+        """업스트림 호출 없이 로컬 저장소로 응답해야 하는지 여부"""
+        if self.mode != "auto":
+            return self.mode == "on"
+        return self._offline_since is not None
+
+    def check(self) -> None:
+        """업스트림 호출 전 확인 (오프라인이면 바로 UpstreamUnavailableError)"""
+        if self.is_offline():
+            with self._lock:
+                self._rejected += 1
+            raise UpstreamUnavailableError("오프라인 모드: 법제처 API 호출을 보내지 않았습니다")
+
+    def _failure_total(self) -> int:
+        """실패 중인 target들의 연속 실패 합계"""
+        return sum(self._target_failures.values())
+
+    def record_success(self, target: str = "") -> None:
+        """업스트림 응답 수신 (그 target의 연속 실패 초기화, 오프라인이었으면 온라인으로 복귀)"""
+        with self._lock:
+            self._target_failures.pop(target, None)
+            self._last_success = time.time()
+            if self._offline_since is None:
+                return
+            # 업스트림이 다시 응답 - 모든 target의 실패를 지우고 새로 집계
+            self._target_failures.clear()
+            outage = time.time() - self._offline_since
+            self._offline_since = None
+            self._transitions += 1
+        logger.info(f"법제처 API 응답 확인 - 온라인 모드로 복귀 (오프라인 {outage:.0f}초)")
+
+    def record_failure(self, error: Any, target: str = "") -> None:
+        """업스트림 장애 기록 (연속 실패 합계와 실패 중인 target 수가 기준에 도달하면 오프라인으로 전환)"""
+        with self._lock:
+            self._target_failures[target] = self._target_failures.get(target, 0) + 1
+            self._last_failure = time.time()
+            self._last_error = str(error)[:200]
+            failures = self._failure_total()
+            failing = sorted(self._target_failures)
+            if self.mode != "auto" or self._offline_since is not None \
+                    or failures < self.failure_threshold or len(failing) < self.min_failing_targets:
+                return
+            self._offline_since = time.time()
+            self._transitions += 1
+        logger.warning(
+            f"법제처 API 연속 {failures}회 실패 ({', '.join(t or '-' for t in failing)}) - 오프라인 모드로 전환 "
+            f"(로컬 저장소로 응답, {self.probe_interval:.0f}초마다 상태 점검): {error}"
+        )
+
+    def record_local_serve(self) -> None:
+        with self._lock:
+            self._local_serves += 1
+
+    def needs_probe(self) -> bool:
+        """상태 점검이 필요한지 여부 (auto 모드에서 실패가 기록되었거나 오프라인일 때)"""
+        return self.mode == "auto" and (self._offline_since is not None or self._failure_total() > 0)
+
+    def probe_once(self) -> bool:
+        """상태 점검 1회 실행 (블로킹 I/O 포함) 후 결과를 기록하고 성공 여부 반환"""
+        with self._lock:
+            self._probes += 1
+        try:
+            self.probe()
+        except Exception as e:
+            with self._lock:
+                self._probe_failures += 1
+            self.record_failure(e, PROBE_TARGET)
+            return False
+        self.record_success(PROBE_TARGET)
+        with self._lock:
+            # 업스트림이 응답함 - 느린 target 하나의 남은 실패가 다른 target의 일시 오류와 합쳐져 전환되지 않도록 초기화
+            self._target_failures.clear()
+        return True
+
+    async def run_forever(self) -> None:
+        """probe_interval마다 필요하면 워커 스레드에서 상태 점검 (취소될 때까지)"""
+        while True:
+            if self.needs_probe():
+                try:
+                    await anyio.to_thread.run_sync(self.probe_once)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"법제처 API 상태 점검 실패: {e}")
+            await asyncio.sleep(self.probe_interval)
+
+    def stats(self) -> Dict[str, Any]:
+        """상태 감시 통계"""
+        def fmt(ts: Optional[float]) -> Optional[str]:
+            return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts)) if ts else None
+
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "offline": self.is_offline(),
+                "offline_since": fmt(self._offline_since),
+                "consecutive_failures": self._failure_total(),
+                "failing_targets": dict(self._target_failures),
+                "failure_threshold": self.failure_threshold,
+                "min_failing_targets": self.min_failing_targets,
+                "probe_interval_seconds": self.probe_interval,
+                "last_success": fmt(self._last_success),
+                "last_failure": fmt(self._last_failure),
+                "last_error": self._last_error,
+                "transitions": self._transitions,
+                "rejected_requests": self._rejected,
+                "local_serves": self._local_serves,
+                "probes": self._probes,
+                "probe_failures": self._probe_failures,
+            }
+
+
+def _probe_upstream() -> None:
+    """가벼운 법령 검색 1건으로 업스트림 응답 확인 (상태 감시를 거치지 않음)"""
+    from mcp_kr_legislation.apis.transport import get_transport
+
+    config = legislation_config
+    if config is None:
+        raise RuntimeError("법제처 API 설정이 없습니다")
+    params = {"OC": config.oc, "target": "law", "type": "JSON", "query": "민법", "display": 1}
+    response = get_transport().get(
+        config.search_base_url, params=params, timeout=config.health_probe_timeout, check_health=False
+    )
+    if response.status_code >= 500:
+        raise RuntimeError(f"HTTP {response.status_code}")
+
+
+_health: Optional[UpstreamHealth] = None
+_health_lock = threading.Lock()
+
+
+def get_upstream_health() -> UpstreamHealth:
+    """프로세스 공용 업스트림 상태 감시 반환 (최초 호출 시 설정값으로 생성)"""
+    global _health
+    if _health is None:
+        with _health_lock:
+            if _health is None:
+                config = legislation_config
+                if config is not None:
+                    _health = UpstreamHealth(
+                        _probe_upstream,
+                        mode=config.offline_mode,
+                        failure_threshold=config.health_failure_threshold,
+                        probe_interval=config.health_probe_interval,
+                        min_failing_targets=config.health_min_failing_targets,
+                    )
+                else:
+                    _health = UpstreamHealth(_probe_upstream)
+    return _health
+
+
+def health_stats() -> Dict[str, Any]:
+    """업스트림 상태 감시 통계"""
+    return get_upstream_health().stats()
+
+
+# ---------------------------------------------------------------------------
+# 로컬 저장소 응답 안내 (도구 호출 단위)
+# ---------------------------------------------------------------------------
+
+_offline_sources: ContextVar[Optional[List[str]]] = ContextVar("offline_sources", default=None)
+
+
+@contextmanager
+def offline_sources_scope() -> Iterator[List[str]]:
+    """도구 호출 하나 동안 로컬 저장소로 대신 응답한 출처를 모음"""
+    sources: List[str] = []
+    token = _offline_sources.set(sources)
+    try:
+        yield sources
+    finally:
+        _offline_sources.reset(token)
+
+
+def note_offline_source(description: str) -> None:
+    """현재 도구 호출이 업스트림 대신 로컬 저장소로 응답했음을 기록"""
+    get_upstream_health().record_local_serve()
+    sources = _offline_sources.get()
+    if sources is not None and description not in sources:
+        sources.append(description)
+
+
+def serving_local_data() -> bool:
+    """현재 도구 호출이 로컬 저장소 응답을 사용했는지 여부 (그 결과로 만든 값은 캐시에 저장하지 않음)"""
+    return bool(_offline_sources.get())
+
+
+def offline_notice(sources: List[str]) -> str:
+    """도구 결과 앞에 붙일 오프라인 응답 안내문"""
+    lines = "\n".join(f"- {source}" for source in sources)
+    return (
+        "⚠️ **오프라인 응답**: 법제처 API에 연결할 수 없어 로컬 저장소의 데이터로 응답했습니다. "
+        "최근 개정 내용이 반영되지 않았을 수 있습니다.\n"
+        f"{lines}\n\n"
+    )
@@ -0,0 +1,423 @@
+"""
+업스트림 요청 재시도(지수 백오프 + jitter, 재시도 예산)와 target별 회로 차단기(circuit breaker)
+
+- RetryPolicy: 일시적 장애(연결 실패, 타임아웃, 429/5xx 응답)만 최대 max_attempts번까지 다시 보냄.
+  대기 시간은 min(max_delay, base_delay * 2^n) 범위의 full jitter이며, Retry-After 응답 헤더가 있으면 그 이상 기다림
+- RetryBudget: 최근 window초 동안 재시도 수를 (요청 수 × ratio + min_retries) 이하로 제한
+  (장애 중 모든 요청이 재시도하며 업스트림 부하가 몇 배로 늘어나지 않도록)
+- CircuitBreaker: target별 연속 실패가 failure_threshold에 도달하면 회로를 열고(open) reset_timeout 동안
+  업스트림을 호출하지 않고 바로 CircuitOpenError로 실패. 이후 요청 하나만 시험으로 보내(half_open)
+  성공하면 닫고(closed), 실패하면 다시 엶
+
+재시도는 조회 요청(GET/HEAD)에만 적용하며, 오프라인 모드 거부·회로 차단·요청 제한 대기 초과는 재시도하지 않습니다.
+CircuitOpenError는 연결 오류로 처리되므로 도구는 로컬 저장소 대체 응답을 그대로 사용합니다.
+"""
+
+import email.utils
+import logging
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+import requests  # type: ignore
+
+from mcp_kr_legislation.apis.health import UpstreamUnavailableError, is_unavailable_error
+from mcp_kr_legislation.apis.throttle import ThrottleTimeoutError
+from mcp_kr_legislation.config import legislation_config
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_METHODS = ("GET", "HEAD")
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """target 회로가 열려 있어 업스트림을 호출하지 않았음 (연결 오류로 처리됨)"""
+
+
+def is_fast_failure(error: BaseException) -> bool:
+    """업스트림을 호출하지 않고 바로 실패한 오류인지 여부 (오프라인 모드, 회로 차단 - 비동기 변환 오류 포함)"""
+    while error is not None:
+        if isinstance(error, (UpstreamUnavailableError, CircuitOpenError)):
+            return True
+        error = error.__cause__  # type: ignore[assignment]
+    return False
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환 (해석할 수 없으면 None)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """지수 백오프 + full jitter 재시도 정책"""
+
+    def __init__(self,
+                 max_attempts: int = 3,
+                 base_delay: float = 0.5,
+                 max_delay: float = 8.0,
+                 max_elapsed: float = 30.0):
+        """
+        Args:
+            max_attempts: 첫 요청을 포함한 최대 시도 횟수 (1이면 재시도 안 함)
+            base_delay: 첫 재시도 대기 시간 상한(초), 재시도마다 두 배
+            max_delay: 재시도 한 번의 최대 대기 시간(초)
+            max_elapsed: 이 시간(초)이 지나면 더 재시도하지 않음 (첫 요청 시작 기준, 대기 시간 포함)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_elapsed = max_elapsed
+
+    def backoff(self, retry: int, retry_after: Optional[float] = None) -> float:
+        """retry번째(0부터) 재시도 전 대기 시간(초) - Retry-After가 있으면 그 이상 (max_delay까지)"""
+        delay = random.uniform(0.0, min(self.max_delay, self.base_delay * (2 ** retry)))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_attempts": self.max_attempts,
+            "base_delay_seconds": self.base_delay,
+            "max_delay_seconds": self.max_delay,
+            "max_elapsed_seconds": self.max_elapsed,
+        }
+
+
+class RetryBudget:
+    """최근 window초 요청 수에 비례하는 재시도 예산 (스레드 안전)"""
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 5, window: float = 10.0):
+        """
+        Args:
+            ratio: 요청 하나당 허용하는 재시도 비율 (0.2면 요청 5건당 재시도 1건)
+            min_retries: 요청이 적을 때도 window 안에서 허용하는 재시도 수
+            window: 집계 구간(초)
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._lock = threading.Lock()
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._exhausted = 0
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window
+        for events in (self._requests, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
+
+    def _allowed(self) -> int:
+        return self.min_retries + int(len(self._requests) * self.ratio)
+
+    def record_request(self) -> None:
+        """첫 요청 기록 (재시도 예산 적립)"""
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            self._requests.append(now)
+
+    def try_spend(self) -> bool:
+        """재시도 하나를 예산에서 차감 (예산이 없으면 False)"""
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            if len(self._retries) >= self._allowed():
+                self._exhausted += 1
+                return False
+            self._retries.append(now)
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._prune(time.monotonic())
+            allowed = self._allowed()
+            return {
+                "ratio": self.ratio,
+                "min_retries": self.min_retries,
+                "window_seconds": self.window,
+                "recent_requests": len(self._requests),
+                "recent_retries": len(self._retries),
+                "remaining": max(0, allowed - len(self._retries)),
+                "exhausted": self._exhausted,
+            }
+
+
+class CircuitBreaker:
+    """target 하나의 회로 차단기 (closed → open → half_open → closed, 스레드 안전)"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Args:
+            name: target 이름 (로그/통계용)
+            failure_threshold: 회로를 열 연속 실패 수
+            reset_timeout: 회로를 연 뒤 시험 요청을 보내기까지 기다릴 시간(초)
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._opened = 0
+        self._rejected = 0
+        self._last_error: Optional[str] = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == self.OPEN and self._opened_at is not None and now - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow(self) -> None:
+        """요청 전 확인 - 허용되면 결과를 record_success/record_failure/release 중 하나로 반드시 알려야 함
+
+        Raises:
+            CircuitOpenError: 회로가 열려 있거나 시험 요청이 이미 진행 중
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            self._rejected += 1
+            if state == self.OPEN and self._opened_at is not None:
+                remaining = max(0.0, self.reset_timeout - (now - self._opened_at))
+                message = f"'{self.name}' 요청 회로 차단 중 ({remaining:.0f}초 후 재시도)"
+            else:
+                message = f"'{self.name}' 요청 회로 차단 중 (복구 확인 요청 진행 중)"
+        raise CircuitOpenError(message)
+
+    def record_success(self) -> None:
+        """업스트림 응답 수신 (시험 요청이 성공하면 회로를 닫음)"""
+        with self._lock:
+            self._consecutive_failures = 0
+            self._trial_in_flight = False
+            if self._state == self.CLOSED:
+                return
+            self._state = self.CLOSED
+            self._opened_at = None
+        logger.info(f"'{self.name}' 요청 회로 복구 - 다시 법제처 API를 호출합니다")
+
+    def record_failure(self, error: Any) -> None:
+        """업스트림 장애 기록 (연속 실패가 기준에 도달하거나 시험 요청이 실패하면 회로를 엶)"""
+        with self._lock:
+            self._consecutive_failures += 1
+            self._last_error = str(error)[:200]
+            state = self._current_state(time.monotonic())
+            if state == self.OPEN:
+                return
+            if state == self.CLOSED and self._consecutive_failures < self.failure_threshold:
+                return
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+            self._opened += 1
+            failures = self._consecutive_failures
+        logger.warning(
+            f"'{self.name}' 요청 연속 {failures}회 실패 - 회로 차단 "
+            f"({self.reset_timeout:.0f}초 동안 호출하지 않음): {error}"
+        )
+
+    def release(self) -> None:
+        """결과 판정 없이 허용 반환 (요청 제한 대기 초과, 취소 등 업스트림 상태와 무관한 실패)"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            retry_in = None
+            if state == self.OPEN and self._opened_at is not None:
+                retry_in = round(max(0.0, self.reset_timeout - (now - self._opened_at)), 1)
+            return {
+                "state": state,
+                "consecutive_failures": self._consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "reset_timeout_seconds": self.reset_timeout,
+                "retry_in_seconds": retry_in,
+                "times_opened": self._opened,
+                "rejected_requests": self._rejected,
+                "last_error": self._last_error,
+            }
+
+
+class RetryCall:
+    """요청 하나의 시도/재시도 판단 (전송 계층이 시도마다 호출)"""
+
+    def __init__(self, resilience: "UpstreamResilience", method: str, target: str):
+        self.resilience = resilience
+        self.breaker = resilience.breaker(target)
+        self.retryable = method.upper() in RETRYABLE_METHODS
+        self.started = time.monotonic()
+        self.attempts = 0
+        resilience.budget.record_request()
+
+    def begin(self) -> None:
+        """시도 시작 (회로가 열려 있으면 CircuitOpenError)"""
+        self.breaker.allow()
+        self.attempts += 1
+
+    def abandon(self) -> None:
+        """판정 없이 시도 종료 (취소 등)"""
+        self.breaker.release()
+
+    def failed(self, error: BaseException) -> Optional[float]:
+        """요청 예외 기록 후 재시도 대기 시간 반환 (재시도하지 않으면 None)"""
+        if isinstance(error, ThrottleTimeoutError) or not is_unavailable_error(error):
+            self.breaker.release()
+            return self._give_up()
+        self.breaker.record_failure(error)
+        return self._next_delay(None)
+
+    def responded(self, status_code: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """응답 상태 기록 후 재시도 대기 시간 반환 (재시도하지 않으면 None)"""
+        if status_code >= 500:
+            self.breaker.record_failure(f"HTTP {status_code}")
+        elif status_code == 429:
+            self.breaker.release()
+        else:
+            self.breaker.record_success()
+            return self._give_up()
+        if status_code not in RETRYABLE_STATUS_CODES:
+            return self._give_up()
+        return self._next_delay(parse_retry_after(retry_after))
+
+    def _next_delay(self, retry_after: Optional[float]) -> Optional[float]:
+        policy = self.resilience.policy
+        if not self.retryable or self.attempts >= policy.max_attempts:
+            return self._give_up()
+        if self.breaker.state == CircuitBreaker.OPEN:
+            return self._give_up()
+        delay = policy.backoff(self.attempts - 1, retry_after)
+        if time.monotonic() - self.started + delay > policy.max_elapsed:
+            return self._give_up()
+        if not self.resilience.budget.try_spend():
+            return self._give_up()
+        self.resilience.count("retries")
+        return delay
+
+    def _give_up(self) -> None:
+        if self.attempts > 1:
+            self.resilience.count("retried_requests")
+        return None
+
+
+class UpstreamResilience:
+    """재시도 정책·예산과 target별 회로 차단기를 관리"""
+
+    def __init__(self,
+                 policy: Optional[RetryPolicy] = None,
+                 budget: Optional[RetryBudget] = None,
+                 failure_threshold: int = 5,
+                 reset_timeout: float = 30.0):
+        """
+        Args:
+            policy: 재시도 정책 (기본값 RetryPolicy())
+            budget: 재시도 예산 (기본값 RetryBudget())
+            failure_threshold: target 회로를 열 연속 실패 수
+            reset_timeout: 회로를 연 뒤 시험 요청까지 기다릴 시간(초)
+        """
+        self.policy = policy or RetryPolicy()
+        self.budget = budget or RetryBudget()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self._counters = {"retries": 0, "retried_requests": 0}
+
+    def breaker(self, target: str) -> CircuitBreaker:
+        """target별 회로 차단기 (처음 사용할 때 생성)"""
+        key = target or "(없음)"
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = CircuitBreaker(key, self.failure_threshold, self.reset_timeout)
+            return breaker
+
+    def call(self, method: str, target: str) -> RetryCall:
+        """요청 하나의 재시도 판단 시작"""
+        return RetryCall(self, method, target)
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """재시도·재시도 예산·target별 회로 상태 통계"""
+        with self._lock:
+            breakers = dict(self._breakers)
+            counters = dict(self._counters)
+        circuits = {target: breaker.stats() for target, breaker in sorted(breakers.items())}
+        return {
+            "retry_policy": self.policy.stats(),
+            "retry_budget": self.budget.stats(),
+            "retries": counters["retries"],
+            "retried_requests": counters["retried_requests"],
+            "open_circuits": [target for target, stats in circuits.items() if stats["state"] != CircuitBreaker.CLOSED],
+            "circuits": circuits,
+        }
+
+
+_resilience: Optional[UpstreamResilience] = None
+_resilience_lock = threading.Lock()
+
+
+def get_resilience() -> UpstreamResilience:
+    """프로세스 공용 재시도/회로 차단기 반환 (최초 호출 시 설정값으로 생성)"""
+    global _resilience
+    if _resilience is None:
+        with _resilience_lock:
+            if _resilience is None:
+                config = legislation_config
+                if config is not None:
+                    _resilience = UpstreamResilience(
+                        policy=RetryPolicy(
+                            max_attempts=config.retry_max_attempts,
+                            base_delay=config.retry_base_delay,
+                            max_delay=config.retry_max_delay,
+                            max_elapsed=config.retry_max_elapsed,
+                        ),
+                        budget=RetryBudget(ratio=config.retry_budget_ratio, min_retries=config.retry_budget_min),
+                        failure_threshold=config.circuit_failure_threshold,
+                        reset_timeout=config.circuit_reset_timeout,
+                    )
+                else:
+                    _resilience = UpstreamResilience()
+    return _resilience
+
+
+def resilience_stats() -> Dict[str, Any]:
+    """재시도/회로 차단기 통계"""
+    return get_resilience().stats()
@@ -0,0 +1,150 @@
+"""
+동일 업스트림 요청 병합(single-flight) 계층
+
+여러 세션이 같은 순간 같은 요청(예: 세법 개정 직후 소득세법 get_law_detail)을 보내면
+첫 요청(leader)만 업스트림을 호출하고 파싱하며, 나머지 요청은 그 결과를 공유합니다.
+요청 키는 정규화된 URL(쿼리 파라미터 정렬)로 만듭니다.
+"""
+
+import asyncio
+import copy
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+def canonical_request_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """URL과 추가 파라미터를 정렬된 쿼리 문자열로 정규화한 요청 키 생성"""
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    if params:
+        query.update({k: str(v) for k, v in params.items() if v is not None})
+    return f"{parts.scheme}://{parts.netloc}{parts.path}?{urlencode(sorted(query.items()))}"
+
+
+class _Call:
+    """진행 중인 동기 요청 하나의 결과 보관소"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _AsyncCall:
+    """진행 중인 비동기 요청 하나 (업스트림 요청 task와 대기 중인 요청 수)"""
+
+    def __init__(self, task: "asyncio.Task[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """키별 진행 중 요청 병합기 (스레드/이벤트 루프 모두 지원)
+
+    leader가 받은 결과를 그대로 반환하고, 병합된 요청에는 결과의 깊은 복사본을 반환해
+    호출자가 결과를 수정해도 다른 요청에 영향을 주지 않도록 합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._async_calls: Dict[Tuple[int, str], _AsyncCall] = {}
+        self._leader_calls = 0
+        self._coalesced_hits = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """같은 키의 요청이 진행 중이면 그 결과를 기다려 공유하고, 아니면 fn을 실행"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._coalesced_hits += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._leader_calls += 1
+                leader = True
+
+        if not leader:
+            logger.debug(f"진행 중인 요청에 병합: {key}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """do의 비동기 버전 (같은 이벤트 루프 안의 요청끼리 병합)
+
+        업스트림 요청은 병합기가 소유한 별도 task에서 실행되므로, leader가 취소되어도
+        (클라이언트 연결 종료 등) 나머지 요청은 결과를 그대로 받습니다.
+        기다리는 요청이 모두 취소된 경우에만 업스트림 요청도 취소합니다.
+        """
+        loop = asyncio.get_running_loop()
+        slot = (id(loop), key)
+
+        call = self._async_calls.get(slot)
+        leader = call is None
+        if call is None:
+            call = _AsyncCall(loop.create_task(fn()))
+            self._async_calls[slot] = call
+            call.task.add_done_callback(lambda task: self._finish_async(slot, call, task))
+            with self._lock:
+                self._leader_calls += 1
+        else:
+            with self._lock:
+                self._coalesced_hits += 1
+            logger.debug(f"진행 중인 비동기 요청에 병합: {key}")
+
+        call.waiters += 1
+        try:
+            # 대기 중인 요청이 취소되어도 업스트림 요청은 계속 진행되도록 shield
+            result = await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # 기다리는 요청이 모두 취소됨 - 새 요청이 취소 중인 task에 병합되지 않도록 먼저 제거
+                if self._async_calls.get(slot) is call:
+                    self._async_calls.pop(slot, None)
+                call.task.cancel()
+        return result if leader else copy.deepcopy(result)
+
+    def _finish_async(self, slot: Tuple[int, str], call: "_AsyncCall", task: "asyncio.Task[Any]") -> None:
+        if self._async_calls.get(slot) is call:
+            self._async_calls.pop(slot, None)
+        if not task.cancelled():
+            # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """요청 병합 통계"""
+        with self._lock:
+            total = self._leader_calls + self._coalesced_hits
+            return {
+                "upstream_calls": self._leader_calls,
+                "coalesced_hits": self._coalesced_hits,
+                "coalesced_ratio": round(self._coalesced_hits / total, 3) if total else 0.0,
+                "in_flight": len(self._calls) + len(self._async_calls),
+            }
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """프로세스 공용 요청 병합기 반환"""
+    return _single_flight
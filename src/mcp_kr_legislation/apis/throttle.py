@@ -0,0 +1,356 @@
+"""
+업스트림 요청 속도 제한(token bucket)과 target별 동시 요청 격벽(bulkhead)
+
+- TokenBucket: OC(인증키)별 초당 요청 수 제한 (burst까지는 바로 보내고 이후 rate 속도로 보충)
+- Bulkhead: target별 동시 요청 수 상한 (lsHstInf/lsStmd/lawHst처럼 느린 target이
+  커넥션과 워커를 모두 차지해 빠른 law 검색이 밀리지 않도록)
+- RequestThrottle: 전송 계층이 요청마다 URL/파라미터의 OC·target으로 두 제한을 적용하고 대기열 통계를 집계
+
+동기(스레드)·비동기(이벤트 루프) 요청이 같은 제한을 공유하며, 격벽 대기는 먼저 온 순서대로 처리합니다.
+max_wait 안에 차례가 오지 않는 요청은 ThrottleTimeoutError로 실패합니다 (업스트림 장애로 집계하지 않음, 비동기 전송 계층은 httpx.PoolTimeout으로 변환).
+
+설정 예시 (TARGET_CONCURRENCY): "lsHstInf=2,lsStmd=2,lawHst=2"
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlsplit
+
+import requests  # type: ignore
+
+from mcp_kr_legislation.config import legislation_config
+
+logger = logging.getLogger(__name__)
+
+
+class ThrottleTimeoutError(requests.exceptions.RequestException):
+    """속도 제한/격벽 대기 시간 초과 (업스트림을 호출하지 않음)"""
+
+
+def parse_target_limits(spec: str) -> Dict[str, int]:
+    """"lsHstInf=2,lsStmd=2" 형식의 target별 동시 요청 수 설정 파싱 (잘못된 항목은 경고 후 무시)"""
+    limits: Dict[str, int] = {}
+    for item in (spec or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        target, _, value = item.partition("=")
+        try:
+            limits[target.strip()] = max(1, int(value))
+        except ValueError:
+            logger.warning(f"잘못된 target 동시 요청 수 설정 무시: '{item}'")
+    return limits
+
+
+def request_identity(url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[str, str]:
+    """요청 URL 쿼리와 파라미터에서 (OC, target) 추출 (없으면 빈 문자열)"""
+    query = dict(parse_qsl(urlsplit(url).query))
+    if params:
+        query.update({str(k): str(v) for k, v in params.items() if v is not None})
+    return query.get("OC", ""), query.get("target", "")
+
+
+class TokenBucket:
+    """초당 rate개씩 보충되고 burst개까지 쌓이는 토큰 버킷 (스레드 안전)
+
+    토큰이 부족하면 미리 예약해 음수로 내려가며, 음수만큼이 대기 중인 요청 수입니다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: 초당 보충되는 토큰 수 (0 이하면 제한 없음)
+            burst: 최대 토큰 수 (한 번에 몰아서 보낼 수 있는 요청 수)
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._acquired = 0
+        self._delayed = 0
+        self._rejected = 0
+        self._total_delay = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, max_wait: float = float("inf")) -> float:
+        """토큰 하나를 예약하고 기다려야 할 시간(초) 반환
+
+        Raises:
+            ThrottleTimeoutError: 기다릴 시간이 max_wait보다 김 (예약하지 않음)
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            self._refill(time.monotonic())
+            delay = (1.0 - self._tokens) / self.rate if self._tokens < 1.0 else 0.0
+            if delay > max_wait:
+                self._rejected += 1
+                raise ThrottleTimeoutError(f"요청 속도 제한 대기 시간 초과 ({delay:.1f}초 > {max_wait:.1f}초)")
+            self._tokens -= 1.0
+            self._acquired += 1
+            if delay > 0:
+                self._delayed += 1
+                self._total_delay += delay
+        return delay
+
+    def acquire(self, max_wait: float = float("inf")) -> None:
+        """토큰 하나를 받을 때까지 대기 (블로킹)"""
+        delay = self.reserve(max_wait)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, max_wait: float = float("inf")) -> None:
+        """토큰 하나를 받을 때까지 대기 (이벤트 루프를 블로킹하지 않음)"""
+        delay = self.reserve(max_wait)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "rate_per_second": self.rate,
+                "burst": self.burst,
+                "available_tokens": round(max(0.0, self._tokens), 2),
+                "queued": int(max(0.0, -self._tokens) + 0.999),
+                "acquired": self._acquired,
+                "delayed": self._delayed,
+                "rejected": self._rejected,
+                "avg_delay_ms": round(self._total_delay / self._delayed * 1000, 1) if self._delayed else 0.0,
+            }
+
+
+class _ThreadWaiter:
+    def __init__(self) -> None:
+        self.event = threading.Event()
+
+    def grant(self) -> None:
+        self.event.set()
+
+
+class _AsyncWaiter:
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.future: "asyncio.Future[bool]" = loop.create_future()
+
+    def grant(self) -> None:
+        def resolve() -> None:
+            if not self.future.done():
+                self.future.set_result(True)
+
+        self.loop.call_soon_threadsafe(resolve)
+
+
+class Bulkhead:
+    """동시 요청 수 상한 (스레드와 이벤트 루프 공용, 먼저 기다린 순서대로 자리 배정)"""
+
+    def __init__(self, name: str, max_concurrent: int):
+        """
+        Args:
+            name: 통계 표시용 이름 (target)
+            max_concurrent: 동시에 실행할 요청 수 상한
+        """
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self._lock = threading.Lock()
+        self._active = 0
+        self._waiters: Deque[Union[_ThreadWaiter, _AsyncWaiter]] = deque()
+        self._peak_waiting = 0
+        self._acquired = 0
+        self._queued = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+
+    def _try_enter(self, waiter: Union[_ThreadWaiter, _AsyncWaiter]) -> bool:
+        """바로 들어갈 수 있으면 True, 아니면 대기열에 추가 (호출자가 잠금 보유)"""
+        if self._active < self.max_concurrent and not self._waiters:
+            self._active += 1
+            self._acquired += 1
+            return True
+        self._waiters.append(waiter)
+        self._queued += 1
+        self._peak_waiting = max(self._peak_waiting, len(self._waiters))
+        return False
+
+    def _abandon(self, waiter: Union[_ThreadWaiter, _AsyncWaiter]) -> bool:
+        """대기를 포기 (이미 자리를 받았으면 False - 호출자가 그 자리를 사용하거나 반납)"""
+        with self._lock:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                self._timeouts += 1
+                return True
+            return False
+
+    def _entered(self, started: float) -> None:
+        with self._lock:
+            self._acquired += 1
+            self._total_wait += time.monotonic() - started
+
+    def acquire(self, timeout: Optional[float] = None) -> None:
+        """자리가 날 때까지 대기 (블로킹)
+
+        Raises:
+            ThrottleTimeoutError: timeout 안에 자리를 받지 못함
+        """
+        waiter = _ThreadWaiter()
+        with self._lock:
+            if self._try_enter(waiter):
+                return
+        started = time.monotonic()
+        if not waiter.event.wait(timeout) and self._abandon(waiter):
+            raise ThrottleTimeoutError(f"{self.name} 동시 요청 대기 시간 초과 ({timeout}초)")
+        self._entered(started)
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> None:
+        """자리가 날 때까지 대기 (이벤트 루프를 블로킹하지 않음)"""
+        waiter = _AsyncWaiter(asyncio.get_running_loop())
+        with self._lock:
+            if self._try_enter(waiter):
+                return
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except asyncio.TimeoutError:
+            if self._abandon(waiter):
+                raise ThrottleTimeoutError(f"{self.name} 동시 요청 대기 시간 초과 ({timeout}초)")
+        except asyncio.CancelledError:
+            # 자리를 받은 뒤 취소되었으면 다음 대기자에게 넘김
+            if not self._abandon(waiter):
+                self.release()
+            raise
+        self._entered(started)
+
+    def release(self) -> None:
+        """자리 반납 (대기자가 있으면 바로 넘김)"""
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if isinstance(waiter, _AsyncWaiter) and waiter.loop.is_closed():
+                    continue
+                waiter.grant()
+                return
+            self._active -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            waited = self._queued - self._timeouts - len(self._waiters)
+            return {
+                "max_concurrent": self.max_concurrent,
+                "active": self._active,
+                "waiting": len(self._waiters),
+                "peak_waiting": self._peak_waiting,
+                "acquired": self._acquired,
+                "queued": self._queued,
+                "timeouts": self._timeouts,
+                "avg_wait_ms": round(self._total_wait / waited * 1000, 1) if waited > 0 else 0.0,
+            }
+
+
+class RequestThrottle:
+    """OC별 토큰 버킷 + target별 격벽을 함께 적용하는 업스트림 요청 제한"""
+
+    def __init__(self,
+                 rate: float = 10.0,
+                 burst: int = 20,
+                 target_limits: Optional[Dict[str, int]] = None,
+                 max_wait: float = 30.0):
+        """
+        Args:
+            rate: OC별 초당 요청 수 (0 이하면 제한 없음)
+            burst: OC별 연속 허용 요청 수
+            target_limits: target → 동시 요청 수 상한 (없는 target은 제한 없음)
+            max_wait: 요청 하나가 제한 때문에 기다릴 수 있는 최대 시간(초)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_wait = max_wait
+        self.bulkheads = {target: Bulkhead(target, limit) for target, limit in (target_limits or {}).items()}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, oc: str) -> TokenBucket:
+        """OC별 토큰 버킷 (처음 사용할 때 생성)"""
+        with self._lock:
+            bucket = self._buckets.get(oc)
+            if bucket is None:
+                bucket = self._buckets[oc] = TokenBucket(self.rate, self.burst)
+            return bucket
+
+    @contextmanager
+    def limit(self, oc: str, target: str) -> Iterator[None]:
+        """격벽 자리와 토큰을 받은 뒤 요청 실행 (블로킹, 격벽 먼저 받아 대기 중 토큰을 쓰지 않음)"""
+        deadline = time.monotonic() + self.max_wait
+        bulkhead = self.bulkheads.get(target)
+        if bulkhead is not None:
+            bulkhead.acquire(self.max_wait)
+        try:
+            self.bucket(oc).acquire(max(0.0, deadline - time.monotonic()))
+            yield
+        finally:
+            if bulkhead is not None:
+                bulkhead.release()
+
+    @asynccontextmanager
+    async def limit_async(self, oc: str, target: str) -> AsyncIterator[None]:
+        """limit의 비동기 버전 (이벤트 루프를 블로킹하지 않음)"""
+        deadline = time.monotonic() + self.max_wait
+        bulkhead = self.bulkheads.get(target)
+        if bulkhead is not None:
+            await bulkhead.acquire_async(self.max_wait)
+        try:
+            await self.bucket(oc).acquire_async(max(0.0, deadline - time.monotonic()))
+            yield
+        finally:
+            if bulkhead is not None:
+                bulkhead.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """OC별 속도 제한, target별 동시 요청/대기열 통계 (OC는 앞 3자만 표시)"""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {
+            "max_wait_seconds": self.max_wait,
+            "rate_limits": {f"{oc[:3]}***" if oc else "(없음)": bucket.stats() for oc, bucket in buckets.items()},
+            "bulkheads": {target: bulkhead.stats() for target, bulkhead in self.bulkheads.items()},
+        }
+
+
+_throttle: Optional[RequestThrottle] = None
+_throttle_lock = threading.Lock()
+
+
+def get_request_throttle() -> RequestThrottle:
+    """프로세스 공용 요청 제한 반환 (최초 호출 시 설정값으로 생성)"""
+    global _throttle
+    if _throttle is None:
+        with _throttle_lock:
+            if _throttle is None:
+                config = legislation_config
+                if config is not None:
+                    _throttle = RequestThrottle(
+                        rate=config.rate_limit_per_second,
+                        burst=config.rate_limit_burst,
+                        target_limits=parse_target_limits(config.target_concurrency),
+                        max_wait=config.throttle_max_wait,
+                    )
+                else:
+                    _throttle = RequestThrottle()
+                logger.info(
+                    f"요청 제한 초기화 - OC별 초당 {_throttle.rate}건 (burst {_throttle.burst}), "
+                    f"target별 동시 요청 {({t: b.max_concurrent for t, b in _throttle.bulkheads.items()})}"
+                )
+    return _throttle
+
+
+def throttle_stats() -> Dict[str, Any]:
+    """요청 제한 통계"""
+    return get_request_throttle().stats()
@@ -0,0 +1,443 @@
+"""
+법제처 OPEN API 공용 HTTP 전송 계층
+
+모든 업스트림 호출 경로(도구 공통 요청 함수, LegislationClient, 캐시 유틸리티 등)가
+하나의 커넥션 풀을 공유하도록 keep-alive 세션을 제공합니다.
+비동기 경로(AsyncLegislationClient, async 도구)는 httpx 기반 AsyncHTTPTransport를 사용합니다.
+두 전송 계층 모두 호출 결과를 업스트림 상태 감시(health)에 기록하고, 오프라인 모드에서는 호출하지 않고 바로 실패합니다.
+요청은 OC별 속도 제한과 target별 동시 요청 격벽(throttle)을 거쳐 전송되며,
+일시적 장애는 지수 백오프로 재시도하고 장애가 이어지는 target은 회로 차단기로 바로 실패합니다(resilience).
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import socket
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
+
+from mcp_kr_legislation.apis.health import UpstreamHealth, UpstreamUnavailableError, get_upstream_health, is_unavailable_error
+from mcp_kr_legislation.apis.resilience import CircuitOpenError, get_resilience
+from mcp_kr_legislation.apis.throttle import ThrottleTimeoutError, get_request_throttle, request_identity
+from mcp_kr_legislation.config import legislation_config
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPTransport:
+    """커넥션 풀 기반 HTTP 전송 계층 (스레드 안전)"""
+
+    def __init__(self,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 20,
+                 keep_alive: bool = True,
+                 default_timeout: int = 30):
+        """
+        Args:
+            pool_connections: 호스트별로 유지할 커넥션 풀 개수
+            pool_maxsize: 풀 하나당 최대 커넥션 수
+            keep_alive: False면 매 요청 후 커넥션을 닫음
+            default_timeout: timeout 미지정 요청의 기본 타임아웃(초)
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.default_timeout = default_timeout
+
+        self._adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self._session = requests.Session()
+        self._session.mount("http://", self._adapter)
+        self._session.mount("https://", self._adapter)
+        self._session.headers["Connection"] = "keep-alive" if keep_alive else "close"
+
+        self._lock = threading.Lock()
+        self._active = 0
+        self._peak_active = 0
+        self._total_requests = 0
+        self._total_errors = 0
+        self._total_elapsed = 0.0
+
+    def request(self, method: str, url: str, timeout: Optional[float] = None,
+                check_health: bool = True, **kwargs) -> requests.Response:
+        """공유 세션으로 요청 실행 (재시도 후에도 실패하면 requests 예외를 그대로 전파)
+
+        Args:
+            check_health: False면 상태 감시·재시도·회로 차단기를 거치지 않음 (오프라인 모드에서도 1회 요청, 결과 미기록 - 상태 점검용)
+
+        Raises:
+            UpstreamUnavailableError: 오프라인 모드 (requests ConnectionError 하위 클래스)
+            CircuitOpenError: target 회로 차단 중 (requests ConnectionError 하위 클래스)
+            ThrottleTimeoutError: 요청 제한 대기 시간 초과
+        """
+        health = get_upstream_health() if check_health else None
+        oc, target = request_identity(url, kwargs.get("params"))
+        throttle = get_request_throttle()
+        if health is None:
+            with throttle.limit(oc, target):
+                return self._send(method, url, timeout, **kwargs)
+
+        health.check()
+        call = get_resilience().call(method, target)
+        while True:
+            call.begin()
+            try:
+                # OC별 속도 제한과 target별 격벽 (제한 대기 시간은 요청 타임아웃에 포함하지 않음, 재시도 대기 중에는 격벽을 비움)
+                with throttle.limit(oc, target):
+                    response = self._send(method, url, timeout, **kwargs)
+            except requests.RequestException as e:
+                delay = call.failed(e)
+                if delay is None:
+                    if is_unavailable_error(e):
+                        health.record_failure(e, target)
+                    raise
+                logger.info(f"법제처 API 요청 재시도 {call.attempts}회 ({target}, {delay:.1f}초 후): {e}")
+                time.sleep(delay)
+                continue
+            except BaseException:
+                call.abandon()
+                raise
+            delay = call.responded(response.status_code, response.headers.get("Retry-After"))
+            if delay is None:
+                _record_response(health, response.status_code, target)
+                return response
+            logger.info(f"법제처 API 요청 재시도 {call.attempts}회 ({target}, HTTP {response.status_code}, {delay:.1f}초 후)")
+            time.sleep(delay)
+
+    def _send(self, method: str, url: str, timeout: Optional[float], **kwargs) -> requests.Response:
+        with self._lock:
+            self._active += 1
+            self._total_requests += 1
+            self._peak_active = max(self._peak_active, self._active)
+
+        started = time.monotonic()
+        try:
+            return self._session.request(method, url, timeout=timeout or self.default_timeout, **kwargs)
+        except requests.RequestException:
+            with self._lock:
+                self._total_errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._total_elapsed += time.monotonic() - started
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        """GET 요청"""
+        return self.request("GET", url, params=params, timeout=timeout, **kwargs)
+
+    def post(self, url: str, data: Any = None,
+             timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        """POST 요청"""
+        return self.request("POST", url, data=data, timeout=timeout, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """커넥션 풀 사용 현황 통계"""
+        with self._lock:
+            total = self._total_requests
+            stats: Dict[str, Any] = {
+                "pool_connections": self.pool_connections,
+                "pool_maxsize": self.pool_maxsize,
+                "keep_alive": self.keep_alive,
+                "active_requests": self._active,
+                "peak_active_requests": self._peak_active,
+                "total_requests": total,
+                "total_errors": self._total_errors,
+                "avg_latency_ms": round(self._total_elapsed / total * 1000, 1) if total else 0.0,
+            }
+
+        hosts = []
+        opened = 0
+        try:
+            pools = self._adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                idle = sum(1 for conn in list(pool.pool.queue) if conn is not None) if pool.pool else 0
+                opened += pool.num_connections
+                hosts.append({
+                    "host": f"{pool.scheme}://{pool.host}:{pool.port}",
+                    "connections_opened": pool.num_connections,
+                    "requests_served": pool.num_requests,
+                    "idle_connections": idle,
+                })
+        except Exception as e:
+            logger.debug(f"커넥션 풀 통계 수집 실패: {e}")
+
+        stats["connections_opened"] = opened
+        stats["connection_reuse_ratio"] = round(1 - opened / total, 3) if total and opened <= total else 0.0
+        stats["hosts"] = hosts
+        return stats
+
+    def close(self) -> None:
+        """세션과 풀의 모든 커넥션 종료"""
+        self._session.close()
+
+
+def _record_response(health: UpstreamHealth, status_code: int, target: str) -> None:
+    """최종 응답 상태를 target별로 업스트림 상태 감시에 기록 (재시도 중간 결과는 기록하지 않음)"""
+    if status_code >= 500:
+        health.record_failure(f"HTTP {status_code}", target)
+    else:
+        health.record_success(target)
+
+
+_transport: Optional[HTTPTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> HTTPTransport:
+    """프로세스 공용 HTTP 전송 계층 반환 (최초 호출 시 설정값으로 생성)"""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                config = legislation_config
+                if config is not None:
+                    _transport = HTTPTransport(
+                        pool_connections=config.http_pool_connections,
+                        pool_maxsize=config.http_pool_maxsize,
+                        keep_alive=config.http_keep_alive,
+                        default_timeout=config.default_timeout,
+                    )
+                else:
+                    _transport = HTTPTransport()
+                logger.info(
+                    f"HTTP 전송 계층 초기화 - pool_connections={_transport.pool_connections}, "
+                    f"pool_maxsize={_transport.pool_maxsize}, keep_alive={_transport.keep_alive}"
+                )
+    return _transport
+
+
+def close_transport() -> None:
+    """공용 HTTP 전송 계층 종료 (서버 종료 시 호출)"""
+    global _transport
+    with _transport_lock:
+        if _transport is not None:
+            _transport.close()
+            _transport = None
+
+
+class AsyncHTTPTransport:
+    """httpx.AsyncClient 기반 비동기 HTTP 전송 계층 (이벤트 루프 하나에 바인딩)"""
+
+    def __init__(self,
+                 max_connections: int = 20,
+                 keep_alive: bool = True,
+                 keepalive_expiry: float = 5.0,
+                 default_timeout: int = 30):
+        """
+        Args:
+            max_connections: 동시에 열 수 있는 최대 커넥션 수
+            keep_alive: False면 유휴 커넥션을 유지하지 않음
+            keepalive_expiry: 유휴 커넥션 유지 시간(초)
+            default_timeout: timeout 미지정 요청의 기본 타임아웃(초)
+        """
+        self.max_connections = max_connections
+        self.keep_alive = keep_alive
+        self.keepalive_expiry = keepalive_expiry
+        self.default_timeout = default_timeout
+
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections if keep_alive else 0,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._client = httpx.AsyncClient(limits=limits, timeout=default_timeout)
+
+        self._active = 0
+        self._peak_active = 0
+        self._total_requests = 0
+        self._total_errors = 0
+        self._total_elapsed = 0.0
+
+    async def request(self, method: str, url: str, timeout: Optional[float] = None, **kwargs) -> httpx.Response:
+        """공유 AsyncClient로 요청 실행 (재시도 후에도 실패하면 httpx 예외를 그대로 전파,
+        오프라인 모드나 회로 차단 중에는 바로 httpx.ConnectError)
+
+        Raises:
+            httpx.PoolTimeout: 요청 제한 대기 시간 초과 (ThrottleTimeoutError를 원인으로 연결)
+        """
+        health = get_upstream_health()
+        oc, target = request_identity(url, kwargs.get("params"))
+        throttle = get_request_throttle()
+        try:
+            health.check()
+            call = get_resilience().call(method, target)
+            call.begin()
+        except (UpstreamUnavailableError, CircuitOpenError) as e:
+            raise httpx.ConnectError(str(e)) from e
+        while True:
+            try:
+                async with throttle.limit_async(oc, target):
+                    response = await self._send(method, url, timeout, **kwargs)
+            except (httpx.HTTPError, ThrottleTimeoutError) as e:
+                delay = call.failed(e)
+                if delay is None:
+                    if is_unavailable_error(e):
+                        health.record_failure(e, target)
+                    if isinstance(e, ThrottleTimeoutError):
+                        # 비동기 호출자는 httpx 예외만 처리 (풀 대기 초과와 같은 로컬 포화라 업스트림 장애로 보지 않음)
+                        raise httpx.PoolTimeout(str(e)) from e
+                    raise
+                logger.info(f"법제처 API 요청 재시도 {call.attempts}회 ({target}, {delay:.1f}초 후): {e}")
+                await asyncio.sleep(delay)
+            except BaseException:
+                call.abandon()
+                raise
+            else:
+                delay = call.responded(response.status_code, response.headers.get("Retry-After"))
+                if delay is None:
+                    _record_response(health, response.status_code, target)
+                    return response
+                logger.info(f"법제처 API 요청 재시도 {call.attempts}회 ({target}, HTTP {response.status_code}, {delay:.1f}초 후)")
+                await asyncio.sleep(delay)
+            try:
+                call.begin()
+            except CircuitOpenError as e:
+                raise httpx.ConnectError(str(e)) from e
+
+    async def _send(self, method: str, url: str, timeout: Optional[float], **kwargs) -> httpx.Response:
+        self._active += 1
+        self._total_requests += 1
+        self._peak_active = max(self._peak_active, self._active)
+
+        # 풀 대기 시간은 타임아웃에서 제외 (동시 요청이 많을 때 대기열에서 실패하지 않도록)
+        request_timeout = httpx.Timeout(timeout or self.default_timeout, pool=None)
+
+        started = time.monotonic()
+        try:
+            return await self._client.request(method, url, timeout=request_timeout, **kwargs)
+        except httpx.HTTPError:
+            self._total_errors += 1
+            raise
+        finally:
+            self._active -= 1
+            self._total_elapsed += time.monotonic() - started
+
+    async def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+                  timeout: Optional[float] = None, **kwargs) -> httpx.Response:
+        """GET 요청"""
+        return await self.request("GET", url, params=params, timeout=timeout, **kwargs)
+
+    async def post(self, url: str, data: Any = None,
+                   timeout: Optional[float] = None, **kwargs) -> httpx.Response:
+        """POST 요청"""
+        return await self.request("POST", url, data=data, timeout=timeout, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """비동기 커넥션 풀 사용 현황 통계"""
+        total = self._total_requests
+        stats: Dict[str, Any] = {
+            "max_connections": self.max_connections,
+            "keep_alive": self.keep_alive,
+            "keepalive_expiry": self.keepalive_expiry,
+            "active_requests": self._active,
+            "peak_active_requests": self._peak_active,
+            "total_requests": total,
+            "total_errors": self._total_errors,
+            "avg_latency_ms": round(self._total_elapsed / total * 1000, 1) if total else 0.0,
+        }
+        try:
+            connections = self._client._transport._pool.connections  # type: ignore[attr-defined]
+            stats["open_connections"] = len(connections)
+            stats["idle_connections"] = sum(1 for conn in connections if conn.is_idle())
+        except Exception as e:
+            logger.debug(f"비동기 커넥션 풀 통계 수집 실패: {e}")
+        return stats
+
+    async def aclose(self) -> None:
+        """AsyncClient와 풀의 모든 커넥션 종료"""
+        await self._client.aclose()
+
+    def close_sockets(self) -> int:
+        """풀의 커넥션 소켓을 이벤트 루프 없이 직접 종료하고 종료한 수 반환
+
+        생성한 이벤트 루프가 이미 멈춰 aclose를 실행할 수 없을 때 사용합니다.
+        소켓은 shutdown으로 연결만 끊고, 파일 디스크립터는 전송 객체가 수거될 때 닫힙니다.
+        """
+        try:
+            connections = list(self._client._transport._pool.connections)  # type: ignore[attr-defined]
+        except Exception as e:
+            logger.debug(f"비동기 커넥션 풀 조회 실패: {e}")
+            return 0
+        closed = 0
+        for conn in connections:
+            try:
+                stream = conn._connection._network_stream  # type: ignore[attr-defined]
+                sock = stream.get_extra_info("socket")
+                if sock is not None:
+                    sock.shutdown(socket.SHUT_RDWR)
+                    closed += 1
+            except Exception as e:
+                logger.debug(f"비동기 커넥션 소켓 종료 실패: {e}")
+        return closed
+
+
+_async_transport: Optional[AsyncHTTPTransport] = None
+_async_transport_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_async_transport() -> AsyncHTTPTransport:
+    """현재 이벤트 루프용 공용 비동기 전송 계층 반환
+
+    httpx 커넥션 풀은 생성된 이벤트 루프에 묶이므로, 루프가 바뀌면 이전 것을 닫고 새로 생성합니다.
+    """
+    global _async_transport, _async_transport_loop
+    loop = asyncio.get_running_loop()
+    if _async_transport is None or _async_transport_loop is not loop:
+        if _async_transport is not None:
+            _retire_async_transport(_async_transport, _async_transport_loop)
+        config = legislation_config
+        if config is not None:
+            _async_transport = AsyncHTTPTransport(
+                max_connections=config.http_pool_maxsize,
+                keep_alive=config.http_keep_alive,
+                keepalive_expiry=config.http_keepalive_expiry,
+                default_timeout=config.default_timeout,
+            )
+        else:
+            _async_transport = AsyncHTTPTransport()
+        _async_transport_loop = loop
+        logger.info(f"비동기 HTTP 전송 계층 초기화 - max_connections={_async_transport.max_connections}")
+    return _async_transport
+
+
+def _retire_async_transport(transport: AsyncHTTPTransport, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """루프가 바뀌어 더 쓰지 않는 전송 계층 종료
+
+    이전 루프가 아직 돌고 있으면 그 루프에서 aclose를 실행하고, 멈췄거나 닫혔으면 소켓을 직접 종료합니다.
+    """
+    if loop is not None and loop.is_running() and not loop.is_closed():
+        future = asyncio.run_coroutine_threadsafe(transport.aclose(), loop)
+
+        def done(f: "concurrent.futures.Future[None]") -> None:
+            if not f.cancelled() and f.exception() is not None:
+                logger.warning(f"이전 비동기 전송 계층 종료 실패: {f.exception()}")
+
+        future.add_done_callback(done)
+        return
+    closed = transport.close_sockets()
+    logger.info(f"이벤트 루프 변경 - 이전 비동기 커넥션 {closed}개 종료")
+
+
+def async_transport_stats() -> Dict[str, Any]:
+    """비동기 전송 계층 통계 (아직 생성되지 않았으면 빈 통계)"""
+    if _async_transport is None:
+        return {"initialized": False}
+    return _async_transport.stats()
+
+
+async def close_async_transport() -> None:
+    """공용 비동기 전송 계층 종료 (서버 종료 시 호출)"""
+    global _async_transport, _async_transport_loop
+    if _async_transport is not None:
+        await _async_transport.aclose()
+        _async_transport = None
+        _async_transport_loop = None
@@ -0,0 +1,262 @@
+"""
+법제처 API 응답 통합 캐시
+
+모든 도구 모듈이 같은 키 규칙(get_cache_key)과 같은 캐시 인스턴스(get_cache)를 사용합니다.
+메모리 LRU 계층이 디스크 계층 앞에 있으며, 디스크 백엔드는 CACHE_BACKEND 설정(file, sqlite)으로 선택합니다.
+
+사용 예시:
+    key = get_cache_key("law", mst, "full")
+    data = load_from_cache(key)
+    if data is None:
+        data = _make_legislation_request("law", {"MST": mst}, is_detail=True)
+        save_to_cache(key, data)
+
+    # 만료 직후에도 이전 값을 바로 응답하고 백그라운드에서 갱신 (stale-while-revalidate)
+    data = fetch_with_cache(key, lambda: _make_legislation_request("law", {"MST": mst}, is_detail=True))
+
+오프라인 모드(업스트림 장애) 동안에는 만료 항목을 지우지 않고, load_last_known으로 마지막 값을 대체 응답에 사용합니다.
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from ..config import cache_config
+from ..utils.data_processor import get_cache_dir
+from .base import CacheBackend, CacheEntry
+from .codec import CacheCodec, LazyValue
+from .eviction import EVICTION_POLICIES, select_victims
+from .file import FileBackend
+from .janitor import CacheJanitor
+from .keys import get_cache_key, parse_cache_key
+from .memory import MemoryBackend
+from .policy import DEFAULT_TTL_RULES, TTLPolicy, parse_overrides
+from .refresh import BackgroundRefresher
+from .search import SearchResultCache, has_search_results, search_cache_key, search_total_count
+from .sqlite import SQLiteBackend
+from .tiered import LocalResponse, TieredCache, is_cacheable
+
+logger = logging.getLogger(__name__)
+
+# 디스크 계층 백엔드 이름 → 생성 함수 (캐시 디렉토리, 값 인코딩을 받음)
+BACKENDS: Dict[str, Callable[[Path, CacheCodec], CacheBackend]] = {
+    "file": FileBackend,
+    "sqlite": SQLiteBackend,
+}
+
+def register_backend(name: str, factory: Callable[[Path, CacheCodec], CacheBackend]) -> None:
+    """디스크 계층 백엔드 등록"""
+    BACKENDS[name] = factory
+
+_cache: Optional[TieredCache] = None
+_janitor: Optional[CacheJanitor] = None
+_search_cache: Optional[SearchResultCache] = None
+_cache_lock = threading.Lock()
+
+def _upstream_offline() -> bool:
+    # 캐시는 전송 계층보다 아래 계층이므로 상태 감시 모듈은 필요할 때 가져옴
+    from ..apis.health import get_upstream_health
+    return get_upstream_health().is_offline()
+
+def _serving_local_data() -> bool:
+    from ..apis.health import serving_local_data
+    return serving_local_data()
+
+def _create_cache() -> TieredCache:
+    memory = MemoryBackend(max_entries=cache_config.memory_max_entries)
+    disk: Optional[CacheBackend] = None
+    factory = BACKENDS.get(cache_config.backend)
+    if factory is None:
+        logger.warning(f"알 수 없는 캐시 백엔드 '{cache_config.backend}' - file 백엔드를 사용합니다.")
+        factory = FileBackend
+    try:
+        codec = CacheCodec(cache_config.serializer, cache_config.compression or None)
+        disk = factory(Path(get_cache_dir()), codec)
+    except Exception as e:
+        # 디스크를 쓸 수 없어도 메모리 캐시로 서비스는 계속됨
+        logger.warning(f"디스크 캐시 초기화 실패 (메모리 캐시만 사용): {e}")
+    policy = cache_config.eviction_policy
+    if policy not in EVICTION_POLICIES:
+        logger.warning(f"알 수 없는 퇴출 정책 '{policy}' - lru를 사용합니다.")
+        policy = "lru"
+    default_ttl = cache_config.ttl_days * 86400
+    ttl_policy = TTLPolicy(default_ttl, parse_overrides(cache_config.ttl_overrides) + DEFAULT_TTL_RULES)
+    return TieredCache(
+        memory,
+        disk,
+        default_ttl=default_ttl,
+        max_bytes=cache_config.max_size_mb * 1024 * 1024,
+        eviction_policy=policy,
+        ttl_policy=ttl_policy,
+        stale_grace=cache_config.stale_grace,
+        refresher=BackgroundRefresher(cache_config.refresh_workers) if cache_config.stale_grace > 0 else None,
+        keep_expired=_upstream_offline,
+    )
+
+def get_cache() -> TieredCache:
+    """프로세스 공용 캐시 반환 (최초 호출 시 설정값으로 생성)"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = _create_cache()
+                logger.info(f"캐시 초기화 - backend={cache_config.backend}, memory_max_entries={cache_config.memory_max_entries}")
+    return _cache
+
+def get_cache_janitor() -> CacheJanitor:
+    """공용 캐시 정리기 반환"""
+    global _janitor
+    if _janitor is None:
+        _janitor = CacheJanitor(get_cache(), interval=cache_config.janitor_interval)
+    return _janitor
+
+def get_search_cache() -> SearchResultCache:
+    """공용 검색 응답 캐시 반환"""
+    global _search_cache
+    if _search_cache is None:
+        _search_cache = SearchResultCache(get_cache())
+    return _search_cache
+
+def cache_stats() -> Dict[str, Any]:
+    """캐시 및 정리 작업 통계"""
+    cache = get_cache()
+    stats = cache.stats()
+    stats["janitor"] = get_cache_janitor().stats()
+    stats["search"] = get_search_cache().stats()
+    if cache.ttl_policy is not None:
+        stats["ttl_policy"] = cache.ttl_policy.describe()
+    return stats
+
+def close_cache() -> None:
+    """공용 캐시 종료 (서버 종료 시 호출)"""
+    global _cache, _janitor, _search_cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+            _cache = None
+            _janitor = None
+            _search_cache = None
+
+def load_from_cache(cache_key: str) -> Optional[Any]:
+    """캐시에서 데이터 로드 (없거나 만료되었으면 None)"""
+    try:
+        return get_cache().get(cache_key)
+    except Exception as e:
+        logger.warning(f"캐시 로드 중 오류 (API 호출로 대체됨): {e}")
+        return None
+
+def save_to_cache(cache_key: str, data: Any, ttl: Optional[float] = None) -> None:
+    """캐시에 데이터 저장 (로컬 저장소 응답으로 만든 값은 저장하지 않음)"""
+    try:
+        if isinstance(data, LocalResponse) or _serving_local_data():
+            return
+        get_cache().set(cache_key, data, ttl=ttl)
+    except Exception as e:
+        logger.warning(f"캐시 저장 중 오류 (서비스는 계속됨): {e}")
+
+def fetch_with_cache(cache_key: str,
+                     fetch: Callable[[], Any],
+                     ttl: Optional[float] = None,
+                     cacheable: Callable[[Any], bool] = is_cacheable) -> Any:
+    """캐시 값 반환, 없으면 fetch 결과를 저장 후 반환
+
+    만료 직후(CACHE_STALE_GRACE 이내)에는 이전 값을 바로 반환하고 백그라운드에서 갱신합니다.
+    캐시 장애 시에는 fetch를 직접 호출합니다.
+    업스트림 장애로 로컬 저장소 응답을 사용해 만든 값은 저장하지 않습니다.
+    """
+    try:
+        cache = get_cache()
+    except Exception as e:
+        logger.warning(f"캐시 초기화 중 오류 (API 호출로 대체됨): {e}")
+        return fetch()
+    return cache.get_or_fetch(
+        cache_key, fetch, ttl=ttl, cacheable=lambda value: cacheable(value) and not _serving_local_data()
+    )
+
+def fetch_search_with_cache(target: str, params: Dict[str, Any], fetch: Callable[[], Any]) -> Any:
+    """lawSearch.do 검색 응답을 캐시에서 반환, 없으면 fetch 결과를 저장 후 반환
+
+    키는 정렬된 검색 파라미터(OC 제외)로 만들며, 결과가 있는 응답은 search,
+    결과가 없는 응답(totalCnt=0)은 negative section에 각각 짧은 TTL로 저장합니다.
+    """
+    try:
+        search_cache = get_search_cache()
+    except Exception as e:
+        logger.warning(f"캐시 초기화 중 오류 (API 호출로 대체됨): {e}")
+        return fetch()
+    return search_cache.get_or_fetch(target, params, fetch)
+
+async def fetch_search_with_cache_async(target: str,
+                                        params: Dict[str, Any],
+                                        fetch: Callable[[], Awaitable[Any]],
+                                        refresh_fetch: Callable[[], Any]) -> Any:
+    """fetch_search_with_cache의 비동기 버전 (캐시 파일 I/O는 워커 스레드, 만료 응답 갱신은 refresh_fetch 사용)"""
+    try:
+        search_cache = get_search_cache()
+    except Exception as e:
+        logger.warning(f"캐시 초기화 중 오류 (API 호출로 대체됨): {e}")
+        return await fetch()
+    return await search_cache.get_or_fetch_async(target, params, fetch, refresh_fetch)
+
+def load_last_known(cache_key: str) -> Optional[CacheEntry]:
+    """만료 여부와 관계없이 마지막으로 저장된 캐시 항목 (업스트림 장애 시 대체 응답용, 없으면 None)"""
+    try:
+        return get_cache().get_last_known(cache_key)
+    except Exception as e:
+        logger.warning(f"캐시 로드 중 오류: {e}")
+        return None
+
+def load_last_known_search(target: str, params: Dict[str, Any]) -> Optional[CacheEntry]:
+    """만료 여부와 관계없이 마지막으로 저장된 검색 응답 항목 (결과 없음 응답 포함, 없으면 None)"""
+    try:
+        return get_search_cache().last_known(target, params)
+    except Exception as e:
+        logger.warning(f"검색 캐시 조회 중 오류: {e}")
+        return None
+
+def delete_from_cache(cache_key: str) -> None:
+    """캐시에서 데이터 삭제"""
+    try:
+        get_cache().delete(cache_key)
+    except Exception as e:
+        logger.warning(f"캐시 삭제 중 오류: {e}")
+
+__all__ = [
+    "BACKENDS",
+    "BackgroundRefresher",
+    "CacheBackend",
+    "CacheCodec",
+    "CacheEntry",
+    "CacheJanitor",
+    "EVICTION_POLICIES",
+    "FileBackend",
+    "LazyValue",
+    "LocalResponse",
+    "MemoryBackend",
+    "SQLiteBackend",
+    "SearchResultCache",
+    "TTLPolicy",
+    "TieredCache",
+    "cache_stats",
+    "close_cache",
+    "delete_from_cache",
+    "fetch_search_with_cache",
+    "fetch_search_with_cache_async",
+    "fetch_with_cache",
+    "get_cache",
+    "get_cache_janitor",
+    "get_cache_key",
+    "get_search_cache",
+    "has_search_results",
+    "is_cacheable",
+    "load_from_cache",
+    "load_last_known",
+    "load_last_known_search",
+    "parse_cache_key",
+    "register_backend",
+    "save_to_cache",
+    "search_cache_key",
+    "search_total_count",
+    "select_victims",
+]
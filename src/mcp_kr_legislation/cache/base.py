@@ -0,0 +1,83 @@
+"""
+캐시 백엔드 인터페이스와 캐시 항목 정의
+"""
+
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class CacheEntry:
+    """캐시 항목 하나 (값과 메타데이터)"""
+
+    key: str
+    value: Any
+    created_at: float
+    expires_at: Optional[float] = None  # None이면 만료 없음
+    target: str = ""  # API target (law, elaw, prec 등)
+    identifier: str = ""  # MST/ID 등 식별자
+    size: int = 0  # 직렬화 크기(바이트), 메모리 계층에서는 추정치
+    hits: int = 0
+    last_access: float = 0.0
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """만료 여부"""
+        if self.expires_at is None:
+            return False
+        return (now or time.time()) >= self.expires_at
+
+
+class CacheBackend(ABC):
+    """캐시 저장소 인터페이스
+
+    백엔드는 만료된 항목도 그대로 반환하며, 만료 판단은 상위 계층(TieredCache)이 합니다.
+    """
+
+    name: str = "base"
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """항목 조회 (없으면 None)"""
+
+    @abstractmethod
+    def set(self, entry: CacheEntry) -> None:
+        """항목 저장 (같은 키는 덮어씀)"""
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """항목 삭제 (삭제했으면 True)"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """전체 삭제"""
+
+    @abstractmethod
+    def iter_entries(self) -> Iterator[CacheEntry]:
+        """저장된 항목의 메타데이터 순회 (디스크 백엔드는 value가 None)"""
+
+    def expired_keys(self, now: float) -> List[str]:
+        """now 기준 만료된 항목의 키 목록"""
+        return [entry.key for entry in self.iter_entries() if entry.is_expired(now)]
+
+    def touch(self, key: str, now: float) -> None:
+        """상위 계층에서 적중한 항목의 접근 시각/횟수 반영 (퇴출 정책용)"""
+
+    def total_size(self) -> int:
+        """저장된 항목의 총 크기(바이트)"""
+        return sum(entry.size for entry in self.iter_entries())
+
+    def flush(self) -> None:
+        """메모리에만 있는 메타데이터를 영구 저장"""
+
+    def compact(self) -> None:
+        """저장 공간 정리 (기본은 flush)"""
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """백엔드 통계"""
+        return {"backend": self.name}
+
+    def close(self) -> None:
+        """리소스 정리"""
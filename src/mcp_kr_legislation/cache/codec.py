@@ -0,0 +1,166 @@
+"""
+캐시 값 직렬화 형식
+
+들여쓰기 JSON 대신 압축된 바이너리 형식으로 저장합니다.
+
+형식 (헤더 5바이트 + 본문):
+    b"LGC" | 버전(1바이트) | 플래그(1바이트: 상위 4비트 직렬화, 하위 4비트 압축) | 본문
+
+- 직렬화: 공백 없는 JSON(기본) 또는 msgpack
+- 압축: zstd(zstandard 설치 시 기본), gzip(표준 라이브러리), 없음
+- 헤더가 없는 값은 이전 형식(UTF-8 JSON)으로 간주해 그대로 읽습니다.
+"""
+
+import gzip
+import json
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+try:
+    import zstandard  # type: ignore
+    HAS_ZSTD = True
+except ImportError:
+    zstandard = None  # type: ignore
+    HAS_ZSTD = False
+
+try:
+    import msgpack  # type: ignore
+    HAS_MSGPACK = True
+except ImportError:
+    msgpack = None  # type: ignore
+    HAS_MSGPACK = False
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"LGC"
+FORMAT_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 2
+
+SERIALIZERS = {"json": 0, "msgpack": 1}
+COMPRESSIONS = {"none": 0, "gzip": 1, "zstd": 2}
+_SERIALIZER_NAMES = {v: k for k, v in SERIALIZERS.items()}
+_COMPRESSION_NAMES = {v: k for k, v in COMPRESSIONS.items()}
+
+# zstd 압축/해제 객체는 스레드 간 공유가 안전하지 않으므로 스레드별로 생성
+_zstd_local = threading.local()
+
+
+def _zstd_compressor() -> Any:
+    if not hasattr(_zstd_local, "compressor"):
+        _zstd_local.compressor = zstandard.ZstdCompressor(level=3)
+    return _zstd_local.compressor
+
+
+def _zstd_decompressor() -> Any:
+    if not hasattr(_zstd_local, "decompressor"):
+        _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return _zstd_local.decompressor
+
+
+class CacheCodec:
+    """캐시 값 인코더/디코더"""
+
+    def __init__(self, serializer: str = "json", compression: Optional[str] = None):
+        """
+        Args:
+            serializer: json 또는 msgpack (msgpack 미설치 시 json)
+            compression: zstd, gzip, none (None이면 zstd 가능 시 zstd, 아니면 gzip)
+        """
+        if serializer == "msgpack" and not HAS_MSGPACK:
+            logger.warning("msgpack이 설치되지 않아 JSON 직렬화를 사용합니다.")
+            serializer = "json"
+        if serializer not in SERIALIZERS:
+            logger.warning(f"알 수 없는 직렬화 형식 '{serializer}' - json을 사용합니다.")
+            serializer = "json"
+        if compression is None:
+            compression = "zstd" if HAS_ZSTD else "gzip"
+        if compression == "zstd" and not HAS_ZSTD:
+            logger.warning("zstandard가 설치되지 않아 gzip 압축을 사용합니다.")
+            compression = "gzip"
+        if compression not in COMPRESSIONS:
+            logger.warning(f"알 수 없는 압축 형식 '{compression}' - gzip을 사용합니다.")
+            compression = "gzip"
+        self.serializer = serializer
+        self.compression = compression
+
+    def encode(self, value: Any) -> bytes:
+        """값을 헤더가 붙은 바이트로 인코딩"""
+        if self.serializer == "msgpack":
+            body = msgpack.packb(value, use_bin_type=True)
+        else:
+            body = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        if self.compression == "zstd":
+            body = _zstd_compressor().compress(body)
+        elif self.compression == "gzip":
+            body = gzip.compress(body, compresslevel=6)
+
+        flags = (SERIALIZERS[self.serializer] << 4) | COMPRESSIONS[self.compression]
+        return MAGIC + bytes([FORMAT_VERSION, flags]) + body
+
+    @staticmethod
+    def decode(blob: bytes) -> Any:
+        """인코딩된 바이트를 값으로 디코딩 (헤더의 형식을 따르므로 설정과 무관)"""
+        if not blob.startswith(MAGIC):
+            # 이전 형식: 헤더 없는 UTF-8 JSON
+            return json.loads(blob)
+
+        version, flags = blob[len(MAGIC)], blob[len(MAGIC) + 1]
+        if version > FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 캐시 형식 버전: {version}")
+        serializer = _SERIALIZER_NAMES.get(flags >> 4)
+        compression = _COMPRESSION_NAMES.get(flags & 0x0F)
+        body = blob[HEADER_SIZE:]
+
+        if compression == "zstd":
+            if not HAS_ZSTD:
+                raise ValueError("zstd로 압축된 캐시를 읽으려면 zstandard가 필요합니다")
+            body = _zstd_decompressor().decompress(body)
+        elif compression == "gzip":
+            body = gzip.decompress(body)
+        elif compression != "none":
+            raise ValueError(f"알 수 없는 압축 형식 플래그: {flags}")
+
+        if serializer == "msgpack":
+            if not HAS_MSGPACK:
+                raise ValueError("msgpack 형식 캐시를 읽으려면 msgpack이 필요합니다")
+            return msgpack.unpackb(body, raw=False)
+        if serializer == "json":
+            return json.loads(body)
+        raise ValueError(f"알 수 없는 직렬화 형식 플래그: {flags}")
+
+    def describe(self) -> Dict[str, Any]:
+        """현재 인코딩 설정"""
+        return {"format_version": FORMAT_VERSION, "serializer": self.serializer, "compression": self.compression}
+
+
+class LazyValue:
+    """디코딩을 실제 사용 시점까지 미루는 캐시 값
+
+    디스크 계층에서 읽은 항목은 만료 여부를 확인한 뒤에만 본문을 디코딩합니다.
+    """
+
+    __slots__ = ("_blob", "_value", "_decoded")
+
+    def __init__(self, blob: bytes):
+        self._blob: Optional[bytes] = blob
+        self._value: Any = None
+        self._decoded = False
+
+    def get(self) -> Any:
+        """디코딩된 값 (최초 호출 시 한 번만 디코딩)"""
+        if not self._decoded:
+            self._value = CacheCodec.decode(self._blob or b"null")
+            self._blob = None
+            self._decoded = True
+        return self._value
+
+    @property
+    def raw_size(self) -> int:
+        return len(self._blob) if self._blob is not None else 0
+
+
+def resolve_value(value: Any) -> Any:
+    """LazyValue이면 디코딩한 값을, 아니면 그대로 반환"""
+    return value.get() if isinstance(value, LazyValue) else value
@@ -0,0 +1,39 @@
+"""
+캐시 용량 초과 시 퇴출 정책
+
+정책은 항목별 우선순위를 반환하며, 값이 작은 항목부터 퇴출합니다.
+- lru: 가장 오래 전에 접근한 항목부터
+- lfu: 적중 횟수가 적은 항목부터 (같으면 오래된 접근부터)
+- size: 적중 횟수 대비 크기가 큰 항목부터 (대용량 법령 본문 중 잘 쓰이지 않는 것 우선)
+"""
+
+from typing import Any, Callable, Collection, Dict, Iterable, List
+
+from .base import CacheEntry
+
+EVICTION_POLICIES: Dict[str, Callable[[CacheEntry], Any]] = {
+    "lru": lambda e: e.last_access or e.created_at,
+    "lfu": lambda e: (e.hits, e.last_access or e.created_at),
+    "size": lambda e: ((e.hits + 1) / max(e.size, 1), e.last_access or e.created_at),
+}
+
+
+def select_victims(entries: Iterable[CacheEntry], bytes_to_free: int, policy: str = "lru",
+                   protected: Collection[str] = ()) -> List[CacheEntry]:
+    """bytes_to_free 이상을 확보할 때까지 정책 순서대로 퇴출 대상 선택
+
+    Args:
+        protected: 퇴출하지 않을 키 (방금 저장한 항목 - size 정책에서 가장 큰 새 항목이 바로 퇴출되지 않도록)
+    """
+    if bytes_to_free <= 0:
+        return []
+    priority = EVICTION_POLICIES.get(policy, EVICTION_POLICIES["lru"])
+    victims: List[CacheEntry] = []
+    freed = 0
+    candidates = (entry for entry in entries if entry.key not in protected)
+    for entry in sorted(candidates, key=priority):
+        if freed >= bytes_to_free:
+            break
+        victims.append(entry)
+        freed += entry.size
+    return victims
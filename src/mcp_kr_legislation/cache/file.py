@@ -0,0 +1,246 @@
+"""
+파일 캐시 백엔드 (키 하나당 파일 하나)
+
+파일 형식: 메타데이터 길이(4바이트, big-endian) | 메타데이터 JSON | codec으로 인코딩한 값
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .base import CacheBackend, CacheEntry
+from .codec import CacheCodec, LazyValue
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.meta"
+INDEX_VERSION = 2  # 파일 형식이 바뀌면 증가 (버전이 다르면 디렉토리를 다시 스캔)
+LEGACY_MIGRATED_MARKER = ".legacy_json_migrated"  # 이전 형식 파일 정리를 마쳤다는 표시
+LEGACY_FILE_PATTERN = re.compile(r"^[0-9a-f]{32}\.json$")  # 이전 캐시 파일명 (키의 md5 해시 + .json)
+
+
+class FileBackend(CacheBackend):
+    """디렉토리 기반 파일 캐시 백엔드
+
+    파일명은 키의 md5 해시이며, 파일 앞부분에 원래 키와 메타데이터를 저장합니다.
+    값은 조회 시 바로 디코딩하지 않고 LazyValue로 반환합니다.
+    쓰기는 임시 파일 작성 후 교체하는 방식으로 원자적으로 수행합니다.
+    크기/접근 시각/적중 횟수 등 퇴출 정책에 필요한 메타데이터는 메모리 인덱스로 관리하고
+    flush 시 index.meta 파일에 저장합니다. 인덱스가 없으면 디렉토리를 한 번 스캔해 재구성합니다.
+    """
+
+    name = "file"
+
+    def __init__(self, cache_dir: Path, codec: Optional[CacheCodec] = None):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.codec = codec or CacheCodec()
+        self._lock = threading.Lock()
+        self._index: Dict[str, CacheEntry] = {}
+        self._dirty = False
+        self._load_index()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{hashlib.md5(key.encode()).hexdigest()}.cache"
+
+    @staticmethod
+    def _read(path: Path, with_value: bool = True) -> Optional[CacheEntry]:
+        """캐시 파일 읽기 (with_value=False면 메타데이터만 읽음)"""
+        with open(path, "rb") as f:
+            header = f.read(4)
+            if len(header) != 4:
+                return None
+            meta = json.loads(f.read(struct.unpack(">I", header)[0]))
+            blob = f.read() if with_value else None
+        if not isinstance(meta, dict) or "key" not in meta:
+            return None
+        return CacheEntry(
+            key=meta["key"],
+            value=LazyValue(blob) if blob is not None else None,
+            created_at=meta.get("created_at", 0.0),
+            expires_at=meta.get("expires_at"),
+            target=meta.get("target", ""),
+            identifier=meta.get("identifier", ""),
+            size=path.stat().st_size,
+        )
+
+    @staticmethod
+    def _metadata(entry: CacheEntry) -> CacheEntry:
+        return CacheEntry(
+            key=entry.key,
+            value=None,
+            created_at=entry.created_at,
+            expires_at=entry.expires_at,
+            target=entry.target,
+            identifier=entry.identifier,
+            size=entry.size,
+            hits=entry.hits,
+            last_access=entry.last_access or entry.created_at,
+        )
+
+    def _load_index(self) -> None:
+        removed = self._remove_legacy_files()
+        index_path = self.cache_dir / INDEX_FILE
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if isinstance(index, dict) and index.get("version") == INDEX_VERSION:
+                self._index = {r["key"]: CacheEntry(value=None, **r) for r in index["entries"]}
+                return
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning(f"캐시 인덱스 손상 - 디렉토리를 다시 스캔합니다: {e}")
+
+        # 인덱스가 없거나 버전이 다르면 캐시 파일을 스캔해 재구성 (읽을 수 없는 파일은 삭제)
+        self._index.clear()
+        for path in self.cache_dir.glob("*.cache"):
+            try:
+                entry = self._read(path, with_value=False)
+            except (OSError, ValueError, struct.error):
+                entry = None
+            if entry is None or path != self._path(entry.key):
+                path.unlink(missing_ok=True)
+                removed += 1
+                continue
+            self._index[entry.key] = self._metadata(entry)
+        self._dirty = True
+        logger.info(f"캐시 인덱스 재구성 - 항목 {len(self._index)}개, 이전 형식 파일 {removed}개 삭제")
+
+    def _remove_legacy_files(self) -> int:
+        """들여쓰기 JSON 형식의 이전 캐시 파일 삭제 (디렉토리당 한 번)
+
+        캐시 디렉토리는 사용자가 지정할 수 있으므로 이전 캐시 파일명 규칙(md5 해시.json)에
+        맞는 파일만 삭제하고, 정리를 마치면 표시 파일을 남겨 다음 실행부터는 건너뜁니다.
+        """
+        marker = self.cache_dir / LEGACY_MIGRATED_MARKER
+        if marker.exists():
+            return 0
+        removed = 0
+        for path in self.cache_dir.glob("*.json"):
+            if not LEGACY_FILE_PATTERN.match(path.name):
+                continue
+            path.unlink(missing_ok=True)
+            removed += 1
+        try:
+            marker.touch()
+        except OSError as e:
+            logger.warning(f"이전 형식 캐시 정리 표시 파일 생성 실패: {e}")
+        return removed
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        path = self._path(key)
+        try:
+            entry = self._read(path)
+        except (FileNotFoundError, ValueError, struct.error):
+            entry = None
+        if entry is None or entry.key != key:
+            with self._lock:
+                if self._index.pop(key, None) is not None:
+                    self._dirty = True
+            return None
+        self.touch(key, time.time())
+        with self._lock:
+            meta = self._index.get(key)
+            if meta is not None:
+                entry.hits, entry.last_access = meta.hits, meta.last_access
+        return entry
+
+    def set(self, entry: CacheEntry) -> None:
+        meta = json.dumps({
+            "key": entry.key,
+            "target": entry.target,
+            "identifier": entry.identifier,
+            "created_at": entry.created_at,
+            "expires_at": entry.expires_at,
+        }, ensure_ascii=False).encode("utf-8")
+        blob = self.codec.encode(entry.value)
+        path = self._path(entry.key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(struct.pack(">I", len(meta)))
+            f.write(meta)
+            f.write(blob)
+        os.replace(tmp_path, path)
+        entry.size = path.stat().st_size
+        with self._lock:
+            self._index[entry.key] = self._metadata(entry)
+            self._dirty = True
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            if self._index.pop(key, None) is not None:
+                self._dirty = True
+        try:
+            self._path(key).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def clear(self) -> None:
+        for path in self.cache_dir.glob("*.cache"):
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.warning(f"캐시 파일 삭제 실패: {path} - {e}")
+        with self._lock:
+            self._index.clear()
+            self._dirty = True
+
+    def iter_entries(self) -> Iterator[CacheEntry]:
+        with self._lock:
+            entries: List[CacheEntry] = list(self._index.values())
+        return iter(entries)
+
+    def touch(self, key: str, now: float) -> None:
+        with self._lock:
+            meta = self._index.get(key)
+            if meta is not None:
+                meta.hits += 1
+                meta.last_access = now
+                self._dirty = True
+
+    def total_size(self) -> int:
+        with self._lock:
+            return sum(entry.size for entry in self._index.values())
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            records = [
+                {
+                    "key": e.key, "created_at": e.created_at, "expires_at": e.expires_at,
+                    "target": e.target, "identifier": e.identifier, "size": e.size,
+                    "hits": e.hits, "last_access": e.last_access,
+                }
+                for e in self._index.values()
+            ]
+            self._dirty = False
+        index_path = self.cache_dir / INDEX_FILE
+        tmp_path = index_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "entries": records}, f, ensure_ascii=False)
+        os.replace(tmp_path, index_path)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = len(self._index)
+            total = sum(entry.size for entry in self._index.values())
+        return {
+            "backend": self.name,
+            "cache_dir": str(self.cache_dir),
+            "files": entries,
+            "size_mb": round(total / (1024 * 1024), 2),
+            "encoding": self.codec.describe(),
+        }
+
+    def close(self) -> None:
+        self.flush()
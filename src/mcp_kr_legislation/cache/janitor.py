@@ -0,0 +1,63 @@
+"""
+캐시 정리 작업 (만료 항목 제거, 용량 상한 적용, 메타데이터 저장 및 공간 정리)
+
+서버 lifespan에서 백그라운드 태스크로 주기 실행합니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+import anyio
+
+from .tiered import TieredCache
+
+logger = logging.getLogger(__name__)
+
+
+class CacheJanitor:
+    """주기적 캐시 정리기"""
+
+    def __init__(self, cache: TieredCache, interval: float = 600.0):
+        """
+        Args:
+            cache: 정리할 캐시
+            interval: 실행 주기(초)
+        """
+        self.cache = cache
+        self.interval = interval
+        self.runs = 0
+        self.last_run: Optional[Dict[str, Any]] = None
+
+    def run_once(self) -> Dict[str, Any]:
+        """정리 작업 1회 실행 (블로킹 I/O 포함)"""
+        started = time.monotonic()
+        purged = self.cache.purge_expired()
+        evicted = self.cache.enforce_budget()
+        self.cache.compact()
+        self.runs += 1
+        self.last_run = {
+            "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "expired_purged": purged,
+            "evicted": evicted,
+            "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
+        }
+        if purged or evicted:
+            logger.info(f"캐시 정리 완료 - 만료 {purged}개, 퇴출 {evicted}개")
+        return self.last_run
+
+    async def run_forever(self) -> None:
+        """interval마다 워커 스레드에서 run_once 실행 (취소될 때까지)"""
+        while True:
+            try:
+                await anyio.to_thread.run_sync(self.run_once)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"캐시 정리 실패 (다음 주기에 재시도): {e}")
+            await asyncio.sleep(self.interval)
+
+    def stats(self) -> Dict[str, Any]:
+        """정리 작업 통계"""
+        return {"interval_seconds": self.interval, "runs": self.runs, "last_run": self.last_run}
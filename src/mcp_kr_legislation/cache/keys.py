@@ -0,0 +1,27 @@
+"""
+캐시 키 규칙
+
+모든 도구 모듈은 "{target}:{identifier}:{section}" 형식의 키를 사용합니다.
+예: law:253527:full, elaw:123456:full, lsStmd:253527:summary
+"""
+
+from typing import Tuple, Union
+
+
+def get_cache_key(target: str, identifier: Union[str, int], section: str = "full") -> str:
+    """캐시 키 생성
+
+    Args:
+        target: API target (law, eflaw, elaw, lsStmd 등)
+        identifier: MST/ID 등 식별자
+        section: 저장 단위 (full: 원본 응답, summary: 요약 등)
+    """
+    return f"{target}:{identifier}:{section}"
+
+
+def parse_cache_key(key: str) -> Tuple[str, str, str]:
+    """캐시 키를 (target, identifier, section)으로 분리 (규칙에 맞지 않으면 빈 문자열)"""
+    parts = key.split(":", 2)
+    if len(parts) != 3:
+        return "", "", ""
+    return parts[0], parts[1], parts[2]
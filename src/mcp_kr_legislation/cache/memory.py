@@ -0,0 +1,63 @@
+"""
+프로세스 내 LRU 메모리 캐시 계층
+
+역직렬화된 객체를 그대로 보관하므로 적중 시 디스크 I/O와 JSON 파싱이 없습니다.
+반환 값은 공유 객체이므로 호출자는 수정하지 않아야 합니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional
+
+from .base import CacheBackend, CacheEntry
+
+
+class MemoryBackend(CacheBackend):
+    """항목 수 기준 LRU 메모리 백엔드 (스레드 안전)"""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                entry.last_access = time.time()
+            return entry
+
+    def set(self, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[entry.key] = entry
+            self._entries.move_to_end(entry.key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def iter_entries(self) -> Iterator[CacheEntry]:
+        with self._lock:
+            entries: List[CacheEntry] = list(self._entries.values())
+        return iter(entries)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": self.name,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "evictions": self._evictions,
+            }
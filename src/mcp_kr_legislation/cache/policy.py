@@ -0,0 +1,127 @@
+"""
+target별 캐시 유효 기간(TTL) 정책
+
+캐시 키("{target}:{identifier}:{section}")의 target/section을 규칙과 위에서부터 비교해
+처음 일치하는 규칙의 TTL을 적용합니다. TTL이 None이면 만료되지 않습니다(용량 퇴출만 적용).
+
+CACHE_TTL_OVERRIDES 환경변수로 규칙을 앞에 추가할 수 있습니다.
+    예: CACHE_TTL_OVERRIDES="prec=30d,search=5m,negative=1m,law:summary=1d,lsHstInf=forever"
+"""
+
+import fnmatch
+import logging
+import re
+from typing import Dict, List, Optional, Tuple
+
+from .keys import parse_cache_key
+
+logger = logging.getLogger(__name__)
+
+FOREVER: Optional[float] = None
+MINUTE = 60.0
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+COMMITTEE_TARGETS = ["ppc", "ftc", "acr", "fsc", "nlrc", "ecc", "sfc", "nhrck", "kcc", "iaciac", "oclt", "eiac"]
+MINISTRY_TARGETS = [
+    "moef", "molit", "moel", "mof", "mohw", "moe", "korea", "mssp",
+    "mote", "maf", "moms", "sme", "nfa", "korail", "nts", "kcs",
+]
+
+# (target 패턴, section 패턴, TTL 초)
+DEFAULT_TTL_RULES: List[Tuple[str, str, Optional[float]]] = [
+    # lawSearch.do 검색 목록 - 신규 공포·현행 여부가 자주 바뀜
+    ("*", "search", 10 * MINUTE),
+    # 결과 없음(totalCnt=0) 검색 응답 - 새 법령 공포 시 바로 반영되도록 더 짧게
+    ("*", "negative", 5 * MINUTE),
+    # 일자별 변경이력 - 당일 목록은 계속 추가됨
+    ("lsHstInf", "*", HOUR),
+    ("lsJoHstInf", "*", DAY),
+    # 확정된 판례·헌재결정례·법령해석례·행정심판례 - 불변
+    ("prec", "*", FOREVER),
+    ("detc", "*", FOREVER),
+    ("expc", "*", FOREVER),
+    ("decc", "*", FOREVER),
+    # 위원회 결정문, 중앙부처 법령해석 - 불변
+    *[(target, "*", FOREVER) for target in COMMITTEE_TARGETS],
+    *[(target, "*", FOREVER) for target in MINISTRY_TARGETS],
+    ("*CgmExpc", "*", FOREVER),
+    # MST로 식별되는 법령 본문은 특정 시점의 버전이므로 불변 (요약·체계도 포함)
+    ("law", "*", FOREVER),
+    ("eflaw", "*", FOREVER),
+    ("elaw", "*", FOREVER),
+    ("lsStmd", "*", FOREVER),
+]
+
+_DURATION_UNITS = {"s": 1.0, "m": MINUTE, "h": HOUR, "d": DAY}
+
+
+def parse_duration(text: str) -> Optional[float]:
+    """'30s', '10m', '2h', '7d', '3600', 'forever'을 초 단위로 변환 (forever는 None)"""
+    text = text.strip().lower()
+    if text in ("forever", "never", "inf", "none"):
+        return FOREVER
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([smhd]?)", text)
+    if not match:
+        raise ValueError(f"잘못된 TTL 형식: '{text}'")
+    return float(match.group(1)) * _DURATION_UNITS.get(match.group(2) or "s", 1.0)
+
+
+def parse_overrides(spec: str) -> List[Tuple[str, str, Optional[float]]]:
+    """'target[:section]=duration,...' 형식의 재정의 규칙 파싱 (잘못된 항목은 무시)"""
+    rules: List[Tuple[str, str, Optional[float]]] = []
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        try:
+            pattern, duration = item.split("=", 1)
+            target, _, section = pattern.strip().partition(":")
+            # 'search'처럼 section 이름만 준 경우는 모든 target의 해당 section으로 해석
+            if not section and target in ("search", "negative"):
+                target, section = "*", target
+            rules.append((target or "*", section or "*", parse_duration(duration)))
+        except ValueError as e:
+            logger.warning(f"CACHE_TTL_OVERRIDES 항목 무시 ({item}): {e}")
+    return rules
+
+
+class TTLPolicy:
+    """캐시 키 → TTL 결정기"""
+
+    def __init__(self,
+                 default_ttl: Optional[float],
+                 rules: Optional[List[Tuple[str, str, Optional[float]]]] = None):
+        """
+        Args:
+            default_ttl: 일치하는 규칙이 없을 때의 TTL(초)
+            rules: (target 패턴, section 패턴, TTL) 목록, 앞의 규칙이 우선
+        """
+        self.default_ttl = default_ttl
+        self.rules = list(DEFAULT_TTL_RULES if rules is None else rules)
+        self._memo: Dict[Tuple[str, str], Optional[float]] = {}
+
+    def ttl_for(self, key: str) -> Optional[float]:
+        """캐시 키에 적용할 TTL(초), None이면 만료 없음"""
+        target, _, section = parse_cache_key(key)
+        memo_key = (target, section)
+        if memo_key not in self._memo:
+            self._memo[memo_key] = self._match(target, section)
+        return self._memo[memo_key]
+
+    def _match(self, target: str, section: str) -> Optional[float]:
+        for target_pattern, section_pattern, ttl in self.rules:
+            if fnmatch.fnmatchcase(target, target_pattern) and fnmatch.fnmatchcase(section, section_pattern):
+                return ttl
+        return self.default_ttl
+
+    def describe(self) -> List[str]:
+        """규칙 목록 (상태 조회용)"""
+        def fmt(ttl: Optional[float]) -> str:
+            if ttl is None:
+                return "forever"
+            for unit, seconds in (("d", DAY), ("h", HOUR), ("m", MINUTE)):
+                if ttl >= seconds and ttl % seconds == 0:
+                    return f"{int(ttl // seconds)}{unit}"
+            return f"{int(ttl)}s"
+
+        described = [f"{t}:{s} = {fmt(ttl)}" for t, s, ttl in self.rules]
+        described.append(f"(기본) = {fmt(self.default_ttl)}")
+        return described
@@ -0,0 +1,95 @@
+"""
+만료된 캐시 항목의 백그라운드 갱신 (stale-while-revalidate)
+
+만료 후 유예 기간 안의 항목은 이전 값을 바로 응답에 사용하고,
+갱신은 동시 실행 수가 제한된 워커 스레드에서 수행합니다.
+같은 키의 갱신은 한 번만 예약됩니다.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundRefresher:
+    """키 단위로 중복 제거되는 백그라운드 갱신 실행기"""
+
+    def __init__(self, max_workers: int = 4, max_pending: Optional[int] = None):
+        """
+        Args:
+            max_workers: 동시에 실행할 갱신 작업 수 상한
+            max_pending: 실행 대기 포함 최대 예약 수 (초과 시 예약하지 않음, 기본 max_workers * 4)
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max_pending if max_pending is not None else self.max_workers * 4
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending: Set[str] = set()
+        self._scheduled = 0
+        self._deduplicated = 0
+        self._rejected = 0
+        self._completed = 0
+        self._failed = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="cache-refresh")
+        return self._executor
+
+    def schedule(self, key: str, refresh: Callable[[], Any]) -> bool:
+        """갱신 작업 예약 (이미 예약된 키이거나 대기열이 가득 차면 False)"""
+        with self._lock:
+            if key in self._pending:
+                self._deduplicated += 1
+                return False
+            if len(self._pending) >= self.max_pending:
+                self._rejected += 1
+                return False
+            self._pending.add(key)
+            self._scheduled += 1
+            executor = self._get_executor()
+        try:
+            executor.submit(self._run, key, refresh)
+        except RuntimeError:
+            # 종료 중인 실행기
+            with self._lock:
+                self._pending.discard(key)
+                self._rejected += 1
+            return False
+        return True
+
+    def _run(self, key: str, refresh: Callable[[], Any]) -> None:
+        try:
+            refresh()
+            with self._lock:
+                self._completed += 1
+        except Exception as e:
+            with self._lock:
+                self._failed += 1
+            logger.warning(f"캐시 백그라운드 갱신 실패 ({key}): {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """갱신 작업 통계"""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "in_flight": len(self._pending),
+                "scheduled": self._scheduled,
+                "deduplicated": self._deduplicated,
+                "rejected": self._rejected,
+                "completed": self._completed,
+                "failed": self._failed,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """실행기 종료 (대기 중인 작업은 취소)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,227 @@
+"""
+검색 목록(lawSearch.do) 응답 캐시
+
+같은 검색어·페이지·표시 개수의 검색은 업스트림을 다시 호출하지 않도록
+검색 파라미터를 정규화한 키로 짧은 기간(TTL 정책의 "*:search" 규칙) 동안 저장합니다.
+
+키 규칙: "{target}:{정규화된 파라미터 해시}:search"
+    - 파라미터는 이름순으로 정렬하고 값은 문자열로 통일
+    - 인증키(OC), 응답 형식(type), target은 키에서 제외 (같은 검색이면 같은 키)
+
+결과가 없는 응답(totalCnt=0)은 "negative" section에 별도의 짧은 TTL("*:negative" 규칙)로 저장해
+오타·존재하지 않는 법령명으로 반복 검색할 때 변형 검색어 재시도마다 업스트림을 호출하지 않도록 합니다.
+
+만료 후 TTL 이내(CACHE_STALE_GRACE가 더 짧으면 그 기간)의 응답은 바로 반환하고 백그라운드에서 갱신합니다
+(stale-while-revalidate). 자주 찾는 법령명 검색이 TTL마다 업스트림 응답을 기다리지 않도록 하기 위함입니다.
+"""
+
+import copy
+import hashlib
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import replace
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlencode
+
+import anyio
+
+from .base import CacheEntry
+from .keys import get_cache_key
+from .tiered import TieredCache, is_cacheable
+
+logger = logging.getLogger(__name__)
+
+SEARCH_SECTION = "search"
+NEGATIVE_SECTION = "negative"
+
+# 검색 결과와 무관한 파라미터
+_IGNORED_PARAMS = frozenset({"OC", "type", "target"})
+
+
+def canonical_search_params(params: Dict[str, Any]) -> str:
+    """검색 파라미터를 정렬된 쿼리 문자열로 정규화 (OC/type/target 제외)"""
+    items = sorted(
+        (str(k), str(v)) for k, v in params.items()
+        if v is not None and k not in _IGNORED_PARAMS
+    )
+    return urlencode(items)
+
+
+def search_cache_key(target: str, params: Dict[str, Any], section: str = SEARCH_SECTION) -> str:
+    """검색 응답 캐시 키"""
+    digest = hashlib.sha1(canonical_search_params(params).encode("utf-8")).hexdigest()[:20]
+    return get_cache_key(target, digest, section)
+
+
+def search_total_count(data: Any) -> Optional[int]:
+    """검색 응답의 전체 결과 수 (LawSearch, PrecSearch 등 루트 아래 totalCnt, 없으면 None)"""
+    if not isinstance(data, dict):
+        return None
+    for root in data.values():
+        if isinstance(root, dict) and "totalCnt" in root:
+            try:
+                return int(root.get("totalCnt") or 0)
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+def is_empty_search_result(data: Any) -> bool:
+    """정상 응답이지만 결과가 없는지(totalCnt=0) 여부"""
+    return is_cacheable(data) and search_total_count(data) == 0
+
+
+def has_search_results(data: Any) -> bool:
+    """결과가 한 건 이상 있는 정상 검색 응답인지 여부"""
+    if not is_cacheable(data):
+        return False
+    total = search_total_count(data)
+    return total is None or total > 0
+
+
+class SearchResultCache:
+    """target별 적중/실패 통계를 집계하는 검색 응답 캐시 (결과 없음 응답은 negative 캐시)"""
+
+    def __init__(self, cache: TieredCache):
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = defaultdict(int)
+        self._misses: Dict[str, int] = defaultdict(int)
+        self._negative_hits: Dict[str, int] = defaultdict(int)
+        self._negative_stores = 0
+
+    def _record(self, target: str, hit: bool, negative: bool = False) -> None:
+        with self._lock:
+            (self._hits if hit else self._misses)[target] += 1
+            if negative:
+                self._negative_hits[target] += 1
+
+    def _lookup(self, key: str, refresh: Callable[[], None]) -> Optional[Any]:
+        """캐시된 검색 응답 조회 (만료 후 TTL 이내면 이전 응답을 반환하고 백그라운드 갱신 예약)"""
+        try:
+            entry = self.cache.get_entry(key, allow_stale=True, stale_within_ttl=True)
+        except Exception as e:
+            logger.warning(f"검색 캐시 조회 중 오류 (API 호출로 대체됨): {e}")
+            return None
+        if entry is None:
+            return None
+        if entry.is_expired():
+            self.cache.schedule_refresh(key, refresh)
+        return entry.value
+
+    def _store(self, key: str, data: Any) -> None:
+        try:
+            self.cache.set(key, data)
+        except Exception as e:
+            logger.warning(f"검색 캐시 저장 중 오류 (서비스는 계속됨): {e}")
+
+    def _cached(self, target: str, key: str, negative_key: str, refresh: Callable[[], None]) -> Optional[Any]:
+        """search → negative 순서로 캐시된 응답의 복사본 조회 (없으면 None, 적중/실패 기록)"""
+        cached = self._lookup(key, refresh)
+        if cached is not None:
+            self._record(target, hit=True)
+            return copy.deepcopy(cached)
+        cached = self._lookup(negative_key, refresh)
+        if cached is not None:
+            self._record(target, hit=True, negative=True)
+            return copy.deepcopy(cached)
+        self._record(target, hit=False)
+        return None
+
+    def get_or_fetch(self,
+                     target: str,
+                     params: Dict[str, Any],
+                     fetch: Callable[[], Any],
+                     cacheable: Callable[[Any], bool] = has_search_results) -> Any:
+        """캐시된 검색 응답을 반환하고, 없으면 fetch 결과를 저장 후 반환
+
+        결과가 없는 응답은 negative section에 저장합니다.
+        캐시된 응답은 호출자가 수정해도 캐시에 영향이 없도록 복사본을 반환합니다.
+        """
+        key = search_cache_key(target, params)
+        negative_key = search_cache_key(target, params, NEGATIVE_SECTION)
+
+        def refresh() -> None:
+            self._save(key, negative_key, fetch(), cacheable)
+
+        cached = self._cached(target, key, negative_key, refresh)
+        if cached is not None:
+            return cached
+        data = fetch()
+        self._save(key, negative_key, data, cacheable)
+        return data
+
+    async def get_or_fetch_async(self,
+                                 target: str,
+                                 params: Dict[str, Any],
+                                 fetch: Callable[[], Awaitable[Any]],
+                                 refresh_fetch: Callable[[], Any],
+                                 cacheable: Callable[[Any], bool] = has_search_results) -> Any:
+        """get_or_fetch의 비동기 버전 (디스크 캐시 조회·저장은 워커 스레드에서 실행)
+
+        Args:
+            fetch: 캐시에 없을 때 호출할 비동기 조회 함수
+            refresh_fetch: 만료된 응답을 백그라운드 스레드에서 갱신할 때 쓸 동기 조회 함수
+        """
+        key = search_cache_key(target, params)
+        negative_key = search_cache_key(target, params, NEGATIVE_SECTION)
+
+        def refresh() -> None:
+            self._save(key, negative_key, refresh_fetch(), cacheable)
+
+        cached = await anyio.to_thread.run_sync(self._cached, target, key, negative_key, refresh)
+        if cached is not None:
+            return cached
+        data = await fetch()
+        await anyio.to_thread.run_sync(self._save, key, negative_key, data, cacheable)
+        return data
+
+    def _save(self, key: str, negative_key: str, data: Any, cacheable: Callable[[Any], bool]) -> None:
+        """결과가 있으면 search, 없으면 negative section에 저장하고 반대쪽의 이전 응답은 삭제"""
+        if cacheable(data):
+            self._store(key, data)
+            stale_key = negative_key
+        elif is_empty_search_result(data):
+            self._store(negative_key, data)
+            stale_key = key
+            with self._lock:
+                self._negative_stores += 1
+        else:
+            return
+        try:
+            self.cache.delete(stale_key)
+        except Exception as e:
+            logger.debug(f"이전 검색 응답 삭제 실패 ({stale_key}): {e}")
+
+    def last_known(self, target: str, params: Dict[str, Any]) -> Optional[CacheEntry]:
+        """만료 여부와 관계없이 마지막으로 저장된 검색 응답 항목 (결과 없음 응답 포함)"""
+        for section in (SEARCH_SECTION, NEGATIVE_SECTION):
+            entry = self.cache.get_last_known(search_cache_key(target, params, section))
+            if entry is not None:
+                return replace(entry, value=copy.deepcopy(entry.value))
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """전체 및 target별 적중/실패 통계"""
+        with self._lock:
+            targets = sorted(set(self._hits) | set(self._misses))
+            per_target = {
+                t: {
+                    "hits": self._hits[t],
+                    "misses": self._misses[t],
+                    "negative_hits": self._negative_hits[t],
+                    "hit_ratio": round(self._hits[t] / (self._hits[t] + self._misses[t]), 3),
+                }
+                for t in targets
+            }
+            hits, misses = sum(self._hits.values()), sum(self._misses.values())
+            negative_hits, negative_stores = sum(self._negative_hits.values()), self._negative_stores
+        return {
+            "hits": hits,
+            "misses": misses,
+            "negative_hits": negative_hits,
+            "negative_stores": negative_stores,
+            "hit_ratio": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+            "targets": per_target,
+        }
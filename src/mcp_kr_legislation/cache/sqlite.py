@@ -0,0 +1,177 @@
+"""
+SQLite 캐시 백엔드 (단일 파일, WAL 모드)
+
+파일 백엔드처럼 키마다 파일을 만들지 않고 cache.db 하나에 저장합니다.
+키/target/만료 시각/최근 접근 시각에 인덱스가 있어 조회와 만료·퇴출 쿼리가 가볍고,
+쓰기는 트랜잭션으로 원자적으로 처리됩니다.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .base import CacheBackend, CacheEntry
+from .codec import CacheCodec, LazyValue
+
+logger = logging.getLogger(__name__)
+
+DB_FILE = "cache.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    target TEXT NOT NULL DEFAULT '',
+    mst TEXT NOT NULL DEFAULT '',
+    size INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    last_access REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    value BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cache_target ON cache_entries (target, mst);
+CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache_entries (expires_at);
+CREATE INDEX IF NOT EXISTS idx_cache_last_access ON cache_entries (last_access);
+"""
+
+_METADATA_COLUMNS = "key, target, mst, size, created_at, expires_at, last_access, hits"
+
+
+class SQLiteBackend(CacheBackend):
+    """SQLite(WAL) 캐시 백엔드 (스레드 안전)
+
+    적중 횟수/최근 접근 시각 갱신은 매 조회마다 쓰지 않고 모아 두었다가
+    flush(캐시 정리 작업) 시 한 번에 반영합니다.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, cache_dir: Path, codec: Optional[CacheCodec] = None):
+        self.path = Path(cache_dir) / DB_FILE
+        self.codec = codec or CacheCodec()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        # 퇴출로 비워진 페이지를 flush 시 반환하도록 incremental auto_vacuum (새 DB에만 적용됨)
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._pending_touches: Dict[str, Tuple[int, float]] = {}
+
+    @staticmethod
+    def _row_to_entry(row: Tuple, value: Any = None) -> CacheEntry:
+        key, target, mst, size, created_at, expires_at, last_access, hits = row
+        return CacheEntry(
+            key=key, value=value, created_at=created_at, expires_at=expires_at,
+            target=target, identifier=mst, size=size, hits=hits, last_access=last_access,
+        )
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_METADATA_COLUMNS}, value FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        entry = self._row_to_entry(row[:-1], LazyValue(row[-1]))
+        self.touch(key, time.time())
+        return entry
+
+    def set(self, entry: CacheEntry) -> None:
+        blob = self.codec.encode(entry.value)
+        entry.size = len(blob)
+        with self._lock:
+            self._pending_touches.pop(entry.key, None)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(key, target, mst, size, created_at, expires_at, last_access, hits, value) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (entry.key, entry.target, entry.identifier, entry.size, entry.created_at,
+                 entry.expires_at, entry.last_access or entry.created_at, entry.hits, blob),
+            )
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            self._pending_touches.pop(key, None)
+            cursor = self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+        return cursor.rowcount > 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending_touches.clear()
+            self._conn.execute("DELETE FROM cache_entries")
+            self._conn.execute("VACUUM")
+
+    def iter_entries(self) -> Iterator[CacheEntry]:
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {_METADATA_COLUMNS} FROM cache_entries").fetchall()
+        return (self._row_to_entry(row) for row in rows)
+
+    def expired_keys(self, now: float) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def touch(self, key: str, now: float) -> None:
+        with self._lock:
+            hits, _ = self._pending_touches.get(key, (0, now))
+            self._pending_touches[key] = (hits + 1, now)
+
+    def total_size(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._pending_touches:
+                return
+            updates = [(hits, last_access, key) for key, (hits, last_access) in self._pending_touches.items()]
+            self._pending_touches.clear()
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "UPDATE cache_entries SET hits = hits + ?, last_access = ? WHERE key = ?", updates
+            )
+            self._conn.execute("COMMIT")
+
+    def compact(self) -> None:
+        """빈 페이지 반환 및 WAL 체크포인트 (캐시 정리 작업에서 호출)"""
+        self.flush()
+        with self._lock:
+            self._conn.execute("PRAGMA incremental_vacuum")
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT target, COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) "
+                "FROM cache_entries GROUP BY target ORDER BY 3 DESC"
+            ).fetchall()
+        entries = sum(row[1] for row in rows)
+        total = sum(row[2] for row in rows)
+        db_size = sum(p.stat().st_size for p in self.path.parent.glob(f"{DB_FILE}*") if p.exists())
+        return {
+            "backend": self.name,
+            "path": str(self.path),
+            "entries": entries,
+            "size_mb": round(total / (1024 * 1024), 2),
+            "db_file_mb": round(db_size / (1024 * 1024), 2),
+            "encoding": self.codec.describe(),
+            "targets": {
+                (row[0] or "-"): {"entries": row[1], "size_mb": round(row[2] / (1024 * 1024), 2), "hits": row[3]}
+                for row in rows
+            },
+        }
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                self._conn.close()
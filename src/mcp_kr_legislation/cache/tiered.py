@@ -0,0 +1,367 @@
+"""
+메모리 + 디스크 2계층 캐시
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Collection, Dict, Optional
+
+from .base import CacheBackend, CacheEntry
+from .codec import resolve_value
+from .eviction import select_victims
+from .keys import parse_cache_key
+from .memory import MemoryBackend
+from .policy import TTLPolicy
+from .refresh import BackgroundRefresher
+
+logger = logging.getLogger(__name__)
+
+
+class LocalResponse(dict):
+    """업스트림 대신 로컬 저장소(만료된 캐시, 조문 샤드, 카탈로그)에서 만든 응답
+
+    일반 응답과 같은 딕셔너리로 포맷팅되지만 캐시에는 다시 저장하지 않습니다.
+    """
+
+    def __init__(self, data: Dict[str, Any], source: str):
+        super().__init__(data)
+        self.source = source  # 응답을 만든 로컬 저장소 설명
+
+
+def is_cacheable(value: Any) -> bool:
+    """빈 응답이나 오류 응답({"error": ...}), 로컬 저장소 응답이 아닌지 여부"""
+    if not value or isinstance(value, LocalResponse):
+        return False
+    return not (isinstance(value, dict) and "error" in value)
+
+
+class TieredCache:
+    """메모리 LRU 계층을 디스크 계층 앞에 둔 캐시
+
+    - 조회: 메모리 → 디스크 순서, 디스크 적중 시 메모리로 승격
+    - 저장: 두 계층 모두 기록
+    - 만료된 항목은 조회 시 두 계층에서 제거 (유예 기간이 남은 항목은 get_or_fetch의 즉시 응답용으로 유지)
+    - 디스크 계층이 용량 상한을 넘으면 퇴출 정책에 따라 low watermark까지 정리
+    """
+
+    # 용량 초과 시 상한의 이 비율까지 줄임 (저장할 때마다 퇴출이 반복되지 않도록)
+    LOW_WATERMARK = 0.9
+
+    def __init__(self,
+                 memory: MemoryBackend,
+                 disk: Optional[CacheBackend] = None,
+                 default_ttl: Optional[float] = None,
+                 max_bytes: Optional[int] = None,
+                 eviction_policy: str = "lru",
+                 ttl_policy: Optional[TTLPolicy] = None,
+                 stale_grace: float = 0.0,
+                 refresher: Optional[BackgroundRefresher] = None,
+                 keep_expired: Optional[Callable[[], bool]] = None):
+        """
+        Args:
+            memory: 메모리 계층
+            disk: 디스크 계층 (None이면 메모리만 사용)
+            default_ttl: 기본 유효 기간(초), None이면 만료 없음
+            max_bytes: 디스크 계층 용량 상한(바이트), None이면 무제한
+            eviction_policy: 퇴출 정책 (lru, lfu, size)
+            ttl_policy: 키별 TTL 정책 (지정 시 default_ttl 대신 사용)
+            stale_grace: 만료 후 이전 값을 즉시 응답에 사용할 수 있는 기간(초), 0이면 사용 안 함
+            refresher: 만료 항목 백그라운드 갱신 실행기 (None이면 stale 응답 없이 바로 조회)
+            keep_expired: True를 반환하는 동안 만료 항목을 지우지 않음 (오프라인 모드에서 마지막 값으로 응답)
+        """
+        self.memory = memory
+        self.disk = disk
+        self.default_ttl = default_ttl
+        self.ttl_policy = ttl_policy
+        self.max_bytes = max_bytes
+        self.eviction_policy = eviction_policy
+        self.stale_grace = stale_grace if refresher is not None else 0.0
+        self.refresher = refresher
+        self.keep_expired = keep_expired
+
+        self._lock = threading.Lock()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._sets = 0
+        self._errors = 0
+        self._evictions = 0
+        self._evicted_bytes = 0
+        self._oversized = 0
+        self._purged = 0
+        self._stale_serves = 0
+        self._last_known_serves = 0
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _keeping_expired(self) -> bool:
+        if self.keep_expired is None:
+            return False
+        try:
+            return bool(self.keep_expired())
+        except Exception:
+            return False
+
+    def _is_stale_usable(self, entry: CacheEntry, now: float, within_ttl: bool = False) -> bool:
+        """만료되었지만 유예 기간 안에 있는지 여부 (within_ttl이면 유예 기간을 항목의 TTL 이하로 제한)"""
+        grace = self.stale_grace
+        if within_ttl and entry.expires_at is not None:
+            grace = min(grace, entry.expires_at - entry.created_at)
+        return grace > 0 and not entry.is_expired(now - grace)
+
+    def get_entry(self, key: str, allow_stale: bool = False, stale_within_ttl: bool = False) -> Optional[CacheEntry]:
+        """만료되지 않은 캐시 항목 조회
+
+        Args:
+            key: 캐시 키
+            allow_stale: True면 만료 후 유예 기간 안의 항목도 반환 (entry.is_expired()로 구분)
+            stale_within_ttl: True면 유예 기간을 항목의 TTL 이하로 제한 (검색 목록처럼 자주 바뀌는 항목)
+        """
+        now = time.time()
+        entry = self.memory.get(key)
+        tier = "_memory_hits"
+        if entry is not None and self.disk is not None:
+            # 디스크 계층의 퇴출 우선순위에도 메모리 적중을 반영
+            self.disk.touch(key, entry.last_access)
+        elif entry is None and self.disk is not None:
+            try:
+                entry = self.disk.get(key)
+            except Exception as e:
+                self._count("_errors")
+                logger.warning(f"디스크 캐시 조회 실패 ({key}): {e}")
+                entry = None
+            tier = "_disk_hits"
+            if entry is not None and (not entry.is_expired(now) or self._is_stale_usable(entry, now, stale_within_ttl)):
+                # 사용할 수 있는 항목만 디코딩해 메모리 계층에 보관
+                entry.value = resolve_value(entry.value)
+                self.memory.set(entry)
+
+        if entry is None:
+            self._count("_misses")
+            return None
+
+        if entry.is_expired(now):
+            stale_usable = self._is_stale_usable(entry, now, stale_within_ttl)
+            if allow_stale and stale_usable:
+                entry.hits += 1
+                self._count("_stale_serves")
+                return entry
+            self._count("_expired")
+            self._count("_misses")
+            if not stale_usable and not self._keeping_expired():
+                self.delete(key)
+            return None
+
+        entry.hits += 1
+        self._count(tier)
+        return entry
+
+    def get_last_known(self, key: str) -> Optional[CacheEntry]:
+        """만료 여부와 관계없이 마지막으로 저장된 항목 조회 (업스트림 장애 시 대체 응답용, 삭제하지 않음)"""
+        entry = self.memory.get(key)
+        if entry is None and self.disk is not None:
+            try:
+                entry = self.disk.get(key)
+            except Exception as e:
+                self._count("_errors")
+                logger.warning(f"디스크 캐시 조회 실패 ({key}): {e}")
+                return None
+            if entry is not None:
+                entry.value = resolve_value(entry.value)
+        if entry is None:
+            return None
+        self._count("_last_known_serves")
+        return entry
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 값 조회 (없거나 만료되었으면 None)"""
+        entry = self.get_entry(key)
+        return entry.value if entry is not None else None
+
+    def get_or_fetch(self,
+                     key: str,
+                     fetch: Callable[[], Any],
+                     ttl: Optional[float] = None,
+                     cacheable: Callable[[Any], bool] = is_cacheable) -> Any:
+        """캐시 값을 반환하고, 없으면 fetch로 조회해 저장 (stale-while-revalidate)
+
+        만료 후 유예 기간 안의 항목은 이전 값을 바로 반환하고 갱신은 백그라운드에서 수행합니다.
+        갱신이 실패하거나 cacheable이 False인 값이면 이전 값을 유지합니다.
+
+        Args:
+            key: 캐시 키
+            fetch: 원본 조회 함수 (예외는 호출자에게 전달됨)
+            ttl: 유효 기간(초), None이면 TTL 정책에 따름
+            cacheable: 저장 여부 판단 함수 (기본: 빈 응답/오류 응답 제외)
+        """
+        entry = self.get_entry(key, allow_stale=True)
+        if entry is not None:
+            if entry.is_expired():
+                self.schedule_refresh(key, lambda: self._refresh(key, fetch, ttl, cacheable))
+            return entry.value
+
+        value = fetch()
+        if cacheable(value):
+            self.set(key, value, ttl=ttl)
+        return value
+
+    def schedule_refresh(self, key: str, refresh: Callable[[], Any]) -> bool:
+        """만료된 항목의 백그라운드 갱신 예약 (갱신기가 없거나 이미 예약된 키면 False)"""
+        if self.refresher is None:
+            return False
+        return self.refresher.schedule(key, refresh)
+
+    def _refresh(self,
+                 key: str,
+                 fetch: Callable[[], Any],
+                 ttl: Optional[float],
+                 cacheable: Callable[[Any], bool]) -> None:
+        value = fetch()
+        if not cacheable(value):
+            raise ValueError("갱신 응답이 비어 있거나 오류 응답이어서 이전 값을 유지합니다")
+        self.set(key, value, ttl=ttl)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> CacheEntry:
+        """캐시 값 저장
+
+        Args:
+            key: 캐시 키 (keys.get_cache_key 규칙)
+            value: 저장할 값 (JSON 직렬화 가능해야 함)
+            ttl: 유효 기간(초), None이면 TTL 정책(없으면 기본값)에 따름
+        """
+        now = time.time()
+        if ttl is None:
+            ttl = self.ttl_policy.ttl_for(key) if self.ttl_policy is not None else self.default_ttl
+        target, identifier, _ = parse_cache_key(key)
+        entry = CacheEntry(
+            key=key,
+            value=value,
+            created_at=now,
+            expires_at=now + ttl if ttl is not None else None,
+            target=target,
+            identifier=identifier,
+        )
+        self._count("_sets")
+        if self.disk is not None:
+            try:
+                self.disk.set(entry)
+                if self.max_bytes is not None and entry.size > self.max_bytes:
+                    # 용량 상한보다 큰 항목은 다른 항목을 모두 퇴출해도 들어갈 수 없으므로 메모리 계층에만 보관
+                    self.disk.delete(key)
+                    self._count("_oversized")
+                    logger.warning(
+                        f"캐시 항목이 디스크 용량 상한보다 커서 메모리에만 보관 ({key}, "
+                        f"{entry.size / (1024 * 1024):.1f}MB > {self.max_bytes / (1024 * 1024):.1f}MB)"
+                    )
+                elif self.max_bytes is not None and self.disk.total_size() > self.max_bytes:
+                    self.enforce_budget(protected=(key,))
+            except Exception as e:
+                self._count("_errors")
+                logger.warning(f"디스크 캐시 저장 실패 ({key}): {e}")
+        self.memory.set(entry)
+        return entry
+
+    def enforce_budget(self, protected: Collection[str] = ()) -> int:
+        """디스크 계층이 용량 상한을 넘으면 퇴출 정책에 따라 정리하고 퇴출한 항목 수 반환
+
+        Args:
+            protected: 퇴출하지 않을 키 (방금 저장한 항목)
+        """
+        if self.disk is None or self.max_bytes is None:
+            return 0
+        used = self.disk.total_size()
+        if used <= self.max_bytes:
+            return 0
+        target = int(self.max_bytes * self.LOW_WATERMARK)
+        victims = select_victims(self.disk.iter_entries(), used - target, self.eviction_policy, protected)
+        freed = 0
+        for victim in victims:
+            if self.disk.delete(victim.key):
+                freed += victim.size
+        with self._lock:
+            self._evictions += len(victims)
+            self._evicted_bytes += freed
+        logger.info(f"캐시 용량 정리 ({self.eviction_policy}) - {len(victims)}개 항목, {freed / (1024 * 1024):.1f}MB 확보")
+        return len(victims)
+
+    def purge_expired(self) -> int:
+        """만료 후 유예 기간까지 지난 항목을 두 계층에서 제거하고 제거한 항목 수 반환 (keep_expired 동안은 보류)"""
+        if self._keeping_expired():
+            return 0
+        now = time.time() - self.stale_grace
+        expired = {e.key for e in self.memory.iter_entries() if e.is_expired(now)}
+        if self.disk is not None:
+            expired.update(self.disk.expired_keys(now))
+        for key in expired:
+            self.delete(key)
+        with self._lock:
+            self._purged += len(expired)
+        return len(expired)
+
+    def flush(self) -> None:
+        """디스크 계층 메타데이터 영구 저장"""
+        if self.disk is not None:
+            self.disk.flush()
+
+    def compact(self) -> None:
+        """디스크 계층 메타데이터 저장 및 저장 공간 정리"""
+        if self.disk is not None:
+            self.disk.compact()
+
+    def delete(self, key: str) -> None:
+        """두 계층에서 항목 삭제"""
+        self.memory.delete(key)
+        if self.disk is not None:
+            try:
+                self.disk.delete(key)
+            except Exception as e:
+                logger.warning(f"디스크 캐시 삭제 실패 ({key}): {e}")
+
+    def clear(self) -> None:
+        """전체 캐시 삭제"""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """계층별 적중/실패 통계"""
+        with self._lock:
+            lookups = self._memory_hits + self._disk_hits + self._misses
+            stats: Dict[str, Any] = {
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "expired": self._expired,
+                "sets": self._sets,
+                "errors": self._errors,
+                "evictions": self._evictions,
+                "evicted_mb": round(self._evicted_bytes / (1024 * 1024), 2),
+                "oversized_skipped": self._oversized,
+                "expired_purged": self._purged,
+                "stale_serves": self._stale_serves,
+                "last_known_serves": self._last_known_serves,
+                "stale_grace_seconds": self.stale_grace,
+                "eviction_policy": self.eviction_policy,
+                "max_size_mb": round(self.max_bytes / (1024 * 1024), 1) if self.max_bytes is not None else None,
+                "hit_ratio": round((self._memory_hits + self._disk_hits) / lookups, 3) if lookups else 0.0,
+            }
+        if self.refresher is not None:
+            stats["refresh"] = self.refresher.stats()
+        stats["memory"] = self.memory.stats()
+        if self.disk is not None:
+            try:
+                stats["disk"] = self.disk.stats()
+            except Exception as e:
+                stats["disk"] = {"error": str(e)}
+        return stats
+
+    def close(self) -> None:
+        """백그라운드 갱신 중지 및 디스크 계층 리소스 정리"""
+        if self.refresher is not None:
+            self.refresher.shutdown()
+        if self.disk is not None:
+            self.disk.close()
@@ -30,6 +30,39 @@ class LegislationConfig:
     default_display: int = 20
     max_display: int = 100
     default_timeout: int = 30
+    
+    # HTTP 커넥션 풀 설정
+    http_pool_connections: int = 10
+    http_pool_maxsize: int = 20
+    http_keep_alive: bool = True
+    http_keepalive_expiry: float = 5.0
+    
+    # 여러 검색을 동시에 실행하는 도구(통합 검색 등)의 병렬 실행 설정
+    fanout_workers: int = 16  # 동시 실행 요청 수 상한 (프로세스 전체 공용)
+    fanout_section_deadline: float = 12.0  # 검색 항목별 응답 대기 시간 (초, 초과 시 해당 항목만 생략)
+
+    # 업스트림 요청 제한 (OC 키별 token bucket, target별 동시 요청 격벽)
+    rate_limit_per_second: float = 10.0  # OC 키별 초당 요청 수 (0이면 제한 없음)
+    rate_limit_burst: int = 20  # OC 키별로 한 번에 몰아서 보낼 수 있는 요청 수
+    target_concurrency: str = "lsHstInf=2,lsStmd=2,lawHst=2"  # target별 동시 요청 수 상한 (느린 target 격리)
+    throttle_max_wait: float = 30.0  # 요청 제한으로 기다릴 수 있는 최대 시간 (초, 초과 시 요청 실패)
+
+    # 일시적 장애 재시도 (지수 백오프 + jitter, 재시도 예산)와 target별 회로 차단기
+    retry_max_attempts: int = 3  # 첫 요청을 포함한 최대 시도 횟수 (1이면 재시도 안 함)
+    retry_base_delay: float = 0.5  # 첫 재시도 대기 시간 상한 (초, 재시도마다 두 배)
+    retry_max_delay: float = 8.0  # 재시도 한 번의 최대 대기 시간 (초)
+    retry_max_elapsed: float = 30.0  # 첫 요청 후 이 시간이 지나면 재시도하지 않음 (초)
+    retry_budget_ratio: float = 0.2  # 최근 요청 수 대비 허용 재시도 비율
+    retry_budget_min: int = 5  # 요청이 적을 때도 10초마다 허용하는 재시도 수
+    circuit_failure_threshold: int = 5  # target 회로를 열 연속 실패 수
+    circuit_reset_timeout: float = 30.0  # 회로를 연 뒤 복구 확인 요청까지 기다릴 시간 (초)
+
+    # 업스트림 장애 시 오프라인 모드 (로컬 저장소로 응답) 설정
+    offline_mode: str = "auto"  # auto: 상태 점검으로 자동 전환, on: 항상 오프라인, off: 전환 안 함
+    health_failure_threshold: int = 3  # 오프라인으로 전환할 연속 실패(연결 오류/타임아웃/5xx) 수
+    health_min_failing_targets: int = 2  # 오프라인 전환에 필요한 연속 실패 중인 target 수 (상태 점검 포함)
+    health_probe_interval: float = 30.0  # 장애 중 상태 점검 주기 (초)
+    health_probe_timeout: float = 5.0  # 상태 점검 요청 타임아웃 (초)
 
     @classmethod
     def from_env(cls) -> "LegislationConfig":
@@ -46,7 +79,90 @@ class LegislationConfig:
             log_file=os.getenv("LOG_FILE", "legislation.log"),
             default_display=int(os.getenv("DEFAULT_DISPLAY", "20")),
             max_display=int(os.getenv("MAX_DISPLAY", "100")),
-            default_timeout=int(os.getenv("REQUEST_TIMEOUT", "30"))
+            default_timeout=int(os.getenv("REQUEST_TIMEOUT", "30")),
+            http_pool_connections=int(os.getenv("HTTP_POOL_CONNECTIONS", "10")),
+            http_pool_maxsize=int(os.getenv("HTTP_POOL_MAXSIZE", "20")),
+            http_keep_alive=os.getenv("HTTP_KEEP_ALIVE", "true").lower() in ("1", "true", "yes"),
+            http_keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "5.0")),
+            fanout_workers=int(os.getenv("FANOUT_WORKERS", "16")),
+            fanout_section_deadline=float(os.getenv("FANOUT_SECTION_DEADLINE", "12")),
+            rate_limit_per_second=float(os.getenv("RATE_LIMIT_PER_SECOND", "10")),
+            rate_limit_burst=int(os.getenv("RATE_LIMIT_BURST", "20")),
+            target_concurrency=os.getenv("TARGET_CONCURRENCY", "lsHstInf=2,lsStmd=2,lawHst=2"),
+            throttle_max_wait=float(os.getenv("THROTTLE_MAX_WAIT", "30")),
+            retry_max_attempts=int(os.getenv("RETRY_MAX_ATTEMPTS", "3")),
+            retry_base_delay=float(os.getenv("RETRY_BASE_DELAY", "0.5")),
+            retry_max_delay=float(os.getenv("RETRY_MAX_DELAY", "8")),
+            retry_max_elapsed=float(os.getenv("RETRY_MAX_ELAPSED", "30")),
+            retry_budget_ratio=float(os.getenv("RETRY_BUDGET_RATIO", "0.2")),
+            retry_budget_min=int(os.getenv("RETRY_BUDGET_MIN", "5")),
+            circuit_failure_threshold=int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5")),
+            circuit_reset_timeout=float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30")),
+            offline_mode=os.getenv("OFFLINE_MODE", "auto").lower(),
+            health_failure_threshold=int(os.getenv("HEALTH_FAILURE_THRESHOLD", "3")),
+            health_min_failing_targets=int(os.getenv("HEALTH_MIN_FAILING_TARGETS", "2")),
+            health_probe_interval=float(os.getenv("HEALTH_PROBE_INTERVAL", "30")),
+            health_probe_timeout=float(os.getenv("HEALTH_PROBE_TIMEOUT", "5"))
+        )
+
+@dataclass
+class CacheConfig:
+    """응답 캐시 설정"""
+    
+    backend: str = "file"  # 디스크 계층 백엔드 (file: 키별 JSON 파일, sqlite: 단일 SQLite 파일)
+    ttl_days: int = 7  # TTL 정책에 해당하지 않는 항목의 기본 유효 기간 (일)
+    ttl_overrides: str = ""  # target별 TTL 재정의 (예: "prec=30d,search=5m")
+    memory_max_entries: int = 256  # 메모리 계층 최대 항목 수
+    max_size_mb: int = 100  # 디스크 계층 최대 크기 (MB)
+    eviction_policy: str = "lru"  # 용량 초과 시 퇴출 정책 (lru, lfu, size)
+    janitor_interval: int = 600  # 캐시 정리 주기 (초)
+    serializer: str = "json"  # 값 직렬화 (json: 공백 없는 JSON, msgpack)
+    compression: str = ""  # 압축 (zstd, gzip, none / 빈 값이면 zstd 가능 시 zstd, 아니면 gzip)
+    stale_grace: int = 86400  # 만료 후에도 즉시 응답에 사용하고 백그라운드로 갱신하는 기간 (초, 0이면 사용 안 함)
+    refresh_workers: int = 4  # 백그라운드 갱신 동시 실행 수 상한
+
+    @classmethod
+    def from_env(cls) -> "CacheConfig":
+        return cls(
+            backend=os.getenv("CACHE_BACKEND", "file"),
+            ttl_days=int(os.getenv("CACHE_TTL_DAYS", "7")),
+            ttl_overrides=os.getenv("CACHE_TTL_OVERRIDES", ""),
+            memory_max_entries=int(os.getenv("CACHE_MEMORY_MAX_ENTRIES", "256")),
+            max_size_mb=int(os.getenv("CACHE_MAX_SIZE_MB", "100")),
+            eviction_policy=os.getenv("CACHE_EVICTION_POLICY", "lru").lower(),
+            janitor_interval=int(os.getenv("CACHE_JANITOR_INTERVAL", "600")),
+            serializer=os.getenv("CACHE_SERIALIZER", "json").lower(),
+            compression=os.getenv("CACHE_COMPRESSION", "").lower(),
+            stale_grace=int(os.getenv("CACHE_STALE_GRACE", "86400")),
+            refresh_workers=int(os.getenv("CACHE_REFRESH_WORKERS", "4"))
+        )
+
+@dataclass
+class IndexConfig:
+    """로컬 색인(법령 카탈로그 등) 설정"""
+    
+    catalog_max_age_hours: int = 24  # 법령 카탈로그를 다시 만드는 주기 (시간)
+    catalog_auto_refresh: bool = True  # 서버 실행 중 카탈로그가 오래되면 백그라운드에서 갱신
+    article_shard_max_laws: int = 500  # 조문 단위로 나눠 저장할 법령 버전 수 상한 (0이면 저장 안 함)
+    similarity_max_documents: int = 5000  # 유사도 색인에 보관할 판례/해석례 문서 수 상한
+    similarity_rebuild_interval_hours: int = 24  # 유사도 행렬을 다시 만드는 최소 간격 (시간, 행렬이 없으면 바로 생성)
+    change_sync_enabled: bool = True  # 법령 변경이력(lsHstInf)으로 카탈로그·조문 저장소를 증분 동기화
+    change_sync_max_days: int = 14  # 증분 동기화로 따라갈 최대 일수 (더 밀리면 카탈로그 전체 갱신)
+    corpus_workers: int = 4  # 오프라인 코퍼스 구축 시 동시 요청 수
+    corpus_rate_limit: float = 5.0  # 오프라인 코퍼스 구축 시 초당 최대 요청 수
+
+    @classmethod
+    def from_env(cls) -> "IndexConfig":
+        return cls(
+            catalog_max_age_hours=int(os.getenv("CATALOG_MAX_AGE_HOURS", "24")),
+            catalog_auto_refresh=os.getenv("CATALOG_AUTO_REFRESH", "true").lower() in ("1", "true", "yes"),
+            article_shard_max_laws=int(os.getenv("ARTICLE_SHARD_MAX_LAWS", "500")),
+            similarity_max_documents=int(os.getenv("SIMILARITY_MAX_DOCUMENTS", "5000")),
+            similarity_rebuild_interval_hours=int(os.getenv("SIMILARITY_REBUILD_INTERVAL_HOURS", "24")),
+            change_sync_enabled=os.getenv("CHANGE_SYNC_ENABLED", "true").lower() in ("1", "true", "yes"),
+            change_sync_max_days=int(os.getenv("CHANGE_SYNC_MAX_DAYS", "14")),
+            corpus_workers=int(os.getenv("CORPUS_WORKERS", "4")),
+            corpus_rate_limit=float(os.getenv("CORPUS_RATE_LIMIT", "5"))
         )
 
 @dataclass
@@ -58,6 +174,7 @@ class MCPConfig:
     log_level: str = "INFO"
     server_name: str = "kr-legislation-mcp"
     transport: Literal["stdio", "sse"] = "stdio"
+    tool_worker_threads: int = 100  # SSE 전송 시 동기 도구 실행용 워커 스레드 수
 
     @classmethod
     def from_env(cls) -> "MCPConfig":
@@ -66,7 +183,8 @@ class MCPConfig:
             port=int(os.getenv("PORT", "8001")),
             log_level=os.getenv("LOG_LEVEL", "INFO"),
             server_name=os.getenv("MCP_SERVER_NAME", "kr-legislation-mcp"),
-            transport=cast(Literal["stdio", "sse"], os.getenv("TRANSPORT", "stdio"))
+            transport=cast(Literal["stdio", "sse"], os.getenv("TRANSPORT", "stdio")),
+            tool_worker_threads=int(os.getenv("TOOL_WORKER_THREADS", "100"))
         )
 
 # 설정 인스턴스 생성
@@ -77,4 +195,6 @@ def _try_make_config():
         return None
 
 legislation_config = _try_make_config()
+cache_config = CacheConfig.from_env()
+index_config = IndexConfig.from_env()
 mcp_config = MCPConfig.from_env() 
\ No newline at end of file
@@ -0,0 +1,686 @@
+"""
+업스트림 호출을 줄이기 위한 로컬 색인
+
+- catalog: 현행 법령 카탈로그 (법령명 → 법령ID/MST)
+- idmap: MST ↔ 법령ID 매핑 (도구가 받은 검색/상세 응답에서 수집)
+- articles: 법령 버전(MST)별 조문 색인 (조문번호/가지번호 조회, 범위 조회, 정리된 텍스트)
+- shards: 조문 색인을 조문 단위 파일 + 목차로 저장 (단일 조문 조회 시 본문 전체를 읽지 않음)
+- fulltext: 색인된 모든 법령 조문의 역색인 (글자 바이그램, BM25) - 법령을 가로지르는 조문 검색
+- similarity: 조문·판례·해석례 TF-IDF 희소 행렬 (글자 n-gram, 코사인 유사도) - 비슷한 조항 찾기 (numpy/scipy 필요)
+- sync: 법령 변경이력(lsHstInf)을 기준일부터 하루씩 따라가며 바뀐 법령만 카탈로그·조문 저장소에 반영
+- corpus: 현행 법령 전체를 미리 받아 두는 재시작 가능한 오프라인 코퍼스 구축 (python -m mcp_kr_legislation.index.corpus)
+
+업스트림 장애(오프라인 모드) 시에는 local_law_body/local_law_search가 조문 샤드와 카탈로그로 대체 응답을 만듭니다.
+
+색인 파일은 캐시 디렉토리 아래 index/ 에 저장합니다.
+서버 lifespan에서 IndexMaintainer가 변경이력을 동기화하고(밀렸으면 카탈로그 전체 갱신) 변경분을 저장합니다.
+다른 프로세스가 코퍼스를 구축하는 동안(corpus.lock)에는 유지 작업과 공용 색인 파일 저장을 건너뛰고,
+구축이 끝나면 카탈로그·ID 매핑·전문 검색 색인을 파일에서 다시 로드합니다.
+
+사용 예시:
+    entry = resolve_law_name("개인정보 보호법")
+    if entry is not None:
+        mst = entry.mst
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from dataclasses import replace
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import anyio
+
+from ..apis.health import get_upstream_health
+from ..cache import fetch_with_cache, get_cache_key
+from ..config import index_config, legislation_config
+from ..utils.data_processor import get_cache_dir
+from .articles import ArticleIndex, ArticleIndexCache, ArticleRecord, format_article_label, parse_article_key
+from .catalog import LawCatalog, LawCatalogEntry, normalize_law_name
+from .corpus import corpus_build_active, corpus_completed_at, corpus_lock_owner
+from .fulltext import ArticleSearchIndex
+from .idmap import LawIdMap, extract_law_id_pairs
+from .shards import ArticleShardStore
+from .similarity import HAS_NUMPY, SimilarityIndex
+from .sync import ChangeFeedSync
+
+logger = logging.getLogger(__name__)
+
+# 카탈로그를 유지하는 lawSearch.do target
+CATALOG_TARGETS = ("law", "elaw")
+
+_catalogs: Dict[str, LawCatalog] = {}
+_catalog_lock = threading.Lock()
+_id_map: Optional[LawIdMap] = None
+_article_indexes: Optional[ArticleIndexCache] = None
+_fulltext: Optional[ArticleSearchIndex] = None
+_similarity: Optional[SimilarityIndex] = None
+_change_sync: Optional[ChangeFeedSync] = None
+
+# 유지 작업 1회에 조문 샤드에서 전문 검색 색인으로 옮길 법령 버전 수
+FULLTEXT_BACKFILL_PER_RUN = 50
+# 변경이력 하루치에서 새 버전 본문을 미리 받아 둘 법령 수 상한
+SYNC_REFETCH_PER_DAY = 20
+# 변경이력으로 카탈로그를 따라가는 동안 전체 갱신 주기 배수 (CATALOG_MAX_AGE_HOURS × 배수, 누락 대비 안전망)
+SYNC_FULL_REFRESH_FACTOR = 7
+# 변경이력(lsHstInf)은 응답이 느리므로 별도 클라이언트에 긴 타임아웃 적용
+SYNC_REQUEST_TIMEOUT = 60
+_client: Any = None
+_sync_client: Any = None
+
+
+def get_index_dir() -> Path:
+    """색인 파일 디렉토리"""
+    path = Path(get_cache_dir()) / "index"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def get_law_catalog(target: str = "law") -> LawCatalog:
+    """target별 공용 법령 카탈로그 반환 (최초 호출 시 저장된 파일 로드)"""
+    catalog = _catalogs.get(target)
+    if catalog is None:
+        with _catalog_lock:
+            catalog = _catalogs.get(target)
+            if catalog is None:
+                catalog = LawCatalog(target, get_index_dir() / f"{target}_catalog.bin")
+                catalog.add_listener(_record_catalog_ids)
+                _catalogs[target] = catalog
+    return catalog
+
+
+def get_law_id_map() -> LawIdMap:
+    """공용 MST ↔ 법령ID 매핑 반환"""
+    global _id_map
+    if _id_map is None:
+        with _catalog_lock:
+            if _id_map is None:
+                _id_map = LawIdMap(get_index_dir() / "law_idmap.bin")
+    return _id_map
+
+
+def _record_catalog_ids(catalog: LawCatalog) -> None:
+    """카탈로그 전체 갱신 후 MST/법령ID 쌍을 매핑에 반영"""
+    get_law_id_map().record_many((e.mst, e.law_id) for e in catalog.entries())
+
+
+def observe_law_ids(data: Any, params: Optional[Dict[str, Any]] = None) -> None:
+    """법제처 응답의 MST/법령ID 쌍을 매핑에 반영 (요청 공통 함수에서 호출)"""
+    try:
+        pairs = extract_law_id_pairs(data, params)
+        if pairs:
+            get_law_id_map().record_many(pairs)
+    except Exception as e:
+        logger.debug(f"MST-법령ID 매핑 반영 실패: {e}")
+
+
+def mst_to_law_id(mst: str) -> Optional[str]:
+    """MST의 법령ID 조회 (매핑, 법령 카탈로그 순, 모르면 None)"""
+    try:
+        law_id = get_law_id_map().law_id_for(mst)
+        if law_id:
+            return law_id
+        for target in CATALOG_TARGETS:
+            entry = get_law_catalog(target).get_by_mst(mst)
+            if entry is not None and entry.law_id:
+                get_law_id_map().record_many([(entry.mst, entry.law_id)])
+                return entry.law_id
+    except Exception as e:
+        logger.warning(f"MST-법령ID 매핑 조회 실패: {e}")
+    return None
+
+
+def resolve_law_name(name: str, target: str = "law") -> Optional[LawCatalogEntry]:
+    """법령명으로 카탈로그 항목 조회 (없거나 카탈로그를 쓸 수 없으면 None → 업스트림 검색으로 대체)"""
+    try:
+        return get_law_catalog(target).resolve(name)
+    except Exception as e:
+        logger.warning(f"법령 카탈로그 조회 실패 (업스트림 검색으로 대체): {e}")
+        return None
+
+
+def observe_search_results(data: Any, target: str = "law") -> None:
+    """lawSearch.do 응답의 법령 목록을 카탈로그에 반영 (도구의 업스트림 검색 후 호출)"""
+    try:
+        items = (data or {}).get("LawSearch", {}).get("law") if isinstance(data, dict) else None
+        if isinstance(items, dict):
+            items = [items]
+        if items:
+            get_law_catalog(target).observe(items)
+    except Exception as e:
+        logger.debug(f"검색 결과 카탈로그 반영 실패: {e}")
+
+
+def get_article_index(target: str, mst: str, load: Callable[[], Any]) -> Optional[ArticleIndex]:
+    """법령 버전의 조문 색인 반환 (처음이면 load()가 반환한 본문으로 생성, 조문이 없으면 None)"""
+    return _get_article_indexes().get(target, mst, load)
+
+
+def _get_article_indexes() -> ArticleIndexCache:
+    global _article_indexes
+    if _article_indexes is None:
+        with _catalog_lock:
+            if _article_indexes is None:
+                store = ArticleShardStore(get_index_dir() / "articles", index_config.article_shard_max_laws)
+                _article_indexes = ArticleIndexCache(store=store, on_build=_index_articles_fulltext)
+    return _article_indexes
+
+
+def get_article_search_index() -> ArticleSearchIndex:
+    """공용 조문 전문 검색 색인 반환"""
+    global _fulltext
+    if _fulltext is None:
+        with _catalog_lock:
+            if _fulltext is None:
+                _fulltext = ArticleSearchIndex(get_index_dir() / "fulltext.bin")
+    return _fulltext
+
+
+def _reload_shared_indexes() -> None:
+    """카탈로그·ID 매핑·전문 검색 색인을 버리고 다음 사용 때 파일에서 다시 로드 (코퍼스 구축 후)
+
+    구축 중 메모리에만 반영된 변경은 버려집니다 (조문 샤드는 유지되므로 전문 검색 색인은 유지 작업이 다시 보충).
+    """
+    global _id_map, _fulltext
+    with _catalog_lock:
+        fulltext, _fulltext = _fulltext, None
+        _catalogs.clear()
+        _id_map = None
+    if fulltext is not None:
+        fulltext.discard()
+
+
+def store_law_body(target: str, mst: str, data: Any) -> int:
+    """법령 본문을 조문 샤드·전문 검색 색인에 바로 저장하고 조문 수 반환 (대량 수집용, 블로킹)
+
+    도구 조회 경로(get_article_index)와 달리 백그라운드 대기열을 거치지 않아 대량 저장 시 누락되지 않습니다.
+    """
+    index = ArticleIndex.from_law_data(data)
+    if not len(index):
+        return 0
+    observe_law_ids(data, {"MST": mst})
+    _get_article_indexes().store.write(target, str(mst), index)
+    get_article_search_index().add_law(target, str(mst), index)
+    return len(index)
+
+
+def local_law_body(target: str, mst: str) -> Optional[Dict[str, Any]]:
+    """조문 샤드로 다시 만든 법령 본문 (업스트림 장애 시 대체 응답용, 저장된 버전이 없으면 None)
+
+    lawService.do 본문과 같은 구조(법령.기본정보, 법령.조문.조문단위 / 영문은 Law.JoSection.Jo)이며
+    조문 외의 부칙·별표는 포함하지 않습니다.
+    """
+    index = _get_article_indexes().store.open(target, str(mst))
+    if index is None:
+        return None
+    try:
+        units = [record.raw for record in index.records]
+    except KeyError:
+        return None
+    if target == "elaw":
+        return {"Law": {"JoSection": {"Jo": units}}}
+    basic: Dict[str, Any] = {"법령명_한글": index.law_name, "법령일련번호": str(mst)}
+    entry = get_law_catalog("law").get_by_mst(str(mst))
+    if entry is not None:
+        basic.update({
+            "법령ID": entry.law_id,
+            "공포일자": entry.promulgation_date,
+            "시행일자": entry.effective_date,
+            "소관부처명": entry.ministry,
+            "법령구분명": entry.law_type,
+            "제개정구분명": entry.revision_type,
+        })
+    return {"법령": {"기본정보": basic, "조문": {"조문단위": units}}}
+
+
+def local_law_search(target: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """법령 카탈로그에서 법령명으로 찾은 lawSearch.do 형식 목록 (업스트림 장애 시 대체 응답용)
+
+    카탈로그가 있는 target의 법령명 검색(query, 본문검색 제외)만 지원하며, 그 밖에는 None을 반환합니다.
+    """
+    query = str(params.get("query") or "").strip()
+    if target not in CATALOG_TARGETS or not query or str(params.get("search", "1")) == "2":
+        return None
+    catalog = get_law_catalog(target)
+    if not len(catalog):
+        return None
+    display = max(1, int(params.get("display") or 20))
+    page = max(1, int(params.get("page") or 1))
+    matches = catalog.search(query, limit=len(catalog))
+    start = (page - 1) * display
+    return {
+        "LawSearch": {
+            "target": target,
+            "키워드": query,
+            "resultCode": "00",
+            "resultMsg": "success",
+            "totalCnt": str(len(matches)),
+            "page": str(page),
+            "numOfRows": str(display),
+            "law": [entry.to_search_item() for entry in matches[start:start + display]],
+        }
+    }
+
+
+def _index_articles_fulltext(target: str, mst: str, index: ArticleIndex) -> None:
+    """새로 만든 조문 색인을 전문 검색 색인에 백그라운드로 추가"""
+    get_article_search_index().add_law_async(target, mst, index)
+
+
+def search_articles(query: str, limit: int = 10, target: Optional[str] = None) -> list:
+    """색인된 모든 법령에서 조문 검색 (BM25 상위 limit개)"""
+    return get_article_search_index().search(query, limit=limit, target=target)
+
+
+def _backfill_fulltext(limit: int = FULLTEXT_BACKFILL_PER_RUN, should_stop: Optional[Callable[[], bool]] = None) -> int:
+    """조문 샤드로 저장됐지만 전문 검색 색인에 없는 법령 버전을 추가하고 추가한 수 반환"""
+    indexes = _get_article_indexes()
+    fulltext = get_article_search_index()
+    added = 0
+    for target, mst in indexes.store.laws():
+        if added >= limit or (should_stop is not None and should_stop()):
+            break
+        if fulltext.has_law(target, mst):
+            continue
+        sharded = indexes.store.open(target, mst)
+        if sharded is not None and fulltext.add_law(target, mst, sharded):
+            added += 1
+    return added
+
+
+def get_similarity_index() -> SimilarityIndex:
+    """공용 유사도 색인 반환"""
+    global _similarity
+    if _similarity is None:
+        with _catalog_lock:
+            if _similarity is None:
+                _similarity = SimilarityIndex(get_index_dir() / "similarity", index_config.similarity_max_documents)
+    return _similarity
+
+
+def observe_documents(data: Any, params: Optional[Dict[str, Any]] = None) -> None:
+    """판례/법령해석례 본문 응답을 유사도 색인 문서로 수집 (요청 공통 함수에서 호출)"""
+    try:
+        if isinstance(data, dict) and ("PrecService" in data or "ExpcService" in data):
+            get_similarity_index().observe(data, params)
+    except Exception as e:
+        logger.debug(f"유사도 색인 문서 수집 실패: {e}")
+
+
+def rebuild_similarity_index(force: bool = False, should_stop: Optional[Callable[[], bool]] = None) -> Optional[int]:
+    """조문 샤드·수집 문서가 바뀌었으면 유사도 행렬을 다시 만들고 행 수 반환 (바뀐 게 없거나 중단되면 None)
+
+    행렬에 행이 있으면 SIMILARITY_REBUILD_INTERVAL_HOURS 안에는 다시 만들지 않습니다 (조문 샤드 전체를 다시 읽으므로).
+    """
+    if not HAS_NUMPY:
+        return None
+    similarity = get_similarity_index()
+    built_at = similarity.built_at
+    if not force and similarity.row_count and built_at is not None and time.time() - built_at < index_config.similarity_rebuild_interval_hours * 3600:
+        return None
+    store = _get_article_indexes().store
+    laws = store.laws()
+    article_keys = [f"{target}:{mst}" for target, mst in laws]
+    if not force and not similarity.is_stale(article_keys):
+        return None
+
+    def articles():
+        for target, mst in laws:
+            sharded = store.open(target, mst)
+            if sharded is None:
+                continue
+            try:
+                sharded.records  # 조문 파일이 정리되었으면 KeyError
+            except KeyError:
+                continue
+            yield target, mst, sharded
+
+    return similarity.build(articles(), article_keys, should_stop)
+
+
+def search_similar(text: str, limit: int = 10, kind: Optional[str] = None) -> list:
+    """질의 텍스트와 비슷한 조문·판례·해석례
+
+    행렬이 아직 없으면 생성을 백그라운드에 예약하고 빈 목록을 반환합니다
+    (similarity.building으로 생성 중인지 확인). 전체 조문 샤드를 읽는 생성을 요청 안에서 기다리지 않습니다.
+    """
+    similarity = get_similarity_index()
+    if similarity.row_count == 0:
+        similarity.build_in_background(rebuild_similarity_index)
+        return []
+    return similarity.search(text, limit=limit, kind=kind)
+
+
+def _fetch_catalog_page(target: str, page: int, display: int) -> Dict[str, Any]:
+    """카탈로그 갱신용 lawSearch.do 목록 조회 (검색어 없이 현행 법령 전체)"""
+    global _client
+    if _client is None:
+        from ..apis.client import LegislationClient
+        _client = LegislationClient()
+    return _client.search(target, {"display": display, "page": page, "sort": "lasc"})
+
+
+def refresh_law_catalog(target: str = "law", should_stop: Optional[Callable[[], bool]] = None) -> int:
+    """lawSearch.do 목록으로 카탈로그 전체 갱신 (블로킹)하고 항목 수 반환
+
+    현행 법령 카탈로그를 새로 받으면 변경이력 동기화 기준일을 어제로 맞춥니다 (오늘 변경분부터 증분 반영).
+    """
+    count = get_law_catalog(target).refresh(lambda page, display: _fetch_catalog_page(target, page, display), should_stop)
+    if target == "law" and index_config.change_sync_enabled:
+        get_change_sync().reset(date.today() - timedelta(days=1))
+    return count
+
+
+def get_change_sync() -> ChangeFeedSync:
+    """공용 변경이력 동기화 작업 반환"""
+    global _change_sync
+    if _change_sync is None:
+        with _catalog_lock:
+            if _change_sync is None:
+                _change_sync = ChangeFeedSync(
+                    get_index_dir() / "change_sync.bin",
+                    _fetch_change_page,
+                    _apply_law_changes,
+                    max_days=index_config.change_sync_max_days,
+                )
+    return _change_sync
+
+
+def _fetch_change_page(day: str, page: int, display: int) -> Dict[str, Any]:
+    """변경이력(lsHstInf) 일자별 목록 조회"""
+    global _sync_client
+    if _sync_client is None:
+        from ..apis.client import LegislationClient
+        _sync_client = LegislationClient(replace(legislation_config, default_timeout=max(legislation_config.default_timeout, SYNC_REQUEST_TIMEOUT)))
+    return _sync_client.search("lsHstInf", {"regDt": day, "display": display, "page": page})
+
+
+def _refetch_law_version(mst: str) -> bool:
+    """새 법령 버전 본문을 받아 캐시와 조문 저장소(조문 샤드·전문 검색·유사도 색인 대상)에 반영"""
+    global _client
+    if _client is None:
+        from ..apis.client import LegislationClient
+        _client = LegislationClient()
+    data = fetch_with_cache(get_cache_key("law", mst, "full"), lambda: _client.service("law", {"MST": mst}))
+    if not isinstance(data, dict) or "error" in data:
+        return False
+    observe_law_ids(data, {"MST": mst})
+    return get_article_index("law", mst, lambda: data) is not None
+
+
+def _apply_law_changes(items: list, day: str) -> Dict[str, int]:
+    """하루치 변경이력 반영 - 매핑·카탈로그 갱신, 로컬에 보관 중인 법령은 새 버전 본문을 미리 받음"""
+    id_map = get_law_id_map()
+    id_map.observe({"LawSearch": {"law": items}})
+    result = get_law_catalog("law").apply_changes(items)
+
+    # 조문 저장소에 이전 버전이 있는 법령만 새 버전을 받음 (나머지는 조회될 때 받음)
+    store = _get_article_indexes().store
+    stored = {mst for target, mst in store.laws() if target == "law"}
+    local_law_ids = {law_id for law_id in map(id_map.law_id_for, stored) if law_id}
+    refetched = failed = 0
+    for item in items:
+        mst = str(item.get("법령일련번호") or "").strip()
+        law_id = str(item.get("법령ID") or "").strip()
+        if not mst or mst in stored or law_id not in local_law_ids or "폐지" in str(item.get("제개정구분명") or ""):
+            continue
+        if refetched + failed >= SYNC_REFETCH_PER_DAY:
+            break
+        try:
+            if _refetch_law_version(mst):
+                refetched += 1
+                stored.add(mst)
+            else:
+                failed += 1
+        except Exception as e:
+            failed += 1
+            logger.warning(f"변경 법령 본문 조회 실패 (MST {mst}, {day}): {e}")
+    result.update({"refetched": refetched, "refetch_failed": failed})
+    if result["updated"] or result["removed"] or refetched:
+        logger.info(f"법령 변경이력 반영 ({day}) - 변경 {len(items)}건, 카탈로그 교체 {result['updated']}건/삭제 {result['removed']}건, 새 버전 수집 {refetched}건")
+    return result
+
+
+def sync_law_changes(should_stop: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+    """변경이력 증분 동기화 1회 (블로킹)
+
+    기준일이 없으면 카탈로그 생성일(너무 오래되었으면 실패)부터 시작합니다.
+    Raises:
+        RuntimeError: 기준일이 없거나 너무 오래되어 카탈로그 전체 갱신이 필요함
+    """
+    sync = get_change_sync()
+    sync.ensure_loaded()
+    if sync.watermark is None:
+        built_at = get_law_catalog("law").built_at
+        if built_at is not None:
+            # 카탈로그 생성일 당일 변경분부터 다시 반영
+            sync.reset(date.fromtimestamp(built_at) - timedelta(days=1))
+    return sync.run_once(should_stop=should_stop)
+
+
+class IndexMaintainer:
+    """주기적 색인 유지 작업 (변경이력 동기화, 오래된 카탈로그 갱신, 변경분 저장)"""
+
+    def __init__(self, interval: float = 3600.0):
+        """
+        Args:
+            interval: 점검 주기(초)
+        """
+        self.interval = interval
+        self.runs = 0
+        self.last_run: Optional[Dict[str, Any]] = None
+        # 종료 요청 - 워커 스레드의 run_once는 취소되지 않으므로 단계·일자·페이지·법령 사이마다 확인
+        self._stop = threading.Event()
+        self._running = threading.Lock()
+        # 서버가 색인을 로드한 시점의 코퍼스 완료 시각 (바뀌면 다시 로드)
+        self._corpus_done = corpus_completed_at(get_index_dir())
+
+    def stop(self) -> None:
+        """진행 중인 run_once를 다음 확인 지점에서 멈추고 run_forever 종료 (서버 종료 시 호출)"""
+        self._stop.set()
+
+    def run_once(self) -> Dict[str, Any]:
+        """유지 작업 1회 실행 (블로킹 I/O 포함, stop() 후에는 남은 단계를 건너뜀)"""
+        should_stop = self._stop.is_set
+        if corpus_build_active(get_index_dir()):
+            # 코퍼스 구축 프로세스가 같은 색인 파일을 쓰는 중 - 저장하면 구축 결과를 덮어씀
+            self.last_run = {"at": time.strftime("%Y-%m-%d %H:%M:%S"), "skipped": "코퍼스 구축 중"}
+            return self.last_run
+        corpus_done = corpus_completed_at(get_index_dir())
+        if corpus_done != self._corpus_done:
+            self._corpus_done = corpus_done
+            _reload_shared_indexes()
+            logger.info("코퍼스 구축 완료 - 카탈로그·전문 검색 색인을 파일에서 다시 로드")
+        started = time.monotonic()
+        refreshed: Dict[str, Any] = {}
+        synced: Any = None
+        # 오프라인 모드에서는 업스트림이 필요한 동기화·갱신을 건너뛰고 로컬 정리만 수행
+        online = legislation_config is not None and not get_upstream_health().is_offline()
+        if not online and legislation_config is not None:
+            synced = "건너뜀: 오프라인 모드"
+        if index_config.change_sync_enabled and online:
+            try:
+                synced = sync_law_changes(should_stop)
+            except Exception as e:
+                synced = f"실패: {e}"
+                logger.warning(f"법령 변경이력 동기화 실패 (필요하면 카탈로그 전체 갱신): {e}")
+        for target in CATALOG_TARGETS:
+            catalog = get_law_catalog(target)
+            max_age = index_config.catalog_max_age_hours * 3600
+            if target == "law" and isinstance(synced, dict):
+                # 변경이력으로 따라가고 있으면 전체 갱신은 누락 대비 안전망 주기로만
+                max_age *= SYNC_FULL_REFRESH_FACTOR
+            if index_config.catalog_auto_refresh and online and not should_stop() and catalog.is_stale(max_age):
+                try:
+                    refreshed[target] = refresh_law_catalog(target, should_stop)
+                except Exception as e:
+                    refreshed[target] = f"실패: {e}"
+                    logger.warning(f"법령 카탈로그 갱신 실패 ({target}, 다음 주기에 재시도): {e}")
+            catalog.flush()
+        get_law_id_map().flush()
+        store = _get_article_indexes().store
+        pruned = store.prune()
+        get_article_search_index().prune_superseded(store.laws())
+        try:
+            backfilled = _backfill_fulltext(should_stop=should_stop)
+        except Exception as e:
+            backfilled = f"실패: {e}"
+            logger.warning(f"전문 검색 색인 보충 실패: {e}")
+        get_article_search_index().flush()
+        try:
+            similarity_rows = None if should_stop() else rebuild_similarity_index(should_stop=should_stop)
+        except Exception as e:
+            similarity_rows = f"실패: {e}"
+            logger.warning(f"유사도 색인 생성 실패: {e}")
+        get_similarity_index().flush()
+        self.runs += 1
+        self.last_run = {
+            "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "synced": synced,
+            "refreshed": refreshed,
+            "article_shards_pruned": pruned,
+            "fulltext_backfilled": backfilled,
+            "similarity_rebuilt": similarity_rows,
+            "stopped": should_stop(),
+            "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
+        }
+        return self.last_run
+
+    async def run_forever(self) -> None:
+        """interval마다 워커 스레드에서 run_once 실행 (stop() 또는 취소될 때까지)
+
+        워커 스레드는 취소되지 않으므로, 취소되면 중단을 요청하고 run_once가 다음 확인 지점에서
+        끝날 때까지 기다린 뒤 종료합니다 (종료 후 close_indexes와 색인 파일을 동시에 쓰지 않도록).
+        """
+        self._stop.clear()
+        while not self._stop.is_set():
+            try:
+                await anyio.to_thread.run_sync(self._run_exclusive)
+            except asyncio.CancelledError:
+                self._stop.set()
+                await anyio.to_thread.run_sync(self._wait_idle)
+                raise
+            except Exception as e:
+                logger.warning(f"색인 유지 작업 실패 (다음 주기에 재시도): {e}")
+            await asyncio.sleep(self.interval)
+
+    def _run_exclusive(self) -> Dict[str, Any]:
+        with self._running:
+            return self.run_once()
+
+    def _wait_idle(self) -> None:
+        with self._running:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {"interval_seconds": self.interval, "runs": self.runs, "last_run": self.last_run}
+
+
+_maintainer: Optional[IndexMaintainer] = None
+
+
+def get_index_maintainer() -> IndexMaintainer:
+    """공용 색인 유지 작업 반환"""
+    global _maintainer
+    if _maintainer is None:
+        _maintainer = IndexMaintainer()
+    return _maintainer
+
+
+def index_stats() -> Dict[str, Any]:
+    """색인 통계"""
+    stats: Dict[str, Any] = {
+        "catalogs": {target: get_law_catalog(target).stats() for target in CATALOG_TARGETS},
+        "id_map": get_law_id_map().stats(),
+        "articles": _get_article_indexes().stats(),
+        "fulltext": get_article_search_index().stats(),
+        "similarity": get_similarity_index().stats(),
+        "change_sync": get_change_sync().stats(),
+        "maintainer": get_index_maintainer().stats(),
+    }
+    return stats
+
+
+def _owns_shared_index_files() -> bool:
+    """이 프로세스의 메모리 색인을 공용 색인 파일에 저장해도 되는지 여부
+
+    다른 프로세스가 코퍼스를 구축 중이거나, 구축이 끝난 뒤 아직 다시 로드하지 않았으면 False.
+    """
+    directory = get_index_dir()
+    owner = corpus_lock_owner(directory)
+    if owner is not None:
+        return owner == os.getpid()
+    return _maintainer is None or corpus_completed_at(directory) == _maintainer._corpus_done
+
+
+def close_indexes() -> None:
+    """색인 변경분 저장 (서버 종료 시 호출, 코퍼스 구축 결과를 덮어쓰게 되면 공용 색인 파일은 저장하지 않음)"""
+    if _article_indexes is not None and _article_indexes.store is not None:
+        _article_indexes.store.close()
+    if _similarity is not None:
+        try:
+            _similarity.close()
+        except Exception as e:
+            logger.warning(f"유사도 색인 문서 저장 실패: {e}")
+    if not _owns_shared_index_files():
+        logger.warning("코퍼스 구축 중이거나 구축 후 다시 로드하지 않아 카탈로그·ID 매핑·전문 검색 색인 저장을 건너뜁니다")
+        if _fulltext is not None:
+            _fulltext.discard()
+        return
+    if _fulltext is not None:
+        try:
+            _fulltext.close()
+        except Exception as e:
+            logger.warning(f"전문 검색 색인 저장 실패: {e}")
+    for index in [*_catalogs.values(), _id_map]:
+        if index is None:
+            continue
+        try:
+            index.flush()
+        except Exception as e:
+            logger.warning(f"색인 저장 실패 ({index.path}): {e}")
+
+
+__all__ = [
+    "ArticleIndex",
+    "ArticleRecord",
+    "ArticleSearchIndex",
+    "ArticleShardStore",
+    "CATALOG_TARGETS",
+    "ChangeFeedSync",
+    "IndexMaintainer",
+    "LawCatalog",
+    "LawCatalogEntry",
+    "LawIdMap",
+    "SimilarityIndex",
+    "close_indexes",
+    "format_article_label",
+    "get_article_index",
+    "get_article_search_index",
+    "get_change_sync",
+    "get_index_dir",
+    "get_index_maintainer",
+    "get_law_catalog",
+    "get_law_id_map",
+    "get_similarity_index",
+    "index_stats",
+    "local_law_body",
+    "local_law_search",
+    "mst_to_law_id",
+    "normalize_law_name",
+    "observe_documents",
+    "observe_law_ids",
+    "observe_search_results",
+    "parse_article_key",
+    "rebuild_similarity_index",
+    "refresh_law_catalog",
+    "resolve_law_name",
+    "search_articles",
+    "search_similar",
+    "store_law_body",
+    "sync_law_changes",
+]
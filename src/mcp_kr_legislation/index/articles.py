@@ -0,0 +1,296 @@
+"""
+법령 버전별 조문 색인
+
+법령 본문(lawService.do) 응답의 조문 목록을 한 번만 정리해 두고
+조문 조회·범위 조회·조문 검색 도구가 재사용합니다.
+
+- (조문번호, 조문가지번호) → 조문: 단일 조문 조회 O(1)
+- 조문 순서(position): 범위 조회는 시작 조문 위치부터 k개 슬라이스
+- 조문여부(전문/조문) 판정과 HTML 태그 제거는 색인 생성 시 1회만 수행
+
+MST는 법령 버전마다 고유하므로 한 번 만든 색인은 같은 (target, MST)에 대해 계속 유효합니다.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_HTML_TAG = re.compile(r"<[^>]+>")
+# "제10조의2", "10조의2", "10-2", "10" 등
+_ARTICLE_REF = re.compile(r"^\s*제?\s*(\d+)\s*(?:조)?\s*(?:(?:의|-)\s*(\d+))?")
+
+ArticleKey = Tuple[int, int]
+
+
+def clean_article_text(value: Any) -> str:
+    """조문 텍스트 정리 (리스트는 줄바꿈으로 합치고 HTML 태그 제거)"""
+    if not value:
+        return ""
+    if isinstance(value, list):
+        value = "\n".join(str(item) for item in value if item)
+    return _HTML_TAG.sub("", str(value)).strip()
+
+
+def _to_int(value: Any) -> int:
+    try:
+        return int(str(value).strip() or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def parse_article_key(article: Any) -> Optional[ArticleKey]:
+    """조문 지정값을 (조문번호, 조문가지번호)로 변환
+
+    예: "제10조의2" → (10, 2), "제15조" → (15, 0), 15 → (15, 0), "001002" → (10, 2)
+    """
+    if isinstance(article, int):
+        return (article, 0)
+    text = str(article or "").strip()
+    if re.fullmatch(r"\d{6}", text):
+        return (int(text[:4]), int(text[4:]))
+    match = _ARTICLE_REF.match(text)
+    if not match:
+        return None
+    return (int(match.group(1)), int(match.group(2) or 0))
+
+
+def format_article_label(key: ArticleKey) -> str:
+    """(10, 2) → "제10조의2" """
+    number, branch = key
+    return f"제{number}조의{branch}" if branch else f"제{number}조"
+
+
+@dataclass
+class ArticleRecord:
+    """정리된 조문 하나"""
+
+    number: int  # 조문번호
+    branch: int  # 조문가지번호 (없으면 0)
+    position: int  # 실제 조문 기준 순서 (0부터)
+    title: str  # 조문제목
+    text: str  # 조문내용 (HTML 제거)
+    paragraphs: List[str] = field(default_factory=list)  # 항내용 (HTML 제거)
+    effective_date: str = ""  # 조문시행일자
+    raw: Dict[str, Any] = field(default_factory=dict, repr=False)  # 원본 조문단위 (항/호/목 포맷팅용)
+    search_text: str = field(init=False, repr=False)  # 검색용 소문자 텍스트 (제목 + 조문내용)
+
+    def __post_init__(self) -> None:
+        self.search_text = f"{self.title} {self.text}".lower()
+
+    @property
+    def key(self) -> ArticleKey:
+        return (self.number, self.branch)
+
+    @property
+    def label(self) -> str:
+        return format_article_label(self.key)
+
+
+
+class ArticleIndex:
+    """법령 버전 하나의 조문 색인
+
+    조문은 순서(position)대로 보관하고 (조문번호, 조문가지번호) → position 표로 조회합니다.
+    하위 클래스는 _load_record를 재정의해 조문을 필요할 때 읽어올 수 있습니다.
+    """
+
+    def __init__(self,
+                 law_name: str,
+                 records: List[Optional[ArticleRecord]],
+                 keys: Optional[List[ArticleKey]] = None,
+                 titles: Optional[List[str]] = None,
+                 effective_date: str = ""):
+        """
+        Args:
+            law_name: 법령명
+            records: 순서대로 정리된 조문 (지연 로드 시 None 자리표시)
+            keys: 순서별 조문 키 (생략하면 records에서 추출)
+            titles: 순서별 조문제목 (생략하면 records에서 추출)
+            effective_date: 법령 시행일자 (YYYYMMDD, 버전 비교용)
+        """
+        self.law_name = law_name
+        self.effective_date = effective_date
+        self._records = records
+        self.keys: List[ArticleKey] = keys if keys is not None else [r.key for r in records]  # type: ignore[union-attr]
+        self.titles: List[str] = titles if titles is not None else [r.title for r in records]  # type: ignore[union-attr]
+        self._positions: Dict[ArticleKey, int] = {}
+        for position, key in enumerate(self.keys):
+            # 같은 키가 반복되면(드문 응답 형식) 첫 번째 조문 유지
+            self._positions.setdefault(key, position)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def is_available(self) -> bool:
+        """조문을 계속 읽을 수 있는지 여부 (메모리 색인은 항상 True)"""
+        return True
+
+    def _load_record(self, position: int) -> ArticleRecord:
+        raise KeyError(position)
+
+    def _record_at(self, position: int) -> ArticleRecord:
+        record = self._records[position]
+        if record is None:
+            record = self._records[position] = self._load_record(position)
+        return record
+
+    @property
+    def records(self) -> List[ArticleRecord]:
+        """전체 조문 (지연 로드 색인은 이때 모두 읽음)"""
+        return [self._record_at(position) for position in range(len(self.keys))]
+
+    def position_of(self, article: Any) -> Optional[int]:
+        key = article if isinstance(article, tuple) else parse_article_key(article)
+        return self._positions.get(key) if key else None
+
+    def get(self, article: Any) -> Optional[ArticleRecord]:
+        """조문 조회 ("제10조의2", (10, 2), 15 등)"""
+        position = self.position_of(article)
+        return self._record_at(position) if position is not None else None
+
+    def range(self, start: Any, count: int) -> List[ArticleRecord]:
+        """start 조문부터 순서대로 count개 (start가 없으면 빈 목록)"""
+        position = self.position_of(start)
+        if position is None:
+            return []
+        end = min(len(self.keys), position + max(0, count))
+        return [self._record_at(i) for i in range(position, end)]
+
+    def labels(self, limit: int = 10) -> List[str]:
+        """앞쪽 조문 이름 목록 (조문을 찾지 못했을 때 안내용)"""
+        return [format_article_label(key) for key in self.keys[:limit]]
+
+    @classmethod
+    def from_law_data(cls, data: Any) -> "ArticleIndex":
+        """lawService.do 본문 응답으로 색인 생성 (법령.조문.조문단위 또는 Law.JoSection.Jo)"""
+        if not isinstance(data, dict):
+            return cls("", [])
+        law = data.get("법령") or data.get("Law") or data
+        if not isinstance(law, dict):
+            return cls("", [])
+        basic = law.get("기본정보") or {}
+        law_name = (basic.get("법령명_한글") or basic.get("법령명한글") or "") if isinstance(basic, dict) else ""
+        effective_date = str(basic.get("시행일자") or "") if isinstance(basic, dict) else ""
+
+        records: List[ArticleRecord] = []
+        section = law.get("조문")
+        units = section.get("조문단위") if isinstance(section, dict) else section
+        if units is None and "조문단위" in law:
+            units = law["조문단위"]
+        if units is not None:
+            if not isinstance(units, list):
+                units = [units]
+            for unit in units:
+                # 조문여부가 "전문"인 항목은 장·절 제목 (조문여부가 없으면 조문으로 간주)
+                if not isinstance(unit, dict) or unit.get("조문여부", "조문") != "조문":
+                    continue
+                hangs = unit.get("항") or []
+                if isinstance(hangs, dict):
+                    hangs = [hangs]
+                records.append(ArticleRecord(
+                    number=_to_int(unit.get("조문번호")),
+                    branch=_to_int(unit.get("조문가지번호")),
+                    position=len(records),
+                    title=clean_article_text(unit.get("조문제목")),
+                    text=clean_article_text(unit.get("조문내용")),
+                    paragraphs=[p for p in (clean_article_text(h.get("항내용")) for h in hangs if isinstance(h, dict)) if p],
+                    effective_date=str(unit.get("조문시행일자") or ""),
+                    raw=unit,
+                ))
+            return cls(law_name, records, effective_date=effective_date)
+
+        # 영문 법령 (Law.JoSection.Jo, joYn=Y가 조문)
+        jo_section = law.get("JoSection")
+        jos = jo_section.get("Jo") if isinstance(jo_section, dict) else None
+        if jos is not None:
+            if not isinstance(jos, list):
+                jos = [jos]
+            for jo in jos:
+                if not isinstance(jo, dict) or jo.get("joYn", "Y") != "Y":
+                    continue
+                records.append(ArticleRecord(
+                    number=_to_int(jo.get("joNo")),
+                    branch=_to_int(jo.get("joBrNo")),
+                    position=len(records),
+                    title="",
+                    text=clean_article_text(jo.get("joCts")),
+                    raw=jo,
+                ))
+        return cls(law_name, records, effective_date=effective_date)
+
+
+class ArticleIndexCache:
+    """(target, MST)별 조문 색인 LRU"""
+
+    def __init__(self,
+                 max_entries: int = 32,
+                 store: Any = None,
+                 on_build: Optional[Callable[[str, str, ArticleIndex], None]] = None):
+        """
+        Args:
+            max_entries: 메모리에 유지할 법령 버전 수
+            store: 조문 단위 저장소 (ArticleShardStore, None이면 메모리 색인만 사용)
+            on_build: 본문으로 새 색인을 만든 뒤 호출할 함수 (target, MST, 색인)
+        """
+        self.max_entries = max_entries
+        self.store = store
+        self.on_build = on_build
+        self._lock = threading.Lock()
+        self._indexes: "OrderedDict[Tuple[str, str], ArticleIndex]" = OrderedDict()
+        self._hits = 0
+        self._builds = 0
+        self._shard_opens = 0
+
+    def get(self, target: str, mst: str, load: Callable[[], Any]) -> Optional[ArticleIndex]:
+        """색인 반환 (없으면 load()로 본문을 받아 생성, 조문이 없으면 None)"""
+        key = (target, str(mst))
+        with self._lock:
+            index = self._indexes.get(key)
+            # 지연 로드 색인은 조문 파일이 정리(prune)되었으면 다시 생성
+            if index is not None and not index.is_available():
+                del self._indexes[key]
+                index = None
+            if index is not None:
+                self._indexes.move_to_end(key)
+                self._hits += 1
+                return index
+        # 조문 단위 저장소에 있으면 본문 전체를 읽지 않고 목차(manifest)만 로드
+        index = self.store.open(target, mst, load) if self.store is not None else None
+        if index is not None:
+            with self._lock:
+                self._shard_opens += 1
+        else:
+            data = load()
+            if not data:
+                return None
+            index = ArticleIndex.from_law_data(data)
+            if not len(index):
+                return None
+            if self.store is not None:
+                # 메모리 색인으로 바로 응답하고 조문 파일은 백그라운드에서 저장
+                self.store.write_async(target, mst, index)
+            if self.on_build is not None:
+                self.on_build(target, str(mst), index)
+            with self._lock:
+                self._builds += 1
+        with self._lock:
+            self._indexes[key] = index
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > self.max_entries:
+                self._indexes.popitem(last=False)
+        return index
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = {
+                "laws": len(self._indexes),
+                "max_laws": self.max_entries,
+                "articles": sum(len(index) for index in self._indexes.values()),
+                "hits": self._hits,
+                "builds": self._builds,
+                "shard_opens": self._shard_opens,
+            }
+        stats["shards"] = self.store.stats() if self.store is not None else None
+        return stats
@@ -0,0 +1,414 @@
+"""
+현행 법령 카탈로그 (법령명 → 법령ID/MST)
+
+법령명으로 호출되는 도구(get_law_summary, compare_law_versions 등)가 MST를 찾기 위해
+매번 lawSearch.do를 호출하지 않도록, 현행 법령 목록을 페이지 단위로 받아 로컬에 저장하고
+메모리 색인으로 법령명·정규화된 법령명·약칭을 조회합니다.
+
+- refresh: lawSearch.do 목록 전체를 다시 받아 교체 (실패 시 기존 카탈로그 유지)
+- observe: 도구가 받은 검색 결과를 카탈로그에 반영 (전체 갱신 사이의 신규 법령 보완)
+- apply_changes: 변경이력(lsHstInf) 항목으로 바뀐 법령만 교체/삭제 (증분 동기화)
+- 갱신 후 등록된 리스너를 호출 (다른 색인이 카탈로그 변경을 따라갈 수 있도록)
+"""
+
+import logging
+import re
+import threading
+import time
+import unicodedata
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ..cache import CacheCodec
+from .store import read_index_payload, write_index_payload
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION = 1
+PAGE_SIZE = 100  # lawSearch.do display 최대값
+MAX_PAGES = 500
+
+# 법령명 정규화 시 제거하는 문자 (공백, 가운뎃점 변형, 따옴표)
+_NAME_NOISE = re.compile(r"[\s·ㆍ∙•‧'\"「」『』]")
+
+
+def normalize_law_name(name: str) -> str:
+    """법령명 비교용 정규화 (공백·가운뎃점 제거, 영문 소문자화)
+
+    예: "개인정보 보호법" → "개인정보보호법", "Civil Act" → "civilact"
+    """
+    return _NAME_NOISE.sub("", unicodedata.normalize("NFC", name or "")).lower()
+
+
+@dataclass
+class LawCatalogEntry:
+    """카탈로그 항목 하나 (현행 법령 1건)"""
+
+    name: str  # 법령명한글
+    law_id: str  # 법령ID
+    mst: str  # 법령일련번호
+    abbreviation: str = ""  # 법령약칭명
+    english_name: str = ""  # 법령명영문 (elaw 카탈로그)
+    effective_date: str = ""  # 시행일자
+    promulgation_date: str = ""  # 공포일자
+    ministry: str = ""  # 소관부처명
+    law_type: str = ""  # 법령구분명
+    revision_type: str = ""  # 제개정구분명
+
+    @property
+    def normalized_name(self) -> str:
+        return normalize_law_name(self.name)
+
+    @classmethod
+    def from_search_item(cls, item: Dict[str, Any]) -> Optional["LawCatalogEntry"]:
+        """lawSearch.do 목록 항목에서 생성 (법령명/MST가 없으면 None)"""
+        name = str(item.get("법령명한글") or item.get("법령명") or "").strip()
+        mst = str(item.get("법령일련번호") or item.get("MST") or "").strip()
+        if not name or not mst:
+            return None
+        return cls(
+            name=name,
+            law_id=str(item.get("법령ID") or "").strip(),
+            mst=mst,
+            abbreviation=str(item.get("법령약칭명") or "").strip(),
+            english_name=str(item.get("법령명영문") or "").strip(),
+            effective_date=str(item.get("시행일자") or ""),
+            promulgation_date=str(item.get("공포일자") or ""),
+            ministry=str(item.get("소관부처명") or ""),
+            law_type=str(item.get("법령구분명") or ""),
+            revision_type=str(item.get("제개정구분명") or ""),
+        )
+
+    def to_search_item(self) -> Dict[str, Any]:
+        """lawSearch.do 목록 항목과 같은 키의 딕셔너리 (검색 결과 대신 사용)"""
+        item = {
+            "법령명한글": self.name,
+            "법령ID": self.law_id,
+            "법령일련번호": self.mst,
+            "법령약칭명": self.abbreviation,
+            "시행일자": self.effective_date,
+            "공포일자": self.promulgation_date,
+            "소관부처명": self.ministry,
+            "법령구분명": self.law_type,
+            "제개정구분명": self.revision_type,
+            "현행연혁코드": "현행",
+        }
+        if self.english_name:
+            item["법령명영문"] = self.english_name
+        return item
+
+
+# 같은 정규화 이름이 여러 개일 때 우선순위 (법률 > 대통령령 > 그 외)
+_LAW_TYPE_PRIORITY = {"법률": 0, "대통령령": 1}
+
+
+class LawCatalog:
+    """target별 현행 법령 카탈로그 (메모리 색인 + 파일 저장)"""
+
+    def __init__(self, target: str, path: Path):
+        """
+        Args:
+            target: lawSearch.do target (law: 현행법령, elaw: 영문법령)
+            path: 카탈로그 저장 파일
+        """
+        self.target = target
+        self.path = Path(path)
+        self.codec = CacheCodec()
+        self._lock = threading.RLock()
+        self._refresh_lock = threading.Lock()
+        self._entries: Dict[str, LawCatalogEntry] = {}  # MST → 항목
+        self._by_name: Dict[str, LawCatalogEntry] = {}  # 정규화된 법령명/영문명 → 항목
+        self._by_abbreviation: Dict[str, LawCatalogEntry] = {}
+        self._by_law_id: Dict[str, LawCatalogEntry] = {}
+        self._listeners: List[Callable[["LawCatalog"], None]] = []
+        self.built_at: Optional[float] = None
+        self._dirty = False
+        self._loaded = False
+        self._lookups = 0
+        self._lookup_hits = 0
+        self._observed = 0
+        self._refreshes = 0
+        self._last_refresh: Optional[Dict[str, Any]] = None
+
+    # ------------------------------------------------------------------
+    # 색인
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _prefer(current: Optional[LawCatalogEntry], candidate: LawCatalogEntry) -> LawCatalogEntry:
+        if current is None:
+            return candidate
+        current_rank = _LAW_TYPE_PRIORITY.get(current.law_type, 9)
+        candidate_rank = _LAW_TYPE_PRIORITY.get(candidate.law_type, 9)
+        if candidate_rank != current_rank:
+            return candidate if candidate_rank < current_rank else current
+        # 같은 종류면 시행일자가 최근인 항목
+        return candidate if candidate.effective_date >= current.effective_date else current
+
+    def _index(self, entry: LawCatalogEntry) -> None:
+        previous = self._entries.get(entry.mst)
+        if previous is not None:
+            self._unindex(previous)
+        self._entries[entry.mst] = entry
+        for name in (entry.name, entry.english_name):
+            if name:
+                key = normalize_law_name(name)
+                self._by_name[key] = self._prefer(self._by_name.get(key), entry)
+        if entry.abbreviation:
+            key = normalize_law_name(entry.abbreviation)
+            self._by_abbreviation[key] = self._prefer(self._by_abbreviation.get(key), entry)
+        if entry.law_id:
+            self._by_law_id[entry.law_id] = self._prefer(self._by_law_id.get(entry.law_id), entry)
+
+    def _unindex(self, entry: LawCatalogEntry) -> None:
+        for mapping in (self._by_name, self._by_abbreviation, self._by_law_id):
+            for key in [k for k, v in mapping.items() if v is entry]:
+                del mapping[key]
+
+    def _replace_all(self, entries: Iterable[LawCatalogEntry], built_at: Optional[float]) -> None:
+        with self._lock:
+            self._entries, self._by_name, self._by_abbreviation, self._by_law_id = {}, {}, {}, {}
+            for entry in entries:
+                self._index(entry)
+            self.built_at = built_at
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        self.ensure_loaded()
+        return len(self._entries)
+
+    def resolve(self, name: str) -> Optional[LawCatalogEntry]:
+        """법령명(정규화 이름, 약칭, '법'을 생략한 이름 포함)으로 항목 조회"""
+        self.ensure_loaded()
+        key = normalize_law_name(name)
+        if not key:
+            return None
+        with self._lock:
+            self._lookups += 1
+            entry = self._by_name.get(key) or self._by_abbreviation.get(key)
+            if entry is None and not key.endswith("법"):
+                entry = self._by_name.get(key + "법")
+            if entry is not None:
+                self._lookup_hits += 1
+            return entry
+
+    def get_by_mst(self, mst: str) -> Optional[LawCatalogEntry]:
+        self.ensure_loaded()
+        with self._lock:
+            return self._entries.get(str(mst))
+
+    def get_by_law_id(self, law_id: str) -> Optional[LawCatalogEntry]:
+        self.ensure_loaded()
+        with self._lock:
+            return self._by_law_id.get(str(law_id))
+
+    def search(self, query: str, limit: int = 10) -> List[LawCatalogEntry]:
+        """법령명에 검색어가 포함된 항목 (검색어로 시작하는 짧은 이름 우선)"""
+        self.ensure_loaded()
+        key = normalize_law_name(query)
+        if not key:
+            return []
+        with self._lock:
+            matches = [e for e in self._entries.values() if key in e.normalized_name]
+        matches.sort(key=lambda e: (not e.normalized_name.startswith(key), len(e.name), e.name))
+        return matches[:limit]
+
+    def entries(self) -> List[LawCatalogEntry]:
+        self.ensure_loaded()
+        with self._lock:
+            return list(self._entries.values())
+
+    # ------------------------------------------------------------------
+    # 저장/로드
+    # ------------------------------------------------------------------
+
+    def ensure_loaded(self) -> None:
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self.load()
+
+    def load(self) -> bool:
+        """저장된 카탈로그 로드 (없거나 형식이 다르면 빈 카탈로그)"""
+        self._loaded = True
+        payload = read_index_payload(self.path, CATALOG_VERSION)
+        if payload is None:
+            return False
+        known = {f.name for f in fields(LawCatalogEntry)}
+        entries = [LawCatalogEntry(**{k: v for k, v in r.items() if k in known}) for r in payload.get("entries", [])]
+        self._replace_all(entries, payload.get("built_at"))
+        logger.info(f"법령 카탈로그 로드 ({self.target}) - {len(entries)}건")
+        return True
+
+    def save(self) -> None:
+        """카탈로그를 파일에 저장 (임시 파일 작성 후 교체)"""
+        with self._lock:
+            payload = {
+                "version": CATALOG_VERSION,
+                "target": self.target,
+                "built_at": self.built_at,
+                "entries": [asdict(e) for e in self._entries.values()],
+            }
+            self._dirty = False
+        write_index_payload(self.path, payload, self.codec)
+
+    def flush(self) -> None:
+        """observe로 바뀐 내용이 있으면 저장"""
+        if self._dirty:
+            self.save()
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+
+    def is_stale(self, max_age_seconds: float) -> bool:
+        self.ensure_loaded()
+        return self.built_at is None or time.time() - self.built_at > max_age_seconds
+
+    def add_listener(self, listener: Callable[["LawCatalog"], None]) -> None:
+        """전체 갱신 후 호출할 함수 등록"""
+        self._listeners.append(listener)
+
+    def refresh(self, fetch_page: Callable[[int, int], Dict[str, Any]],
+                should_stop: Optional[Callable[[], bool]] = None) -> int:
+        """lawSearch.do 목록을 페이지 단위로 모두 받아 카탈로그 교체
+
+        Args:
+            fetch_page: (page, display) → lawSearch.do 응답
+            should_stop: 페이지마다 확인할 중단 여부 (True면 기존 카탈로그를 유지하고 중단)
+        Returns:
+            항목 수
+        Raises:
+            RuntimeError: 응답 오류·형식 이상·빈 목록·중단 (기존 카탈로그와 갱신 시각은 유지)
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            logger.info(f"법령 카탈로그 갱신이 이미 진행 중입니다 ({self.target})")
+            return len(self)
+        try:
+            started = time.monotonic()
+            collected: Dict[str, LawCatalogEntry] = {}
+            total: Optional[int] = None
+            page = 1
+            while page <= MAX_PAGES:
+                if should_stop is not None and should_stop():
+                    raise RuntimeError(f"카탈로그 갱신 중단 (page={page})")
+                data = fetch_page(page, PAGE_SIZE)
+                if not isinstance(data, dict) or "error" in data:
+                    raise RuntimeError(f"카탈로그 목록 조회 실패 (page={page}): {data.get('error') if isinstance(data, dict) else data}")
+                root = data.get("LawSearch")
+                if not isinstance(root, dict):
+                    # 비JSON·예상 밖 응답(content 래핑 등)을 "법령 0건"으로 저장하지 않도록
+                    raise RuntimeError(f"카탈로그 목록 응답 형식이 올바르지 않습니다 (page={page}, LawSearch 없음)")
+                if total is None:
+                    total = int(root.get("totalCnt") or 0)
+                items = root.get("law") or []
+                if isinstance(items, dict):
+                    items = [items]
+                if page == 1 and not items:
+                    raise RuntimeError(f"카탈로그 목록 첫 페이지에 법령이 없습니다 (totalCnt={total})")
+                for item in items:
+                    entry = LawCatalogEntry.from_search_item(item)
+                    if entry is not None:
+                        collected[entry.mst] = entry
+                if not items or page * PAGE_SIZE >= total:
+                    break
+                page += 1
+
+            if total and len(collected) < total * 0.9:
+                raise RuntimeError(f"카탈로그 목록이 불완전합니다 ({len(collected)}/{total}건)")
+            if not collected:
+                # 기존 카탈로그를 빈 카탈로그로 바꾸거나 갱신 시각을 기록하지 않음
+                raise RuntimeError("카탈로그 목록에서 유효한 법령 항목을 찾지 못했습니다")
+
+            self._replace_all(collected.values(), time.time())
+            self.save()
+            self._refreshes += 1
+            self._last_refresh = {
+                "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "entries": len(collected),
+                "pages": page,
+                "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
+            }
+            logger.info(f"법령 카탈로그 갱신 완료 ({self.target}) - {len(collected)}건, {page}페이지")
+        finally:
+            self._refresh_lock.release()
+
+        for listener in list(self._listeners):
+            try:
+                listener(self)
+            except Exception as e:
+                logger.warning(f"법령 카탈로그 리스너 실패: {e}")
+        return len(collected)
+
+    def observe(self, items: Iterable[Dict[str, Any]]) -> int:
+        """검색 결과 항목을 카탈로그에 반영하고 추가/변경된 항목 수 반환 (현행 법령만)"""
+        self.ensure_loaded()
+        changed = 0
+        with self._lock:
+            for item in items:
+                if not isinstance(item, dict) or item.get("현행연혁코드") not in (None, "", "현행"):
+                    continue
+                entry = LawCatalogEntry.from_search_item(item)
+                if entry is None or self._entries.get(entry.mst) == entry:
+                    continue
+                self._index(entry)
+                changed += 1
+            if changed:
+                self._dirty = True
+                self._observed += changed
+        return changed
+
+    def apply_changes(self, items: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """변경이력(lsHstInf) 항목 반영 - 같은 법령ID의 이전 버전을 새 버전으로 교체, 폐지 법령은 삭제
+
+        시행 전(현행이 아닌) 버전은 건너뜁니다.
+        Returns:
+            {"updated": 교체/추가 수, "removed": 삭제 수}
+        """
+        self.ensure_loaded()
+        updated = removed = 0
+        with self._lock:
+            for item in items:
+                entry = LawCatalogEntry.from_search_item(item) if isinstance(item, dict) else None
+                if entry is None or not entry.law_id:
+                    continue
+                repealed = "폐지" in entry.revision_type
+                if not repealed and item.get("현행연혁코드") not in (None, "", "현행"):
+                    continue
+                stale = [e for e in self._entries.values() if e.law_id == entry.law_id and e.mst != entry.mst]
+                if repealed and entry.mst in self._entries:
+                    stale.append(self._entries[entry.mst])
+                elif not entry.abbreviation:
+                    # 변경이력 항목에는 약칭이 없을 수 있으므로 이전 버전의 약칭 유지
+                    entry.abbreviation = next((old.abbreviation for old in stale if old.abbreviation), "")
+                for old in stale:
+                    del self._entries[old.mst]
+                    removed += 1
+                if not repealed and self._entries.get(entry.mst) != entry:
+                    self._entries[entry.mst] = entry
+                    updated += 1
+            if updated or removed:
+                # 이름·약칭 색인은 같은 이름의 다른 법령이 있을 수 있으므로 전체 재구성 (수천 건, 수 ms)
+                self._replace_all(list(self._entries.values()), self.built_at)
+                self._dirty = True
+        return {"updated": updated, "removed": removed}
+
+    def stats(self) -> Dict[str, Any]:
+        """카탈로그 통계"""
+        self.ensure_loaded()
+        with self._lock:
+            return {
+                "target": self.target,
+                "entries": len(self._entries),
+                "built_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.built_at)) if self.built_at else None,
+                "lookups": self._lookups,
+                "lookup_hits": self._lookup_hits,
+                "observed": self._observed,
+                "refreshes": self._refreshes,
+                "last_refresh": self._last_refresh,
+                "path": str(self.path),
+            }
@@ -0,0 +1,422 @@
+"""
+현행 법령 전체 오프라인 코퍼스 구축
+
+대화형 도구가 law.go.kr을 거의 호출하지 않도록 현행 법령 전체를 로컬에 미리 받아 둡니다.
+
+1. 목록: lawSearch.do(search_law)를 max_display 단위로 페이지 병렬 조회 → 카탈로그에 반영
+2. 본문: lawService.do를 MST별로 제한된 작업자 풀 + 초당 요청 수 제한으로 조회
+3. 저장: 응답 캐시(law:{MST}:full, 압축 형식)와 조문 샤드·전문 검색 색인
+
+진행 상황(완료한 페이지·MST, 실패 목록)은 체크포인트 파일에 주기적으로 저장하므로
+중단된 실행을 다시 시작하면 완료한 부분은 건너뜁니다.
+
+용량: 목록을 받은 뒤 본문을 받기 전에 CACHE_MAX_SIZE_MB, ARTICLE_SHARD_MAX_LAWS가 코퍼스를 담을 수 있는지
+확인하고, 부족하면 본문을 받지 않고 중단합니다 (받은 본문이 곧바로 퇴출·정리되지 않도록).
+--allow-eviction으로 확인을 건너뛸 수 있습니다.
+
+동시 실행: 구축 중에는 색인 디렉토리에 corpus.lock을 두고 체크포인트마다 갱신합니다.
+실행 중인 서버는 잠금이 있는 동안 카탈로그·ID 매핑·전문 검색 색인(fulltext.bin)을 저장하지 않고,
+구축이 끝나면(corpus.done 갱신) 메모리 색인을 버리고 파일에서 다시 로드합니다 (서버의 저장이 코퍼스 결과를 덮어쓰지 않도록).
+
+사용 예시:
+    python -m mcp_kr_legislation.index.corpus --workers 4 --rate 5
+    python -m mcp_kr_legislation.index.corpus --limit 100      # 일부만 (시험용)
+    python -m mcp_kr_legislation.index.corpus --restart        # 체크포인트 무시하고 처음부터
+"""
+
+import argparse
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from ..apis.throttle import TokenBucket
+from ..cache import CacheCodec, get_cache_key, save_to_cache
+from .store import read_index_payload, write_index_payload
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+# 완료 건수가 이만큼 늘 때마다 체크포인트 저장
+CHECKPOINT_EVERY = 25
+MAX_PAGES = 500
+# 용량 확인에 쓰는 법령 본문 캐시 항목 크기 추정치 (압축 후, 현행 법령 평균)
+ESTIMATED_BODY_BYTES = 64 * 1024
+CORPUS_LOCK_FILE = "corpus.lock"
+# 구축을 마칠(중단 포함) 때마다 갱신 - 서버가 색인을 다시 로드할 시점 판단용
+CORPUS_DONE_FILE = "corpus.done"
+# 잠금 파일이 이 시간(초) 동안 갱신되지 않으면 비정상 종료된 실행으로 간주
+CORPUS_LOCK_STALE = 600
+
+
+class CorpusCapacityError(RuntimeError):
+    """캐시·조문 저장소 용량 설정이 코퍼스보다 작음"""
+
+
+class CorpusLockedError(RuntimeError):
+    """다른 코퍼스 구축이 진행 중"""
+
+
+class CorpusLock:
+    """색인 디렉토리의 코퍼스 구축 잠금 파일 (내용: 프로세스 ID)
+
+    실행 중인 서버는 corpus_build_active()로 확인해 공용 색인 파일 저장을 미룹니다.
+    """
+
+    def __init__(self, directory: Path):
+        self.path = Path(directory) / CORPUS_LOCK_FILE
+        self.held = False
+
+    def acquire(self) -> None:
+        """잠금 생성 (다른 실행이 갱신 중이면 CorpusLockedError, 오래된 잠금은 대체)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if corpus_lock_owner(self.path.parent) not in (None, os.getpid()):
+            raise CorpusLockedError(f"다른 코퍼스 구축이 진행 중입니다 ({self.path}, 중단된 실행이면 파일을 삭제하세요)")
+        self.path.write_text(str(os.getpid()))
+        self.held = True
+
+    def touch(self) -> None:
+        """진행 중임을 알리도록 수정 시각 갱신"""
+        if self.held:
+            try:
+                os.utime(self.path)
+            except OSError:
+                pass
+
+    def release(self) -> None:
+        """완료 표시(corpus.done) 갱신 후 잠금 삭제"""
+        if self.held:
+            self.held = False
+            try:
+                self.path.with_name(CORPUS_DONE_FILE).write_text(str(time.time()))
+                self.path.unlink()
+            except OSError:
+                pass
+
+
+def corpus_lock_owner(directory: Path) -> Optional[int]:
+    """코퍼스를 구축 중인 프로세스 ID (잠금이 없거나 오래되었으면 None)"""
+    path = Path(directory) / CORPUS_LOCK_FILE
+    try:
+        if time.time() - path.stat().st_mtime > CORPUS_LOCK_STALE:
+            return None
+        return int(path.read_text().strip() or 0)
+    except (OSError, ValueError):
+        return None
+
+
+def corpus_completed_at(directory: Path) -> Optional[float]:
+    """마지막 코퍼스 구축이 끝난 시각 (없으면 None)"""
+    try:
+        return (Path(directory) / CORPUS_DONE_FILE).stat().st_mtime
+    except OSError:
+        return None
+
+
+def corpus_build_active(directory: Path) -> bool:
+    """다른 프로세스가 이 색인 디렉토리에 코퍼스를 구축하고 있는지 여부"""
+    owner = corpus_lock_owner(directory)
+    return owner is not None and owner != os.getpid()
+
+
+class CorpusBuilder:
+    """현행 법령 목록·본문을 받아 로컬 캐시/색인에 저장하는 재시작 가능한 작업"""
+
+    def __init__(self,
+                 client: Any,
+                 checkpoint_path: Path,
+                 store_body: Callable[[str, Dict[str, Any]], int],
+                 observe_page: Optional[Callable[[List[Dict[str, Any]]], Any]] = None,
+                 workers: int = 4,
+                 rate: float = 5.0,
+                 check_capacity: Optional[Callable[[int], None]] = None,
+                 lock: Optional[CorpusLock] = None):
+        """
+        Args:
+            client: LegislationClient (search_law, service 사용)
+            checkpoint_path: 체크포인트 파일
+            store_body: (MST, 본문 응답) → 저장한 조문 수
+            observe_page: 목록 페이지 항목을 받을 함수 (카탈로그 반영)
+            workers: 동시 요청 수
+            rate: 초당 최대 요청 수 (목록·본문 합산)
+            check_capacity: 본문 조회 전 보관할 법령 수로 호출 (용량이 부족하면 예외)
+            lock: 체크포인트마다 갱신할 잠금 (획득·해제는 호출자)
+        """
+        self.client = client
+        self.checkpoint_path = Path(checkpoint_path)
+        self.store_body = store_body
+        self.observe_page = observe_page
+        self.check_capacity = check_capacity
+        self.lock = lock
+        self.workers = max(1, workers)
+        # 요청 간 최소 간격 유지 (burst 1), 전송 계층의 OC별 속도 제한과 별개로 코퍼스 구축만 더 느리게
+        self.limiter = TokenBucket(rate, burst=1)
+        self.codec = CacheCodec()
+        self._lock = threading.Lock()
+        self.total: Optional[int] = None
+        self.pages_done: Set[int] = set()
+        self.laws: Dict[str, List[str]] = {}  # MST → [법령ID, 법령명]
+        self.done: Set[str] = set()
+        self.failed: Dict[str, str] = {}
+        self.articles = 0
+        self._since_checkpoint = 0
+
+    # ------------------------------------------------------------------
+    # 체크포인트
+    # ------------------------------------------------------------------
+
+    def load_checkpoint(self) -> bool:
+        """이전 실행의 체크포인트 로드 (없으면 False)"""
+        payload = read_index_payload(self.checkpoint_path, CHECKPOINT_VERSION)
+        if payload is None:
+            return False
+        self.total = payload.get("total")
+        self.pages_done = set(payload.get("pages_done", []))
+        self.laws = dict(payload.get("laws", {}))
+        self.done = set(payload.get("done", []))
+        self.failed = dict(payload.get("failed", {}))
+        self.articles = int(payload.get("articles", 0))
+        logger.info(f"코퍼스 체크포인트 로드 - 목록 {len(self.pages_done)}페이지, 본문 {len(self.done)}/{len(self.laws)}건")
+        return True
+
+    def save_checkpoint(self) -> None:
+        with self._lock:
+            payload = {
+                "version": CHECKPOINT_VERSION,
+                "total": self.total,
+                "pages_done": sorted(self.pages_done),
+                "laws": dict(self.laws),
+                "done": sorted(self.done),
+                "failed": dict(self.failed),
+                "articles": self.articles,
+                "saved_at": time.time(),
+            }
+            self._since_checkpoint = 0
+        write_index_payload(self.checkpoint_path, payload, self.codec)
+        if self.lock is not None:
+            self.lock.touch()
+
+    def _progress(self) -> None:
+        with self._lock:
+            self._since_checkpoint += 1
+            due = self._since_checkpoint >= CHECKPOINT_EVERY
+        if due:
+            self.save_checkpoint()
+
+    # ------------------------------------------------------------------
+    # 목록
+    # ------------------------------------------------------------------
+
+    def _fetch_page(self, page: int, display: int) -> int:
+        self.limiter.acquire()
+        data = self.client.search_law(display=display, page=page, sort="lasc")
+        if not isinstance(data, dict) or "error" in data:
+            raise RuntimeError(f"목록 조회 실패 (page={page}): {data.get('error') if isinstance(data, dict) else data}")
+        root = data.get("LawSearch") or {}
+        items = root.get("law") or []
+        if isinstance(items, dict):
+            items = [items]
+        with self._lock:
+            if self.total is None:
+                self.total = int(root.get("totalCnt") or 0)
+            for item in items:
+                mst = str(item.get("법령일련번호") or "").strip()
+                if mst:
+                    self.laws[mst] = [str(item.get("법령ID") or ""), str(item.get("법령명한글") or "")]
+            self.pages_done.add(page)
+        if self.observe_page is not None and items:
+            self.observe_page(items)
+        self._progress()
+        return len(items)
+
+    def collect_listing(self, executor: ThreadPoolExecutor, display: int) -> None:
+        """목록 전체 조회 (첫 페이지로 전체 건수를 확인한 뒤 나머지 페이지는 병렬)"""
+        if self.total is None or 1 not in self.pages_done:
+            self._fetch_page(1, display)
+        pages = min(MAX_PAGES, -(-(self.total or 0) // display))
+        remaining = [page for page in range(1, pages + 1) if page not in self.pages_done]
+        errors = []
+        for future in [executor.submit(self._fetch_page, page, display) for page in remaining]:
+            try:
+                future.result()
+            except Exception as e:
+                errors.append(str(e))
+        self.save_checkpoint()
+        if errors:
+            raise RuntimeError(f"목록 {len(errors)}페이지 조회 실패 (다시 실행하면 이어서 진행): {errors[0]}")
+        logger.info(f"현행 법령 목록 {len(self.laws)}건 ({pages}페이지)")
+
+    # ------------------------------------------------------------------
+    # 본문
+    # ------------------------------------------------------------------
+
+    def _fetch_body(self, mst: str) -> int:
+        self.limiter.acquire()
+        data = self.client.service("law", {"MST": mst})
+        if not isinstance(data, dict) or "error" in data or not data:
+            raise RuntimeError(f"본문 조회 실패: {data.get('error') if isinstance(data, dict) else data}")
+        return self.store_body(mst, data)
+
+    def collect_bodies(self, executor: ThreadPoolExecutor, limit: Optional[int] = None) -> None:
+        """완료하지 않은 MST의 본문을 동시 요청 수만큼씩 조회 (대기열은 작업자 수의 2배로 제한)"""
+        pending = [mst for mst in self.laws if mst not in self.done]
+        if limit is not None:
+            pending = pending[:limit]
+        logger.info(f"법령 본문 조회 - {len(pending)}건 (완료 {len(self.done)}건)")
+        in_flight: Dict[Future, str] = {}
+        queue = iter(pending)
+        started = time.monotonic()
+        completed = 0
+        while True:
+            while len(in_flight) < self.workers * 2:
+                mst = next(queue, None)
+                if mst is None:
+                    break
+                in_flight[executor.submit(self._fetch_body, mst)] = mst
+            if not in_flight:
+                break
+            finished, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            for future in finished:
+                mst = in_flight.pop(future)
+                try:
+                    articles = future.result()
+                    with self._lock:
+                        self.done.add(mst)
+                        self.failed.pop(mst, None)
+                        self.articles += articles
+                except Exception as e:
+                    with self._lock:
+                        self.failed[mst] = str(e)
+                    logger.warning(f"법령 본문 조회 실패 (MST {mst}): {e}")
+                completed += 1
+                self._progress()
+                if completed % 100 == 0:
+                    rate = completed / max(time.monotonic() - started, 1e-6)
+                    logger.info(f"진행 {completed}/{len(pending)}건 ({rate:.1f}건/초, 실패 {len(self.failed)}건)")
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+
+    def run(self, display: int = 100, limit: Optional[int] = None, restart: bool = False) -> Dict[str, Any]:
+        """목록·본문 조회 실행 (중단되면 체크포인트 저장 후 예외 전달)"""
+        if not restart:
+            self.load_checkpoint()
+        started = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="corpus")
+        try:
+            self.collect_listing(executor, display)
+            if self.check_capacity is not None:
+                # 이번 실행 후 보관하게 될 본문 수 (이미 받은 것 포함)
+                remaining = len(self.laws) - len(self.done)
+                self.check_capacity(len(self.done) + (min(remaining, limit) if limit is not None else remaining))
+            self.collect_bodies(executor, limit)
+        finally:
+            # 중단(KeyboardInterrupt 포함) 시에도 완료분은 저장
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.save_checkpoint()
+        return self.summary(time.monotonic() - started)
+
+    def summary(self, elapsed: float = 0.0) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "total": self.total,
+                "listed": len(self.laws),
+                "bodies_done": len(self.done),
+                "bodies_failed": len(self.failed),
+                "articles": self.articles,
+                "elapsed_s": round(elapsed, 1),
+                "checkpoint": str(self.checkpoint_path),
+            }
+
+
+def check_capacity(expected_laws: int) -> None:
+    """코퍼스가 캐시·조문 저장소 용량 설정보다 크면 CorpusCapacityError (본문 조회 전 호출)"""
+    from ..config import cache_config, index_config
+    problems = []
+    if index_config.article_shard_max_laws < expected_laws:
+        problems.append(
+            f"ARTICLE_SHARD_MAX_LAWS({index_config.article_shard_max_laws})가 법령 수({expected_laws})보다 작아 "
+            f"유지 작업에서 조문 샤드가 정리됩니다 → {expected_laws} 이상으로 설정"
+        )
+    required_mb = -(-expected_laws * ESTIMATED_BODY_BYTES // (1024 * 1024))
+    if cache_config.max_size_mb < required_mb:
+        problems.append(
+            f"CACHE_MAX_SIZE_MB({cache_config.max_size_mb})가 본문 {expected_laws}건 추정 크기({required_mb}MB)보다 작아 "
+            f"받은 본문이 퇴출됩니다 → {required_mb} 이상으로 설정"
+        )
+    if problems:
+        raise CorpusCapacityError(
+            "용량 설정이 코퍼스보다 작아 본문 조회를 시작하지 않았습니다.\n- " + "\n- ".join(problems)
+            + "\n일부가 퇴출되어도 된다면 --allow-eviction 옵션으로 실행하세요."
+        )
+
+
+def build_corpus(workers: int = 4, rate: float = 5.0, limit: Optional[int] = None, restart: bool = False,
+                 allow_eviction: bool = False) -> Dict[str, Any]:
+    """현행 법령 전체를 받아 캐시·색인에 저장 (블로킹, 재실행 시 이어서 진행)
+
+    Args:
+        allow_eviction: True면 용량 확인을 건너뜀 (일부 본문·조문 샤드가 퇴출될 수 있음)
+    """
+    from ..apis.client import LegislationClient
+    from ..config import legislation_config
+    from . import close_indexes, get_index_dir, get_law_catalog, store_law_body
+
+    client = LegislationClient()
+
+    def store(mst: str, data: Dict[str, Any]) -> int:
+        save_to_cache(get_cache_key("law", mst, "full"), data)
+        return store_law_body("law", mst, data)
+
+    lock = CorpusLock(get_index_dir())
+    builder = CorpusBuilder(
+        client,
+        get_index_dir() / "corpus_checkpoint.bin",
+        store,
+        observe_page=get_law_catalog("law").observe,
+        workers=workers,
+        rate=rate,
+        check_capacity=None if allow_eviction else check_capacity,
+        lock=lock,
+    )
+    lock.acquire()
+    try:
+        return builder.run(display=legislation_config.max_display, limit=limit, restart=restart)
+    finally:
+        # 색인 파일을 모두 저장한 뒤 잠금 해제 (서버는 해제를 보고 파일에서 다시 로드)
+        try:
+            close_indexes()
+        finally:
+            lock.release()
+
+
+def main() -> None:
+    """명령행 실행 진입점"""
+    from ..config import index_config
+
+    parser = argparse.ArgumentParser(description="현행 법령 전체 오프라인 코퍼스 구축 (중단 후 다시 실행하면 이어서 진행)")
+    parser.add_argument("--workers", type=int, default=index_config.corpus_workers, help="동시 요청 수")
+    parser.add_argument("--rate", type=float, default=index_config.corpus_rate_limit, help="초당 최대 요청 수 (0이면 제한 없음)")
+    parser.add_argument("--limit", type=int, default=None, help="이번 실행에서 받을 본문 수 상한")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터")
+    parser.add_argument("--allow-eviction", action="store_true", help="용량 설정이 코퍼스보다 작아도 진행 (일부 퇴출 허용)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    try:
+        result = build_corpus(args.workers, args.rate, args.limit, args.restart, args.allow_eviction)
+    except KeyboardInterrupt:
+        logger.info("중단됨 - 다시 실행하면 체크포인트부터 이어서 진행합니다")
+        return
+    except (CorpusCapacityError, CorpusLockedError) as e:
+        logger.error(str(e))
+        raise SystemExit(1)
+    logger.info(f"코퍼스 구축 결과: {result}")
+
+
+if __name__ == "__main__":
+    main()
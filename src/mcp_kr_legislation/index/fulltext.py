@@ -0,0 +1,354 @@
+"""
+법령 조문 전문 검색 색인 (역색인 + BM25)
+
+조문 색인이 만들어진 법령(조회했던 법령, 조문 샤드로 저장된 법령)의 모든 조문을
+한국어 글자 바이그램으로 역색인해 "어느 법령의 어느 조문이 X를 다루는가"를
+업스트림 호출 없이 검색합니다.
+
+- 토큰: 단어(한글/영문/숫자 연속) 안의 글자 바이그램, 한 글자 단어는 그대로
+- 순위: BM25 (k1=1.2, b=0.75)
+- 같은 target·법령명의 새 버전(MST)이 들어오면 이전 버전 조문은 삭제 표시 후 주기적으로 압축
+- 법령명마다 현행 버전(오늘 기준 시행일자가 가장 최근인 버전, 같으면 MST가 큰 버전)만 색인
+  시행 예정 버전은 현행 버전보다 뒤로 두고, 시행일이 지나면 다시 비교해 교체
+- 밀려난 이전 버전 MST는 기록해 다시 색인하지 않음 (이전 버전을 조회해도 현행 버전이 검색에서 빠지지 않도록),
+  조문 샤드가 정리된 버전은 기록에서도 제거
+"""
+
+import heapq
+import logging
+import math
+import re
+import threading
+import time
+from collections import Counter
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..cache import BackgroundRefresher, CacheCodec
+from .articles import ArticleIndex
+from .store import read_index_payload, write_index_payload
+
+logger = logging.getLogger(__name__)
+
+FULLTEXT_VERSION = 1
+BM25_K1 = 1.2
+BM25_B = 0.75
+PREVIEW_CHARS = 160
+# 삭제 표시된 문서 비율이 이 값을 넘으면 역색인 압축
+COMPACT_RATIO = 0.2
+
+_WORD = re.compile(r"[0-9a-z가-힣ㄱ-ㆎ一-鿿]+")
+
+
+def _today() -> str:
+    return date.today().strftime("%Y%m%d")
+
+
+def is_in_force(effective_date: str, today: Optional[str] = None) -> bool:
+    """시행일자가 오늘 이전인지 여부 (시행일자를 모르면 현행으로 간주)"""
+    return not effective_date or str(effective_date) <= (today or _today())
+
+
+def version_order(mst: str, effective_date: str = "", today: Optional[str] = None) -> Tuple[int, int, int, str]:
+    """법령 버전 비교 키 (클수록 현행 버전에 가까움)
+
+    시행 중인 버전이 시행 예정 버전보다 앞서고, 시행 중인 버전끼리는 시행일자가 최근일수록,
+    시행 예정 버전끼리는 시행일이 가까울수록 앞섭니다. MST(법령일련번호)는 시행일자가 같을 때만 비교합니다
+    (시행 예정 개정이 공포되면 현행 버전보다 MST가 크므로 MST만으로는 현행을 가리지 못함).
+    """
+    effective_date = str(effective_date or "")
+    day = int(effective_date) if effective_date.isdigit() else 0
+    number, suffix = (int(mst), "") if mst.isdigit() else (-1, mst)
+    if is_in_force(effective_date, today):
+        return (1, day, number, suffix)
+    return (0, -day, number, suffix)
+
+
+def tokenize(text: str) -> List[str]:
+    """글자 바이그램 토큰 (단어 경계를 넘지 않음)
+
+    예: "개인정보 보호" → ["개인", "인정", "정보", "보호"]
+    """
+    tokens: List[str] = []
+    for word in _WORD.findall((text or "").lower()):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+class ArticleSearchIndex:
+    """조문 역색인 (메모리 + 파일 저장)"""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: 색인 저장 파일
+        """
+        self.path = Path(path)
+        self.codec = CacheCodec()
+        self._lock = threading.RLock()
+        # 문서: [target, mst, 법령명, 조문 표시, 조문제목, 미리보기, 길이]
+        self._docs: List[List[Any]] = []
+        self._postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        self._deleted: Set[int] = set()
+        self._laws: Dict[Tuple[str, str], Tuple[str, List[int], str]] = {}  # (target, 법령명) → (MST, 문서 번호, 시행일자)
+        self._superseded: Set[Tuple[str, str]] = set()  # 현행 버전으로 대체된 시행 중인 (target, MST)
+        self._total_length = 0
+        self._indexer = BackgroundRefresher(max_workers=1, max_pending=64)
+        self._dirty = False
+        self._loaded = False
+        self._queries = 0
+        self._last_query_ms = 0.0
+
+    # ------------------------------------------------------------------
+    # 색인
+    # ------------------------------------------------------------------
+
+    def has_law(self, target: str, mst: str) -> bool:
+        """색인된 버전이거나 더 새 버전으로 대체된 버전인지 여부 (다시 색인할 필요 없음)"""
+        self.ensure_loaded()
+        mst = str(mst)
+        with self._lock:
+            if (target, mst) in self._superseded:
+                return True
+            return any(t == target and m == mst for (t, _), (m, _, _) in self._laws.items())
+
+    def add_law(self, target: str, mst: str, index: ArticleIndex) -> int:
+        """법령 버전의 조문을 색인에 추가하고 추가한 조문 수 반환
+
+        같은 target·법령명의 색인된 버전보다 현행에 가까우면 교체하고(version_order), 아니거나
+        같은 버전이면 아무것도 하지 않습니다 (밀려난 시행 중인 버전은 대체된 버전으로 기록).
+        """
+        self.ensure_loaded()
+        mst = str(mst)
+        effective_date = str(getattr(index, "effective_date", "") or "")
+        law_key = (target, index.law_name or mst)
+        with self._lock:
+            if self._is_outdated(law_key, target, mst, effective_date):
+                return 0
+
+        # 토큰화는 잠금 밖에서 (수천 조문이면 수백 ms)
+        prepared = []
+        for record in index.records:
+            # 조문제목은 두 번 넣어 본문보다 가중치를 높임
+            counts = Counter(tokenize(f"{record.title} {record.title} {record.text} {' '.join(record.paragraphs)}"))
+            if counts:
+                preview = record.text or " ".join(record.paragraphs)
+                prepared.append((record.label, record.title, preview[:PREVIEW_CHARS], counts))
+
+        with self._lock:
+            # 토큰화하는 동안 다른 작업이 더 새 버전을 넣었을 수 있음
+            if self._is_outdated(law_key, target, mst, effective_date):
+                return 0
+            current = self._laws.get(law_key)
+            if current is not None:
+                self._deleted.update(current[1])
+                self._mark_superseded(target, current[0], current[2])
+            doc_ids: List[int] = []
+            for label, title, preview, counts in prepared:
+                doc_id = len(self._docs)
+                length = sum(counts.values())
+                self._docs.append([target, mst, index.law_name, label, title, preview, length])
+                self._total_length += length
+                for term, tf in counts.items():
+                    ids, tfs = self._postings.setdefault(term, ([], []))
+                    ids.append(doc_id)
+                    tfs.append(tf)
+                doc_ids.append(doc_id)
+            self._laws[law_key] = (mst, doc_ids, effective_date)
+            self._dirty = True
+            if self._docs and len(self._deleted) > len(self._docs) * COMPACT_RATIO:
+                self._compact()
+        return len(doc_ids)
+
+    def _is_outdated(self, law_key: Tuple[str, str], target: str, mst: str, effective_date: str) -> bool:
+        """같은 버전이 이미 있거나 현행에 더 가까운 버전이 색인되어 있는지 여부 (잠금 안에서 호출, 밀려난 버전은 기록)"""
+        if (target, mst) in self._superseded:
+            return True
+        current = self._laws.get(law_key)
+        if current is None:
+            return False
+        if current[0] == mst:
+            return True
+        today = _today()
+        if version_order(current[0], current[2], today) > version_order(mst, effective_date, today):
+            self._mark_superseded(target, mst, effective_date, today)
+            return True
+        return False
+
+    def _mark_superseded(self, target: str, mst: str, effective_date: str, today: Optional[str] = None) -> None:
+        """밀려난 버전 기록 (잠금 안에서 호출)
+
+        시행 예정 버전은 시행일이 지나면 현행이 될 수 있으므로 기록하지 않고 다음 보충 때 다시 비교합니다.
+        """
+        if is_in_force(effective_date, today):
+            self._superseded.add((target, mst))
+            self._dirty = True
+
+    def prune_superseded(self, stored: Iterable[Tuple[str, str]]) -> int:
+        """조문 샤드가 정리된 버전을 대체된 버전 기록에서 제거하고 제거 수 반환
+
+        기록은 조문 샤드 보충 시 이전 버전을 다시 읽지 않으려는 것이므로 저장소에 남은 버전만 유지합니다
+        (다시 조회되면 add_law가 비교 후 다시 기록).
+        Args:
+            stored: 조문 샤드로 저장된 (target, MST) 목록
+        """
+        self.ensure_loaded()
+        keep = {(target, str(mst)) for target, mst in stored}
+        with self._lock:
+            removed = self._superseded - keep
+            if removed:
+                self._superseded -= removed
+                self._dirty = True
+        return len(removed)
+
+    def add_law_async(self, target: str, mst: str, index: ArticleIndex) -> bool:
+        """색인 추가를 백그라운드로 예약"""
+        return self._indexer.schedule(f"{target}:{mst}", lambda: self.add_law(target, mst, index))
+
+    def _compact(self) -> None:
+        """삭제 표시된 문서를 제거하고 문서 번호를 다시 매김 (잠금 안에서 호출)"""
+        remap: Dict[int, int] = {}
+        docs: List[List[Any]] = []
+        for doc_id, doc in enumerate(self._docs):
+            if doc_id not in self._deleted:
+                remap[doc_id] = len(docs)
+                docs.append(doc)
+        postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        for term, (ids, tfs) in self._postings.items():
+            kept = [(remap[d], tf) for d, tf in zip(ids, tfs) if d in remap]
+            if kept:
+                postings[term] = ([d for d, _ in kept], [tf for _, tf in kept])
+        self._docs = docs
+        self._postings = postings
+        self._laws = {key: (mst, [remap[d] for d in ids if d in remap], effective_date)
+                      for key, (mst, ids, effective_date) in self._laws.items()}
+        self._deleted = set()
+        self._total_length = sum(doc[6] for doc in docs)
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+
+    def search(self, query: str, limit: int = 10, target: Optional[str] = None) -> List[Dict[str, Any]]:
+        """BM25 점수 상위 조문 목록"""
+        self.ensure_loaded()
+        started = time.perf_counter()
+        terms = set(tokenize(query))
+        with self._lock:
+            live = len(self._docs) - len(self._deleted)
+            if not terms or live <= 0:
+                return []
+            avgdl = self._total_length / max(len(self._docs), 1)
+            scores: Dict[int, float] = {}
+            for term in terms:
+                posting = self._postings.get(term)
+                if not posting:
+                    continue
+                ids, tfs = posting
+                idf = math.log(1 + (live - len(ids) + 0.5) / (len(ids) + 0.5))
+                for doc_id, tf in zip(ids, tfs):
+                    length = self._docs[doc_id][6]
+                    norm = tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avgdl))
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * norm
+            candidates = (
+                (score, doc_id) for doc_id, score in scores.items()
+                if doc_id not in self._deleted and (target is None or self._docs[doc_id][0] == target)
+            )
+            top = heapq.nlargest(limit, candidates)
+            results = []
+            for score, doc_id in top:
+                doc_target, mst, law_name, label, title, preview, _ = self._docs[doc_id]
+                results.append({
+                    "target": doc_target,
+                    "mst": mst,
+                    "law_name": law_name,
+                    "article": label,
+                    "title": title,
+                    "preview": preview,
+                    "score": round(score, 3),
+                })
+            self._queries += 1
+            self._last_query_ms = round((time.perf_counter() - started) * 1000, 2)
+        return results
+
+    # ------------------------------------------------------------------
+    # 저장/로드
+    # ------------------------------------------------------------------
+
+    def ensure_loaded(self) -> None:
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self.load()
+
+    def load(self) -> bool:
+        """저장된 색인 로드 (없거나 형식이 다르면 빈 색인)"""
+        self._loaded = True
+        payload = read_index_payload(self.path, FULLTEXT_VERSION)
+        if payload is None:
+            return False
+        with self._lock:
+            self._docs = payload.get("docs", [])
+            self._postings = {term: (ids, tfs) for term, (ids, tfs) in payload.get("postings", {}).items()}
+            # 시행일자 없이 저장된 색인은 시행일자를 모르는 버전으로 로드
+            self._laws = {(law[0], law[1]): (law[2], law[3], law[4] if len(law) > 4 else "") for law in payload.get("laws", [])}
+            self._superseded = {(t, mst) for t, mst in payload.get("superseded", [])}
+            self._deleted = set()
+            self._total_length = sum(doc[6] for doc in self._docs)
+        logger.info(f"조문 전문 검색 색인 로드 - 법령 {len(self._laws)}개, 조문 {len(self._docs)}개")
+        return True
+
+    def save(self) -> None:
+        """색인을 파일에 저장 (삭제 표시된 문서는 압축 후 저장)"""
+        with self._lock:
+            if self._deleted:
+                self._compact()
+            payload = {
+                "version": FULLTEXT_VERSION,
+                "docs": self._docs,
+                "postings": {term: [ids, tfs] for term, (ids, tfs) in self._postings.items()},
+                "laws": [[t, name, mst, ids, effective_date] for (t, name), (mst, ids, effective_date) in self._laws.items()],
+                "superseded": sorted([t, mst] for t, mst in self._superseded),
+            }
+            self._dirty = False
+            write_index_payload(self.path, payload, self.codec)
+
+    def flush(self) -> None:
+        """바뀐 내용이 있으면 저장"""
+        if self._dirty:
+            self.save()
+
+    def close(self) -> None:
+        """진행 중인 색인 작업을 마치고 저장"""
+        self._indexer.shutdown(wait=True)
+        self.flush()
+
+    def discard(self) -> None:
+        """대기 중인 색인 작업을 취소하고 저장하지 않음 (다른 프로세스가 파일을 갱신한 경우)"""
+        self._indexer.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """색인 통계"""
+        self.ensure_loaded()
+        with self._lock:
+            return {
+                "laws": len(self._laws),
+                "articles": len(self._docs) - len(self._deleted),
+                "terms": len(self._postings),
+                "deleted": len(self._deleted),
+                "superseded_versions": len(self._superseded),
+                "queries": self._queries,
+                "last_query_ms": self._last_query_ms,
+                "indexer": self._indexer.stats(),
+                "path": str(self.path),
+            }
+
+    def laws(self) -> Iterable[Tuple[str, str, str]]:
+        """색인된 (target, 법령명, MST) 목록"""
+        self.ensure_loaded()
+        with self._lock:
+            return [(t, name, mst) for (t, name), (mst, _, _) in self._laws.items()]
@@ -0,0 +1,167 @@
+"""
+법령일련번호(MST) ↔ 법령ID 매핑
+
+조문 변경이력(lsJoHstInf)처럼 법령ID를 요구하는 API에 MST만 알고 있을 때,
+법령 본문 전체(lawService.do)를 받아 기본정보.법령ID 하나를 읽지 않도록
+이미 받은 검색/상세 응답에서 MST와 법령ID 쌍을 모아 저장합니다.
+
+- MST → 법령ID: 연혁 MST를 포함해 MST마다 하나의 법령ID
+- 법령ID → MST 목록: 같은 법령의 모든 버전(현행·연혁·시행예정)
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..cache import CacheCodec
+from .store import read_index_payload, write_index_payload
+
+logger = logging.getLogger(__name__)
+
+IDMAP_VERSION = 1
+
+
+def extract_law_id_pairs(data: Any, params: Optional[Dict[str, Any]] = None) -> List[Tuple[str, str]]:
+    """법제처 응답에서 (MST, 법령ID) 쌍 추출
+
+    - 검색 목록: LawSearch.law[].법령일련번호/법령ID
+    - 본문 상세: 법령.기본정보.법령ID (+ 요청 파라미터의 MST)
+    """
+    pairs: List[Tuple[str, str]] = []
+    if not isinstance(data, dict):
+        return pairs
+
+    root = data.get("LawSearch")
+    if isinstance(root, dict):
+        items = root.get("law") or []
+        if isinstance(items, dict):
+            items = [items]
+        for item in items:
+            if isinstance(item, dict):
+                mst, law_id = item.get("법령일련번호"), item.get("법령ID")
+                if mst and law_id:
+                    pairs.append((str(mst).strip(), str(law_id).strip()))
+
+    law = data.get("법령")
+    if isinstance(law, dict):
+        basic = law.get("기본정보") or {}
+        law_id = basic.get("법령ID") if isinstance(basic, dict) else None
+        mst = (params or {}).get("MST") or (basic.get("법령일련번호") if isinstance(basic, dict) else None)
+        if mst and law_id:
+            pairs.append((str(mst).strip(), str(law_id).strip()))
+    return pairs
+
+
+class LawIdMap:
+    """MST ↔ 법령ID 양방향 매핑 (메모리 + 파일 저장)"""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: 매핑 저장 파일
+        """
+        self.path = Path(path)
+        self.codec = CacheCodec()
+        self._lock = threading.RLock()
+        self._mst_to_id: Dict[str, str] = {}
+        self._id_to_msts: Dict[str, Set[str]] = {}
+        self._dirty = False
+        self._loaded = False
+        self._lookups = 0
+        self._lookup_hits = 0
+        self._recorded = 0
+
+    def __len__(self) -> int:
+        self.ensure_loaded()
+        return len(self._mst_to_id)
+
+    def _record(self, mst: str, law_id: str) -> bool:
+        previous = self._mst_to_id.get(mst)
+        if previous == law_id:
+            return False
+        if previous is not None:
+            self._id_to_msts.get(previous, set()).discard(mst)
+        self._mst_to_id[mst] = law_id
+        self._id_to_msts.setdefault(law_id, set()).add(mst)
+        return True
+
+    def record_many(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        """(MST, 법령ID) 쌍을 반영하고 추가/변경된 수 반환"""
+        self.ensure_loaded()
+        changed = 0
+        with self._lock:
+            for mst, law_id in pairs:
+                if mst and law_id and self._record(str(mst), str(law_id)):
+                    changed += 1
+            if changed:
+                self._dirty = True
+                self._recorded += changed
+        return changed
+
+    def observe(self, data: Any, params: Optional[Dict[str, Any]] = None) -> int:
+        """법제처 응답에 포함된 MST/법령ID 쌍을 반영"""
+        return self.record_many(extract_law_id_pairs(data, params))
+
+    def law_id_for(self, mst: str) -> Optional[str]:
+        """MST의 법령ID (모르면 None)"""
+        self.ensure_loaded()
+        with self._lock:
+            self._lookups += 1
+            law_id = self._mst_to_id.get(str(mst).strip())
+            if law_id is not None:
+                self._lookup_hits += 1
+            return law_id
+
+    def msts_for(self, law_id: str) -> List[str]:
+        """법령ID에 속한 알려진 MST 목록 (오름차순)"""
+        self.ensure_loaded()
+        with self._lock:
+            return sorted(self._id_to_msts.get(str(law_id).strip(), ()), key=lambda m: (len(m), m))
+
+    # ------------------------------------------------------------------
+    # 저장/로드
+    # ------------------------------------------------------------------
+
+    def ensure_loaded(self) -> None:
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self.load()
+
+    def load(self) -> bool:
+        """저장된 매핑 로드 (없거나 형식이 다르면 빈 매핑)"""
+        self._loaded = True
+        payload = read_index_payload(self.path, IDMAP_VERSION)
+        if payload is None:
+            return False
+        with self._lock:
+            for mst, law_id in (payload.get("mst_to_id") or {}).items():
+                self._record(mst, law_id)
+        logger.info(f"MST-법령ID 매핑 로드 - {len(self._mst_to_id)}건")
+        return True
+
+    def save(self) -> None:
+        """매핑을 파일에 저장"""
+        with self._lock:
+            payload = {"version": IDMAP_VERSION, "mst_to_id": dict(self._mst_to_id)}
+            self._dirty = False
+        write_index_payload(self.path, payload, self.codec)
+
+    def flush(self) -> None:
+        """바뀐 내용이 있으면 저장"""
+        if self._dirty:
+            self.save()
+
+    def stats(self) -> Dict[str, Any]:
+        """매핑 통계"""
+        self.ensure_loaded()
+        with self._lock:
+            return {
+                "msts": len(self._mst_to_id),
+                "law_ids": len(self._id_to_msts),
+                "lookups": self._lookups,
+                "lookup_hits": self._lookup_hits,
+                "recorded": self._recorded,
+                "path": str(self.path),
+            }
@@ -0,0 +1,270 @@
+"""
+조문 단위 저장소 (법령 버전별 조문 샤드 + 목차)
+
+조세특례제한법·자본시장법처럼 본문이 수 MB인 법령에서 조문 하나를 읽으려고
+캐시된 본문 전체를 디코딩하지 않도록, 조문 색인을 조문 하나당 파일 하나로 나눠 저장합니다.
+
+디렉토리 구조: {색인 디렉토리}/articles/{target}/{MST}/
+    - manifest.bin: 법령명, 조문 키·제목 목록 (수 KB)
+    - 00000.bin, 00001.bin, ...: 순서(position)별 조문 (원본 조문단위 포함)
+
+목차는 모든 조문 파일을 쓴 뒤 마지막에 쓰므로 목차가 있으면 조문 파일도 모두 있습니다.
+단일 조문·짧은 범위 조회는 목차와 해당 조문 파일만 읽고 나머지는 필요할 때 읽습니다.
+"""
+
+import logging
+import os
+import shutil
+import threading
+import time
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..cache import BackgroundRefresher, CacheCodec
+from .articles import ArticleIndex, ArticleRecord
+from .store import read_index_payload, write_index_payload
+
+logger = logging.getLogger(__name__)
+
+SHARD_VERSION = 1
+MANIFEST_NAME = "manifest.bin"
+# 목차 없이 남은 디렉토리(저장 중 종료 등)를 정리하기 전 대기 시간(초)
+ORPHAN_GRACE = 3600
+
+_RECORD_FIELDS = {f.name for f in fields(ArticleRecord) if f.init}
+
+
+def _shard_name(position: int) -> str:
+    return f"{position:05d}.bin"
+
+
+class ShardedArticleIndex(ArticleIndex):
+    """목차만 읽고 조문은 처음 조회할 때 조문 파일에서 읽는 색인
+
+    조문 파일이 지워졌으면(정리·수동 삭제 등) 캐시 미스로 처리합니다. 저장된 버전을 버리고
+    load()로 받은 본문으로 색인을 다시 만들어 응답하며, 조문 파일은 백그라운드에서 다시 저장합니다.
+    """
+
+    def __init__(self,
+                 directory: Path,
+                 manifest: Dict[str, Any],
+                 store: "ArticleShardStore",
+                 load: Optional[Callable[[], Any]] = None):
+        """
+        Args:
+            directory: 법령 버전 디렉토리
+            manifest: 목차
+            store: 조문 단위 저장소
+            load: 조문 파일이 없을 때 본문을 다시 받는 함수 (None이면 KeyError)
+        """
+        keys = [tuple(key) for key in manifest.get("keys", [])]
+        super().__init__(
+            manifest.get("law_name", ""),
+            [None] * len(keys),
+            keys=keys,  # type: ignore[arg-type]
+            titles=list(manifest.get("titles", [])),
+            effective_date=str(manifest.get("effective_date", "")),
+        )
+        self.directory = directory
+        self.target = str(manifest.get("target", directory.parent.name))
+        self.mst = str(manifest.get("mst", directory.name))
+        self._store = store
+        self._load = load
+        self._rebuilt = False
+        self._load_lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        return self._rebuilt or (self.directory / MANIFEST_NAME).exists()
+
+    def _load_record(self, position: int) -> ArticleRecord:
+        payload = read_index_payload(self.directory / _shard_name(position), SHARD_VERSION)
+        if payload is None:
+            return self._rebuild(position)
+        self._store.record_read()
+        return ArticleRecord(**{k: v for k, v in payload["record"].items() if k in _RECORD_FIELDS})
+
+    def _rebuild(self, position: int) -> ArticleRecord:
+        """조문 파일이 없을 때 본문으로 색인을 다시 만들어 나머지 조문을 채우고 요청한 조문 반환"""
+        missing = self.directory / _shard_name(position)
+        # 조문 파일이 지워졌으면 목차도 무효
+        self._store.discard(self.directory)
+        data = self._load() if self._load is not None else None
+        index = ArticleIndex.from_law_data(data) if data else None
+        if index is None or index.get(self.keys[position]) is None:
+            raise KeyError(f"조문 파일이 없습니다: {missing}")
+        for i, key in enumerate(self.keys):
+            if self._records[i] is None:
+                self._records[i] = index.get(key)
+        self._rebuilt = True
+        self._store.record_rebuild(self.target, self.mst, index)
+        logger.info(f"조문 파일이 없어 본문으로 다시 만듦 ({self.target}:{self.mst})")
+        return self._records[position]  # type: ignore[return-value]
+
+    def _record_at(self, position: int) -> ArticleRecord:
+        with self._load_lock:
+            return super()._record_at(position)
+
+
+class ArticleShardStore:
+    """법령 버전별 조문 샤드 저장소"""
+
+    def __init__(self, root: Path, max_laws: int = 500):
+        """
+        Args:
+            root: 저장 디렉토리
+            max_laws: 보관할 법령 버전 수 상한 (초과 시 오래 사용하지 않은 버전부터 삭제)
+        """
+        self.root = Path(root)
+        self.max_laws = max_laws
+        self.codec = CacheCodec()
+        self._lock = threading.Lock()
+        self._writer = BackgroundRefresher(max_workers=1, max_pending=8)
+        self._writes = 0
+        self._opens = 0
+        self._shard_reads = 0
+        self._rebuilds = 0
+        self._pruned = 0
+
+    def _directory(self, target: str, mst: str) -> Path:
+        return self.root / target / str(mst)
+
+    def open(self, target: str, mst: str, load: Optional[Callable[[], Any]] = None) -> Optional[ShardedArticleIndex]:
+        """저장된 법령 버전의 지연 로드 색인 (없으면 None)
+
+        Args:
+            load: 조문 파일이 지워졌을 때 본문을 다시 받는 함수 (None이면 조문 조회 시 KeyError)
+        """
+        directory = self._directory(target, mst)
+        manifest_path = directory / MANIFEST_NAME
+        manifest = read_index_payload(manifest_path, SHARD_VERSION)
+        if manifest is None:
+            return None
+        try:
+            # 사용 시각 갱신 (용량 정리 시 오래 사용하지 않은 버전부터 삭제)
+            os.utime(manifest_path)
+        except OSError:
+            pass
+        with self._lock:
+            self._opens += 1
+        return ShardedArticleIndex(directory, manifest, self, load)
+
+    def write(self, target: str, mst: str, index: ArticleIndex) -> bool:
+        """색인을 조문 파일과 목차로 저장 (실패해도 서비스는 계속됨)"""
+        if self.max_laws <= 0:
+            return False
+        directory = self._directory(target, mst)
+        try:
+            for position, record in enumerate(index.records):
+                payload = {
+                    "version": SHARD_VERSION,
+                    "record": {k: v for k, v in asdict(record).items() if k in _RECORD_FIELDS},
+                }
+                write_index_payload(directory / _shard_name(position), payload, self.codec)
+            manifest = {
+                "version": SHARD_VERSION,
+                "target": target,
+                "mst": str(mst),
+                "law_name": index.law_name,
+                "effective_date": index.effective_date,
+                "keys": [list(key) for key in index.keys],
+                "titles": index.titles,
+                "written_at": time.time(),
+            }
+            write_index_payload(directory / MANIFEST_NAME, manifest, self.codec)
+        except Exception as e:
+            logger.warning(f"조문 샤드 저장 실패 ({target}:{mst}): {e}")
+            return False
+        with self._lock:
+            self._writes += 1
+        return True
+
+    def write_async(self, target: str, mst: str, index: ArticleIndex) -> bool:
+        """색인 저장을 백그라운드로 예약 (같은 법령 버전은 한 번만, 대기열이 가득 차면 생략)"""
+        if self.max_laws <= 0:
+            return False
+        return self._writer.schedule(f"{target}:{mst}", lambda: self.write(target, mst, index))
+
+    def discard(self, directory: Path) -> None:
+        """법령 버전 디렉토리 삭제"""
+        shutil.rmtree(directory, ignore_errors=True)
+
+    def record_read(self) -> None:
+        with self._lock:
+            self._shard_reads += 1
+
+    def record_rebuild(self, target: str, mst: str, index: ArticleIndex) -> None:
+        """조문 파일이 없어 본문으로 다시 만든 색인을 백그라운드로 다시 저장"""
+        with self._lock:
+            self._rebuilds += 1
+        self.write_async(target, mst, index)
+
+    def _manifests(self) -> List[Path]:
+        if not self.root.exists():
+            return []
+        return list(self.root.glob(f"*/*/{MANIFEST_NAME}"))
+
+    def laws(self) -> List[Tuple[str, str]]:
+        """저장된 (target, MST) 목록"""
+        return [(path.parent.parent.name, path.parent.name) for path in self._manifests()]
+
+    def prune(self) -> int:
+        """보관 상한을 넘는 법령 버전을 오래 사용하지 않은 순으로 삭제하고 삭제 수 반환"""
+        manifests = self._manifests()
+        removed = self._prune_orphans({path.parent for path in manifests})
+        excess = len(manifests) - max(self.max_laws, 0)
+        if excess <= 0:
+            with self._lock:
+                self._pruned += removed
+            return removed
+
+        def last_used(path: Path) -> float:
+            try:
+                return path.stat().st_mtime
+            except OSError:
+                return 0.0
+
+        for manifest_path in sorted(manifests, key=last_used)[:excess]:
+            self.discard(manifest_path.parent)
+            removed += 1
+        with self._lock:
+            self._pruned += removed
+        return removed
+
+    def _prune_orphans(self, complete: set) -> int:
+        """목차 없이 ORPHAN_GRACE 이상 지난 디렉토리 삭제 (저장 도중 종료된 경우)"""
+        if not self.root.exists():
+            return 0
+        removed = 0
+        now = time.time()
+        for directory in self.root.glob("*/*"):
+            if directory in complete or not directory.is_dir():
+                continue
+            try:
+                if now - directory.stat().st_mtime < ORPHAN_GRACE:
+                    continue
+            except OSError:
+                continue
+            self.discard(directory)
+            removed += 1
+        return removed
+
+    def close(self) -> None:
+        """실행 중인 저장 작업을 마치고 종료 (대기 중인 작업은 취소)"""
+        self._writer.shutdown(wait=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """저장소 통계"""
+        laws = len(self._manifests())
+        with self._lock:
+            return {
+                "laws": laws,
+                "max_laws": self.max_laws,
+                "writes": self._writes,
+                "opens": self._opens,
+                "shard_reads": self._shard_reads,
+                "missing_shard_rebuilds": self._rebuilds,
+                "pruned": self._pruned,
+                "writer": self._writer.stats(),
+                "path": str(self.root),
+            }
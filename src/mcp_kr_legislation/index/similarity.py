@@ -0,0 +1,482 @@
+"""
+조문·판례·해석례 유사도 검색 (TF-IDF 희소 행렬)
+
+"이 조항과 비슷한 조문/판례를 찾아줘"처럼 키워드가 정확히 겹치지 않는 질의를 위해
+조문 샤드로 저장된 법령 조문, 조회했던 판례(판시사항/판결요지)와 법령해석례(질의요지/회답)를
+글자 n-gram TF-IDF 행렬로 만들고 코사인 유사도로 검색합니다.
+
+- 특징: 단어 안의 글자 2·3-gram을 crc32로 2^20 차원에 해싱 (어휘 사전 없이 프로세스 간 동일)
+- 가중치: 1 + log(tf), 평활 idf, 행 단위 L2 정규화
+- 질의: 희소 행렬 × 희소 벡터 곱 1회 + argpartition 상위 k개
+- 생성: 법령 하나씩 읽으며 특징을 임시 파일로 흘려 쓰고 행 블록 단위로 가중치 적용 (조문 전체를 메모리에 올리지 않음)
+- 저장: 세대별 디렉토리에 CSR 배열(.npy)을 쓰고 목차(matrix.bin)를 마지막에 교체, 로드는 메모리 매핑
+
+numpy/scipy가 설치되어 있지 않으면(pip install "mcp-kr-legislation[similarity]") 문서 수집만 하고 검색은 비활성화됩니다.
+"""
+
+import logging
+import re
+import shutil
+import threading
+import time
+import zlib
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..cache import BackgroundRefresher, CacheCodec
+from .articles import ArticleIndex, clean_article_text
+from .store import read_index_payload, write_index_payload
+
+try:
+    import numpy as np  # type: ignore
+    from scipy import sparse  # type: ignore
+    HAS_NUMPY = True
+except ImportError:
+    np = None  # type: ignore
+    sparse = None  # type: ignore
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+SIMILARITY_VERSION = 1
+N_FEATURES = 1 << 20
+NGRAM_SIZES = (2, 3)
+PREVIEW_CHARS = 160
+# 행렬 생성 시 idf·정규화를 한 번에 적용할 행 수 (메모리 사용량 상한)
+BUILD_ROW_BLOCK = 4096
+# 판례/해석례 문서 하나에서 색인할 최대 글자 수
+MAX_DOCUMENT_CHARS = 4000
+
+KIND_ARTICLE = "article"
+KIND_PRECEDENT = "precedent"
+KIND_INTERPRETATION = "interpretation"
+KINDS = (KIND_ARTICLE, KIND_PRECEDENT, KIND_INTERPRETATION)
+
+_WORD = re.compile(r"[0-9a-z가-힣ㄱ-ㆎ一-鿿]+")
+
+
+def char_ngram_features(text: str) -> Counter:
+    """단어 안의 글자 n-gram을 해시 특징 번호로 세어 반환 (한 글자 단어는 그대로)"""
+    counts: Counter = Counter()
+    for word in _WORD.findall((text or "").lower()):
+        if len(word) == 1:
+            counts[zlib.crc32(word.encode()) % N_FEATURES] += 1
+            continue
+        for n in NGRAM_SIZES:
+            for i in range(len(word) - n + 1):
+                counts[zlib.crc32(word[i:i + n].encode()) % N_FEATURES] += 1
+    return counts
+
+
+def _first(item: Dict[str, Any], *keys: str) -> str:
+    for key in keys:
+        value = item.get(key)
+        if value:
+            return str(value).strip()
+    return ""
+
+
+def extract_documents(data: Any, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, str]]:
+    """판례/법령해석례 본문 응답에서 유사도 색인용 문서 추출
+
+    - 판례: PrecService(.판례).판시사항 + 판결요지
+    - 법령해석례: ExpcService(.해석례).질의요지 + 회답
+    """
+    documents: List[Dict[str, str]] = []
+    if not isinstance(data, dict):
+        return documents
+    request_id = str((params or {}).get("ID") or "").strip()
+
+    service = data.get("PrecService")
+    if isinstance(service, dict):
+        item = service.get("판례") if isinstance(service.get("판례"), dict) else service
+        text = "\n".join(filter(None, (clean_article_text(item.get("판시사항")), clean_article_text(item.get("판결요지")))))
+        doc_id = _first(item, "판례정보일련번호", "판례일련번호") or request_id
+        if text and doc_id:
+            documents.append({
+                "kind": KIND_PRECEDENT,
+                "id": doc_id,
+                "name": _first(item, "사건명"),
+                "label": " ".join(filter(None, (_first(item, "법원명"), _first(item, "선고일자"), _first(item, "사건번호")))),
+                "text": text[:MAX_DOCUMENT_CHARS],
+            })
+
+    service = data.get("ExpcService")
+    if isinstance(service, dict):
+        item = service.get("해석례") if isinstance(service.get("해석례"), dict) else service
+        text = "\n".join(filter(None, (clean_article_text(item.get("질의요지")), clean_article_text(item.get("회답")))))
+        doc_id = _first(item, "법령해석례일련번호", "해석례일련번호") or request_id
+        if text and doc_id:
+            documents.append({
+                "kind": KIND_INTERPRETATION,
+                "id": doc_id,
+                "name": _first(item, "안건명", "해석례명"),
+                "label": " ".join(filter(None, (_first(item, "해석기관", "질의기관명"), _first(item, "해석일자", "회신일자"), _first(item, "안건번호")))),
+                "text": text[:MAX_DOCUMENT_CHARS],
+            })
+    return documents
+
+
+class _Matrix:
+    """검색에 쓰는 행렬 한 세대 (교체 시 참조만 바꿈)"""
+
+    def __init__(self, matrix: Any, idf: Any, rows: List[List[str]], kinds: Any, meta: Dict[str, Any]):
+        self.matrix = matrix
+        self.idf = idf
+        self.rows = rows  # [종류, target(조문만), 참조 ID, 이름, 조문/사건 표시, 미리보기]
+        self.kinds = kinds
+        self.meta = meta
+
+
+class SimilarityIndex:
+    """조문·판례·해석례 TF-IDF 유사도 색인"""
+
+    def __init__(self, directory: Path, max_documents: int = 5000):
+        """
+        Args:
+            directory: 저장 디렉토리
+            max_documents: 보관할 판례/해석례 문서 수 상한 (초과 시 오래된 문서부터 삭제)
+        """
+        self.directory = Path(directory)
+        self.max_documents = max_documents
+        self.codec = CacheCodec()
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+        self._builder = BackgroundRefresher(max_workers=1, max_pending=1)
+        self._documents: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+        self._current: Optional[_Matrix] = None
+        self._dirty = False
+        self._loaded = False
+        self._builds = 0
+        self._queries = 0
+        self._last_query_ms = 0.0
+
+    @property
+    def available(self) -> bool:
+        return HAS_NUMPY
+
+    # ------------------------------------------------------------------
+    # 문서 수집
+    # ------------------------------------------------------------------
+
+    def observe(self, data: Any, params: Optional[Dict[str, Any]] = None) -> int:
+        """판례/해석례 본문 응답의 문서를 수집하고 추가/변경된 수 반환 (다음 재생성 때 행렬에 반영)"""
+        documents = extract_documents(data, params)
+        if not documents:
+            return 0
+        self.ensure_loaded()
+        changed = 0
+        with self._lock:
+            for document in documents:
+                key = f"{document['kind']}:{document['id']}"
+                if self._documents.get(key) != document:
+                    self._documents[key] = document
+                    changed += 1
+                self._documents.move_to_end(key)
+            while len(self._documents) > max(self.max_documents, 0):
+                self._documents.popitem(last=False)
+            if changed:
+                self._dirty = True
+        return changed
+
+    # ------------------------------------------------------------------
+    # 행렬 생성
+    # ------------------------------------------------------------------
+
+    def _signature(self, article_keys: List[str]) -> int:
+        with self._lock:
+            document_keys = sorted(f"{key}:{zlib.crc32(doc['text'].encode())}" for key, doc in self._documents.items())
+        return zlib.crc32("\n".join(sorted(article_keys) + document_keys).encode())
+
+    @property
+    def building(self) -> bool:
+        """백그라운드 행렬 생성이 진행 중인지 여부"""
+        return self._builder.stats()["in_flight"] > 0
+
+    def build_in_background(self, rebuild: Callable[[], Any]) -> bool:
+        """행렬 생성을 워커 스레드에 예약 (이미 진행 중이면 False, 검색 요청이 생성을 기다리지 않도록)"""
+        return self._builder.schedule("similarity", rebuild)
+
+    def is_stale(self, article_keys: List[str]) -> bool:
+        """저장된 행렬이 현재 조문 샤드·수집 문서와 다른지 여부"""
+        self.ensure_loaded()
+        current = self._current
+        if current is None:
+            return bool(article_keys) or bool(self._documents)
+        return current.meta.get("signature") != self._signature(article_keys)
+
+    @property
+    def built_at(self) -> Optional[float]:
+        """현재 행렬 생성 시각 (없으면 None)"""
+        self.ensure_loaded()
+        current = self._current
+        return current.meta["built_at"] if current is not None else None
+
+    @property
+    def row_count(self) -> int:
+        """현재 행렬의 행 수"""
+        self.ensure_loaded()
+        current = self._current
+        return len(current.rows) if current is not None else 0
+
+    def build(self, articles: Iterable[Tuple[str, str, ArticleIndex]], article_keys: List[str],
+              should_stop: Optional[Callable[[], bool]] = None) -> Optional[int]:
+        """조문과 수집 문서로 행렬을 새로 만들어 저장하고 행 수 반환 (중단되면 None)
+
+        행 특징은 법령 하나씩 읽으며 바로 임시 파일에 쓰고, 문서 빈도는 고정 크기 배열로 셉니다.
+        idf·정규화는 행 블록 단위로 최종 배열(메모리 매핑)에 기록하므로 조문 전체를 메모리에 올리지 않습니다.
+
+        Args:
+            articles: (target, MST, 조문 색인) 목록 (법령 하나씩 읽히도록 지연 생성 권장)
+            article_keys: 행렬에 반영되는 법령 버전 키 ("target:MST", 변경 판단용)
+            should_stop: 법령마다 확인할 중단 여부 (True면 만들던 세대를 지우고 기존 행렬 유지)
+        """
+        if not HAS_NUMPY:
+            return 0
+        self.ensure_loaded()
+        with self._build_lock:
+            started = time.monotonic()
+            signature = self._signature(article_keys)
+            generation = f"matrix-{time.time_ns()}"
+            directory = self.directory / generation
+            directory.mkdir(parents=True, exist_ok=True)
+            cols_path = directory / "cols.tmp"
+            tfs_path = directory / "tfs.tmp"
+            rows: List[List[str]] = []
+            indptr = [0]
+            df = np.zeros(N_FEATURES, dtype=np.int32)
+            try:
+                with open(cols_path, "wb") as cols_file, open(tfs_path, "wb") as tfs_file:
+                    def add_row(text: str, row: List[str]) -> None:
+                        counts = char_ngram_features(text)
+                        if not counts:
+                            return
+                        cols = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+                        tfs = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+                        order = np.argsort(cols)
+                        cols = cols[order]
+                        cols.tofile(cols_file)
+                        (1 + np.log(tfs[order])).astype(np.float32).tofile(tfs_file)
+                        df[cols] += 1  # 행 안에서 특징 번호는 중복 없음
+                        indptr.append(indptr[-1] + len(cols))
+                        rows.append(row)
+
+                    for target, mst, index in articles:
+                        if should_stop is not None and should_stop():
+                            break
+                        for record in index.records:
+                            preview = record.text or " ".join(record.paragraphs)
+                            add_row(f"{record.title} {record.text} {' '.join(record.paragraphs)}",
+                                    [KIND_ARTICLE, target, str(mst), index.law_name, record.label, preview[:PREVIEW_CHARS]])
+                    with self._lock:
+                        documents = list(self._documents.values())
+                    for document in documents:
+                        add_row(f"{document['name']} {document['text']}",
+                                [document["kind"], "", document["id"], document["name"],
+                                 document["label"], document["text"][:PREVIEW_CHARS]])
+
+                if should_stop is not None and should_stop():
+                    shutil.rmtree(directory, ignore_errors=True)
+                    logger.info(f"유사도 색인 생성 중단 - 기존 행렬 유지 ({len(rows)}행까지 처리)")
+                    return None
+                n_rows = len(rows)
+                nnz = indptr[-1]
+                idf = np.zeros(N_FEATURES, dtype=np.float32)
+                seen = df > 0
+                idf[seen] = (np.log((1 + n_rows) / (1 + df[seen].astype(np.float64))) + 1).astype(np.float32)
+                del df
+                # scipy가 int32 인덱스로 다루는 크기면 int32로 저장해야 로드 시 복사 없이 매핑됨
+                indptr_array = np.asarray(indptr, dtype=np.int32 if nnz < 2 ** 31 else np.int64)
+                del indptr
+                self._write_arrays(directory, cols_path, tfs_path, indptr_array, idf)
+            except BaseException:
+                shutil.rmtree(directory, ignore_errors=True)
+                raise
+            finally:
+                for path in (cols_path, tfs_path):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+
+            meta = {
+                "version": SIMILARITY_VERSION,
+                "generation": generation,
+                "rows": rows,
+                "n_features": N_FEATURES,
+                "signature": signature,
+                "built_at": time.time(),
+            }
+            self._commit_generation(generation, meta)
+            self._current = self._open_generation(meta)
+            with self._lock:
+                self._builds += 1
+            logger.info(f"유사도 색인 생성 - 행 {n_rows}개, 비영 {nnz}개 ({(time.monotonic() - started) * 1000:.0f}ms)")
+            return n_rows
+
+    def _write_arrays(self, directory: Path, cols_path: Path, tfs_path: Path, indptr: Any, idf: Any) -> None:
+        """임시 특징 파일에 idf 가중치와 행 정규화를 적용해 CSR 배열(.npy) 기록 (행 블록 단위)"""
+        nnz = int(indptr[-1])
+        n_rows = len(indptr) - 1
+        np.save(directory / "indptr.npy", indptr)
+        np.save(directory / "idf.npy", idf)
+        indices = np.lib.format.open_memmap(directory / "indices.npy", mode="w+", dtype=np.int32, shape=(nnz,))
+        values = np.lib.format.open_memmap(directory / "data.npy", mode="w+", dtype=np.float32, shape=(nnz,))
+        if nnz:
+            cols = np.memmap(cols_path, dtype=np.int32, mode="r", shape=(nnz,))
+            tfs = np.memmap(tfs_path, dtype=np.float32, mode="r", shape=(nnz,))
+            for first in range(0, n_rows, BUILD_ROW_BLOCK):
+                last = min(first + BUILD_ROW_BLOCK, n_rows)
+                start, end = int(indptr[first]), int(indptr[last])
+                block_cols = np.asarray(cols[start:end])
+                weights = tfs[start:end] * idf[block_cols]
+                lengths = np.diff(indptr[first:last + 1])
+                norms = np.sqrt(np.add.reduceat(weights * weights, indptr[first:last] - start))
+                norms[norms == 0] = 1.0
+                indices[start:end] = block_cols
+                values[start:end] = weights / np.repeat(norms, lengths)
+            del cols, tfs
+        indices.flush()
+        values.flush()
+        del indices, values
+
+    def _commit_generation(self, generation: str, meta: Dict[str, Any]) -> None:
+        """목차를 새 세대로 교체한 뒤 이전 세대 삭제
+
+        이미 메모리 매핑된 이전 세대 파일은 삭제되어도 매핑이 닫힐 때까지 읽을 수 있습니다.
+        """
+        write_index_payload(self.directory / "matrix.bin", meta, self.codec)
+        for old in self.directory.glob("matrix-*"):
+            if old.name != generation and old.is_dir():
+                shutil.rmtree(old, ignore_errors=True)
+
+    def _open_generation(self, meta: Dict[str, Any]) -> Optional[_Matrix]:
+        """세대 배열을 메모리 매핑으로 열어 CSR 행렬 구성"""
+        directory = self.directory / meta["generation"]
+        try:
+            arrays = {name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in ("data", "indices", "indptr", "idf")}
+        except (OSError, ValueError) as e:
+            logger.warning(f"유사도 색인 배열 로드 실패 ({directory}): {e}")
+            return None
+        rows = meta["rows"]
+        matrix = sparse.csr_matrix(
+            (arrays["data"], arrays["indices"], arrays["indptr"]),
+            shape=(len(rows), meta["n_features"]),
+            copy=False,
+        )
+        kind_codes = {kind: code for code, kind in enumerate(KINDS)}
+        kinds = np.fromiter((kind_codes.get(row[0], -1) for row in rows), dtype=np.int8, count=len(rows))
+        return _Matrix(matrix, arrays["idf"], rows, kinds, meta)
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+
+    def search(self, text: str, limit: int = 10, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """질의 텍스트와 코사인 유사도가 높은 행 목록 (행렬이 없으면 빈 목록)"""
+        if not HAS_NUMPY:
+            return []
+        self.ensure_loaded()
+        current = self._current
+        counts = char_ngram_features(text)
+        if current is None or not counts or not current.rows:
+            return []
+        started = time.perf_counter()
+        cols = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+        tfs = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        weights = (1 + np.log(tfs)) * current.idf[cols]
+        norm = float(np.linalg.norm(weights))
+        if norm == 0.0:
+            return []
+        query = sparse.csr_matrix(
+            (weights / norm, cols, np.array([0, len(cols)])),
+            shape=(1, N_FEATURES),
+        )
+        scores = (current.matrix @ query.T).toarray().ravel()
+        if kind is not None:
+            scores[current.kinds != KINDS.index(kind)] = 0.0
+        k = min(max(limit, 1), len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        results = []
+        for row in top:
+            score = float(scores[row])
+            if score <= 0.0:
+                break
+            row_kind, target, ref, name, label, preview = current.rows[row]
+            results.append({
+                "kind": row_kind,
+                "target": target,
+                "id": ref,
+                "name": name,
+                "label": label,
+                "preview": preview,
+                "score": round(score, 4),
+            })
+        with self._lock:
+            self._queries += 1
+            self._last_query_ms = round((time.perf_counter() - started) * 1000, 2)
+        return results
+
+    # ------------------------------------------------------------------
+    # 저장/로드
+    # ------------------------------------------------------------------
+
+    def ensure_loaded(self) -> None:
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self.load()
+
+    def load(self) -> bool:
+        """수집 문서와 저장된 행렬 로드 (없거나 형식이 다르면 빈 색인)"""
+        self._loaded = True
+        payload = read_index_payload(self.directory / "documents.bin", SIMILARITY_VERSION)
+        if payload is not None:
+            with self._lock:
+                for document in payload.get("documents", []):
+                    self._documents[f"{document['kind']}:{document['id']}"] = document
+        meta = read_index_payload(self.directory / "matrix.bin", SIMILARITY_VERSION)
+        if meta is not None and HAS_NUMPY:
+            self._current = self._open_generation(meta)
+        return payload is not None or self._current is not None
+
+    def save(self) -> None:
+        """수집 문서를 파일에 저장"""
+        with self._lock:
+            payload = {"version": SIMILARITY_VERSION, "documents": list(self._documents.values())}
+            self._dirty = False
+        write_index_payload(self.directory / "documents.bin", payload, self.codec)
+
+    def flush(self) -> None:
+        """바뀐 내용이 있으면 저장"""
+        if self._dirty:
+            self.save()
+
+    def close(self) -> None:
+        """대기 중인 행렬 생성을 취소하고 수집 문서 저장 (서버 종료 시)"""
+        self._builder.shutdown(wait=False)
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """색인 통계"""
+        self.ensure_loaded()
+        current = self._current
+        rows = current.rows if current is not None else []
+        with self._lock:
+            by_kind = Counter(row[0] for row in rows)
+            return {
+                "available": HAS_NUMPY,
+                "rows": len(rows),
+                "rows_by_kind": dict(by_kind),
+                "nonzeros": int(current.matrix.nnz) if current is not None else 0,
+                "built_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(current.meta["built_at"])) if current is not None else None,
+                "documents": len(self._documents),
+                "max_documents": self.max_documents,
+                "builds": self._builds,
+                "building": self.building,
+                "queries": self._queries,
+                "last_query_ms": self._last_query_ms,
+                "path": str(self.directory),
+            }
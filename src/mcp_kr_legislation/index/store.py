@@ -0,0 +1,38 @@
+"""
+색인 파일 저장/로드 공용 함수
+
+색인은 응답 캐시와 같은 CacheCodec 형식(압축 + JSON/msgpack)으로 저장하고,
+쓰는 도중 프로세스가 종료되어도 기존 파일이 깨지지 않도록 임시 파일 작성 후 교체합니다.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..cache import CacheCodec
+
+logger = logging.getLogger(__name__)
+
+
+def read_index_payload(path: Path, version: int) -> Optional[Dict[str, Any]]:
+    """저장된 색인 로드 (없거나 형식/버전이 다르면 None)"""
+    try:
+        payload = CacheCodec.decode(Path(path).read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"색인 파일 로드 실패 ({path}): {e}")
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != version:
+        return None
+    return payload
+
+
+def write_index_payload(path: Path, payload: Dict[str, Any], codec: CacheCodec) -> None:
+    """색인을 파일에 저장 (임시 파일 작성 후 교체)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(codec.encode(payload))
+    os.replace(tmp_path, path)
@@ -0,0 +1,201 @@
+"""
+법령 변경이력(lsHstInf) 기반 증분 동기화
+
+법령 카탈로그를 매일 전체 목록(수십 페이지)으로 다시 받는 대신,
+일자별 변경이력 목록(regDt)을 저장된 기준일(watermark) 다음 날부터 하루씩 읽어
+바뀐 법령만 카탈로그·조문 저장소에 반영합니다.
+
+- 기준일: 변경이력을 끝까지 반영한 마지막 날짜 (YYYYMMDD, 하루 단위로 저장해 중단 후 이어서 진행)
+- 오늘 목록은 계속 추가되므로 기준일로 확정하지 않고 다음 실행 때 다시 읽음 (반영은 멱등)
+- 기준일이 max_days보다 오래 밀렸으면 증분 대신 전체 갱신이 필요하다고 알림
+"""
+
+import logging
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from ..cache import CacheCodec
+from .store import read_index_payload, write_index_payload
+
+logger = logging.getLogger(__name__)
+
+SYNC_VERSION = 1
+PAGE_SIZE = 100  # lawSearch.do display 최대값
+MAX_PAGES = 50
+
+
+def _parse_day(value: str) -> date:
+    return datetime.strptime(value, "%Y%m%d").date()
+
+
+def _format_day(value: date) -> str:
+    return value.strftime("%Y%m%d")
+
+
+class ChangeFeedSync:
+    """lsHstInf 일자별 변경이력을 기준일부터 따라가는 동기화 작업"""
+
+    def __init__(self,
+                 path: Path,
+                 fetch_page: Callable[[str, int, int], Dict[str, Any]],
+                 apply: Callable[[List[Dict[str, Any]], str], Dict[str, Any]],
+                 max_days: int = 14):
+        """
+        Args:
+            path: 동기화 상태 저장 파일
+            fetch_page: (변경일자, page, display) → lsHstInf 응답
+            apply: (변경 항목 목록, 변경일자) → 반영 결과 (항목별 수)
+            max_days: 한 번에 따라갈 최대 일수 (더 밀렸으면 전체 갱신 필요)
+        """
+        self.path = Path(path)
+        self.fetch_page = fetch_page
+        self.apply = apply
+        self.max_days = max_days
+        self.codec = CacheCodec()
+        self._lock = threading.Lock()
+        self.watermark: Optional[str] = None
+        self._loaded = False
+        self._runs = 0
+        self._days_synced = 0
+        self._changes_seen = 0
+        self._applied: Dict[str, int] = {}
+        self._last_run: Optional[Dict[str, Any]] = None
+
+    def fetch_day(self, day: str) -> List[Dict[str, Any]]:
+        """하루치 변경이력 항목 전체 (페이지를 끝까지 읽음)
+
+        Raises:
+            RuntimeError: 응답 오류·형식 이상·불완전한 목록 (기준일은 그대로 유지, 다음 실행에서 그날부터 재시도)
+        """
+        items: List[Dict[str, Any]] = []
+        page = 1
+        while page <= MAX_PAGES:
+            data = self.fetch_page(day, page, PAGE_SIZE)
+            if not isinstance(data, dict) or "error" in data:
+                raise RuntimeError(f"변경이력 조회 실패 ({day}, page={page}): {data.get('error') if isinstance(data, dict) else data}")
+            root = data.get("LawSearch")
+            # 오류·비JSON 응답을 "변경 없음"으로 보고 기준일을 넘기면 그날 개정분이 영영 빠지므로 실패 처리
+            if not isinstance(root, dict) or root.get("totalCnt") in (None, ""):
+                raise RuntimeError(f"변경이력 응답 형식이 올바르지 않습니다 ({day}, page={page}, LawSearch/totalCnt 없음)")
+            total = int(root["totalCnt"])
+            page_items = root.get("law") or []
+            if isinstance(page_items, dict):
+                page_items = [page_items]
+            items.extend(item for item in page_items if isinstance(item, dict))
+            if page * PAGE_SIZE >= total:
+                break
+            if not page_items:
+                raise RuntimeError(f"변경이력 목록이 불완전합니다 ({day}, {len(items)}/{total}건)")
+            page += 1
+        return items
+
+    def is_behind(self, today: Optional[date] = None) -> bool:
+        """기준일이 max_days보다 오래되어 증분으로 따라갈 수 없는지 여부 (기준일이 없어도 True)"""
+        self.ensure_loaded()
+        today = today or date.today()
+        return self.watermark is None or (today - _parse_day(self.watermark)).days > self.max_days
+
+    def reset(self, watermark: date) -> None:
+        """전체 갱신 직후 기준일을 지정 (그 다음 날부터 증분 동기화)"""
+        self.ensure_loaded()
+        with self._lock:
+            self.watermark = _format_day(watermark)
+        self.save()
+
+    def run_once(self, today: Optional[date] = None, should_stop: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+        """기준일 다음 날부터 오늘까지 변경이력 반영 (블로킹 I/O 포함)
+
+        Args:
+            today: 기준 오늘 날짜 (기본: date.today())
+            should_stop: 하루 단위로 확인할 중단 여부 (True면 반영한 날까지 기준일을 저장하고 종료)
+        Returns:
+            실행 결과 (반영한 일자, 변경 항목 수, 반영 결과 합계, 중단 여부)
+        Raises:
+            RuntimeError: 기준일이 없거나 max_days보다 오래됨 (전체 갱신 후 reset 필요)
+        """
+        self.ensure_loaded()
+        today = today or date.today()
+        if self.is_behind(today):
+            raise RuntimeError(f"변경이력 기준일이 없거나 {self.max_days}일보다 오래되었습니다 (기준일: {self.watermark})")
+        started = time.monotonic()
+        day = _parse_day(self.watermark) + timedelta(days=1)  # type: ignore[arg-type]
+        days: List[str] = []
+        changes = 0
+        totals: Dict[str, int] = {}
+        stopped = False
+        while day <= today:
+            if should_stop is not None and should_stop():
+                stopped = True
+                break
+            key = _format_day(day)
+            items = self.fetch_day(key)
+            result = self.apply(items, key) if items else {}
+            changes += len(items)
+            for name, count in result.items():
+                totals[name] = totals.get(name, 0) + int(count or 0)
+            days.append(key)
+            # 오늘 목록은 아직 추가될 수 있으므로 어제까지만 확정
+            if day < today:
+                with self._lock:
+                    self.watermark = key
+                    self._days_synced += 1
+                self.save()
+            day += timedelta(days=1)
+
+        with self._lock:
+            self._runs += 1
+            self._changes_seen += changes
+            for name, count in totals.items():
+                self._applied[name] = self._applied.get(name, 0) + count
+            self._last_run = {
+                "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "days": days,
+                "changes": changes,
+                "applied": totals,
+                "stopped": stopped,
+                "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
+            }
+            return self._last_run
+
+    # ------------------------------------------------------------------
+    # 저장/로드
+    # ------------------------------------------------------------------
+
+    def ensure_loaded(self) -> None:
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self.load()
+
+    def load(self) -> bool:
+        """저장된 기준일 로드 (없으면 None)"""
+        self._loaded = True
+        payload = read_index_payload(self.path, SYNC_VERSION)
+        if payload is None:
+            return False
+        self.watermark = payload.get("watermark")
+        return True
+
+    def save(self) -> None:
+        """기준일을 파일에 저장"""
+        with self._lock:
+            payload = {"version": SYNC_VERSION, "watermark": self.watermark, "saved_at": time.time()}
+        write_index_payload(self.path, payload, self.codec)
+
+    def stats(self) -> Dict[str, Any]:
+        """동기화 통계"""
+        self.ensure_loaded()
+        with self._lock:
+            return {
+                "watermark": self.watermark,
+                "max_days": self.max_days,
+                "runs": self._runs,
+                "days_synced": self._days_synced,
+                "changes_seen": self._changes_seen,
+                "applied": dict(self._applied),
+                "last_run": self._last_run,
+                "path": str(self.path),
+            }
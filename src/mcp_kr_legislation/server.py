@@ -21,17 +21,26 @@
 import logging
 import sys
 import asyncio
+import functools
+import inspect
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any, Literal, Optional
+from typing import Any, Callable, Literal, Optional
 from typing import AsyncIterator
 
+import anyio
 from fastmcp import FastMCP
 from mcp.types import TextContent
 from mcp.server.session import ServerSession
 
 from .config import MCPConfig, LegislationConfig, mcp_config, legislation_config
 from .apis.client import LegislationClient
+from .apis.async_client import AsyncLegislationClient
+from .apis.transport import close_transport, close_async_transport
+from .apis.fanout import get_fanout
+from .apis.health import get_upstream_health, offline_notice, offline_sources_scope
+from .cache import close_cache, get_cache_janitor
+from .index import close_indexes, get_index_maintainer
 from .apis import law_api, legislation_api
 from .registry.initialize_registry import initialize_registry
 
@@ -49,6 +58,7 @@ logging.basicConfig(
 class LegislationContext(ServerSession):
     """법제처 API 통합 컨텍스트"""
     client: Optional[LegislationClient] = None
+    async_client: Optional[AsyncLegislationClient] = None
     law_api: Any = None
     legislation_api: Any = None
 
@@ -58,6 +68,8 @@ class LegislationContext(ServerSession):
             if legislation_config is None:
                 raise ValueError("법제처 설정이 올바르게 로드되지 않았습니다.")
             self.client = LegislationClient(config=legislation_config)
+        if self.async_client is None:
+            self.async_client = AsyncLegislationClient(config=self.client.config)
             
         # API 모듈이 None이면 초기화
         if self.law_api is None:
@@ -96,6 +108,9 @@ else:
 async def legislation_lifespan(app: FastMCP) -> AsyncIterator[LegislationContext]:
     """법제처 MCP 서버 라이프사이클 관리"""
     logger.info("Initializing Legislation FastMCP server...")
+    janitor_task: Optional[asyncio.Task] = None
+    index_task: Optional[asyncio.Task] = None
+    health_task: Optional[asyncio.Task] = None
     
     try:
         logger.info(f"Server Name: {mcp_config.server_name}")
@@ -106,12 +121,14 @@ async def legislation_lifespan(app: FastMCP) -> AsyncIterator[LegislationContext
         if legislation_config is None:
             raise ValueError("법제처 설정이 올바르게 로드되지 않았습니다.")
         
-        # 법제처 API 클라이언트 초기화
+        # 법제처 API 클라이언트 초기화 (동기 + 비동기)
         client = LegislationClient(config=legislation_config)
+        async_client = AsyncLegislationClient(config=legislation_config)
         
         # API 모듈 초기화
         ctx = LegislationContext(
             client=client,
+            async_client=async_client,
             law_api=law_api.LawAPI(client),
             legislation_api=legislation_api.LegislationAPI(client)
         )
@@ -119,6 +136,13 @@ async def legislation_lifespan(app: FastMCP) -> AsyncIterator[LegislationContext
         logger.info("Legislation client and API modules initialized successfully.")
         logger.info("🚀 157개 법제처 OPEN API 지원 완료!")
         
+        # 캐시 정리 작업 (만료 항목 제거, 용량 상한 적용)
+        janitor_task = asyncio.create_task(get_cache_janitor().run_forever())
+        # 법령 카탈로그 갱신 작업 (법령명 → MST 조회용 로컬 색인)
+        index_task = asyncio.create_task(get_index_maintainer().run_forever())
+        # 법제처 API 상태 점검 (장애 시 오프라인 모드 전환, 복구 시 온라인 복귀)
+        health_task = asyncio.create_task(get_upstream_health().run_forever())
+        
         yield ctx
         
     except Exception as e:
@@ -126,12 +150,91 @@ async def legislation_lifespan(app: FastMCP) -> AsyncIterator[LegislationContext
         raise
     finally:
         logger.info("Shutting down Legislation FastMCP server...")
+        # 진행 중인 색인 유지 작업이 전체 동기화·재생성을 끝낼 때까지 종료가 막히지 않도록 먼저 중단 요청
+        get_index_maintainer().stop()
+        for task in (janitor_task, index_task, health_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        get_fanout().shutdown()
+        close_transport()
+        await close_async_transport()
+        close_indexes()
+        close_cache()
 
 # 도구 레지스트리 초기화
 tool_registry = initialize_registry()
 
+_tool_thread_limiter: Optional[anyio.CapacityLimiter] = None
+
+def _offload_sync_tool(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """동기 도구 함수를 워커 스레드에서 실행하는 async 래퍼로 변환 (async 도구는 그대로 반환)"""
+    if inspect.iscoroutinefunction(fn):
+        return fn
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        global _tool_thread_limiter
+        if _tool_thread_limiter is None:
+            _tool_thread_limiter = anyio.CapacityLimiter(mcp_config.tool_worker_threads)
+        return await anyio.to_thread.run_sync(
+            functools.partial(fn, *args, **kwargs), limiter=_tool_thread_limiter
+        )
+
+    return wrapper
+
+def _with_offline_notice(result: Any, sources: list) -> Any:
+    """로컬 저장소로 대신 응답한 도구 결과 앞에 안내문 추가"""
+    if not sources:
+        return result
+    notice = offline_notice(sources)
+    if isinstance(result, TextContent):
+        return TextContent(type="text", text=notice + result.text)
+    if isinstance(result, str):
+        return notice + result
+    return result
+
+def _flag_offline_responses(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """업스트림 장애로 로컬 저장소 응답을 사용한 도구 결과에 오프라인 안내문을 붙이는 래퍼"""
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with offline_sources_scope() as sources:
+                result = await fn(*args, **kwargs)
+            return _with_offline_notice(result, sources)
+
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with offline_sources_scope() as sources:
+            result = fn(*args, **kwargs)
+        return _with_offline_notice(result, sources)
+
+    return wrapper
+
+def _prepare_tool(fn: Callable[..., Any]) -> Callable[..., Any]:
+    fn = _flag_offline_responses(fn)
+    return _offload_sync_tool(fn) if mcp_config.transport == "sse" else fn
+
+class LegislationFastMCP(FastMCP):
+    """도구 결과에 오프라인 응답 안내를 붙이고, SSE 전송 시 동기 도구가 이벤트 루프를 블로킹하지 않도록 등록하는 FastMCP
+    
+    stdio 전송에서는 동기 도구를 그대로(호출한 스레드에서) 실행합니다.
+    SSE 전송에서는 동기 도구를 워커 스레드로 오프로드하고, async 도구는 이벤트 루프에서 직접 실행합니다.
+    """
+
+    def tool(self, name_or_fn: Any = None, **kwargs: Any) -> Any:  # type: ignore[override]
+        if callable(name_or_fn):
+            return super().tool(_prepare_tool(name_or_fn), **kwargs)
+        decorator = super().tool(name_or_fn, **kwargs)
+        return lambda fn: decorator(_prepare_tool(fn))
+
 # FastMCP 인스턴스 생성
-mcp = FastMCP(
+mcp = LegislationFastMCP(
     "KR Legislation MCP",
     instructions="Korean legislation information MCP server with comprehensive tools covering all categories",
     lifespan=legislation_lifespan,
@@ -153,7 +256,8 @@ tool_modules = [
     "ministry_interpretation_tools",
     "misc_tools",
     "precedent_tools",
-    "specialized_tools"
+    "specialized_tools",
+    "system_tools"
 ]
 
 for module_name in tool_modules:
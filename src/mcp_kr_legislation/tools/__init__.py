@@ -15,6 +15,7 @@
 - linkage_tools: 연계정보 도구들 (용어 관련)
 - misc_tools: 기타 도구들 (자치법규, 조약)
 - legislation_tools: 나머지 도구들 (1개)
+- system_tools: 시스템 상태 도구들 (커넥션 풀 등 운영 지표)
 """
 
 # 분리된 모듈들에서 도구들을 가져옵니다
@@ -96,6 +97,12 @@ try:
 except ImportError as e:
     print(f"legislation_tools import 실패: {e}")
 
+try:
+    from .system_tools import *
+    print("system_tools 모듈 import 성공")
+except ImportError as e:
+    print(f"system_tools import 실패: {e}")
+
 print("\n모든 도구 모듈 로드 완료!")
 print("주요 변경사항:")
 print("   • 법령 관련 29개 도구 → law_tools.py로 통합")
@@ -14,6 +14,7 @@ from mcp.types import TextContent
 
 from ..server import mcp
 from ..config import legislation_config
+from ..apis.transport import get_transport
 
 logger = logging.getLogger(__name__)
 
@@ -154,8 +155,8 @@ def get_local_ordinance_detail(ordinance_id: Union[str, int]) -> TextContent:
         oc = os.getenv("LEGISLATION_API_KEY", "lchangoo")
         url = f"http://www.law.go.kr/DRF/lawService.do?OC={oc}&target=ordin&ID={ordinance_id}&type=JSON"
         
-        # API 요청 - 직접 requests 사용
-        response = requests.get(url, timeout=15)
+        # API 요청 - 공용 커넥션 풀 사용
+        response = get_transport().get(url, timeout=15)
         response.raise_for_status()
         
         data = response.json()
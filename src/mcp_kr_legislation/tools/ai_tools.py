@@ -7,6 +7,7 @@ AI 기반 종합 법률 검색 등 인공지능 기반 검색 기능을 제공
 import logging
 import json
 import os
+import functools
 import requests  # type: ignore
 from urllib.parse import urlencode
 from typing import Optional, Union
@@ -14,6 +15,7 @@ from mcp.types import TextContent
 
 from ..server import mcp
 from ..config import legislation_config
+from ..apis.fanout import get_fanout
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,32 @@ from .law_tools import (
     _format_search_results
 )
 
+# target="all" 검색 카테고리 (target, 응답 루트 키, 이름, 추가 파라미터) - 출력 순서
+AI_SEARCH_CATEGORIES = [
+    ("law", "LawSearch", "법령", {}),
+    ("prec", "PrecSearch", "판례", {"search": 2}),
+    ("expc", "Expc", "해석례", {}),
+]
+
+def _search_ai_category(category: str, params: dict, search_query: str) -> str:
+    """target="all" 검색의 카테고리 하나를 검색해 출력 조각 반환 (결과가 없으면 빈 문자열)"""
+    _, root_key, label, extra_params = next(c for c in AI_SEARCH_CATEGORIES if c[0] == category)
+    try:
+        category_params = {**params, "target": category, **extra_params}
+        data = _make_legislation_request(category, category_params)
+        if data and isinstance(data, dict) and data.get(root_key):
+            total = data[root_key].get('totalCnt', 0)
+            try:
+                total = int(total)
+            except:
+                total = 0
+            if total > 0:
+                formatted = _format_search_results(data, category, search_query, 5)
+                return f"**{label} 검색 결과**: {total}건\n" + formatted + "\n\n"
+    except Exception as e:
+        return f"**{label} 검색 오류**: {str(e)}\n\n"
+    return ""
+
 # ===========================================
 # AI 도구들 (1개)
 # ===========================================
@@ -50,6 +78,7 @@ from .law_tools import (
 - 판례: 사건명, 판례ID, 선고일자, 법원명
 - 해석례: 제목, 해석례ID, 작성일자, 소관부처
 - 위원회결정문: 안건명, 결정문ID, 의결일자, 위원회명
+- target=all: 법령/판례/해석례를 동시에 검색하고 카테고리별 응답 시간을 함께 표시
 
 사용 예시:
 - search_legal_ai("개인정보보호")  # 전체 검색
@@ -92,63 +121,30 @@ def search_legal_ai(
     try:
         # AI 검색 구현: target에 따라 적절한 API 호출
         if target == "all":
-            # 전체 검색인 경우 주요 카테고리별로 검색 수행
+            # 전체 검색인 경우 주요 카테고리별 검색을 동시에 수행하고 고정된 순서로 출력
             result = f"AI 기반 종합 법률 검색 결과: '{search_query}'\n"
             result += "=" * 50 + "\n\n"
             
-            # 1. 법령 검색
-            try:
-                law_params = {**params, "target": "law"}
-                law_data = _make_legislation_request("law", law_params)
-                law_url = _generate_api_url("law", law_params)
-                if law_data and isinstance(law_data, dict) and law_data.get('LawSearch'):
-                    law_total = law_data['LawSearch'].get('totalCnt', 0)
-                    try:
-                        law_total = int(law_total)
-                    except:
-                        law_total = 0
-                    if law_total > 0:
-                        result += f"**법령 검색 결과**: {law_total}건\n"
-                        law_result = _format_search_results(law_data, "law", search_query, 5)
-                        result += law_result + "\n\n"
-            except Exception as e:
-                result += f"**법령 검색 오류**: {str(e)}\n\n"
+            category_results = get_fanout().run([
+                (category, functools.partial(_search_ai_category, category, params, search_query))
+                for category, _, _, _ in AI_SEARCH_CATEGORIES
+            ])
             
-            # 2. 판례 검색
-            try:
-                prec_params = {**params, "target": "prec", "search": 2}
-                prec_data = _make_legislation_request("prec", prec_params)
-                prec_url = _generate_api_url("prec", prec_params)
-                if prec_data and isinstance(prec_data, dict) and prec_data.get('PrecSearch'):
-                    prec_total = prec_data['PrecSearch'].get('totalCnt', 0)
-                    try:
-                        prec_total = int(prec_total)
-                    except:
-                        prec_total = 0
-                    if prec_total > 0:
-                        result += f"**판례 검색 결과**: {prec_total}건\n"
-                        prec_result = _format_search_results(prec_data, "prec", search_query, 5)
-                        result += prec_result + "\n\n"
-            except Exception as e:
-                result += f"**판례 검색 오류**: {str(e)}\n\n"
+            labels = {category: label for category, _, label, _ in AI_SEARCH_CATEGORIES}
+            latencies = []
+            for category_result in category_results:
+                label = labels[category_result.name]
+                if category_result.timed_out:
+                    result += f"**{label} 검색**: 응답 시간 초과로 생략되었습니다.\n\n"
+                    latencies.append(f"{label} 시간 초과")
+                    continue
+                if category_result.error is not None:
+                    result += f"**{label} 검색 오류**: {str(category_result.error)}\n\n"
+                else:
+                    result += category_result.value
+                latencies.append(f"{label} {category_result.elapsed_ms:.0f}ms")
             
-            # 3. 해석례 검색
-            try:
-                expc_params = {**params, "target": "expc"}
-                expc_data = _make_legislation_request("expc", expc_params)
-                expc_url = _generate_api_url("expc", expc_params)
-                if expc_data and isinstance(expc_data, dict) and expc_data.get('Expc'):
-                    expc_total = expc_data['Expc'].get('totalCnt', 0)
-                    try:
-                        expc_total = int(expc_total)
-                    except:
-                        expc_total = 0
-                    if expc_total > 0:
-                        result += f"**해석례 검색 결과**: {expc_total}건\n"
-                        expc_result = _format_search_results(expc_data, "expc", search_query, 5)
-                        result += expc_result + "\n\n"
-            except Exception as e:
-                result += f"**해석례 검색 오류**: {str(e)}\n\n"
+            result += f"**카테고리별 응답 시간**: {' · '.join(latencies)}\n"
         else:
             # 특정 타겟 검색인 경우
             data = _make_legislation_request(target, params)
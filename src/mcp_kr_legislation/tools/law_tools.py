@@ -8,13 +8,14 @@
 import logging
 import json
 import os
+import time
+import functools
+import anyio
+import httpx
 import requests  # type: ignore
 from urllib.parse import urlencode
 from typing import Optional, Union, Dict, Any, List
 from mcp.types import TextContent
-from datetime import datetime, timedelta
-from pathlib import Path
-import hashlib
 import re
 
 try:
@@ -27,13 +28,20 @@ except ImportError:
 from ..server import mcp
 from ..config import legislation_config
 from ..apis.client import LegislationClient
+from ..apis.transport import get_transport, get_async_transport
+from ..apis.singleflight import get_single_flight, canonical_request_key
+from ..apis.fanout import get_fanout
+from ..apis.health import get_upstream_health, is_unavailable_error, note_offline_source
+from ..apis.resilience import is_fast_failure
+from ..cache import LocalResponse, get_cache_key, load_from_cache, load_last_known, load_last_known_search, save_to_cache, fetch_with_cache, fetch_search_with_cache, fetch_search_with_cache_async, is_cacheable
+from ..index import get_article_index, get_article_search_index, get_law_catalog, get_similarity_index, local_law_body, local_law_search, mst_to_law_id, observe_documents, observe_law_ids, observe_search_results, resolve_law_name, search_articles, search_similar
 from ..utils.law_tools_utils import (
     # search_law 도구 관련
     format_search_law_results, normalize_search_query, create_search_variants,
     # get_law_detail 도구 관련  
     extract_law_summary_from_detail, format_law_detail_summary,
     # get_law_article_by_key 도구 관련
-    normalize_article_key, find_article_in_data, get_available_articles, format_article_content,
+    format_article_content,
     # 공통 유틸리티
     clean_html_tags, safe_get_nested_value
 )
@@ -41,97 +49,6 @@ from ..utils.law_tools_utils import (
 
 logger = logging.getLogger(__name__)
 
-# ===========================================
-# 캐시 시스템 (최적화용)
-# ===========================================
-
-# 홈 디렉토리의 .cache 사용 (권한 문제 해결)
-CACHE_DIR = Path.home() / ".cache" / "mcp-kr-legislation"
-CACHE_DAYS = 7  # 캐시 유효 기간 (일)
-
-def ensure_cache_dir():
-    """캐시 디렉토리 생성"""
-    try:
-        # 홈 디렉토리의 .cache 사용
-        cache_path = CACHE_DIR
-        cache_path.mkdir(parents=True, exist_ok=True)
-        
-        # 디렉토리 쓰기 권한 확인
-        test_file = cache_path / ".test"
-        try:
-            test_file.touch()
-            test_file.unlink()
-            logger.info(f"캐시 디렉토리 준비 완료: {cache_path}")
-            return True
-        except Exception as e:
-            logger.warning(f"캐시 디렉토리에 쓰기 권한이 없습니다: {cache_path} - {e}")
-            return False
-        
-    except Exception as e:
-        logger.error(f"캐시 디렉토리 생성 실패: {e}")
-        return False
-
-def get_cache_key(law_id: str, section: str = "all") -> str:
-    """캐시 키 생성"""
-    key_string = f"{law_id}_{section}"
-    return hashlib.md5(key_string.encode()).hexdigest()
-
-def get_cache_path(cache_key: str) -> Path:
-    """캐시 파일 경로 생성"""
-    return CACHE_DIR / f"{cache_key}.json"
-
-def is_cache_valid(cache_path: Path) -> bool:
-    """캐시 유효성 확인"""
-    if not cache_path.exists():
-        return False
-    from datetime import timedelta
-    file_time = datetime.fromtimestamp(cache_path.stat().st_mtime)
-    expiry_time = datetime.now() - timedelta(days=CACHE_DAYS)
-    return file_time > expiry_time
-
-def save_to_cache(cache_key: str, data: Any):
-    """캐시에 데이터 저장"""
-    try:
-        if not ensure_cache_dir():
-            logger.warning("캐시 디렉토리를 생성할 수 없어 캐시 저장을 건너뜁니다.")
-            return
-        
-        cache_file = get_cache_path(cache_key)
-        
-        # 캐시 데이터 구조
-        cache_data = {
-            "timestamp": datetime.now().isoformat(),
-            "data": data
-        }
-        
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            
-        logger.info(f"캐시 저장 완료: {cache_key}")
-    except Exception as e:
-        logger.warning(f"캐시 저장 중 오류 (서비스는 계속됨): {e}")
-
-def load_from_cache(cache_key: str) -> Optional[Any]:
-    """캐시에서 데이터 로드"""
-    try:
-        cache_file = get_cache_path(cache_key)
-        
-        if not cache_file.exists():
-            return None
-            
-        if not is_cache_valid(cache_file):
-            cache_file.unlink()  # 만료된 캐시 삭제
-            return None
-            
-        with open(cache_file, 'r', encoding='utf-8') as f:
-            cache_data = json.load(f)
-            logger.info(f"캐시 로드 완료: {cache_key}")
-            return cache_data.get("data")
-            
-    except Exception as e:
-        logger.warning(f"캐시 로드 중 오류 (API 호출로 대체됨): {e}")
-        return None
-
 # ===========================================
 # 공통 유틸리티 함수들
 # ===========================================
@@ -147,97 +64,272 @@ def extract_article_number(article_key: str) -> int:
 
 # 유틸리티 함수들은 utils/law_tools_utils.py로 이동됨
 
+def _resolve_request_timeout(target: str, timeout: int) -> int:
+    """타겟별 요청 타임아웃 결정"""
+    # 시간이 많이 걸리는 API들은 더 긴 타임아웃 설정
+    if target in ["lsHstInf", "lsStmd", "lawHst"]:  # 변경이력, 체계도, 법령연혁
+        return max(timeout, 60)  # 최소 60초
+    return timeout
+
+def _log_request_url(target: str, url: str):
+    """디버깅용 요청 URL 로그"""
+    # 디버깅: 법령약칭과 삭제된 법령 URL 로그
+    if target in ["lsAbrv", "delHst"]:
+        logger.info(f"{target} API 요청 URL: {url}")
+    
+    # 디버깅을 위한 로그 추가 (영문 법령의 경우)
+    if target == "elaw":
+        logger.info(f"영문법령 API 요청 URL: {url}")
+
+def _parse_legislation_response(target: str, params: dict, response: Any) -> dict:
+    """법제처 API 응답 검증 및 JSON 파싱 (requests/httpx 응답 공용)"""
+    # 응답 내용 확인 (영문 법령의 경우)
+    if target == "elaw":
+        logger.info(f"영문법령 응답 상태: {response.status_code}")
+        logger.info(f"영문법령 Content-Type: {response.headers.get('Content-Type', 'None')}")
+        if not response.text:
+            logger.error("영문법령 API 빈 응답")
+            return {"error": "영문법령 API가 빈 응답을 반환했습니다"}
+    
+    # HTML 오류 페이지 체크
+    if response.headers.get('Content-Type', '').startswith('text/html'):
+        if '사용자인증에 실패' in response.text or '페이지 접속에 실패' in response.text:
+            raise ValueError("API 인증 실패 - OC(기관코드)를 확인하세요")
+        elif target == "elaw":
+            logger.error(f"영문법령 HTML 응답: {response.text[:500]}")
+            raise ValueError("영문법령 API가 HTML을 반환했습니다. API 엔드포인트나 파라미터를 확인하세요.")
+        else:
+            raise ValueError("HTML 응답 반환 - JSON 응답이 예상됨")
+    
+    # JSON 파싱
+    try:
+        # 빈 응답 체크
+        if not response.text or response.text.strip() == "":
+            logger.warning(f"{target} API가 빈 응답을 반환했습니다")
+            return {"error": f"{target} API가 빈 응답을 반환했습니다"}
+        
+        data = response.json()
+    except json.JSONDecodeError as e:
+        # 특정 타겟들에 대한 상세한 오류 처리
+        if target in ["elaw", "ordinance", "ordinanceApp"]:
+            logger.error(f"{target} JSON 파싱 오류: {str(e)}")
+            logger.error(f"응답 내용 (처음 500자): {response.text[:500]}")
+            return {"error": f"{target} API JSON 파싱 실패: {str(e)}"}
+        raise
+    
+    # 응답 구조 확인
+    if not isinstance(data, dict):
+        raise ValueError("Invalid JSON response structure")
+    
+    # 빈 응답 체크
+    if not data:
+        logger.warning(f"빈 응답 반환 - target: {target}, params: {params}")
+        return {}
+    
+    # 오류 코드 체크
+    if 'LawSearch' in data:
+        # resultCode가 없는 API들: elaw, lsHstInf, lsJoHstInf 등
+        targets_without_result_code = ["elaw", "lsHstInf", "lsJoHstInf"]
+        
+        if target not in targets_without_result_code:
+            result_code = data['LawSearch'].get('resultCode')
+            if result_code and result_code != '00':
+                result_msg = data['LawSearch'].get('resultMsg', '알 수 없는 오류')
+                raise ValueError(f"API 오류: {result_msg} (코드: {result_code})")
+        else:
+            # resultCode가 없는 API들은 totalCnt로 결과 유무 판단
+            total_cnt = data['LawSearch'].get('totalCnt', '0')
+            if str(total_cnt) == '0' and 'law' not in data['LawSearch']:
+                # 실제로 결과가 없는 경우만 처리 (빈 검색 결과는 오류가 아님)
+                pass
+    
+    return data
+
 def _make_legislation_request(target: str, params: dict, is_detail: bool = False, timeout: int = 10) -> dict:
     """법제처 API 요청 공통 함수"""
     try:
-        # 시간이 많이 걸리는 API들은 더 긴 타임아웃 설정
-        if target in ["lsHstInf", "lsStmd", "lawHst"]:  # 변경이력, 체계도, 법령연혁
-            timeout = max(timeout, 60)  # 최소 60초
+        timeout = _resolve_request_timeout(target, timeout)
         
         # URL 생성 - 올바른 target 파라미터 사용
         url = _generate_api_url(target, params, is_detail)
+        _log_request_url(target, url)
         
-        # 디버깅: 법령약칭과 삭제된 법령 URL 로그
-        if target in ["lsAbrv", "delHst"]:
-            logger.info(f"{target} API 요청 URL: {url}")
-        
-        # 디버깅을 위한 로그 추가 (영문 법령의 경우)
-        if target == "elaw":
-            logger.info(f"영문법령 API 요청 URL: {url}")
-        
-        # 요청 실행
-        response = requests.get(url, timeout=timeout)
-        response.raise_for_status()
-        
-        # 응답 내용 확인 (영문 법령의 경우)
-        if target == "elaw":
-            logger.info(f"영문법령 응답 상태: {response.status_code}")
-            logger.info(f"영문법령 Content-Type: {response.headers.get('Content-Type', 'None')}")
-            if not response.text:
-                logger.error("영문법령 API 빈 응답")
-                return {"error": "영문법령 API가 빈 응답을 반환했습니다"}
-        
-        # HTML 오류 페이지 체크
-        if response.headers.get('Content-Type', '').startswith('text/html'):
-            if '사용자인증에 실패' in response.text or '페이지 접속에 실패' in response.text:
-                raise ValueError("API 인증 실패 - OC(기관코드)를 확인하세요")
-            elif target == "elaw":
-                logger.error(f"영문법령 HTML 응답: {response.text[:500]}")
-                raise ValueError("영문법령 API가 HTML을 반환했습니다. API 엔드포인트나 파라미터를 확인하세요.")
-            else:
-                raise ValueError("HTML 응답 반환 - JSON 응답이 예상됨")
+        def fetch() -> dict:
+            # 요청 실행 (공용 커넥션 풀 사용)
+            response = get_transport().get(url, timeout=timeout)
+            response.raise_for_status()
+            return _parse_legislation_response(target, params, response)
         
-        # JSON 파싱
-        try:
-            # 빈 응답 체크
-            if not response.text or response.text.strip() == "":
-                logger.warning(f"{target} API가 빈 응답을 반환했습니다")
-                return {"error": f"{target} API가 빈 응답을 반환했습니다"}
-            
-            data = response.json()
-        except json.JSONDecodeError as e:
-            # 특정 타겟들에 대한 상세한 오류 처리
-            if target in ["elaw", "ordinance", "ordinanceApp"]:
-                logger.error(f"{target} JSON 파싱 오류: {str(e)}")
-                logger.error(f"응답 내용 (처음 500자): {response.text[:500]}")
-                return {"error": f"{target} API JSON 파싱 실패: {str(e)}"}
-            raise
-        
-        # 응답 구조 확인
-        if not isinstance(data, dict):
-            raise ValueError("Invalid JSON response structure")
+        # 동일 요청이 진행 중이면 업스트림 호출/파싱 결과를 공유
+        def coalesced_fetch() -> dict:
+            return get_single_flight().do(canonical_request_key(url), fetch)
         
-        # 빈 응답 체크
-        if not data:
-            logger.warning(f"빈 응답 반환 - target: {target}, params: {params}")
-            return {}
+        if is_detail and ("ID" in params or "MST" in params):
+            data = coalesced_fetch()
+        else:
+            # 검색 목록(lawSearch.do)은 정규화된 파라미터 키로 짧은 기간 캐시
+            data = fetch_search_with_cache(target, params, coalesced_fetch)
+        # 응답에 포함된 MST/법령ID 쌍을 매핑에, 판례/해석례 본문을 유사도 색인 문서에 반영
+        observe_law_ids(data, params)
+        observe_documents(data, params)
+        return data
         
-        # 오류 코드 체크
-        if 'LawSearch' in data:
-            # resultCode가 없는 API들: elaw, lsHstInf, lsJoHstInf 등
-            targets_without_result_code = ["elaw", "lsHstInf", "lsJoHstInf"]
-            
-            if target not in targets_without_result_code:
-                result_code = data['LawSearch'].get('resultCode')
-                if result_code and result_code != '00':
-                    result_msg = data['LawSearch'].get('resultMsg', '알 수 없는 오류')
-                    raise ValueError(f"API 오류: {result_msg} (코드: {result_code})")
-            else:
-                # resultCode가 없는 API들은 totalCnt로 결과 유무 판단
-                total_cnt = data['LawSearch'].get('totalCnt', '0')
-                if str(total_cnt) == '0' and 'law' not in data['LawSearch']:
-                    # 실제로 결과가 없는 경우만 처리 (빈 검색 결과는 오류가 아님)
-                    pass
+    except requests.exceptions.RequestException as e:
+        # 업스트림 장애(오프라인 모드 포함)면 로컬 저장소로 대신 응답
+        local = _load_local_response(target, params, is_detail) if is_unavailable_error(e) else None
+        if local is not None:
+            return local
+        if get_upstream_health().is_offline() or is_fast_failure(e):
+            logger.info(f"업스트림 호출 생략 ({e}) - 로컬 저장소에 대체 응답 없음 ({target})")
+        else:
+            logger.error(f"API 요청 실패: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"데이터 처리 실패: {e}")
+        raise
+
+async def _make_legislation_request_async(target: str, params: dict, is_detail: bool = False, timeout: int = 10) -> dict:
+    """법제처 API 요청 공통 함수 (비동기 버전)
+    
+    _make_legislation_request와 동일한 URL/응답 처리·검색 캐시·오프라인 대체 응답을 사용하며,
+    이벤트 루프를 블로킹하지 않도록 httpx 비동기 전송 계층으로 요청하고 캐시 파일 I/O는 워커 스레드에서 실행합니다.
+    """
+    try:
+        timeout = _resolve_request_timeout(target, timeout)
+        
+        url = _generate_api_url(target, params, is_detail)
+        _log_request_url(target, url)
+        request_key = canonical_request_key(url)
+        
+        async def fetch() -> dict:
+            response = await get_async_transport().get(url, timeout=timeout)
+            response.raise_for_status()
+            return _parse_legislation_response(target, params, response)
         
+        async def coalesced_fetch() -> dict:
+            return await get_single_flight().do_async(request_key, fetch)
+        
+        def refresh_fetch() -> dict:
+            # 만료된 검색 응답의 백그라운드 갱신 (워커 스레드, 동기 전송 계층)
+            def fetch_sync() -> dict:
+                response = get_transport().get(url, timeout=timeout)
+                response.raise_for_status()
+                return _parse_legislation_response(target, params, response)
+            return get_single_flight().do(request_key, fetch_sync)
+        
+        if is_detail and ("ID" in params or "MST" in params):
+            data = await coalesced_fetch()
+        else:
+            # 검색 목록은 동기 경로와 같은 검색 캐시(정규화된 파라미터 키, negative 캐시 포함) 사용
+            data = await fetch_search_with_cache_async(target, params, coalesced_fetch, refresh_fetch)
+        
+        def observe() -> None:
+            observe_law_ids(data, params)
+            observe_documents(data, params)
+        
+        await anyio.to_thread.run_sync(observe)
         return data
         
-    except requests.exceptions.RequestException as e:
-        logger.error(f"API 요청 실패: {e}")
+    except httpx.HTTPError as e:
+        if is_unavailable_error(e):
+            local = await anyio.to_thread.run_sync(_load_local_response, target, params, is_detail)
+            if local is not None:
+                return local
+        if get_upstream_health().is_offline() or is_fast_failure(e):
+            logger.info(f"업스트림 호출 생략 ({e}) - 로컬 저장소에 대체 응답 없음 ({target})")
+        else:
+            logger.error(f"API 요청 실패: {e}")
         raise
     except Exception as e:
         logger.error(f"데이터 처리 실패: {e}")
         raise
 
+def _format_saved_at(timestamp: float) -> str:
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(timestamp))
+
+def _local_response(data: dict, source: str) -> LocalResponse:
+    """로컬 저장소 응답으로 표시하고 도구 결과 안내문용 출처 기록"""
+    note_offline_source(source)
+    logger.info(f"업스트림 장애로 로컬 저장소 응답 사용: {source}")
+    return LocalResponse(data, source)
+
+def _load_local_response(target: str, params: dict, is_detail: bool) -> Optional[LocalResponse]:
+    """업스트림 장애 시 대체 응답 (마지막 캐시 값 → 조문 샤드/법령 카탈로그 순서, 없으면 None)
+    
+    만료된 캐시 값도 사용하며, 반환값은 LocalResponse라 캐시에 다시 저장되지 않습니다.
+    """
+    try:
+        if not is_detail:
+            entry = load_last_known_search(target, params)
+            if entry is not None and isinstance(entry.value, dict):
+                return _local_response(entry.value, f"캐시에 저장된 {target} 검색 결과 ({_format_saved_at(entry.created_at)} 저장)")
+            data = local_law_search(target, params)
+            if data is not None:
+                built_at = get_law_catalog(target).built_at
+                as_of = f"{_format_saved_at(built_at)} 기준" if built_at else "기준 시각 없음"
+                return _local_response(data, f"로컬 법령 카탈로그의 법령명 검색 ({as_of})")
+            return None
+        
+        # 법령ID로 요청했으면 카탈로그로 MST를 찾아 MST 기준 캐시 키·조문 샤드도 확인
+        law_id = str(params.get("ID") or "")
+        catalog_entry = get_law_catalog().get_by_law_id(law_id) if law_id and target in ("law", "eflaw") else None
+        mst = str(params.get("MST") or (catalog_entry.mst if catalog_entry else ""))
+        for identifier in dict.fromkeys(i for i in (mst, law_id) if i):
+            entry = load_last_known(get_cache_key(target, identifier, "full"))
+            if entry is not None and isinstance(entry.value, dict) and is_cacheable(entry.value):
+                return _local_response(entry.value, f"캐시에 저장된 {target} 본문 ({_format_saved_at(entry.created_at)} 저장)")
+        if mst:
+            body = local_law_body(target, mst)
+            if body is not None:
+                return _local_response(body, f"로컬 조문 저장소의 {target} 본문 (MST {mst}, 부칙·별표 제외)")
+    except Exception as e:
+        logger.warning(f"로컬 저장소 대체 응답 생성 실패 ({target}): {e}")
+    return None
+
+def _fetch_law_full(target: str, mst: str) -> dict:
+    """MST로 법령 본문 전체 조회 (캐시 우선)
+    
+    MST로 식별되는 본문은 버전별로 불변이라 기본 TTL 정책에서는 만료되지 않습니다.
+    CACHE_TTL_OVERRIDES로 TTL을 지정하면 만료 직후에는 이전 본문을 바로 반환하고 백그라운드에서 갱신합니다.
+    """
+    mst = str(mst)
+    return fetch_with_cache(
+        get_cache_key(target, mst, "full"),
+        lambda: _make_legislation_request(target, {"MST": mst}, is_detail=True)
+    )
+
+def _fetch_law_summary(target: str, mst: str) -> dict:
+    """MST로 법령 요약 조회 (캐시 우선, 본문을 새로 받으면 본문 캐시도 함께 갱신)"""
+    mst = str(mst)
+    
+    def fetch() -> dict:
+        data = _make_legislation_request(target, {"MST": mst}, is_detail=True)
+        if isinstance(data, LocalResponse):
+            # 로컬 저장소 본문으로 만든 요약은 캐시하지 않음
+            return LocalResponse(extract_law_summary_from_detail(data), data.source)
+        if is_cacheable(data):
+            save_to_cache(get_cache_key(target, mst, "full"), data)
+        return extract_law_summary_from_detail(data)
+    
+    return fetch_with_cache(get_cache_key(target, mst, "summary"), fetch)
+
+def _resolve_law_id(mst: str) -> str:
+    """MST를 법령ID로 변환 (MST-법령ID 매핑 우선, 모르면 본문 캐시로 확인, 실패 시 입력값 그대로)"""
+    law_id = mst_to_law_id(mst)
+    if law_id:
+        return law_id
+    try:
+        # 본문 조회 결과는 요청 공통 함수에서 매핑에 반영됨 (캐시 적중 시에는 직접 확인)
+        data = _fetch_law_full("law", mst)
+        basic_info = data.get("법령", {}).get("기본정보", {}) if isinstance(data, dict) else {}
+        found_id = basic_info.get("법령ID", basic_info.get("ID", ""))
+        if found_id:
+            observe_law_ids(data, {"MST": mst})
+            return str(found_id)
+    except Exception as e:
+        logger.warning(f"MST를 ID로 변환 실패: {e}")
+    return mst
+
 def _generate_api_url(target: str, params: dict, is_detail: bool = False) -> str:
     """올바른 법제처 API URL 생성"""
     try:
@@ -1373,7 +1465,7 @@ def search_law(
         suggested_laws = keyword_mapping[search_query.lower()]
         results = []
         
-        for law_name in suggested_laws:
+        def search_suggested(law_name: str) -> dict:
             params = {
                 "OC": legislation_config.oc,
                 "type": "JSON",
@@ -1382,15 +1474,18 @@ def search_law(
                 "search": 1,
                 "display": 5
             }
-            
-            try:
-                data = _make_legislation_request("law", params, is_detail=False)
-                if 'LawSearch' in data and 'law' in data['LawSearch']:
-                    laws = data['LawSearch']['law']
-                    if isinstance(laws, list):
-                        results.extend(laws[:3])  # 각 법령당 최대 3개
-            except:
-                continue
+            return _make_legislation_request("law", params, is_detail=False)
+        
+        # 매핑된 법령들을 한 번에 동시 검색 (출력은 매핑 순서 유지)
+        batch = get_fanout().run([
+            (law_name, functools.partial(search_suggested, law_name)) for law_name in suggested_laws
+        ])
+        for item in batch:
+            data = item.value
+            if item.ok and isinstance(data, dict) and 'LawSearch' in data and 'law' in data['LawSearch']:
+                laws = data['LawSearch']['law']
+                if isinstance(laws, list):
+                    results.extend(laws[:3])  # 각 법령당 최대 3개
         
         if results:
             # 수동으로 결과 포맷팅
@@ -1437,69 +1532,79 @@ def search_law(
         best_result = None
         best_count = 0
         
-        for attempt_query, search_mode in search_attempts:
-            # 기본 파라미터 설정
-            base_params = {"OC": oc, "type": "JSON", "target": "law"}
-            
-            # 검색 파라미터 추가
-            params = base_params.copy()
-            params.update({
-                "query": attempt_query,
-                "search": search_mode,
-                "display": min(display, 100),
-                "page": page
-            })
-            
-            # 선택적 파라미터 추가
-            optional_params = {
-                "sort": sort, "date": date, "efDateRange": ef_date_range,
-                "announceDateRange": announce_date_range, "announceNoRange": announce_no_range,
-                "revisionType": revision_type, "announceNo": announce_no,
-                "ministryCode": ministry_code, "lawTypeCode": law_type_code,
-                "lawChapter": law_chapter, "alphabetical": alphabetical
-            }
+        # 기본 파라미터 설정
+        params = {
+            "OC": oc, "type": "JSON", "target": "law",
+            "display": min(display, 100),
+            "page": page
+        }
+        
+        # 선택적 파라미터 추가
+        optional_params = {
+            "sort": sort, "date": date, "efDateRange": ef_date_range,
+            "announceDateRange": announce_date_range, "announceNoRange": announce_no_range,
+            "revisionType": revision_type, "announceNo": announce_no,
+            "ministryCode": ministry_code, "lawTypeCode": law_type_code,
+            "lawChapter": law_chapter, "alphabetical": alphabetical
+        }
+        
+        for key, value in optional_params.items():
+            if value is not None:
+                params[key] = value
+        
+        def search_attempt(attempt_query: str, search_mode: int) -> tuple:
+            # API 요청 - 현행법령 검색
+            data = _make_legislation_request(
+                "law", {**params, "query": attempt_query, "search": search_mode}, is_detail=False
+            )
+            return attempt_query, data
+        
+        def first_law_name(data: dict) -> str:
+            results = data.get('LawSearch', {}).get('law') if isinstance(data, dict) else None
+            if isinstance(results, list) and len(results) > 0:
+                return results[0].get('법령명한글', '')
+            return ''
+        
+        def is_exact_match(attempt_query: str, data: dict) -> bool:
+            # 첫 번째 결과의 법령명이 검색어와 일치하는지 확인
+            law_name = first_law_name(data)
+            return bool(law_name) and (
+                original_query in law_name or
+                attempt_query in law_name or
+                law_name.replace(" ", "") == attempt_query.replace(" ", "")
+            )
+        
+        # 검색어 변형을 동시에 요청하고 정확히 일치하는 결과가 처음 도착하면 나머지는 취소/무시
+        winner, completed = get_fanout().race(
+            [(q, functools.partial(search_attempt, q, mode)) for q, mode in search_attempts],
+            accept=lambda outcome: is_exact_match(*outcome)
+        )
+        
+        if winner is not None:
+            attempt_query, data = winner.value
+            formatted_result = format_search_law_results(data, original_query)
             
-            for key, value in optional_params.items():
-                if value is not None:
-                    params[key] = value
+            # 검색어가 다른 경우 안내 추가
+            if attempt_query != original_query:
+                formatted_result = f"['{original_query}' → '{attempt_query}'로 검색]\n\n" + formatted_result
             
-            try:
-                # API 요청 - 현행법령 검색
-                data = _make_legislation_request("law", params, is_detail=False)
-                
-                # 결과 확인
-                if 'LawSearch' in data and 'law' in data['LawSearch']:
-                    results = data['LawSearch']['law']
-                    total_count = int(data['LawSearch'].get('totalCnt', 0))
-                    
-                    # 정확한 매칭 검사
-                    if isinstance(results, list) and len(results) > 0:
-                        # 첫 번째 결과가 정확히 일치하는지 확인
-                        first_law = results[0]
-                        law_name = first_law.get('법령명한글', '')
-                        
-                        # 정확한 매칭이면 즉시 반환
-                        if law_name and (
-                            original_query in law_name or 
-                            attempt_query in law_name or
-                            law_name.replace(" ", "") == attempt_query.replace(" ", "")
-                        ):
-                            formatted_result = format_search_law_results(data, original_query)
-                            
-                            # 검색어가 다른 경우 안내 추가
-                            if attempt_query != original_query:
-                                formatted_result = f"['{original_query}' → '{attempt_query}'로 검색]\n\n" + formatted_result
-                            
-                            return TextContent(type="text", text=formatted_result)
-                    
-                    # 최선의 결과 저장 (결과 수가 적으면서 0이 아닌 경우)
-                    if 0 < total_count < 20 and (best_result is None or total_count < best_count):
-                        best_result = (attempt_query, data)
-                        best_count = total_count
-                        
-            except Exception as e:
-                logger.debug(f"검색 시도 실패 ({attempt_query}): {e}")
+            return TextContent(type="text", text=formatted_result)
+        
+        # 정확한 매칭이 없으면 시도 순서대로 최선의 결과 선택 (결과 수가 적으면서 0이 아닌 경우)
+        for attempt in completed:
+            if not attempt.ok:
+                if attempt.error is not None:
+                    logger.debug(f"검색 시도 실패 ({attempt.name}): {attempt.error}")
                 continue
+            attempt_query, data = attempt.value
+            if isinstance(data, dict) and 'LawSearch' in data and 'law' in data['LawSearch']:
+                try:
+                    total_count = int(data['LawSearch'].get('totalCnt', 0))
+                except (ValueError, TypeError):
+                    continue
+                if 0 < total_count < 20 and (best_result is None or total_count < best_count):
+                    best_result = (attempt_query, data)
+                    best_count = total_count
         
         # 최선의 결과가 있으면 반환
         if best_result:
@@ -1511,11 +1616,11 @@ def search_law(
         
         # 모든 시도가 실패한 경우 본문검색으로 최종 시도
         if search == 1:
-            params["search"] = 2
-            params["query"] = original_query
+            # 취소된 시도가 params를 아직 참조할 수 있으므로 복사본 사용
+            fallback_params = {**params, "search": 2, "query": original_query}
             
             try:
-                data = _make_legislation_request("law", params, is_detail=False)
+                data = _make_legislation_request("law", fallback_params, is_detail=False)
                 result = _format_search_results(data, "law", original_query)
                 
                 # 본문검색임을 명시
@@ -2085,7 +2190,7 @@ def search_law_articles(mst: Union[str, int], display: int = 20, page: int = 1)
             }
             
             url = f"{legislation_config.search_base_url}?{urlencode(params)}"
-            response = requests.get(url, timeout=30)
+            response = get_transport().get(url, timeout=30)
             response.raise_for_status()
             
             data = response.json()
@@ -2667,7 +2772,7 @@ def search_one_view(query: Optional[str] = None, display: int = 20, page: int =
 - search_law_system_diagram("조세", display=30)  # 조세 관련 법령 체계도
 
 참고: 법령의 구조와 하위법령 관계를 시각적으로 보여주는 다이어그램입니다.""")
-def search_law_system_diagram(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
+async def search_law_system_diagram(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """법령 체계도 검색
     
     Args:
@@ -2688,7 +2793,7 @@ def search_law_system_diagram(query: Optional[str] = None, display: int = 20, pa
             params["query"] = query.strip()
         
         # API 호출
-        data = _make_legislation_request("lsStmd", params, is_detail=False)
+        data = await _make_legislation_request_async("lsStmd", params, is_detail=False)
         
         if not data or not _has_meaningful_content(data):
             search_term = query or "전체"
@@ -2728,7 +2833,7 @@ def search_law_system_diagram(query: Optional[str] = None, display: int = 20, pa
 사용 예시: get_law_system_diagram_detail(mst_id="248613")
 
 주의: 체계도 데이터가 매우 클 수 있어 요약본을 먼저 제공합니다.""")
-def get_law_system_diagram_detail(mst_id: Union[str, int]) -> TextContent:
+async def get_law_system_diagram_detail(mst_id: Union[str, int]) -> TextContent:
     """법령 체계도 상세내용 조회
     
     Args:
@@ -2740,21 +2845,16 @@ def get_law_system_diagram_detail(mst_id: Union[str, int]) -> TextContent:
     try:
         mst_str = str(mst_id)
         
-        # 캐시 확인 (안전한 import)
-        try:
-            from ..utils.legislation_utils import load_from_cache, save_to_cache, get_cache_key
-            cache_key = get_cache_key(f"diagram_{mst_str}", "summary")
-            cached_data = load_from_cache(cache_key)
-        except ImportError:
-            logger.warning("캐시 모듈을 로드할 수 없습니다. 캐시 없이 진행합니다.")
-            cached_data = None
+        # 캐시 확인
+        cache_key = get_cache_key("lsStmd", mst_str, "summary")
+        cached_data = await anyio.to_thread.run_sync(load_from_cache, cache_key)
         
         if cached_data:
             return TextContent(type="text", text=cached_data.get("summary", "캐시된 데이터를 읽을 수 없습니다."))
         
         # API 요청 (target="lsStmd"가 가장 정확함)
         params = {"MST": mst_str}
-        data = _make_legislation_request("lsStmd", params, is_detail=True)
+        data = await _make_legislation_request_async("lsStmd", params, is_detail=True)
         
         if data and "법령체계도" in data:
             diagram_data = data["법령체계도"]
@@ -2769,7 +2869,7 @@ def get_law_system_diagram_detail(mst_id: Union[str, int]) -> TextContent:
                     "summary": summary,
                     "data_size": len(str(diagram_data))
                 }
-                save_to_cache(cache_key, cache_data)
+                await anyio.to_thread.run_sync(save_to_cache, cache_key, cache_data)
             except (NameError, Exception) as e:
                 logger.warning(f"캐시 저장 실패: {e}")
                 # 캐시 저장 실패해도 계속 진행
@@ -2810,7 +2910,7 @@ def get_law_system_diagram_detail(mst_id: Union[str, int]) -> TextContent:
 사용 예시: get_law_system_diagram_full(mst_id="248613")
 
 주의: 매우 큰 데이터이므로 필요한 경우에만 사용. 일반적으로는 get_law_system_diagram_detail 권장""")
-def get_law_system_diagram_full(mst_id: Union[str, int]) -> TextContent:
+async def get_law_system_diagram_full(mst_id: Union[str, int]) -> TextContent:
     """법령 체계도 전체 상세 정보 조회 (캐시 활용)
     
     Args:
@@ -2822,14 +2922,9 @@ def get_law_system_diagram_full(mst_id: Union[str, int]) -> TextContent:
     try:
         mst_str = str(mst_id)
         
-        # 캐시 확인 (안전한 import)
-        try:
-            from ..utils.legislation_utils import load_from_cache, save_to_cache, get_cache_key
-            cache_key = get_cache_key(f"diagram_{mst_str}", "summary")
-            cached_data = load_from_cache(cache_key)
-        except ImportError:
-            logger.warning("캐시 모듈을 로드할 수 없습니다. 캐시 없이 진행합니다.")
-            cached_data = None
+        # 캐시 확인
+        cache_key = get_cache_key("lsStmd", mst_str, "summary")
+        cached_data = await anyio.to_thread.run_sync(load_from_cache, cache_key)
         
         if cached_data and "full_data" in cached_data:
             # 캐시된 전체 데이터 사용
@@ -2839,7 +2934,7 @@ def get_law_system_diagram_full(mst_id: Union[str, int]) -> TextContent:
         
         # 캐시에 없으면 API 요청
         params = {"MST": mst_str}
-        data = _make_legislation_request("lsStmd", params, is_detail=True)
+        data = await _make_legislation_request_async("lsStmd", params, is_detail=True)
         
         if data and "법령체계도" in data:
             diagram_data = data["법령체계도"]
@@ -2855,7 +2950,7 @@ def get_law_system_diagram_full(mst_id: Union[str, int]) -> TextContent:
                     "summary": summary,
                     "data_size": len(str(diagram_data))
                 }
-                save_to_cache(cache_key, cache_data)
+                await anyio.to_thread.run_sync(save_to_cache, cache_key, cache_data)
             except (NameError, Exception) as e:
                 logger.warning(f"캐시 저장 실패: {e}")
                 # 캐시 저장 실패해도 계속 진행
@@ -3345,25 +3440,18 @@ def get_current_law_articles(
     
     try:
         # 캐시 확인 또는 API 호출
-        cache_key = get_cache_key(f"law_{mst}", "full")
-        law_data = load_from_cache(cache_key)
-        
+        params = {
+            "target": "law",
+            "MST": str(mst),
+            "type": "JSON",
+            "OC": legislation_config.oc
+        }
+        law_data = fetch_with_cache(
+            get_cache_key("law", mst, "full"),
+            lambda: law_client._make_request("http://www.law.go.kr/DRF/lawService.do", params)
+        )
         if not law_data:
-            # 캐시가 없으면 API 호출
-            params = {
-                "target": "law",
-                "MST": str(mst),
-                "type": "JSON",
-                "OC": legislation_config.oc
-            }
-            
-            response = law_client._make_request("http://www.law.go.kr/DRF/lawService.do", params)
-            if not response:
-                return TextContent(type="text", text="API 응답이 없습니다.")
-            
-            law_data = response
-            # 캐시 저장
-            save_to_cache(cache_key, law_data)
+            return TextContent(type="text", text="API 응답이 없습니다.")
         
         # 법령 정보 추출
         law_info = law_data.get("법령", {})
@@ -3524,25 +3612,8 @@ def get_effective_law_detail(effective_law_id: Union[str, int]) -> TextContent:
         mst = str(effective_law_id)
         target = "eflaw"
         
-        # 캐시 확인
-        cache_key = get_cache_key(f"{target}_{mst}", "summary")
-        cached_summary = load_from_cache(cache_key)
-        
-        if cached_summary:
-            logger.info(f"캐시에서 시행일법령 요약 조회: {target}_{mst}")
-            summary = cached_summary
-        else:
-            # API 호출 - get_law_detail과 동일한 방식 (OC, type는 _make_legislation_request에서 처리)
-            params = {"MST": mst}
-            data = _make_legislation_request(target, params, is_detail=True)
-            
-            # 전체 데이터 캐시
-            full_cache_key = get_cache_key(f"{target}_{mst}", "full")
-            save_to_cache(full_cache_key, data)
-            
-            # 요약 추출
-            summary = extract_law_summary_from_detail(data)
-            save_to_cache(cache_key, summary)
+        # 캐시 확인 또는 API 호출 - get_law_detail과 동일한 방식 (OC, type는 _make_legislation_request에서 처리)
+        summary = _fetch_law_summary(target, mst)
         
         # 오류 메시지가 있는 경우 별도 처리
         if summary.get('오류메시지'):
@@ -3708,7 +3779,7 @@ def _format_law_history_detail(data: dict, history_id: str) -> str:
 - search_law_history("법령명")  # 해당 법령의 전체 연혁
 
 주의: 특정 날짜에 발생한 법령의 제정, 개정, 폐지 등 모든 변경사항을 추적하며, 대용량 데이터로 인해 응답 시간이 길 수 있습니다.""")
-def search_law_change_history(change_date: str, org: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
+async def search_law_change_history(change_date: str, org: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """법령 변경이력 검색
     
     Args:
@@ -3736,10 +3807,10 @@ def search_law_change_history(change_date: str, org: Optional[str] = None, displ
         if org:
             params["org"] = org
         
-        # API 요청 (타임아웃 대응)
+        # API 요청 (타임아웃 대응, 대용량 응답 대기 중 이벤트 루프를 블로킹하지 않음)
         try:
-            data = _make_legislation_request("lsHstInf", params, is_detail=False)
-        except requests.exceptions.ReadTimeout:
+            data = await _make_legislation_request_async("lsHstInf", params, is_detail=False)
+        except httpx.TimeoutException:
             return TextContent(type="text", text=f"""**법령 변경이력 검색 결과**
 
 **검색일자**: {change_date}
@@ -3756,7 +3827,19 @@ def search_law_change_history(change_date: str, org: Optional[str] = None, displ
 - get_law_detail()로 법령 기본정보 확인
 
 **참고**: 변경이력 데이터가 많은 날짜는 응답 시간이 길어질 수 있습니다.""")
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
+            if get_upstream_health().is_offline():
+                return TextContent(type="text", text=f"""**법령 변경이력 검색 결과**
+
+**검색일자**: {change_date}
+
+⚠️ **오프라인 모드**: 법제처 API 장애로 업스트림을 호출하지 않았고, 로컬 저장소에 이 날짜의 변경이력이 없습니다.
+
+**대안 방법**:
+- search_law("법령명")으로 로컬 카탈로그에서 법령 확인
+- get_law_article_by_key()로 로컬에 저장된 조문 확인
+
+**참고**: 법제처 API가 복구되면 자동으로 온라인 모드로 돌아갑니다. (상태: get_system_status("health"))""")
             return TextContent(type="text", text=f"""**법령 변경이력 검색 결과**
 
 **검색일자**: {change_date}
@@ -3861,29 +3944,11 @@ def search_daily_article_revision(
         mst_str = mst.strip()
         actual_law_id = mst_str
         
-        # MST 값인 경우 (보통 6자리 이상의 숫자) ID로 변환 시도
+        # MST 값인 경우 (보통 6자리 이상의 숫자) ID로 변환 (매핑 조회, 실패시 원래 값 사용)
         if len(mst_str) >= 6 and mst_str.isdigit():
-            try:
-                # 해당 MST로 법령 검색하여 ID 확인
-                search_params = {
-                    "OC": legislation_config.oc,
-                    "type": "JSON",
-                    "target": "law",
-                    "MST": mst_str,
-                    "display": 1
-                }
-                search_data = _make_legislation_request("law", search_params, is_detail=True)
-                
-                if search_data and "법령" in search_data:
-                    law_info = search_data["법령"]
-                    basic_info = law_info.get("기본정보", {})
-                    found_id = basic_info.get("법령ID", basic_info.get("ID", ""))
-                    if found_id:
-                        actual_law_id = str(found_id)
-                        logger.info(f"MST {mst_str}를 ID {actual_law_id}로 변환")
-            except Exception as e:
-                logger.warning(f"MST를 ID로 변환 실패: {e}")
-                # 변환 실패시 원래 값 사용
+            actual_law_id = _resolve_law_id(mst_str)
+            if actual_law_id != mst_str:
+                logger.info(f"MST {mst_str}를 ID {actual_law_id}로 변환")
         
         # 기본 파라미터 설정 (필수 파라미터 포함)
         params = {
@@ -3957,29 +4022,11 @@ def search_article_change_history(mst: str, article_no: str, display: int = 20,
         mst_str = mst.strip()
         actual_law_id = mst_str
         
-        # MST 값인 경우 (보통 6자리 이상의 숫자) ID로 변환 시도
+        # MST 값인 경우 (보통 6자리 이상의 숫자) ID로 변환 (매핑 조회, 실패시 원래 값 사용)
         if len(mst_str) >= 6 and mst_str.isdigit():
-            try:
-                # 해당 MST로 법령 검색하여 ID 확인
-                search_params = {
-                    "OC": legislation_config.oc,
-                    "type": "JSON",
-                    "target": "law",
-                    "MST": mst_str,
-                    "display": 1
-                }
-                search_data = _make_legislation_request("law", search_params, is_detail=True)
-                
-                if search_data and "법령" in search_data:
-                    law_info = search_data["법령"]
-                    basic_info = law_info.get("기본정보", {})
-                    found_id = basic_info.get("법령ID", basic_info.get("ID", ""))
-                    if found_id:
-                        actual_law_id = str(found_id)
-                        logger.info(f"MST {mst_str}를 ID {actual_law_id}로 변환")
-            except Exception as e:
-                logger.warning(f"MST를 ID로 변환 실패: {e}")
-                # 변환 실패시 원래 값 사용
+            actual_law_id = _resolve_law_id(mst_str)
+            if actual_law_id != mst_str:
+                logger.info(f"MST {mst_str}를 ID {actual_law_id}로 변환")
         
         # 기본 파라미터 설정 (필수 파라미터 포함)
         params = {
@@ -4465,25 +4512,8 @@ def get_law_detail(mst: str) -> TextContent:
         return TextContent(type="text", text="법령일련번호(mst)를 입력해주세요.")
     
     try:
-        # 캐시 확인
-        cache_key = get_cache_key(f"law_{mst}", "summary")
-        cached_summary = load_from_cache(cache_key)
-        
-        if cached_summary:
-            logger.info(f"캐시에서 요약 조회: law_{mst}")
-            summary = cached_summary
-        else:
-            # API 호출
-            params = {"MST": mst}
-            data = _make_legislation_request("law", params, is_detail=True)
-            
-            # 전체 데이터 캐시
-            full_cache_key = get_cache_key(f"law_{mst}", "full")
-            save_to_cache(full_cache_key, data)
-            
-            # 요약 추출
-            summary = extract_law_summary_from_detail(data)
-            save_to_cache(cache_key, summary)
+        # 캐시 확인 또는 API 호출
+        summary = _fetch_law_summary("law", mst)
         
         # 포맷팅
         result = format_law_detail_summary(summary, mst, "law")
@@ -4543,50 +4573,29 @@ def get_law_article_by_key(
         return TextContent(type="text", text="mst, target, article_key 모두 입력해주세요.")
     
     try:
-        # 캐시에서 전체 데이터 조회
-        full_cache_key = get_cache_key(f"{target}_{mst}", "full")
-        cached_data = load_from_cache(full_cache_key)
+        # 캐시된 본문의 조문 색인 조회 (처음이면 캐시에서 본문을 읽어 색인 생성)
+        full_cache_key = get_cache_key(target, mst, "full")
+        article_index = get_article_index(target, mst, lambda: load_from_cache(full_cache_key))
         
-        if not cached_data:
+        if article_index is None:
             return TextContent(
                 type="text", 
                 text=f"캐시된 데이터가 없습니다. 먼저 get_law_detail을 호출하세요."
             )
         
-        # 조문 추출 - 실제 API 구조에 맞게
-        law_info = cached_data.get("법령", {})
-        articles_section = law_info.get("조문", {})
-        article_units = []
+        # 조문 찾기 ("제10조의2"처럼 가지번호가 있는 조문 포함)
+        found = article_index.get(article_key)
         
-        if isinstance(articles_section, dict) and "조문단위" in articles_section:
-            article_units = articles_section.get("조문단위", [])
-            # 리스트가 아닌 경우 리스트로 변환
-            if not isinstance(article_units, list):
-                article_units = [article_units] if article_units else []
-        elif isinstance(articles_section, list):
-            article_units = articles_section
-        
-        # 조문 번호 정규화
-        article_num = normalize_article_key(article_key)
-        
-        # 조문 찾기
-        found_article = find_article_in_data(article_units, article_num)
-        
-        if not found_article:
+        if not found:
             # 사용 가능한 조문 번호들 표시
-            available_articles = get_available_articles(article_units, 10)
-            
             return TextContent(
                 type="text",
                 text=f"'{article_key}'를 찾을 수 없습니다.\n"
-                     f"사용 가능한 조문: {', '.join(available_articles)} ..."
+                     f"사용 가능한 조문: {', '.join(article_index.labels(10))} ..."
             )
         
-        # 법령명 추출
-        law_name = law_info.get("기본정보", {}).get("법령명_한글", "")
-        
-        # 조문 내용 포맷팅
-        result = format_article_content(found_article, law_name, article_key)
+        # 조문 내용 포맷팅 (항/호/목 구조는 원본 조문단위 사용)
+        result = format_article_content(found.raw, article_index.law_name, article_key)
         
         return TextContent(type="text", text=result)
         
@@ -4623,115 +4632,40 @@ def get_law_articles_range(
         return TextContent(type="text", text="mst, target 모두 입력해주세요.")
     
     try:
-        # 캐시에서 전체 데이터 조회
-        full_cache_key = get_cache_key(f"{target}_{mst}", "full")
-        cached_data = load_from_cache(full_cache_key)
-        
-        if not cached_data:
-            # 캐시가 없으면 API 직접 호출
-            params = {"MST": mst}
-            cached_data = _make_legislation_request(target, params, is_detail=True)
-            
-            # 데이터 검증 로그
-            try:
-                law_info = cached_data.get("법령", {})
-                articles = law_info.get("조문", {}).get("조문단위", [])
-                logger.info(f"API 응답 수신 - 전체 조문 수: {len(articles)}")
-                
-                # 첫 번째 실제 조문 확인
-                for art in articles:
-                    if art.get("조문여부") == "조문":
-                        art_no = art.get("조문번호", "")
-                        hangs = art.get("항", [])
-                        logger.info(f"첫 번째 조문: 제{art_no}조, 항 개수: {len(hangs)}")
-                        break
-            except Exception as e:
-                logger.warning(f"API 응답 검증 중 오류: {e}")
-            
-            # 캐시 저장 시도 (실패해도 계속 진행)
-            try:
-                save_to_cache(full_cache_key, cached_data)
-            except:
-                pass
-        
-        # 조문 추출
-        law_info = cached_data.get("법령", {})
-        articles_section = law_info.get("조문", {})
-        article_units = []
-        
-        if isinstance(articles_section, dict) and "조문단위" in articles_section:
-            article_units = articles_section.get("조문단위", [])
-            # 리스트가 아닌 경우 리스트로 변환
-            if not isinstance(article_units, list):
-                article_units = [article_units] if article_units else []
-        elif isinstance(articles_section, list):
-            article_units = articles_section
-        
-        # 실제 조문만 필터링 (조문여부가 "조문"인 것만)
-        actual_articles = []
-        for i, article in enumerate(article_units):
-            if article.get("조문여부") == "조문":
-                actual_articles.append(article)
+        # 조문 색인 조회 (캐시에 본문이 없으면 API 직접 호출)
+        article_index = get_article_index(target, mst, lambda: _fetch_law_full(target, mst))
+        if article_index is None:
+            return TextContent(type="text", text=f"조문 데이터를 가져올 수 없습니다. MST: {mst}")
         
-        # 시작/끝 인덱스 계산
-        start_idx = None
-        for idx, article in enumerate(actual_articles):
-            if int(article.get("조문번호", "0")) == start_article:
-                start_idx = idx
-                break
+        # 시작 조문 위치부터 count개
+        selected_articles = article_index.range((start_article, 0), count)
         
-        if start_idx is None:
-            available_articles = []
-            for article in actual_articles[:10]:
-                no = article.get("조문번호", "")
-                if no:
-                    available_articles.append(f"제{no}조")
+        if not selected_articles:
             return TextContent(
                 type="text",
                 text=f"제{start_article}조를 찾을 수 없습니다.\n"
-                     f"사용 가능한 조문: {', '.join(available_articles)} ..."
+                     f"사용 가능한 조문: {', '.join(article_index.labels(10))} ..."
             )
         
-        end_idx = min(start_idx + count, len(actual_articles))
-        selected_articles = actual_articles[start_idx:end_idx]
-        
         # 조문 내용 포맷팅
-        law_name = law_info.get("기본정보", {}).get("법령명_한글", "")
+        law_name = article_index.law_name
         
-        end_article_no = int(selected_articles[-1].get("조문번호", start_article))
-        result = f"📚 **{law_name}** 조문 (제{start_article}조 ~ 제{end_article_no}조)\n"
+        result = f"📚 **{law_name}** 조문 (제{start_article}조 ~ {selected_articles[-1].label})\n"
         result += "=" * 50 + "\n\n"
         
         for article in selected_articles:
-            article_no = article.get("조문번호", "")
-            article_title = article.get("조문제목", "")
-            
-            result += f"## 제{article_no}조"
-            if article_title:
-                result += f"({article_title})"
+            result += f"## {article.label}"
+            if article.title:
+                result += f"({article.title})"
             result += "\n\n"
             
-            # 조문 내용 추출
-            article_content = article.get("조문내용", "")
-            if article_content and article_content.strip():
-                # HTML 태그 제거
-                clean_content = re.sub(r'<[^>]+>', '', article_content)
-                result += clean_content + "\n\n"
-            
-            # 항 내용 처리 - 더 명확하게
-            hangs = article.get("항", [])
+            # 조문 내용 (HTML 태그는 색인 생성 시 제거됨)
+            if article.text:
+                result += article.text + "\n\n"
             
-            if hangs and isinstance(hangs, list):
-                for hang in hangs:
-                    if isinstance(hang, dict):
-                        hang_num = hang.get("항번호", "")
-                        hang_content = hang.get("항내용", "")
-                        if hang_content:
-                            # HTML 태그 제거
-                            clean_hang = re.sub(r'<[^>]+>', '', hang_content)
-                            clean_hang = clean_hang.strip()
-                            if clean_hang:
-                                result += f"{clean_hang}\n\n"
+            # 항 내용
+            for paragraph in article.paragraphs:
+                result += f"{paragraph}\n\n"
             
             result += "-" * 30 + "\n\n"
         
@@ -4765,14 +4699,19 @@ def compare_law_versions(law_name: str) -> TextContent:
         return TextContent(type="text", text="법령명을 입력해주세요.")
     
     try:
-        # 현행법령 검색
-        current_data = _make_legislation_request("law", {"query": law_name, "display": 1})
-        current_items = current_data.get("LawSearch", {}).get("law", [])
-        
-        if not current_items:
-            return TextContent(type="text", text=f"'{law_name}'을(를) 찾을 수 없습니다.")
-        
-        current_law = current_items[0] if isinstance(current_items, list) else current_items
+        # 현행법령 (법령 카탈로그에 없으면 검색)
+        entry = resolve_law_name(law_name)
+        if entry is not None:
+            current_law = entry.to_search_item()
+        else:
+            current_data = _make_legislation_request("law", {"query": law_name, "display": 1})
+            current_items = current_data.get("LawSearch", {}).get("law", [])
+            
+            if not current_items:
+                return TextContent(type="text", text=f"'{law_name}'을(를) 찾을 수 없습니다.")
+            observe_search_results(current_data)
+            
+            current_law = current_items[0] if isinstance(current_items, list) else current_items
         law_id = current_law.get("법령ID")
         
         # 시행일법령 검색
@@ -4842,24 +4781,29 @@ def compare_article_before_after(law_name: str, article_no: str, show_context: b
         return TextContent(type="text", text="법령명과 조문번호를 모두 입력해주세요.")
     
     try:
-        # 1단계: 법령 검색으로 MST 확보
-        search_params = {
-            "query": law_name,
-            "display": 5,
-            "search": 1
-        }
-        
-        current_law_data = _make_legislation_request("law", search_params)
-        if not current_law_data or 'LawSearch' not in current_law_data:
-            return TextContent(type="text", text=f"'{law_name}' 법령을 찾을 수 없습니다.")
-        
-        laws = current_law_data['LawSearch'].get('law', [])
-        if not laws:
-            return TextContent(type="text", text=f"'{law_name}' 법령을 찾을 수 없습니다.")
-        
-        # 첫 번째 검색 결과 사용
-        current_law = laws[0] if isinstance(laws, list) else laws
-        current_mst = current_law.get('법령일련번호') or current_law.get('MST')
+        # 1단계: 법령 카탈로그(없으면 법령 검색)로 MST 확보
+        entry = resolve_law_name(law_name)
+        if entry is not None:
+            current_mst = entry.mst
+        else:
+            search_params = {
+                "query": law_name,
+                "display": 5,
+                "search": 1
+            }
+            
+            current_law_data = _make_legislation_request("law", search_params)
+            if not current_law_data or 'LawSearch' not in current_law_data:
+                return TextContent(type="text", text=f"'{law_name}' 법령을 찾을 수 없습니다.")
+            
+            laws = current_law_data['LawSearch'].get('law', [])
+            if not laws:
+                return TextContent(type="text", text=f"'{law_name}' 법령을 찾을 수 없습니다.")
+            observe_search_results(current_law_data)
+            
+            # 첫 번째 검색 결과 사용
+            current_law = laws[0] if isinstance(laws, list) else laws
+            current_mst = current_law.get('법령일련번호') or current_law.get('MST')
         
         if not current_mst:
             return TextContent(type="text", text="법령일련번호를 찾을 수 없습니다.")
@@ -4966,119 +4910,17 @@ def _normalize_article_number(article_no: str) -> str:
 def _get_article_content(mst: str, article_no: str, target: str) -> str:
     """특정 조문의 내용을 조회"""
     try:
-        # 캐시 확인
-        cache_key = get_cache_key(f"{target}_{mst}", "full")
-        cached_data = load_from_cache(cache_key)
-        
-        if not cached_data:
-            # API 호출
-            params = {"MST": str(mst)}
-            cached_data = _make_legislation_request(target, params, is_detail=True)
-            
-            if cached_data:
-                save_to_cache(cache_key, cached_data)
+        # 조문 색인 조회 (캐시 확인 또는 API 호출)
+        article_index = get_article_index(target, mst, lambda: _fetch_law_full(target, mst))
         
-        if not cached_data:
+        if article_index is None:
             return "조회할 수 없습니다"
         
-        # 조문 번호 정규화
-        normalized_article = _normalize_article_number(article_no)
-        
-        # get_law_article_by_key와 동일한 로직으로 조문 찾기
-        law_data = None
-        if '법령' in cached_data:
-            law_data = cached_data['법령']
-        elif 'Law' in cached_data:
-            law_data = cached_data['Law']
-        elif isinstance(cached_data, dict):
-            law_data = cached_data
-            
-        if not law_data:
-            return "조회할 수 없습니다"
-        
-        # 조문 구조 탐색
-        articles_data = None
-        
-        # 조문단위 구조 확인
-        if '조문' in law_data and '조문단위' in law_data['조문']:
-            articles_data = law_data['조문']['조문단위']
-        elif '조문단위' in law_data:
-            articles_data = law_data['조문단위']
-        elif 'JoSection' in law_data and 'Jo' in law_data['JoSection']:
-            articles_data = law_data['JoSection']['Jo']
-        
-        if not articles_data:
-            return "조문 구조를 찾을 수 없습니다"
-        
-        # 리스트가 아니면 리스트로 변환
-        if not isinstance(articles_data, list):
-            articles_data = [articles_data]
-        
-        # 조문 검색
-        # 조문 번호를 다양한 형태로 준비
-        article_num_raw = article_no.replace('제', '').replace('조', '')  # "15"
-        article_num_int = int(article_num_raw) if article_num_raw.isdigit() else 0  # 15
-        
-        # 실제 조문 내용을 가진 조문 찾기 (조문키가 XXXX01 형태인 것)
-        target_jo_key = f"{article_num_raw.zfill(4)}01"  # "1501" -> "150101"
-        
-        for article in articles_data:
-            if not isinstance(article, dict):
-                continue
-                
-            # 조문 번호 확인
-            article_numbers = [
-                article.get('조문번호'),
-                article.get('joNo'), 
-                article.get('articleNo'),
-                article.get('조번호')
-            ]
-            
-            # 조문키 확인 (실제 조문 내용이 있는지)
-            조문키 = article.get('조문키', '')
-            
-            # 다양한 형태로 비교
-            found_match = False
-            for num in article_numbers:
-                if num is not None:
-                    # 숫자 형태로 비교 (15 == 15)
-                    if isinstance(num, int) and num == article_num_int:
-                        found_match = True
-                    # 문자열 형태로 비교 ("15" == "15")
-                    elif str(num) == article_num_raw:
-                        found_match = True
-                    # 6자리 형태로 비교 ("001500" == "001500")
-                    elif str(num).zfill(6) == normalized_article:
-                        found_match = True
-                        
-            if found_match:
-                # 조문 내용 추출
-                content_fields = ['조문내용', 'joContent', '내용', 'content', 'joCts']
-                
-                for field in content_fields:
-                    if field in article and article[field]:
-                        content = article[field]
-                        
-                        # 리스트인 경우 조인
-                        if isinstance(content, list):
-                            content = '\n'.join(str(item) for item in content if item)
-                        
-                        # HTML 태그 제거
-                        import re
-                        content = re.sub(r'<[^>]+>', '', str(content))
-                        content = content.strip()
-                        
-                        # 실제 조문 내용인지 확인
-                        if content:
-                            # 조문키가 실제 조문을 나타내는 경우 (XXXX01 형태) - 우선순위 높음
-                            if 조문키 and 조문키.endswith('01'):
-                                return content
-                            # 조문 제목이 포함된 실제 조문 내용
-                            elif f'제{article_num_raw}조(' in content:
-                                return content
-                            # 장/절 제목이 아닌 실제 내용 (제X장, 제X절로 시작하지 않음)
-                            elif not (content.startswith('제') and ('장' in content[:10] or '절' in content[:10])):
-                                return content
+        article = article_index.get(article_no)
+        if article is not None:
+            content = article.text or "\n".join(article.paragraphs)
+            if content:
+                return content
         
         return "해당 조문을 찾을 수 없습니다"
         
@@ -5184,6 +5026,20 @@ def _analyze_practical_impact(law_name: str, article_no: str, current_content: s
     except Exception as e:
         return f"실무 영향 분석 중 오류: {str(e)}"
 
+def _search_current_laws_by_name(law_name: str, display: int) -> List[Dict[str, Any]]:
+    """법령명으로 현행법령 목록 조회 (전체 갱신된 법령 카탈로그가 있으면 업스트림 검색 생략)"""
+    catalog = get_law_catalog("law")
+    if catalog.built_at is not None:
+        entries = catalog.search(law_name, limit=display)
+        if entries:
+            return [entry.to_search_item() for entry in entries]
+    law_result = _make_legislation_request("law", {"query": law_name, "display": display})
+    laws = law_result.get("LawSearch", {}).get("law", [])
+    if not laws:
+        return []
+    observe_search_results(law_result)
+    return laws if isinstance(laws, list) else [laws]
+
 @mcp.tool(
     name="search_financial_laws",
     description="""금융 관련 법령을 전문적으로 검색합니다.
@@ -5240,20 +5096,14 @@ def search_financial_laws(
             for law_name in financial_laws:
                 if query.lower() in law_name.lower():
                     try:
-                        law_result = _make_legislation_request("law", {"query": law_name, "display": 3})
-                        laws = law_result.get("LawSearch", {}).get("law", [])
-                        if laws:
-                            search_results.extend(laws if isinstance(laws, list) else [laws])
+                        search_results.extend(_search_current_laws_by_name(law_name, 3))
                     except:
                         continue
         else:
             # 전체 금융법령 검색
             for law_name in financial_laws[:10]:  # 상위 10개 법령
                 try:
-                    law_result = _make_legislation_request("law", {"query": law_name, "display": 2})
-                    laws = law_result.get("LawSearch", {}).get("law", [])
-                    if laws:
-                        search_results.extend(laws if isinstance(laws, list) else [laws])
+                    search_results.extend(_search_current_laws_by_name(law_name, 2))
                 except:
                     continue
         
@@ -5375,20 +5225,14 @@ def search_tax_laws(
             for law_name in tax_laws:
                 if query.lower() in law_name.lower():
                     try:
-                        law_result = _make_legislation_request("law", {"query": law_name, "display": 3})
-                        laws = law_result.get("LawSearch", {}).get("law", [])
-                        if laws:
-                            search_results.extend(laws if isinstance(laws, list) else [laws])
+                        search_results.extend(_search_current_laws_by_name(law_name, 3))
                     except:
                         continue
         else:
             # 전체 세무법령 검색
             for law_name in tax_laws[:8]:  # 상위 8개 법령
                 try:
-                    law_result = _make_legislation_request("law", {"query": law_name, "display": 2})
-                    laws = law_result.get("LawSearch", {}).get("law", [])
-                    if laws:
-                        search_results.extend(laws if isinstance(laws, list) else [laws])
+                    search_results.extend(_search_current_laws_by_name(law_name, 2))
                 except:
                     continue
         
@@ -5522,10 +5366,7 @@ def search_privacy_laws(
             # 전체 개인정보보호법령 검색
             for law_name in privacy_laws[:6]:  # 상위 6개 법령
                 try:
-                    law_result = _make_legislation_request("law", {"query": law_name, "display": 2})
-                    laws = law_result.get("LawSearch", {}).get("law", [])
-                    if laws:
-                        search_results.extend(laws if isinstance(laws, list) else [laws])
+                    search_results.extend(_search_current_laws_by_name(law_name, 2))
                 except:
                     continue
         
@@ -5949,47 +5790,13 @@ def search_law_articles_semantic(
         return TextContent(type="text", text="법령일련번호(mst)와 검색어(query)를 모두 입력해주세요.")
     
     try:
-        # 캐시 키 생성
-        cache_key = get_cache_key(f"{target}_{mst}", "full")
-        cached_data = load_from_cache(cache_key)
-        
-        # 캐시가 없으면 API로 전체 데이터 가져오기
-        if not cached_data:
-            logger.info(f"캐시 없음. API로 법령 전체 조회: {target}_{mst}")
-            params = {"MST": mst}
-            data = _make_legislation_request(target, params, is_detail=True)
-            
-            if not data:
-                return TextContent(type="text", text=f"법령 데이터를 가져올 수 없습니다. MST: {mst}")
-            
-            # 캐시 저장
-            save_to_cache(cache_key, data)
-            cached_data = data
+        # 조문 색인 조회 (캐시 확인, 없으면 API로 전체 데이터 가져오기)
+        article_index = get_article_index(target, mst, lambda: _fetch_law_full(target, mst))
+        if article_index is None:
+            return TextContent(type="text", text=f"법령 데이터를 가져올 수 없습니다. MST: {mst}")
         
-        # 법령 정보 추출
-        law_info = cached_data.get("법령", {})
-        basic_info = law_info.get("기본정보", {})
-        law_name = basic_info.get("법령명_한글", basic_info.get("법령명한글", ""))
-        
-        # 조문 데이터 추출
-        articles_section = law_info.get("조문", {})
-        all_articles = []
-        
-        if isinstance(articles_section, dict):
-            if "조문단위" in articles_section:
-                article_units = articles_section.get("조문단위", [])
-                if not isinstance(article_units, list):
-                    article_units = [article_units] if article_units else []
-                all_articles = article_units
-            else:
-                # 조문이 직접 딕셔너리로 되어있는 경우
-                for key, value in articles_section.items():
-                    if isinstance(value, dict) and "조문내용" in value:
-                        all_articles.append({
-                            "조문번호": key.replace("제", "").replace("조", ""),
-                            "조문제목": value.get("조문제목", ""),
-                            "조문내용": value.get("조문내용", "")
-                        })
+        law_name = article_index.law_name
+        all_articles = article_index.records
         
         # 시맨틱 검색 (개선된 키워드 매칭)
         search_results = []
@@ -6018,19 +5825,12 @@ def search_law_articles_semantic(
         }
         
         for article in all_articles:
-            if not isinstance(article, dict):
-                continue
-                
-            article_no = article.get("조문번호", "")
-            article_title = article.get("조문제목", "")
-            article_content = article.get("조문내용", "")
-            
-            # 조문 여부 확인
-            if article.get("조문여부") != "조문" and "조문여부" in article:
-                continue
+            article_label = article.label
+            article_title = article.title
+            article_content = article.text
             
-            # 전체 텍스트 생성
-            full_text = f"{article_title} {article_content}".lower()
+            # 전체 텍스트 (조문여부 판정·HTML 제거는 색인 생성 시 완료)
+            full_text = article.search_text
             
             # 점수 계산 (개선된 알고리즘)
             score = 0
@@ -6060,7 +5860,7 @@ def search_law_articles_semantic(
             
             if score > 0:
                 search_results.append({
-                    "조문번호": article_no,
+                    "조문": article_label,
                     "조문제목": article_title,
                     "조문내용": article_content[:200] + "..." if len(article_content) > 200 else article_content,
                     "점수": score
@@ -6078,14 +5878,14 @@ def search_law_articles_semantic(
         result += "=" * 50 + "\n\n"
         
         for i, item in enumerate(search_results, 1):
-            result += f"**{i}. 제{item['조문번호']}조"
+            result += f"**{i}. {item['조문']}"
             if item['조문제목']:
                 result += f"({item['조문제목']})"
             result += f"** (관련도: {item['점수']})\n"
             result += f"{item['조문내용']}\n"
-            result += f"→ 전체 내용: get_law_article_by_key(mst=\"{mst}\", target=\"{target}\", article_key=\"제{item['조문번호']}조\")\n\n"
+            result += f"→ 전체 내용: get_law_article_by_key(mst=\"{mst}\", target=\"{target}\", article_key=\"{item['조문']}\")\n\n"
         
-        result += f"\n캐시 정보: {cache_key} (총 {len(all_articles)}개 조문 검색)"
+        result += f"\n캐시 정보: {get_cache_key(target, mst, 'full')} (총 {len(all_articles)}개 조문 검색)"
         
         return TextContent(type="text", text=result)
         
@@ -6093,6 +5893,160 @@ def search_law_articles_semantic(
         logger.error(f"시맨틱 검색 중 오류: {e}")
         return TextContent(type="text", text=f"검색 중 오류가 발생했습니다: {str(e)}")
 
+@mcp.tool(
+    name="search_articles_across_laws",
+    description="""로컬 색인에 있는 모든 법령의 조문에서 키워드를 검색합니다 (업스트림 호출 없음).
+
+언제 사용:
+- "어느 법령의 어느 조문이 X를 다루는가"를 여러 법령에 걸쳐 찾을 때
+- 법령명을 모르고 내용으로 관련 조문을 찾을 때
+
+검색 대상: 한 번 이상 조문을 조회한 법령(get_law_detail, get_law_article_by_key 등)과 오프라인으로 구축된 법령
+검색 방식: 한국어 글자 단위(2글자) 색인, BM25 관련도 순
+
+매개변수:
+- query: 검색 키워드 (필수) - 예: "개인정보 제3자 제공", "연장근로 가산임금"
+- target: 법령 종류 (선택) - "law"(현행법령), "eflaw"(시행일법령), "elaw"(영문법령), 생략 시 전체
+- max_results: 최대 결과 개수 (기본값: 10, 최대 50)
+
+반환정보: 법령명, 조문, 조문제목, 관련도, 조문 미리보기, 전체 조문 조회 방법
+
+사용 예시:
+- search_articles_across_laws("개인정보 제3자 제공")
+- search_articles_across_laws("과징금 부과기준", target="law", max_results=20)"""
+)
+def search_articles_across_laws(
+    query: str,
+    target: Optional[str] = None,
+    max_results: int = 10
+) -> TextContent:
+    """색인된 전체 법령 조문 검색 (BM25)"""
+    if not query or not query.strip():
+        return TextContent(type="text", text="검색어(query)를 입력해주세요.")
+    
+    try:
+        hits = search_articles(query, limit=min(max(max_results, 1), 50), target=target or None)
+        stats = get_article_search_index().stats()
+        
+        if not hits:
+            if stats["laws"] == 0:
+                return TextContent(
+                    type="text",
+                    text="아직 색인된 법령이 없습니다.\n\n"
+                         "get_law_detail, get_law_article_by_key 등으로 법령 조문을 조회하면 자동으로 색인됩니다.\n"
+                         "특정 법령을 찾으려면 search_law 도구를 사용하세요."
+                )
+            return TextContent(
+                type="text",
+                text=f"'{query}'와 관련된 조문을 찾을 수 없습니다. (색인된 법령 {stats['laws']}개, 조문 {stats['articles']}개)"
+            )
+        
+        result = f"**전체 법령 조문 검색: '{query}'** (상위 {len(hits)}개)\n"
+        result += "=" * 50 + "\n\n"
+        
+        for i, hit in enumerate(hits, 1):
+            result += f"**{i}. {hit['law_name']} {hit['article']}"
+            if hit['title']:
+                result += f"({hit['title']})"
+            result += f"** (관련도: {hit['score']:.2f})\n"
+            result += f"{hit['preview']}...\n" if len(hit['preview']) >= 160 else f"{hit['preview']}\n"
+            result += f"→ 전체 내용: get_law_article_by_key(mst=\"{hit['mst']}\", target=\"{hit['target']}\", article_key=\"{hit['article']}\")\n\n"
+        
+        result += f"\n색인 정보: 법령 {stats['laws']}개, 조문 {stats['articles']}개 (검색 {stats['last_query_ms']}ms)"
+        
+        return TextContent(type="text", text=result)
+        
+    except Exception as e:
+        logger.error(f"전체 법령 조문 검색 중 오류: {e}")
+        return TextContent(type="text", text=f"검색 중 오류가 발생했습니다: {str(e)}")
+
+@mcp.tool(
+    name="search_similar_provisions",
+    description="""주어진 조항·문장과 내용이 비슷한 조문, 판례, 법령해석례를 찾습니다 (업스트림 호출 없음).
+
+언제 사용:
+- "이 조항과 비슷한 규정이 다른 법령에도 있는가"를 확인할 때
+- 조문 내용과 관련된 판례(판시사항/판결요지)나 법령해석례(질의요지/회답)를 찾을 때
+- 키워드가 정확히 일치하지 않아 search_articles_across_laws로 찾기 어려울 때
+
+검색 대상: 조회한 적이 있는 법령 조문, 판례, 법령해석례 (로컬 색인)
+검색 방식: 글자 n-gram TF-IDF 코사인 유사도 (numpy/scipy 설치 필요)
+
+매개변수:
+- text: 비교할 조항 또는 문장 (필수)
+- kind: 검색 대상 종류 (선택) - "article"(법령 조문), "precedent"(판례), "interpretation"(법령해석례), 생략 시 전체
+- max_results: 최대 결과 개수 (기본값: 10, 최대 50)
+
+반환정보: 종류, 법령명/사건명, 조문/사건 정보, 유사도, 미리보기, 상세 조회 방법
+
+사용 예시:
+- search_similar_provisions("사용자는 근로자에게 연장근로에 대하여 통상임금의 100분의 50 이상을 가산하여 지급하여야 한다")
+- search_similar_provisions("개인정보를 제3자에게 제공하는 경우 정보주체의 동의를 받아야 한다", kind="precedent")"""
+)
+def search_similar_provisions(
+    text: str,
+    kind: Optional[str] = None,
+    max_results: int = 10
+) -> TextContent:
+    """조문·판례·해석례 유사도 검색 (TF-IDF)"""
+    if not text or not text.strip():
+        return TextContent(type="text", text="비교할 조항이나 문장(text)을 입력해주세요.")
+    if kind and kind not in ("article", "precedent", "interpretation"):
+        return TextContent(type="text", text="kind는 \"article\", \"precedent\", \"interpretation\" 중 하나여야 합니다.")
+    
+    similarity = get_similarity_index()
+    if not similarity.available:
+        return TextContent(
+            type="text",
+            text="유사도 검색에는 numpy/scipy가 필요합니다.\n\n"
+                 "설치: pip install \"mcp-kr-legislation[similarity]\"\n"
+                 "키워드 검색은 search_articles_across_laws 도구를 사용하세요."
+        )
+    
+    try:
+        hits = search_similar(text, limit=min(max(max_results, 1), 50), kind=kind or None)
+        stats = similarity.stats()
+        
+        if not hits:
+            if stats["rows"] == 0 and stats["building"]:
+                return TextContent(
+                    type="text",
+                    text="유사도 색인을 생성하고 있습니다. 잠시 후 다시 검색해주세요.\n\n"
+                         "생성은 백그라운드에서 진행되며, 그동안 키워드 검색은 search_articles_across_laws 도구를 사용할 수 있습니다."
+                )
+            if stats["rows"] == 0:
+                return TextContent(
+                    type="text",
+                    text="아직 유사도 색인에 문서가 없습니다.\n\n"
+                         "법령 조문(get_law_detail, get_law_article_by_key 등), 판례(get_precedent_detail), "
+                         "법령해석례(get_legal_interpretation_detail)를 조회하면 색인 대상으로 수집되어 다음 색인 갱신 때 반영됩니다."
+                )
+            return TextContent(type="text", text=f"비슷한 내용을 찾을 수 없습니다. (색인 {stats['rows']}건)")
+        
+        kind_names = {"article": "조문", "precedent": "판례", "interpretation": "법령해석례"}
+        result = f"**유사 조항 검색** (상위 {len(hits)}개)\n"
+        result += f"질의: {text[:100]}{'...' if len(text) > 100 else ''}\n"
+        result += "=" * 50 + "\n\n"
+        
+        for i, hit in enumerate(hits, 1):
+            result += f"**{i}. [{kind_names.get(hit['kind'], hit['kind'])}] {hit['name']} {hit['label']}** (유사도: {hit['score']:.3f})\n"
+            result += f"{hit['preview']}\n"
+            if hit['kind'] == "article":
+                result += f"→ 전체 내용: get_law_article_by_key(mst=\"{hit['id']}\", target=\"{hit['target']}\", article_key=\"{hit['label']}\")\n\n"
+            elif hit['kind'] == "precedent":
+                result += f"→ 상세 조회: get_precedent_detail(case_id=\"{hit['id']}\")\n\n"
+            else:
+                result += f"→ 상세 조회: get_legal_interpretation_detail(interpretation_id=\"{hit['id']}\")\n\n"
+        
+        by_kind = ", ".join(f"{kind_names.get(k, k)} {v}건" for k, v in stats["rows_by_kind"].items())
+        result += f"\n색인 정보: {by_kind} (생성 {stats['built_at']}, 검색 {stats['last_query_ms']}ms)"
+        
+        return TextContent(type="text", text=result)
+        
+    except Exception as e:
+        logger.error(f"유사 조항 검색 중 오류: {e}")
+        return TextContent(type="text", text=f"검색 중 오류가 발생했습니다: {str(e)}")
+
 # 전역 클라이언트 인스턴스
 law_client = LegislationClient()
 
@@ -6126,24 +6080,13 @@ def search_english_law_articles_semantic(
 ) -> TextContent:
     """영문법령 조문 시맨틱 검색"""
     try:
-        # 캐시 확인
-        cache_key = get_cache_key(f"elaw_{mst}", "full")
-        cached_data = load_from_cache(cache_key)
-        
-        if not cached_data:
-            # 캐시가 없으면 API 호출하여 전체 법령 데이터 가져오기
-            params = {"MST": mst}
-            data = _make_legislation_request("elaw", params, is_detail=True)
-            
-            if not data or 'Law' not in data:
-                return TextContent(
-                    type="text", 
-                    text=f"영문 법령 데이터를 찾을 수 없습니다. (MST: {mst})"
-                )
-            
-            # 캐시에 저장
-            save_to_cache(cache_key, data)
-            cached_data = data
+        # 캐시 확인, 없으면 API 호출하여 전체 법령 데이터 가져오기
+        cached_data = _fetch_law_full("elaw", mst)
+        if not cached_data or 'Law' not in cached_data:
+            return TextContent(
+                type="text", 
+                text=f"영문 법령 데이터를 찾을 수 없습니다. (MST: {mst})"
+            )
         
         law_data = cached_data['Law']
         
@@ -6289,35 +6232,40 @@ def get_english_law_summary(
 ) -> TextContent:
     """영문 법령 통합 요약"""
     try:
-        # 1단계: 영문 법령 검색 (내부 호출 시뮬레이션)
-        # search_english_law 로직 직접 구현
-        search_params = {
-            "OC": legislation_config.oc,
-            "type": "JSON", 
-            "target": "elaw",
-            "query": law_name,
-            "search": 1,
-            "display": 5,
-            "page": 1
-        }
-        
-        search_data = _make_legislation_request("elaw", search_params, is_detail=False)
-        
-        # 검색 결과에서 첫 번째 법령 선택
-        if not search_data or 'LawSearch' not in search_data or 'law' not in search_data['LawSearch']:
-            return TextContent(
-                type="text",
-                text=f"'{law_name}'에 해당하는 영문 법령을 찾을 수 없습니다."
-            )
-        
-        laws = search_data['LawSearch']['law']
-        if not laws:
-            return TextContent(
-                type="text",
-                text=f"'{law_name}'에 해당하는 영문 법령을 찾을 수 없습니다."
-            )
-        
-        current_law = laws[0] if isinstance(laws, list) else laws
+        # 1단계: 영문 법령 카탈로그 조회 (없으면 영문 법령 검색)
+        entry = resolve_law_name(law_name, target="elaw")
+        if entry is not None:
+            current_law = entry.to_search_item()
+        else:
+            # search_english_law 로직 직접 구현
+            search_params = {
+                "OC": legislation_config.oc,
+                "type": "JSON", 
+                "target": "elaw",
+                "query": law_name,
+                "search": 1,
+                "display": 5,
+                "page": 1
+            }
+            
+            search_data = _make_legislation_request("elaw", search_params, is_detail=False)
+            
+            # 검색 결과에서 첫 번째 법령 선택
+            if not search_data or 'LawSearch' not in search_data or 'law' not in search_data['LawSearch']:
+                return TextContent(
+                    type="text",
+                    text=f"'{law_name}'에 해당하는 영문 법령을 찾을 수 없습니다."
+                )
+            
+            laws = search_data['LawSearch']['law']
+            if not laws:
+                return TextContent(
+                    type="text",
+                    text=f"'{law_name}'에 해당하는 영문 법령을 찾을 수 없습니다."
+                )
+            observe_search_results(search_data, target="elaw")
+            
+            current_law = laws[0] if isinstance(laws, list) else laws
         mst = current_law.get('법령일련번호')
         
         if not mst:
@@ -6346,7 +6294,7 @@ def get_english_law_summary(
         # 3단계: 키워드가 있으면 시맨틱 검색
         if keyword:
             # search_english_law_articles_semantic 로직 직접 구현
-            cache_key = get_cache_key(f"elaw_{mst}", "full")
+            cache_key = get_cache_key("elaw", mst, "full")
             cached_data = load_from_cache(cache_key)
             
             if not cached_data:
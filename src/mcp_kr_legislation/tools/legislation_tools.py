@@ -9,13 +9,18 @@ search_simple_law의 성공 패턴을 적용한 안전하고 간단한 모든 
 import logging
 import json
 import os
+import functools
 import requests  # type: ignore
 from urllib.parse import urlencode
-from typing import Optional, Union
+from typing import Optional, Union, List, Tuple, Callable
 from mcp.types import TextContent
 
 from ..server import mcp
 from ..config import legislation_config
+from ..apis.transport import get_transport
+from ..apis.singleflight import get_single_flight, canonical_request_key
+from ..apis.fanout import get_fanout
+from ..cache import fetch_search_with_cache
 
 logger = logging.getLogger(__name__)
 
@@ -207,8 +212,6 @@ def _make_legislation_request(target: str, params: dict, is_detail: bool = False
         is_detail: True면 상세조회(lawService.do), False면 검색(lawSearch.do)
     """
     try:
-        import requests
-        
         # API 키 설정
         oc = os.getenv("LEGISLATION_API_KEY", "lchangoo")
         
@@ -231,11 +234,19 @@ def _make_legislation_request(target: str, params: dict, is_detail: bool = False
         
         base_params["target"] = target
         
-        response = requests.get(url, params=base_params, timeout=15)
-        response.raise_for_status()
+        def fetch() -> dict:
+            response = get_transport().get(url, params=base_params, timeout=15)
+            response.raise_for_status()
+            return response.json()
+        
+        # 동일 요청이 진행 중이면 결과를 공유
+        def coalesced_fetch() -> dict:
+            return get_single_flight().do(canonical_request_key(url, base_params), fetch)
         
-        data = response.json()
-        return data
+        if url == legislation_config.service_base_url:
+            return coalesced_fetch()
+        # 검색 목록(lawSearch.do)은 정규화된 파라미터 키로 짧은 기간 캐시
+        return fetch_search_with_cache(target, params, coalesced_fetch)
         
     except Exception as e:
         logger.error(f"API 요청 실패: {e}")
@@ -1107,6 +1118,76 @@ def _format_search_results(data: dict, search_type: str, query: str = "", url: s
 
 # get_law_detail은 basic_law_tools.py로 분리됨
 
+# 통합 검색에 포함하는 주요 위원회 (target, 위원회명)
+SEARCH_ALL_COMMITTEE_TARGETS = [
+    ("ppc", "개인정보보호위원회"),
+    ("fsc", "금융위원회"), 
+    ("ftc", "공정거래위원회"),
+    ("acr", "국민권익위원회"),
+    ("nhrck", "국가인권위원회")
+]
+
+def _parse_total_count(value) -> int:
+    """totalCnt 값을 정수로 변환 (변환 실패 시 0)"""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return 0
+
+def _search_all_law_section(search_query: str) -> Tuple[List[str], int]:
+    """통합 검색 - 스마트 법령 검색 항목 (출력 조각, 결과 수)"""
+    try:
+        law_data = _smart_search("law", search_query, display=5)
+        
+        # 결과 유효성 검사
+        if law_data and isinstance(law_data, dict) and law_data.get('LawSearch'):
+            law_count = _parse_total_count(law_data['LawSearch'].get('totalCnt', 0))
+            if law_count > 0:
+                law_result = _format_search_results(law_data, "law", search_query, 20)
+                return ["**법령 검색 결과:**\n", law_result + "\n"], law_count
+            return ["**법령 검색 결과:** 관련 법령을 찾을 수 없습니다.\n\n"], 0
+        return ["**법령 검색 결과:** 검색 중 오류가 발생했습니다.\n\n"], 0
+    except Exception as e:
+        return [f"**법령 검색 오류:** {str(e)}\n\n"], 0
+
+def _search_all_document_section(target: str, root_key: str, label: str, empty_message: str,
+                                 params: dict) -> Tuple[List[str], int]:
+    """통합 검색 - 판례/해석례 항목 (출력 조각, 결과 수)"""
+    try:
+        data = _make_legislation_request(target, params)
+        
+        if data and isinstance(data, dict) and data.get(root_key):
+            count = _parse_total_count(data[root_key].get('totalCnt', 0))
+            if count > 0:
+                formatted = _format_search_results(data, target, params["query"], 20)
+                return [f"**{label} 검색 결과:**\n", formatted + "\n"], count
+            return [f"**{label} 검색 결과:** {empty_message}\n\n"], 0
+        return [f"**{label} 검색 결과:** 검색 중 오류가 발생했습니다.\n\n"], 0
+    except Exception as e:
+        return [f"**{label} 검색 오류:** {str(e)}\n\n"], 0
+
+def _search_all_committee_section(target: str, name: str, search_query: str) -> Tuple[List[str], int]:
+    """통합 검색 - 위원회 결정문 항목 (출력 조각, 결과 수)"""
+    try:
+        committee_params = {"query": search_query, "display": 3, "search": 2}  # 본문검색으로 정확도 향상
+        committee_data = _make_legislation_request(target, committee_params)
+        
+        # 결과 유효성 검사 강화
+        if committee_data and isinstance(committee_data, dict) and not committee_data.get("error"):
+            # 각 위원회별 응답 구조 확인 (실제 키는 Ppc, Fsc, Ftc, Acr, Nhrck 등)
+            search_key = target.title()  # Ppc, Fsc, Ftc 등
+            if search_key in committee_data:
+                total_cnt = _parse_total_count(committee_data[search_key].get('totalCnt', 0))
+                if total_cnt > 0:
+                    committee_result = _format_search_results(committee_data, target, search_query, 20)
+                    if "결과가 없습니다" not in committee_result and "검색된" not in committee_result:
+                        return [f"**{name}:**\n", committee_result + "\n"], total_cnt
+                return [], 0
+            return [f"**{name}:** 관련 결정문이 없습니다.\n"], 0
+        return [f"**{name}:** 검색 중 오류가 발생했습니다.\n"], 0
+    except Exception as e:
+        return [f"**{name}:** 검색 실패 - {str(e)}\n"], 0
+
 @mcp.tool(
     name="search_all_legal_documents", 
     description="""모든 종류의 법적 문서를 통합 검색합니다. 법령, 판례, 해석례, 위원회 결정문을 포괄적으로 검색합니다.
@@ -1128,7 +1209,11 @@ def search_all_legal_documents(
     include_interpretation: bool = True,
     include_committee: bool = True
 ) -> TextContent:
-    """통합 법률 문서 검색 - 정확도 개선 버전"""
+    """통합 법률 문서 검색 - 정확도 개선 버전
+    
+    각 검색 항목(법령, 판례, 해석례, 위원회별 결정문)은 공용 fan-out 풀에서 동시에 실행하며,
+    출력 순서는 항목 순서를 유지합니다. 응답 대기 시간을 넘긴 항목만 생략하고 나머지 결과는 반환합니다.
+    """
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요. 예: '개인정보보호', '금융규제', '노동법' 등")
     
@@ -1139,133 +1224,70 @@ def search_all_legal_documents(
     results.append("=" * 50 + "\n")
     
     try:
-        total_results = 0
+        # (항목 이름, 실행 함수, 시간 초과 시 메시지)
+        sections: List[Tuple[str, Callable[[], Tuple[List[str], int]], str]] = []
         
-        # 1. 스마트 법령 검색 (정확도 개선)
         if include_law:
-            try:
-                law_data = _smart_search("law", search_query, display=5)
-                law_url = _generate_api_url("law", {"query": search_query, "display": 5})
-                
-                # 결과 유효성 검사
-                if law_data and isinstance(law_data, dict) and law_data.get('LawSearch'):
-                    law_count = law_data['LawSearch'].get('totalCnt', 0)
-                    try:
-                        law_count = int(law_count)
-                    except (ValueError, TypeError):
-                        law_count = 0
-                    if law_count > 0:
-                        law_result = _format_search_results(law_data, "law", search_query, 20)
-                        results.append("**법령 검색 결과:**\n")
-                        results.append(law_result + "\n")
-                        total_results += law_count
-                    else:
-                        results.append("**법령 검색 결과:** 관련 법령을 찾을 수 없습니다.\n\n")
-                else:
-                    results.append("**법령 검색 결과:** 검색 중 오류가 발생했습니다.\n\n")
-            except Exception as e:
-                results.append(f"**법령 검색 오류:** {str(e)}\n\n")
-        
-        # 2. 판례 검색 (안정성 강화)
+            sections.append((
+                "law",
+                lambda: _search_all_law_section(search_query),
+                "**법령 검색 결과:** 응답 시간 초과로 생략되었습니다.\n\n"
+            ))
         if include_precedent:
-            try:
-                prec_params = {"query": search_query, "display": 4, "search": 2}  # 본문검색으로 정확도 향상
-                prec_data = _make_legislation_request("prec", prec_params)
-                prec_url = _generate_api_url("prec", prec_params)
-                
-                if prec_data and isinstance(prec_data, dict) and prec_data.get('PrecSearch'):
-                    prec_count = prec_data['PrecSearch'].get('totalCnt', 0)
-                    try:
-                        prec_count = int(prec_count)
-                    except (ValueError, TypeError):
-                        prec_count = 0
-                    if prec_count > 0:
-                        prec_result = _format_search_results(prec_data, "prec", search_query, 20)
-                        results.append("**판례 검색 결과:**\n")
-                        results.append(prec_result + "\n")
-                        total_results += prec_count
-                    else:
-                        results.append("**판례 검색 결과:** 관련 판례를 찾을 수 없습니다.\n\n")
-                else:
-                    results.append("**판례 검색 결과:** 검색 중 오류가 발생했습니다.\n\n")
-            except Exception as e:
-                results.append(f"**판례 검색 오류:** {str(e)}\n\n")
-        
-        # 3. 해석례 검색 (안정성 강화)
+            sections.append((
+                "prec",
+                lambda: _search_all_document_section(
+                    "prec", "PrecSearch", "판례", "관련 판례를 찾을 수 없습니다.",
+                    {"query": search_query, "display": 4, "search": 2}  # 본문검색으로 정확도 향상
+                ),
+                "**판례 검색 결과:** 응답 시간 초과로 생략되었습니다.\n\n"
+            ))
         if include_interpretation:
-            try:
-                interp_params = {"query": search_query, "display": 4}
-                interp_data = _make_legislation_request("expc", interp_params)
-                interp_url = _generate_api_url("expc", interp_params)
-                
-                if interp_data and isinstance(interp_data, dict) and interp_data.get('Expc'):
-                    interp_count = interp_data['Expc'].get('totalCnt', 0)
-                    try:
-                        interp_count = int(interp_count)
-                    except (ValueError, TypeError):
-                        interp_count = 0
-                    if interp_count > 0:
-                        interp_result = _format_search_results(interp_data, "expc", search_query, 20)
-                        results.append("**해석례 검색 결과:**\n")
-                        results.append(interp_result + "\n")
-                        total_results += interp_count
-                    else:
-                        results.append("**해석례 검색 결과:** 관련 해석례를 찾을 수 없습니다.\n\n")
-                else:
-                    results.append("**해석례 검색 결과:** 검색 중 오류가 발생했습니다.\n\n")
-            except Exception as e:
-                results.append(f"**해석례 검색 오류:** {str(e)}\n\n")
+            sections.append((
+                "expc",
+                lambda: _search_all_document_section(
+                    "expc", "Expc", "해석례", "관련 해석례를 찾을 수 없습니다.",
+                    {"query": search_query, "display": 4}
+                ),
+                "**해석례 검색 결과:** 응답 시간 초과로 생략되었습니다.\n\n"
+            ))
         
-        # 4. 주요 위원회 결정문 검색 (안정성 강화)
-        committee_results = 0
+        committee_names = []
         if include_committee:
-            committee_targets = [
-                ("ppc", "개인정보보호위원회"),
-                ("fsc", "금융위원회"), 
-                ("ftc", "공정거래위원회"),
-                ("acr", "국민권익위원회"),
-                ("nhrck", "국가인권위원회")
-            ]
-            
-            results.append("**위원회 결정문 검색 결과:**\n")
-            
-            for target, name in committee_targets:
-                try:
-                    committee_params = {"query": search_query, "display": 3, "search": 2}  # 본문검색으로 정확도 향상
-                    committee_data = _make_legislation_request(target, committee_params)
-                    committee_url = _generate_api_url(target, committee_params)
-                    
-                    # 결과 유효성 검사 강화
-                    if committee_data and isinstance(committee_data, dict) and not committee_data.get("error"):
-                        # 각 위원회별 응답 구조 확인 (실제 키는 Ppc, Fsc, Ftc, Acr, Nhrck 등)
-                        search_key = target.title()  # Ppc, Fsc, Ftc 등
-                        if search_key in committee_data:
-                            total_cnt = committee_data[search_key].get('totalCnt', 0)
-                            try:
-                                total_cnt = int(total_cnt)
-                            except (ValueError, TypeError):
-                                total_cnt = 0
-                            
-                            if total_cnt > 0:
-                                committee_result = _format_search_results(committee_data, target, search_query, 20)
-                                if "결과가 없습니다" not in committee_result and "검색된" not in committee_result:
-                                    results.append(f"**{name}:**\n")
-                                    results.append(committee_result + "\n")
-                                    committee_results += total_cnt
-                        else:
-                            results.append(f"**{name}:** 관련 결정문이 없습니다.\n")
-                    else:
-                        results.append(f"**{name}:** 검색 중 오류가 발생했습니다.\n")
-                except Exception as e:
-                    results.append(f"**{name}:** 검색 실패 - {str(e)}\n")
-                    continue
+            for target, name in SEARCH_ALL_COMMITTEE_TARGETS:
+                committee_names.append(target)
+                sections.append((
+                    target,
+                    functools.partial(_search_all_committee_section, target, name, search_query),
+                    f"**{name}:** 응답 시간 초과로 생략되었습니다.\n"
+                ))
+        
+        section_results = get_fanout().run([(name, fn) for name, fn, _ in sections])
+        timeout_messages = {name: message for name, _, message in sections}
+        
+        total_results = 0
+        for result in section_results:
+            # 위원회 결정문은 첫 위원회 앞에 공통 제목 출력
+            if committee_names and result.name == committee_names[0]:
+                results.append("**위원회 결정문 검색 결과:**\n")
             
-            total_results += committee_results
+            if result.timed_out:
+                results.append(timeout_messages[result.name])
+            elif result.error is not None:
+                results.append(f"**{result.name} 검색 오류:** {str(result.error)}\n\n")
+            else:
+                fragments, count = result.value
+                results.extend(fragments)
+                total_results += count
         
         # 검색 총계 및 요약 추가
         results.append("\n" + "=" * 50)
         results.append(f"\n**검색 총계**: {total_results:,}건의 문서를 찾았습니다.")
         
+        timed_out = [r.name for r in section_results if r.timed_out]
+        if timed_out:
+            results.append(f"\n**응답 지연으로 생략된 항목**: {', '.join(timed_out)} (잠시 후 다시 검색하면 캐시된 결과로 빠르게 응답합니다)")
+        
         if total_results == 0:
             results.append(f"\n\n**검색 팁**: '{search_query}' 키워드로 결과가 없습니다. 다음을 시도해보세요:")
             results.append("\n- 더 일반적인 키워드 사용 (예: '개인정보' → '정보보호')")
@@ -13,6 +13,7 @@ from mcp.types import TextContent
 
 # FastMCP 서버 인스턴스 가져오기
 from ..server import mcp
+from ..index import observe_search_results, resolve_law_name
 from ..utils.legislation_utils import (
     fetch_law_data, 
     extract_law_summary, 
@@ -68,50 +69,52 @@ def get_law_summary(
     try:
         # 법령명으로 검색하는 경우 법령일련번호를 먼저 찾아야 함
         if law_name and not law_id:
-            from .law_tools import _make_legislation_request
-            
-            # 법령 검색 API로 정확한 법령ID 찾기
-            logger.info(f"법령명으로 검색: {law_name}")
-            search_params = {
-                "OC": "lchangoo",
-                "type": "JSON",
-                "query": law_name,
-                "display": 5
-            }
-            
-            search_result = _make_legislation_request("law", search_params)
-            if search_result and search_result.get("법령"):
-                laws = search_result.get("법령", [])
+            # 로컬 법령 카탈로그에서 먼저 조회 (업스트림 검색 생략)
+            entry = resolve_law_name(law_name)
+            if entry is not None:
+                law_id = entry.mst
+                logger.info(f"법령 카탈로그 조회 성공: {entry.name} (MST: {law_id})")
+            else:
+                from .law_tools import _make_legislation_request
+                
+                # 법령 검색 API로 정확한 법령ID 찾기
+                logger.info(f"법령명으로 검색: {law_name}")
+                search_params = {
+                    "OC": "lchangoo",
+                    "type": "JSON",
+                    "query": law_name,
+                    "display": 5
+                }
+                
+                search_result = _make_legislation_request("law", search_params)
+                laws = search_result.get("LawSearch", {}).get("law", []) if isinstance(search_result, dict) else []
                 if isinstance(laws, dict):
                     laws = [laws]
+                if not laws:
+                    return TextContent(
+                        type="text",
+                        text=f"'{law_name}' 검색 중 오류가 발생했습니다.\n\n"
+                             f"🔍 search_law 도구로 먼저 검색해보세요."
+                    )
+                observe_search_results(search_result)
                 
                 # 법령명 일치 우선
                 target_law = None
                 for law in laws:
-                    law_info = law.get("기본정보", {}) if isinstance(law, dict) else {}
-                    api_law_name = (law_info.get("법령명_한글") or 
-                                  law_info.get("법령명한글") or 
-                                  law_info.get("법령명", ""))
+                    api_law_name = law.get("법령명한글", "") if isinstance(law, dict) else ""
                     
                     # 정확한 이름 매칭
                     if api_law_name == law_name:
                         target_law = law
                         break
                     # 부분 매칭
-                    elif law_name in api_law_name or api_law_name in law_name:
+                    elif api_law_name and (law_name in api_law_name or api_law_name in law_name):
                         if not target_law:  # 첫 번째 부분 일치만 사용
                             target_law = law
                 
                 if target_law:
-                    basic_info = target_law.get("기본정보", {})
-                    law_id = (basic_info.get("법령일련번호") or 
-                             basic_info.get("법령MST") or
-                             target_law.get("법령키", "")[:10] if target_law.get("법령키") else None)
-                    
-                    actual_law_name = (basic_info.get("법령명_한글") or 
-                                     basic_info.get("법령명한글") or 
-                                     basic_info.get("법령명", ""))
-                    logger.info(f"법령 검색 성공: {actual_law_name} (MST: {law_id})")
+                    law_id = target_law.get("법령일련번호")
+                    logger.info(f"법령 검색 성공: {target_law.get('법령명한글', '')} (MST: {law_id})")
                 else:
                     return TextContent(
                         type="text",
@@ -121,12 +124,6 @@ def get_law_summary(
                              f"- 핵심 키워드만 입력 (예: '개인정보', '근로기준' 등)\n"
                              f"- search_law 도구로 먼저 검색해보세요."
                     )
-            else:
-                return TextContent(
-                    type="text",
-                    text=f"'{law_name}' 검색 중 오류가 발생했습니다.\n\n"
-                         f"🔍 search_law 도구로 먼저 검색해보세요."
-                )
         
         if not law_id:
             return TextContent(
@@ -15,6 +15,7 @@ from mcp.types import TextContent
 
 from ..server import mcp
 from ..config import legislation_config
+from ..apis.transport import get_transport
 
 logger = logging.getLogger(__name__)
 
@@ -384,7 +385,7 @@ def get_precedent_detail(case_id: Union[str, int]) -> TextContent:
             html_params = {"OC": oc, "target": "prec", "ID": str(case_id)}
             
             url = f"{legislation_config.service_base_url}?{urlencode(html_params)}"
-            response = requests.get(url, timeout=15)
+            response = get_transport().get(url, timeout=15)
             response.raise_for_status()
             
             # HTML 응답 포맷팅
@@ -397,7 +398,7 @@ def get_precedent_detail(case_id: Union[str, int]) -> TextContent:
             html_params = {"OC": oc, "target": "prec", "ID": str(case_id)}
             
             url = f"{legislation_config.service_base_url}?{urlencode(html_params)}"
-            response = requests.get(url, timeout=15)
+            response = get_transport().get(url, timeout=15)
             response.raise_for_status()
             
             return _format_html_precedent_response(response.text, str(case_id), url)
@@ -0,0 +1,88 @@
+"""
+한국 법제처 OPEN API - 시스템 상태 도구들
+
+업스트림 전송 계층 등 서버 내부 구성요소의 운영 지표를 조회하는 기능을 제공합니다.
+"""
+
+import logging
+import json
+from typing import Any, Callable, Dict, Optional
+from mcp.types import TextContent
+
+from ..server import mcp
+from ..apis.transport import get_transport, async_transport_stats
+from ..apis.singleflight import get_single_flight
+from ..apis.fanout import fanout_stats
+from ..apis.health import health_stats
+from ..apis.resilience import resilience_stats
+from ..apis.throttle import throttle_stats
+from ..cache import cache_stats
+from ..index import index_stats
+
+logger = logging.getLogger(__name__)
+
+# 상태 섹션 이름 → 통계 수집 함수
+STATUS_SECTIONS: Dict[str, Callable[[], Dict[str, Any]]] = {
+    "transport": lambda: get_transport().stats(),
+    "async_transport": async_transport_stats,
+    "coalescing": lambda: get_single_flight().stats(),
+    "fanout": fanout_stats,
+    "health": health_stats,
+    "throttle": throttle_stats,
+    "resilience": resilience_stats,
+    "cache": cache_stats,
+    "index": index_stats,
+}
+
+def _format_status_section(name: str, stats: Dict[str, Any]) -> str:
+    """상태 섹션 하나를 마크다운으로 포맷팅"""
+    result = f"## {name}\n\n"
+    for key, value in stats.items():
+        if isinstance(value, (dict, list)):
+            result += f"• **{key}**:\n```json\n{json.dumps(value, ensure_ascii=False, indent=2)}\n```\n"
+        else:
+            result += f"• **{key}**: {value}\n"
+    return result + "\n"
+
+# ===========================================
+# 시스템 상태 도구들
+# ===========================================
+
+@mcp.tool(name="get_system_status", description="""서버 내부 구성요소의 운영 지표를 조회합니다.
+
+매개변수:
+- section: 조회할 섹션 (선택) - 생략 시 전체
+  - transport: HTTP 커넥션 풀 사용 현황 (활성 요청, 재사용률, 호스트별 유휴 커넥션)
+  - async_transport: 비동기(httpx) 커넥션 풀 사용 현황 (async 도구 경로)
+  - coalescing: 동일 요청 병합 현황 (업스트림 호출 수, 병합된 요청 수)
+  - fanout: 통합 검색 병렬 실행 현황 (실행 수, 항목 수, 시간 초과/오류 수)
+  - health: 법제처 API 상태와 오프라인 모드 (연속 실패 수, 전환 시각, 호출 없이 거부한 요청, 로컬 저장소 응답 수, 상태 점검)
+  - throttle: 요청 제한 현황 (OC 키별 초당 요청 수·남은 토큰·대기 요청 수, target별 동시 요청 격벽의 실행/대기열 길이·최대 대기열·평균 대기 시간)
+  - resilience: 재시도와 회로 차단기 현황 (재시도 정책·남은 재시도 예산·재시도 횟수, target별 회로 상태(closed/open/half_open)·연속 실패 수·복구 확인까지 남은 시간)
+  - cache: 응답 캐시 현황 (메모리/디스크 계층별 적중, 디스크 사용량, 퇴출/정리 작업, 만료 후 즉시 응답(stale_serves)과 백그라운드 갱신, 검색 응답 target별 적중/실패)
+  - index: 로컬 색인 현황 (법령 카탈로그 항목 수, 생성 시각, 법령명 조회 적중, MST-법령ID 매핑, 조문 색인, 전문 검색 색인, 유사도 색인, 변경이력 동기화 기준일, 갱신 작업)
+
+사용 예시: get_system_status(), get_system_status("transport")""")
+def get_system_status(section: Optional[str] = None) -> TextContent:
+    """시스템 상태 조회
+
+    Args:
+        section: 섹션 이름 (None이면 전체)
+    """
+    if section and section not in STATUS_SECTIONS:
+        return TextContent(type="text", text=f"알 수 없는 섹션입니다: '{section}'. 사용 가능: {', '.join(STATUS_SECTIONS)}")
+
+    names = [section] if section else list(STATUS_SECTIONS)
+    result = "**시스템 상태**\n"
+    result += "=" * 50 + "\n\n"
+
+    for name in names:
+        try:
+            result += _format_status_section(name, STATUS_SECTIONS[name]())
+        except Exception as e:
+            logger.warning(f"상태 수집 실패 ({name}): {e}")
+            result += f"## {name}\n\n수집 실패: {str(e)}\n\n"
+
+    return TextContent(type="text", text=result)
+
+logger.info("시스템 상태 도구가 로드되었습니다!")
@@ -6,7 +6,7 @@ law_tools.py에서 사용하는 유틸리티 함수들
 import re
 import json
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any
 
 logger = logging.getLogger(__name__)
 
@@ -265,68 +265,6 @@ def format_law_detail_summary(summary: Dict[str, Any], mst: str, target: str = "
 # get_law_article_by_key 도구 관련 함수들
 # ===========================================
 
-def normalize_article_key(article_key: str) -> str:
-    """
-    get_law_article_by_key 도구 전용 조문 키 정규화 함수
-    """
-    if not article_key:
-        return ""
-    
-    # 제X조 → X 형태로 변환
-    match = re.search(r'제(\d+)조', article_key)
-    if match:
-        return match.group(1)
-    
-    # 숫자만 있는 경우 그대로 반환
-    if article_key.isdigit():
-        return article_key
-    
-    return article_key
-
-
-def find_article_in_data(article_units: List[Dict], article_num: str) -> Optional[Dict]:
-    """
-    get_law_article_by_key 도구 전용 조문 데이터에서 특정 조문 찾기 함수
-    """
-    if not isinstance(article_units, list):
-        return None
-    
-    for i, article in enumerate(article_units):
-        if not isinstance(article, dict):
-            continue
-            
-        if article.get("조문번호") == article_num:
-            # 조문여부가 "전문"인 경우 실제 조문은 다음에 있을 수 있음
-            if article.get("조문여부") == "전문" and i < len(article_units) - 1:
-                # 다음 항목 확인
-                next_article = article_units[i + 1]
-                if (next_article.get("조문번호") == article_num and 
-                    next_article.get("조문여부") == "조문"):
-                    return next_article
-            elif article.get("조문여부") == "조문":
-                return article
-    
-    return None
-
-
-def get_available_articles(article_units: List[Dict], limit: int = 10) -> List[str]:
-    """
-    get_law_article_by_key 도구 전용 사용 가능한 조문 번호들 추출 함수
-    """
-    available_articles = []
-    
-    if not isinstance(article_units, list):
-        return available_articles
-    
-    for article in article_units[:limit]:
-        if isinstance(article, dict) and article.get("조문여부") == "조문":
-            no = article.get("조문번호", "")
-            if no:
-                available_articles.append(f"제{no}조")
-    
-    return available_articles
-
-
 def format_article_content(found_article: Dict, law_name: str, article_key: str) -> str:
     """
     get_law_article_by_key 도구 전용 조문 내용 포맷팅 함수
@@ -335,7 +273,10 @@ def format_article_content(found_article: Dict, law_name: str, article_key: str)
         content = found_article.get("조문내용", "")
         article_no = found_article.get("조문번호", "")
         article_title = found_article.get("조문제목", "")
+        branch_no = found_article.get("조문가지번호", "")
         key = f"제{article_no}조" if article_no else article_key
+        if article_no and branch_no and str(branch_no) not in ("0", "00"):
+            key += f"의{branch_no}"
         
         result = f"📄 **{law_name}** - {key}"
         if article_title:
@@ -1,102 +1,23 @@
 #!/usr/bin/env python3
 """
 법령 조회 최적화 유틸리티
-- 대용량 응답 처리를 위한 캐싱 시스템
+- 통합 캐시(mcp_kr_legislation.cache)를 사용하는 법령 조회
 - 필요한 정보만 추출하는 압축 기능
 """
 
 import json
 import os
-import hashlib
 import re
 import requests  # type: ignore
 import logging
-from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, Union, List, Tuple
-from pathlib import Path
 from bs4 import BeautifulSoup  # type: ignore
 
-logger = logging.getLogger(__name__)
-
-# 캐시 시스템 설정
-CACHE_DIR = Path.home() / ".cache" / "mcp-kr-legislation"
-CACHE_DAYS = 7  # 캐시 유효 기간
-MAX_CACHE_SIZE_MB = 100  # 최대 캐시 크기 100MB
-
-def ensure_cache_dir() -> bool:
-    """캐시 디렉토리 확인 및 생성"""
-    try:
-        # 절대 경로로 변환
-        abs_cache_dir = CACHE_DIR.resolve()
-        abs_cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        # 쓰기 권한 테스트
-        test_file = abs_cache_dir / ".write_test"
-        test_file.touch()
-        test_file.unlink()
-        
-        return True
-    except Exception as e:
-        logger.warning(f"캐시 디렉토리 생성/쓰기 실패: {e}")
-        return False
-
-def get_cache_key(law_id: str, section: str = "all") -> str:
-    """캐시 키 생성"""
-    key_string = f"{law_id}_{section}"
-    return hashlib.md5(key_string.encode()).hexdigest()
-
-def get_cache_path(cache_key: str) -> Path:
-    """캐시 파일 경로 생성"""
-    return CACHE_DIR / f"{cache_key}.json"
-
-def is_cache_valid(cache_path: Path) -> bool:
-    """캐시 유효성 확인"""
-    if not cache_path.exists():
-        return False
-    
-    # 파일 수정 시간 확인
-    file_time = datetime.fromtimestamp(cache_path.stat().st_mtime)
-    expiry_time = datetime.now() - timedelta(days=CACHE_DAYS)
-    
-    return file_time > expiry_time
-
-def save_to_cache(cache_key: str, data: Dict[str, Any]):
-    """데이터를 캐시에 저장"""
-    try:
-        ensure_cache_dir()
-        cache_path = get_cache_path(cache_key)
-        
-        # 메타데이터 추가
-        cache_data = {
-            "cached_at": datetime.now().isoformat(),
-            "data": data
-        }
-        
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            
-        logger.info(f"캐시 저장 완료: {cache_key}")
-        
-    except Exception as e:
-        logger.error(f"캐시 저장 실패: {e}")
+from ..apis.transport import get_transport
+from ..apis.singleflight import get_single_flight, canonical_request_key
+from ..cache import get_cache_key, load_from_cache, save_to_cache
 
-def load_from_cache(cache_key: str) -> Optional[Dict[str, Any]]:
-    """캐시에서 데이터 로드"""
-    try:
-        cache_path = get_cache_path(cache_key)
-        
-        if not is_cache_valid(cache_path):
-            return None
-            
-        with open(cache_path, 'r', encoding='utf-8') as f:
-            cache_data = json.load(f)
-            
-        logger.info(f"캐시 로드 완료: {cache_key}")
-        return cache_data.get("data")
-        
-    except Exception as e:
-        logger.error(f"캐시 로드 실패: {e}")
-        return None
+logger = logging.getLogger(__name__)
 
 def format_date(date_str: str) -> str:
     """날짜 형식을 YYYY-MM-DD로 통일"""
@@ -219,7 +140,7 @@ def extract_article_number(article_key: str) -> int:
 def fetch_law_data(law_id: str, oc: str = "lchangoo", use_cache: bool = True) -> Optional[Dict[str, Any]]:
     """법령 데이터 조회 (캐싱 지원)"""
     try:
-        cache_key = get_cache_key(law_id, "full")
+        cache_key = get_cache_key("law", law_id, "full")
         
         # 캐시 확인
         if use_cache:
@@ -237,17 +158,20 @@ def fetch_law_data(law_id: str, oc: str = "lchangoo", use_cache: bool = True) ->
             "MST": law_id
         }
         
-        logger.info(f"API에서 법령 조회: {law_id}")
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # 캐시에 저장
-        if use_cache:
-            save_to_cache(cache_key, data)
+        def fetch() -> Dict[str, Any]:
+            logger.info(f"API에서 법령 조회: {law_id}")
+            response = get_transport().get(url, params=params, timeout=30)
+            response.raise_for_status()
+            
+            data = response.json()
+            
+            # 캐시에 저장 (병합된 요청은 leader가 한 번만 저장)
+            if use_cache:
+                save_to_cache(cache_key, data)
+            
+            return data
         
-        return data
+        return get_single_flight().do(canonical_request_key(url, params), fetch)
         
     except Exception as e:
         logger.error(f"법령 조회 실패: {e}")